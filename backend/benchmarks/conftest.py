@@ -0,0 +1,170 @@
+"""Shared fixtures for the benchmark suite (pytest-benchmark).
+
+Run from ``backend/``::
+
+    uv run pytest benchmarks --benchmark-autosave    # store a run under .benchmarks/
+    uv run pytest benchmarks --benchmark-compare     # compare with the last stored run
+
+or ``make bench-backend`` / ``make bench-compare`` from the repository root.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from aerospike_py import Record
+from fastapi import FastAPI
+
+from aerospike_cluster_manager_api.etag import Tagged
+from aerospike_cluster_manager_api.fake_client import NAMESPACES, FakeAsyncClient
+from aerospike_cluster_manager_api.instrumentation import InstrumentedClient
+from aerospike_cluster_manager_api.main import app
+from aerospike_cluster_manager_api.models.connection import ConnectionProfile
+from aerospike_cluster_manager_api.models.query import FilterGroup
+from aerospike_cluster_manager_api.routers.clusters import _cluster_info
+from aerospike_cluster_manager_api.sample_data_generator import SAMPLE_INDEXES
+
+CONN_ID = "conn-bench"
+PROFILE = ConnectionProfile(
+    id=CONN_ID,
+    name="Benchmark",
+    hosts=["localhost"],
+    port=3000,
+    color="#0097D3",
+    createdAt="2025-01-01T00:00:00+00:00",
+    updatedAt="2025-01-01T00:00:00+00:00",
+)
+SCAN_RECORDS = 5_000
+UDF_MODULES = 50
+SETS_PER_NAMESPACE = 50
+STATISTICS_PER_NODE = 400
+
+# (operator, binType, value) choices for :func:`make_group`
+OPERATORS = [
+    ("eq", "integer", 1),
+    ("gt", "integer", 10),
+    ("between", "integer", 5),
+    ("eq", "string", "value"),
+    ("contains", "string", "needle"),
+    ("regex", "string", "^prefix.*"),
+    ("exists", "string", None),
+    ("is_true", "bool", None),
+]
+
+
+def make_group(seed: int, size: int = 20) -> FilterGroup:
+    """A flat filter group of *size* conditions drawn from :data:`OPERATORS`, reproducible from *seed*."""
+    rng = random.Random(seed)
+    conditions = []
+    for i in range(size):
+        operator, bin_type, value = rng.choice(OPERATORS)
+        cond = {"bin": f"bin{i}", "operator": operator, "binType": bin_type, "value": value}
+        if operator == "between":
+            cond["value2"] = value + 100
+        conditions.append(cond)
+    return FilterGroup.model_validate({"logic": rng.choice(["and", "or"]), "conditions": conditions})
+
+
+def make_records(count: int) -> list[Record]:
+    """*count* query results with a mix of scalar, nested, bytes and GeoJSON bins."""
+    return [
+        Record(
+            key=("test", "demo", i, i.to_bytes(20, "big")),
+            meta={"gen": 1 + i % 5, "ttl": 86400},
+            bins={
+                "id": i,
+                "name": f"user-{i}",
+                "score": i * 0.5,
+                "active": i % 2 == 0,
+                "tags": ["red", "blue", i],
+                "profile": {"city": "Seoul", "visits": {"2024": i, "2025": i * 2}, 7: "int key"},
+                "blob": bytes(range(16)),
+                "location": json.dumps({"type": "Point", "coordinates": [126.97, 37.56]}),
+            },
+        )
+        for i in range(count)
+    ]
+
+
+class _BusyClusterClient(FakeAsyncClient):
+    """A :class:`FakeAsyncClient` whose nodes report ``STATISTICS_PER_NODE`` statistics, as a server does."""
+
+    def _statistics(self, node: int) -> str:
+        padding = ";".join(f"stat_{i}={i * 7}" for i in range(STATISTICS_PER_NODE))
+        return f"{super()._statistics(node)};{padding}"
+
+
+async def _cluster_client() -> FakeAsyncClient:
+    """An 8-node cluster with ``SETS_PER_NAMESPACE`` sets in every namespace."""
+    client = _BusyClusterClient(nodes=8, records=0, latency_us=0, jitter_us=0, failure_pct=0)
+    await client.connect()
+    for ns in NAMESPACES:
+        for i in range(SETS_PER_NAMESPACE):
+            for pk in range(i % 5 + 1):
+                await client.put((ns, f"set_{i}", pk), {"n": pk})
+    return client
+
+
+async def _bench_client(udf_dir) -> FakeAsyncClient:
+    """A :class:`FakeAsyncClient` with the sample set, its indexes and ``UDF_MODULES`` registered modules."""
+    client = FakeAsyncClient(nodes=8, records=SCAN_RECORDS, latency_us=0, jitter_us=0, failure_pct=0)
+    await client.connect()
+    create = {
+        "numeric": client.index_integer_create,
+        "string": client.index_string_create,
+        "geo2dsphere": client.index_geo2dsphere_create,
+    }
+    for name, bin_name, index_type in SAMPLE_INDEXES:
+        await create[index_type]("test", "sample_set", bin_name, name)
+    for i in range(UDF_MODULES):
+        path = udf_dir / f"module_{i}.lua"
+        path.write_text(f"function f{i}(rec) return {i} end\n")
+        await client.udf_put(str(path))
+    return client
+
+
+@pytest.fixture(scope="module")
+def cluster_view() -> Iterator[Callable[[frozenset[str]], bytes]]:
+    """Render the ``GET /api/clusters/{conn_id}`` body for the given sections of a :func:`_cluster_client`."""
+    loop = asyncio.new_event_loop()
+    client = loop.run_until_complete(_cluster_client())
+    yield lambda sections: Tagged.of(loop.run_until_complete(_cluster_info(client, CONN_ID, sections))).body
+    loop.close()
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Callable[[str], httpx.Response]]:
+    """``GET`` a path through the full middleware stack, with ``conn-bench`` served by a :class:`FakeAsyncClient`."""
+    loop = asyncio.new_event_loop()
+    aerospike = loop.run_until_complete(_bench_client(tmp_path_factory.mktemp("udfs")))
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+    app.state.limiter.enabled = False
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+    with (
+        patch(
+            "aerospike_cluster_manager_api.dependencies.db.get_connection",
+            AsyncMock(return_value=PROFILE),
+        ),
+        patch(
+            "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+            AsyncMock(return_value=InstrumentedClient(aerospike, CONN_ID)),
+        ),
+    ):
+        yield lambda path: loop.run_until_complete(client.get(path))
+    loop.run_until_complete(client.aclose())
+    loop.close()
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
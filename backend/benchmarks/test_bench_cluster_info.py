@@ -0,0 +1,27 @@
+"""Building and rendering the cluster view: the full one against the ``include=`` summary.
+
+The cluster has 8 nodes reporting several hundred statistics each and 50 sets
+per namespace, so the numbers cover parsing, aggregation, model building and
+rendering, not the network.  Over a real network the summary also saves the
+``statistics`` and ``sets/`` fan-out round trips.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from aerospike_cluster_manager_api.routers.clusters import CLUSTER_SECTIONS
+
+
+@pytest.mark.parametrize(
+    "sections",
+    [pytest.param(CLUSTER_SECTIONS, id="full"), pytest.param(frozenset(), id="summary")],
+)
+def test_cluster_info(benchmark, cluster_view, sections):
+    assert benchmark(cluster_view, sections)
+
+
+def test_summary_leaves_out_statistics_and_sets(cluster_view):
+    full, summary = cluster_view(CLUSTER_SECTIONS), cluster_view(frozenset())
+    assert b"stat_399" in full and b"set_49" in full
+    assert b"stat_399" not in summary and b"set_49" not in summary
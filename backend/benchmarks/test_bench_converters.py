@@ -0,0 +1,66 @@
+"""Converting and rendering 10,000 query results."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from aerospike_py import Record
+from conftest import make_records
+from pydantic import TypeAdapter
+
+from aerospike_cluster_manager_api.converters import record_to_model, records_to_dicts
+from aerospike_cluster_manager_api.fast_json import FastJSONResponse
+from aerospike_cluster_manager_api.models.record import RecordListResponse
+
+COUNT = 10_000
+
+
+@pytest.fixture(scope="module")
+def records() -> list[Record]:
+    return make_records(COUNT)
+
+
+def test_record_to_model(benchmark, records):
+    result = benchmark(lambda: [record_to_model(r) for r in records])
+    assert len(result) == COUNT
+
+
+def test_records_to_dicts(benchmark, records):
+    result = benchmark(records_to_dicts, records)
+    assert len(result) == COUNT
+
+
+def test_render_record_list(benchmark, records):
+    def render() -> bytes:
+        value = RecordListResponse.model_construct(
+            records=records_to_dicts(records), total=COUNT, page=1, pageSize=COUNT, hasMore=False
+        )
+        return FastJSONResponse(value).body
+
+    assert benchmark(render)
+
+
+def _render_via_models(records: list[Record]) -> bytes:
+    """What endpoints did before ``fast_json``: validated models, FastAPI's response-model dump, ``json.dumps``."""
+    adapter = TypeAdapter(RecordListResponse)
+    value = RecordListResponse(
+        records=[record_to_model(r) for r in records], total=len(records), page=1, pageSize=len(records), hasMore=False
+    )
+    content = adapter.dump_python(adapter.validate_python(value), mode="json", by_alias=True)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def test_render_record_list_via_models(benchmark, records):
+    assert benchmark(_render_via_models, records)
+
+
+def test_both_renderings_agree():
+    # Bytes that are not UTF-8 fail the model path, so compare on text blobs.
+    records = make_records(100)
+    for record in records:
+        record.bins["blob"] = b"text"
+    value = RecordListResponse.model_construct(
+        records=records_to_dicts(records), total=100, page=1, pageSize=100, hasMore=False
+    )
+    assert json.loads(_render_via_models(records)) == json.loads(FastJSONResponse(value).body)
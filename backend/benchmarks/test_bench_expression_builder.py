@@ -0,0 +1,55 @@
+"""Compiling filter groups at the request size limits: 20 conditions per group, 50 per filter, 4 levels deep."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from conftest import make_group
+
+from aerospike_cluster_manager_api.expression_builder import build_expression, build_expression_uncached, clear_cache
+from aerospike_cluster_manager_api.models.query import MAX_FILTER_CONDITIONS, MAX_FILTER_DEPTH, FilterGroup
+
+
+def _nested(seed: int) -> FilterGroup:
+    """A filter using the whole condition budget: 10 + 10 + 10 + 20 conditions over four levels."""
+    group: FilterGroup | None = None
+    for level, size in enumerate([20, 10, 10, 10]):
+        flat = make_group(seed * 10 + level, size)
+        conditions = [c.model_copy(update={"bin": f"l{level}_{c.bin}"}) for c in flat.conditions]
+        group = FilterGroup(logic=flat.logic, conditions=conditions, groups=[group] if group else [])
+    assert group is not None
+    assert group.depth() == MAX_FILTER_DEPTH
+    assert group.condition_count() == MAX_FILTER_CONDITIONS
+    return group
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_flat_group_uncached(benchmark):
+    group = make_group(0, 20)
+    benchmark(build_expression_uncached, group)
+
+
+def test_nested_group_uncached(benchmark):
+    group = _nested(0)
+    benchmark(build_expression_uncached, group)
+
+
+def test_nested_group_cached(benchmark):
+    group = _nested(0)
+    expected = build_expression(group)
+    assert benchmark(build_expression, group) is expected
+
+
+def test_reordered_group_cached(benchmark):
+    """A UI that reorders conditions still hits the entry compiled for the original order."""
+    group = make_group(0, 20)
+    expected = build_expression(group)
+    reordered = FilterGroup(logic=group.logic, conditions=random.Random(1).sample(group.conditions, 20))
+    assert benchmark(build_expression, reordered) is expected
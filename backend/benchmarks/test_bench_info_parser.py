@@ -0,0 +1,80 @@
+"""Info reply parsing and multi-node aggregation on a 50-node cluster with 500 sets per namespace."""
+
+from __future__ import annotations
+
+import pytest
+
+from aerospike_cluster_manager_api.constants import NS_SUM_KEYS
+from aerospike_cluster_manager_api.info_parser import (
+    aggregate_node_kv,
+    aggregate_set_records,
+    parse_kv_pairs,
+    parse_records,
+)
+
+NODES = [f"BB9{i:013X}" for i in range(50)]
+SETS = 500
+STATISTICS = 1000
+
+
+def _statistics() -> str:
+    stats = {"cluster_size": len(NODES), "uptime": 86400, "client_connections": 12}
+    stats.update({f"stat_{i}": i * 7 for i in range(STATISTICS)})
+    return ";".join(f"{k}={v}" for k, v in stats.items())
+
+
+def _namespace(node: int) -> str:
+    stats = {
+        "objects": 100_000 + node,
+        "tombstones": node,
+        "memory_used_bytes": 1 << 30,
+        "memory-size": 4 << 30,
+        "device_used_bytes": 1 << 32,
+        "device-total-bytes": 1 << 34,
+        "replication-factor": 2,
+        "stop_writes": "false",
+        "hwm_breached": "false",
+    }
+    stats.update({f"ns_stat_{i}": i for i in range(300)})
+    return ";".join(f"{k}={v}" for k, v in stats.items())
+
+
+def _sets(node: int) -> str:
+    return ";".join(
+        f"ns=test:set=set_{i}:objects={i * 100 + node}:tombstones=0:memory_data_bytes={i * 4096}"
+        f":device_data_bytes=0:truncate_lut=0:sindexes=0:index_populating=false:stop-writes-count=0"
+        for i in range(SETS)
+    )
+
+
+@pytest.fixture(scope="module")
+def namespace_replies() -> list[tuple[str, int, str]]:
+    return [(name, 0, _namespace(i)) for i, name in enumerate(NODES)]
+
+
+@pytest.fixture(scope="module")
+def sets_replies() -> list[tuple[str, int, str]]:
+    return [(name, 0, _sets(i)) for i, name in enumerate(NODES)]
+
+
+def test_parse_kv_pairs_statistics(benchmark):
+    reply = _statistics()
+    result = benchmark(parse_kv_pairs, reply)
+    assert len(result) == STATISTICS + 3
+
+
+def test_parse_records_sets(benchmark):
+    reply = _sets(0)
+    result = benchmark(parse_records, reply)
+    assert len(result) == SETS
+
+
+def test_aggregate_node_kv_namespace(benchmark, namespace_replies):
+    result = benchmark(aggregate_node_kv, namespace_replies, keys_to_sum=NS_SUM_KEYS)
+    assert result["objects"] == str(sum(100_000 + i for i in range(len(NODES))))
+
+
+def test_aggregate_set_records(benchmark, sets_replies):
+    result = benchmark(aggregate_set_records, sets_replies, 2)
+    assert len(result) == SETS
+    assert all(s["node_count"] == len(NODES) for s in result)
@@ -0,0 +1,131 @@
+"""Building an AerospikeCluster CR from a fully populated request, and the detail view of a large CR."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aerospike_cluster_manager_api.models.k8s_cluster import CreateK8sClusterRequest
+from aerospike_cluster_manager_api.services.k8s_service import build_cr, extract_detail
+
+PODS = 64
+RACKS = 10
+
+
+def _create_request() -> CreateK8sClusterRequest:
+    return CreateK8sClusterRequest.model_validate(
+        {
+            "name": "bench",
+            "namespace": "aerospike",
+            "size": 8,
+            "image": "aerospike:ee-8.1.1.1",
+            "namespaces": [
+                {
+                    "name": f"ns{i}",
+                    "replicationFactor": 2,
+                    "storageEngine": {"type": "device", "filesize": 8 << 30},
+                }
+                for i in range(5)
+            ],
+            "storage": {
+                "volumes": [
+                    {
+                        "name": f"data-{i}",
+                        "source": "persistentVolume",
+                        "persistentVolume": {"storageClass": "ssd", "size": "100Gi"},
+                        "aerospike": {"path": f"/opt/aerospike/data{i}"},
+                        "cascadeDelete": True,
+                    }
+                    for i in range(4)
+                ],
+            },
+            "resources": {"requests": {"cpu": "2", "memory": "8Gi"}, "limits": {"cpu": "4", "memory": "16Gi"}},
+            "monitoring": {"enabled": True, "port": 9145, "serviceMonitor": {"enabled": True, "interval": "30s"}},
+            "acl": {
+                "enabled": True,
+                "roles": [{"name": f"role-{i}", "privileges": ["read-write"]} for i in range(10)],
+                "users": [
+                    {"name": f"user-{i}", "secretName": f"user-{i}-secret", "roles": [f"role-{i}"]} for i in range(10)
+                ],
+            },
+            "rollingUpdate": {"batchSize": 2, "maxUnavailable": "25%"},
+            "rackConfig": {
+                "racks": [{"id": i + 1, "zone": f"zone-{i % 3}"} for i in range(RACKS)],
+                "namespaces": ["ns0", "ns1"],
+            },
+            "podScheduling": {
+                "nodeSelector": {"pool": "aerospike"},
+                "tolerations": [
+                    {"key": f"dedicated-{i}", "operator": "Equal", "value": "aerospike", "effect": "NoSchedule"}
+                    for i in range(5)
+                ],
+            },
+        }
+    )
+
+
+def _pod_name(i: int) -> str:
+    return f"bench-{i % RACKS + 1}-{i // RACKS}"
+
+
+def _large_cr() -> dict[str, Any]:
+    return {
+        "metadata": {"name": "bench", "namespace": "aerospike", "creationTimestamp": "2025-01-01T00:00:00Z"},
+        "spec": {
+            "size": PODS,
+            "image": "aerospike:ee-8.1.1.1",
+            "operations": [{"id": "op-1", "kind": "WarmRestart", "podList": [_pod_name(i) for i in range(PODS)]}],
+        },
+        "status": {
+            "phase": "InProgress",
+            "aerospikeClusterSize": PODS,
+            "pods": {
+                _pod_name(i): {
+                    "nodeID": f"BB9{i:013X}",
+                    "rack": i % RACKS + 1,
+                    "configHash": f"{i:040x}",
+                    "podSpecHash": f"{i * 7:040x}",
+                    "dynamicConfigStatus": "Applied",
+                    "accessEndpoints": [f"10.0.{i // 250}.{i % 250}:3000"],
+                    "readinessGateSatisfied": True,
+                }
+                for i in range(PODS)
+            },
+            "operationStatus": {
+                "id": "op-1",
+                "kind": "WarmRestart",
+                "phase": "InProgress",
+                "completedPods": [_pod_name(i) for i in range(PODS // 2)],
+            },
+            "conditions": [
+                {"type": f"Condition{i}", "status": "True", "reason": "Reconciled", "message": "ok"} for i in range(10)
+            ],
+            "pendingRestartPods": [_pod_name(i) for i in range(PODS // 2, PODS)],
+        },
+    }
+
+
+def _pods() -> list[dict[str, Any]]:
+    return [
+        {
+            "name": _pod_name(i),
+            "podIP": f"10.0.{i // 250}.{i % 250}",
+            "hostIP": f"192.168.0.{i % 250}",
+            "isReady": True,
+            "phase": "Running",
+            "image": "aerospike:ee-8.1.1.1",
+        }
+        for i in range(PODS)
+    ]
+
+
+def test_build_cr(benchmark):
+    req = _create_request()
+    cr = benchmark(build_cr, req)
+    assert len(cr["spec"]["aerospikeConfig"]["namespaces"]) == 5
+
+
+def test_extract_detail(benchmark):
+    item = _large_cr()
+    pods = _pods()
+    detail = benchmark(extract_detail, item, pods)
+    assert len(detail.pods) == PODS
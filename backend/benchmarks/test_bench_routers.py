@@ -0,0 +1,30 @@
+"""Full request round trips through the middleware stack, routing, dependencies and rendering.
+
+The Aerospike client is an in-memory :class:`FakeAsyncClient` with no injected
+latency, so the numbers are the API's own overhead per request.
+"""
+
+from __future__ import annotations
+
+import pytest
+from conftest import CONN_ID, SCAN_RECORDS
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param(f"/api/clusters/{CONN_ID}", id="cluster-full"),
+        pytest.param(f"/api/clusters/{CONN_ID}?include=", id="cluster-summary"),
+        pytest.param(f"/api/records/{CONN_ID}?ns=test&set=sample_set&pageSize=500", id="records-page"),
+        pytest.param(f"/api/records/{CONN_ID}/detail?ns=test&set=sample_set&pk=42", id="record-detail"),
+        pytest.param(f"/api/indexes/{CONN_ID}", id="indexes"),
+        pytest.param(f"/api/udfs/{CONN_ID}", id="udfs"),
+    ],
+)
+def test_get(benchmark, api, path):
+    response = benchmark(api, path)
+    assert response.status_code == 200, response.text
+
+
+def test_records_page_total(api):
+    assert api(f"/api/records/{CONN_ID}?ns=test&set=sample_set&pageSize=500").json()["total"] == SCAN_RECORDS
@@ -0,0 +1,138 @@
+"""Asynchronous, batched audit log of mutating operations.
+
+Handlers call :meth:`AuditLog.record`, which only appends to a bounded
+in-memory queue and never waits on the database.  A background task drains
+the queue and writes entries in batches (``COPY`` on PostgreSQL).  When the
+queue is full new entries are dropped and counted, so a slow or unavailable
+database can never add latency to the request path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from aerospike_cluster_manager_api import config, db
+from aerospike_cluster_manager_api.request_context import request_id_var
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEntry:
+    action: str
+    target: str
+    connection_id: str | None = None
+    detail: dict[str, Any] = field(default_factory=dict)
+    request_id: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+class AuditLog:
+    """Bounded queue plus background batch writer for :class:`AuditEntry` rows."""
+
+    def __init__(self, *, enabled: bool, queue_size: int, batch_size: int, flush_interval: float) -> None:
+        self._enabled = enabled
+        self._queue: asyncio.Queue[AuditEntry] = asyncio.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._task: asyncio.Task[None] | None = None
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def record(
+        self,
+        action: str,
+        target: str,
+        *,
+        connection_id: str | None = None,
+        detail: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue an audit entry without blocking. Drops (and counts) it when the queue is full."""
+        if not self._enabled:
+            return
+        entry = AuditEntry(
+            action=action,
+            target=target,
+            connection_id=connection_id,
+            detail=detail or {},
+            request_id=request_id_var.get(),
+        )
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning("Audit queue full, %d entries dropped so far", self.dropped)
+            return
+        self.enqueued += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def _drain(self, batch: list[AuditEntry]) -> None:
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def _write(self, batch: list[AuditEntry]) -> None:
+        try:
+            await db.insert_audit_entries(batch)
+            self.written += len(batch)
+        except Exception:
+            self.failed += len(batch)
+            logger.exception("Failed to write %d audit entries", len(batch))
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                # Give concurrent writers a moment to fill the batch before flushing.
+                await asyncio.sleep(self._flush_interval)
+            finally:
+                # Also runs on cancellation (shutdown) so the batch in hand is not lost.
+                self._drain(batch)
+                await asyncio.shield(self._write(batch))
+
+    async def flush(self) -> None:
+        """Write everything currently queued."""
+        while not self._queue.empty():
+            batch: list[AuditEntry] = []
+            self._drain(batch)
+            await self._write(batch)
+
+    def start(self) -> None:
+        if not self._enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="audit-log-writer")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+
+audit_log = AuditLog(
+    enabled=config.AUDIT_LOG_ENABLED,
+    queue_size=config.AUDIT_QUEUE_SIZE,
+    batch_size=config.AUDIT_BATCH_SIZE,
+    flush_interval=config.AUDIT_FLUSH_INTERVAL_MS / 1000,
+)
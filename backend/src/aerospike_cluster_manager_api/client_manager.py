@@ -1,28 +1,57 @@
 """Aerospike async client pool manager.
 
 Manages one AsyncClient per connection-id, with asyncio.Lock()
-for safe concurrent access in the async event loop.
+for safe concurrent access in the async event loop.  With several workers
+only the coordinator holds clients; the other workers get
+:class:`~coordinator.RemoteClient` proxies that run each call there.
 """
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import inspect
 from typing import Any
 
 import aerospike_py
 from aerospike_py.exception import AerospikeError
 
-from aerospike_cluster_manager_api import db
+from aerospike_cluster_manager_api import config, db, tracing
+from aerospike_cluster_manager_api.coordinator import Coordinator, RemoteClient, coordinator
+from aerospike_cluster_manager_api.fake_client import FakeAsyncClient
+from aerospike_cluster_manager_api.instrumentation import InstrumentedClient
 from aerospike_cluster_manager_api.utils import parse_host_port
 
 
+def new_client(as_config: dict[str, Any]) -> aerospike_py.AsyncClient:
+    """Create an unconnected client for *as_config*; a :class:`FakeAsyncClient` when ``AEROSPIKE_CLIENT=fake``."""
+    if config.AEROSPIKE_CLIENT == "fake":
+        return FakeAsyncClient(as_config)
+    return aerospike_py.AsyncClient(as_config)
+
+
 class ClientManager:
-    def __init__(self) -> None:
+    def __init__(self, coordinator: Coordinator = coordinator) -> None:
+        self._coordinator = coordinator
         self._clients: dict[str, aerospike_py.AsyncClient] = {}
+        self._remotes: dict[str, RemoteClient] = {}
         self._lock = asyncio.Lock()
 
+    async def start(self) -> None:
+        """Take part in the coordinator election (no-op with a single worker)."""
+        await self._coordinator.start(self)
+
     async def get_client(self, conn_id: str) -> aerospike_py.AsyncClient:
+        """Return the connected client for *conn_id*, wrapped to record per-call latency."""
+        if not self._coordinator.is_local:
+            remote = self._remotes.get(conn_id)
+            if remote is None:
+                remote = await RemoteClient(conn_id, self._coordinator).connect()
+                self._remotes[conn_id] = remote
+            return InstrumentedClient(remote, conn_id)
+        return InstrumentedClient(await self._local_client(conn_id), conn_id)
+
+    async def _local_client(self, conn_id: str) -> aerospike_py.AsyncClient:
         async with self._lock:
             client = self._clients.get(conn_id)
             if client is not None and client.is_connected():
@@ -37,9 +66,15 @@ class ClientManager:
         if profile.username and profile.password:
             as_config["user"] = profile.username
             as_config["password"] = profile.password
+        if profile.rackId is not None:
+            # Rack the manager runs in, for ``replica=prefer_rack`` read routing.  aerospike_py 0.14.4
+            # does not read this key (it is not in ``ClientConfig`` and a bad value is not rejected),
+            # so until it does, prefer_rack reads are not steered to this rack.
+            as_config["rack_ids"] = [profile.rackId]
 
-        client = aerospike_py.AsyncClient(as_config)
-        await client.connect()
+        client = new_client(as_config)
+        with tracing.span("aerospike connect", {"connection.id": conn_id, "aerospike.seed_hosts": len(hosts)}):
+            await client.connect()
 
         async with self._lock:
             old = self._clients.get(conn_id)
@@ -50,7 +85,32 @@ class ClientManager:
 
         return client
 
+    async def execute(
+        self, conn_id: str, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Any, list[str]]:
+        """Run one forwarded :class:`RemoteClient` call on this worker's client (coordinator side)."""
+        client = await self._local_client(conn_id)
+        if method == "query":
+            namespace, set_name, bins, predicate = args
+            query = client.query(namespace, set_name)
+            if bins:
+                query.select(*bins)
+            if predicate is not None:
+                query.where(predicate)
+            result = await query.results(kwargs.get("policy"))
+        else:
+            if method.startswith("_"):
+                raise AttributeError(method)
+            result = getattr(client, method)(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+        return result, client.get_node_names()
+
     async def close_client(self, conn_id: str) -> None:
+        if not self._coordinator.is_local:
+            self._remotes.pop(conn_id, None)
+            await self._coordinator.close(conn_id)
+            return
         async with self._lock:
             client = self._clients.pop(conn_id, None)
         if client is not None:
@@ -58,6 +118,8 @@ class ClientManager:
                 await client.close()
 
     async def close_all(self) -> None:
+        await self._coordinator.stop()
+        self._remotes.clear()
         async with self._lock:
             clients = list(self._clients.values())
             self._clients.clear()
@@ -0,0 +1,218 @@
+"""Content-negotiated response compression (zstd, brotli, gzip).
+
+:class:`CompressionMiddleware` picks the encoding from ``Accept-Encoding``
+(highest q-value first, ties broken by ``COMPRESSION_ENCODINGS`` order) and
+compresses JSON and text responses of at least ``COMPRESSION_MIN_BYTES``.
+
+Bodies sent in one message (ordinary JSON responses) are compressed in one
+go and get an exact ``Content-Length``.  Streamed bodies (``StreamingResponse``)
+are buffered only until the threshold is reached, then compressed chunk by
+chunk; each chunk is flushed so the client receives data as it is produced.
+
+brotli and zstd come from the optional ``brotli`` / ``zstandard`` packages
+(``pip install aerospike-cluster-manager-api[compression]``); when they are
+not installed only gzip is offered.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 4  # brotli's default of 11 is far too slow for live responses
+_ZSTD_LEVEL = 3
+
+_COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+
+class _Gzip:
+    def __init__(self) -> None:
+        self._obj = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _Brotli:
+    def __init__(self) -> None:
+        self._obj = brotli.Compressor(quality=_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _Zstd:
+    def __init__(self) -> None:
+        self._obj = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+_CODECS: dict[str, Callable[[], Any]] = {"gzip": _Gzip}
+if brotli is not None:
+    _CODECS["br"] = _Brotli
+if zstandard is not None:
+    _CODECS["zstd"] = _Zstd
+
+
+def available_encodings(preferred: list[str]) -> list[str]:
+    """The configured encodings that are installed, in preference order."""
+    return [e for e in preferred if e in _CODECS]
+
+
+def negotiate(accept_encoding: str, offered: list[str]) -> str | None:
+    """Choose an encoding from *offered* for an ``Accept-Encoding`` header, or ``None`` for identity."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in offered:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with the best encoding the client accepts."""
+
+    def __init__(self, app: ASGIApp, *, encodings: list[str], minimum_size: int = 1024) -> None:
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponse(encoding, self.minimum_size, send)(self.app, scope, receive)
+
+
+class _CompressedResponse:
+    def __init__(self, encoding: str, minimum_size: int, send: Send) -> None:
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = send
+        self.start: Message | None = None
+        self.buffer: list[bytes] = []
+        self.buffered = 0
+        self.codec: Any = None
+        self.passthrough = False
+
+    async def __call__(self, app: ASGIApp, scope: Scope, receive: Receive) -> None:
+        await app(scope, receive, self.on_send)
+
+    def _eligible(self, start: Message) -> bool:
+        headers = Headers(raw=start["headers"])
+        if start["status"] < 200 or start["status"] in (204, 304) or "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", ""):
+            return False
+        content_type = headers.get("content-type", "")
+        # Server-sent events must reach the client as they are produced, not once a threshold is buffered.
+        return content_type.startswith(_COMPRESSIBLE_TYPES) and not content_type.startswith("text/event-stream")
+
+    async def _start_compressed(self, *, length: int | None) -> None:
+        assert self.start is not None
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The compressed bytes differ from the identity representation the strong ETag names.
+            headers["ETag"] = f"W/{etag}"
+        await self.send(self.start)
+
+    async def _flush_identity(self, more_body: bool) -> None:
+        assert self.start is not None
+        self.passthrough = True
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": b"".join(self.buffer), "more_body": more_body})
+        self.buffer.clear()
+
+    async def on_send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+        if message["type"] == "http.response.start":
+            self.start = message
+            if not self._eligible(message):
+                self.passthrough = True
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.codec is not None:
+            chunk = self.codec.compress(body) if body else b""
+            if not more_body:
+                chunk += self.codec.finish()
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        self.buffer.append(body)
+        self.buffered += len(body)
+        if not more_body:
+            if self.buffered < self.minimum_size:
+                await self._flush_identity(False)
+                return
+            codec = _CODECS[self.encoding]()
+            compressed = codec.compress(b"".join(self.buffer)) + codec.finish()
+            await self._start_compressed(length=len(compressed))
+            await self.send({"type": "http.response.body", "body": compressed, "more_body": False})
+        elif self.buffered >= self.minimum_size:
+            # Streaming body past the threshold: compress from here on, chunk by chunk.
+            self.codec = _CODECS[self.encoding]()
+            await self._start_compressed(length=None)
+            chunk = self.codec.compress(b"".join(self.buffer))
+            self.buffer.clear()
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": True})
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import tempfile
 
 
 def _get_int(name: str, default: int) -> int:
@@ -27,3 +28,95 @@ LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")  # "text" or "json"
 
 K8S_MANAGEMENT_ENABLED: bool = os.getenv("K8S_MANAGEMENT_ENABLED", "false").lower() in ("true", "1", "yes")
+
+# Background connection health monitor (0 disables periodic probing)
+HEALTH_CHECK_INTERVAL_SECONDS: int = _get_int("HEALTH_CHECK_INTERVAL_SECONDS", 30)
+HEALTH_CHECK_CONCURRENCY: int = _get_int("HEALTH_CHECK_CONCURRENCY", 16)
+
+# Multi-worker mode: uvicorn reads WEB_CONCURRENCY as its default --workers value.
+WORKERS: int = _get_int("WEB_CONCURRENCY", 1)
+# Must be private to this user (mode 0700, checked at startup); defaults under the per-user runtime dir
+WORKER_STATE_DIR: str = os.getenv(
+    "WORKER_STATE_DIR",
+    os.path.join(os.environ["XDG_RUNTIME_DIR"], "aerospike-cluster-manager")
+    if os.getenv("XDG_RUNTIME_DIR")
+    else os.path.join(tempfile.gettempdir(), f"aerospike-cluster-manager-{os.getuid()}"),
+)
+
+# slowapi/limits storage backend. With several workers the default "memory://" is kept
+# by the coordinator worker for all of them; an external store (e.g. "redis://host:6379")
+# also shares limits across replicas.
+RATE_LIMIT_STORAGE_URI: str = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+
+# Audit log of mutating operations (written asynchronously in batches)
+AUDIT_LOG_ENABLED: bool = os.getenv("AUDIT_LOG_ENABLED", "true").lower() in ("true", "1", "yes")
+AUDIT_QUEUE_SIZE: int = _get_int("AUDIT_QUEUE_SIZE", 10_000)
+AUDIT_BATCH_SIZE: int = _get_int("AUDIT_BATCH_SIZE", 500)
+AUDIT_FLUSH_INTERVAL_MS: int = _get_int("AUDIT_FLUSH_INTERVAL_MS", 1000)
+
+# Query history retention: rows older than this many days, and all but the newest
+# QUERY_HISTORY_MAX_ROWS per connection, are pruned as new executions are recorded (0 disables)
+QUERY_HISTORY_RETENTION_DAYS: int = _get_int("QUERY_HISTORY_RETENTION_DAYS", 30)
+QUERY_HISTORY_MAX_ROWS: int = _get_int("QUERY_HISTORY_MAX_ROWS", 1000)
+QUERY_HISTORY_PRUNE_INTERVAL_SECONDS: int = _get_int("QUERY_HISTORY_PRUNE_INTERVAL_SECONDS", 60)
+
+# Saved queries: a result snapshot younger than this is served instead of rescanning (0 disables)
+SAVED_QUERY_SNAPSHOT_TTL_SECONDS: int = _get_int("SAVED_QUERY_SNAPSHOT_TTL_SECONDS", 300)
+
+# Full cluster views (with per-node statistics) are rendered at most once per this many
+# seconds per connection, so polls in between revalidate against one ETag (0 disables)
+CLUSTER_SNAPSHOT_TTL_SECONDS: int = _get_int("CLUSTER_SNAPSHOT_TTL_SECONDS", 10)
+
+# Query result cache for /query and /records/{conn_id}/filter (TTL 0 disables)
+QUERY_CACHE_TTL_SECONDS: int = _get_int("QUERY_CACHE_TTL_SECONDS", 30)
+QUERY_CACHE_MAX_BYTES: int = _get_int("QUERY_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+# Maximum number of compiled filter expressions kept in memory (0 disables the cache)
+EXPRESSION_CACHE_SIZE: int = _get_int("EXPRESSION_CACHE_SIZE", 1024)
+
+# Scan throttling: cluster-wide records/second cap applied to every scan (0 = unlimited)
+SCAN_MAX_RECORDS_PER_SECOND: int = _get_int("SCAN_MAX_RECORDS_PER_SECOND", 0)
+# Rate used for lowPriority scans that do not set recordsPerSecond
+SCAN_LOW_PRIORITY_RECORDS_PER_SECOND: int = _get_int("SCAN_LOW_PRIORITY_RECORDS_PER_SECOND", 1000)
+
+# Scan admission control: concurrent scan-type operations per connection and worker (0 = unlimited)
+SCAN_MAX_CONCURRENT_PER_CONNECTION: int = _get_int("SCAN_MAX_CONCURRENT_PER_CONNECTION", 4)
+SCAN_QUEUE_MAX: int = _get_int("SCAN_QUEUE_MAX", 100)
+SCAN_QUEUE_TIMEOUT_SECONDS: int = _get_int("SCAN_QUEUE_TIMEOUT_SECONDS", 60)
+
+# Response compression: encodings offered in server preference order (empty disables).
+# br and zstd need the optional "compression" extra (brotli, zstandard); gzip is always available.
+COMPRESSION_ENCODINGS: list[str] = [
+    e.strip().lower() for e in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if e.strip()
+]
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_BYTES: int = _get_int("COMPRESSION_MIN_BYTES", 1024)
+
+# Requests slower than this are logged with their Aerospike / database / serialization breakdown (0 disables)
+SLOW_REQUEST_MS: int = _get_int("SLOW_REQUEST_MS", 1000)
+
+# OpenTelemetry tracing: OTLP/HTTP collector base URL (empty disables tracing; needs the "tracing" extra)
+OTEL_EXPORTER_OTLP_ENDPOINT: str = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "")
+OTEL_SERVICE_NAME: str = os.getenv("OTEL_SERVICE_NAME", "aerospike-cluster-manager-api")
+
+# On-demand profiling of requests sent with "X-Profile: 1" and "X-Profile-Token" (empty token disables)
+PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+# Profiled requests allowed across all workers sharing RATE_LIMIT_STORAGE_URI
+PROFILING_RATE_LIMIT: str = os.getenv("PROFILING_RATE_LIMIT", "6/minute")
+PROFILE_DIR: str = os.getenv("PROFILE_DIR", os.path.join(WORKER_STATE_DIR, "profiles"))
+# Newest profiles kept in PROFILE_DIR
+PROFILE_KEEP: int = _get_int("PROFILE_KEEP", 50)
+
+# Aerospike client implementation: "native" (aerospike_py) or "fake", an in-memory stand-in
+# for load and benchmark testing without a cluster (see fake_client.py)
+AEROSPIKE_CLIENT: str = os.getenv("AEROSPIKE_CLIENT", "native").lower()
+if AEROSPIKE_CLIENT not in ("native", "fake"):
+    raise ValueError(f"Environment variable AEROSPIKE_CLIENT must be 'native' or 'fake', got: {AEROSPIKE_CLIENT!r}")
+FAKE_AEROSPIKE_NODES: int = _get_int("FAKE_AEROSPIKE_NODES", 3)
+# Records from the sample data generator preloaded into test.sample_set of every fake connection
+FAKE_AEROSPIKE_RECORDS: int = _get_int("FAKE_AEROSPIKE_RECORDS", 0)
+# Simulated round trip per call: latency +/- uniform jitter, then an injected timeout with the given probability
+FAKE_AEROSPIKE_LATENCY_US: int = _get_int("FAKE_AEROSPIKE_LATENCY_US", 0)
+FAKE_AEROSPIKE_JITTER_US: int = _get_int("FAKE_AEROSPIKE_JITTER_US", 0)
+FAKE_AEROSPIKE_FAILURE_PCT: int = _get_int("FAKE_AEROSPIKE_FAILURE_PCT", 0)
+FAKE_AEROSPIKE_SEED: int = _get_int("FAKE_AEROSPIKE_SEED", 0)
@@ -13,6 +13,7 @@ INFO_SERVICE = "service"
 INFO_STATUS = "status"
 INFO_NODE = "node"
 INFO_UDF_LIST = "udf-list"
+INFO_QUERY_SHOW = "query-show"
 
 
 def info_namespace(ns: str) -> str:
@@ -27,6 +28,10 @@ def info_sindex(ns: str) -> str:
     return f"sindex/{ns}"
 
 
+def info_sindex_stat(ns: str, index_name: str) -> str:
+    return f"sindex-stat:namespace={ns};indexname={index_name}"
+
+
 def info_bins(ns: str) -> str:
     return f"bins/{ns}"
 
@@ -67,3 +72,14 @@ MAX_QUERY_RECORDS = 10_000
 POLICY_READ = {"key": aerospike_py.POLICY_KEY_SEND}
 POLICY_WRITE = {"key": aerospike_py.POLICY_KEY_SEND}
 POLICY_QUERY = {"total_timeout": 30000, "key": aerospike_py.POLICY_KEY_SEND}
+
+# Read routing options (``replica`` / ``read_mode_ap`` policy values) by API name
+REPLICA_POLICIES = {
+    "master": aerospike_py.POLICY_REPLICA_MASTER,
+    "sequence": aerospike_py.POLICY_REPLICA_SEQUENCE,
+    "prefer_rack": aerospike_py.POLICY_REPLICA_PREFER_RACK,
+}
+READ_MODE_AP_POLICIES = {
+    "one": aerospike_py.POLICY_READ_MODE_AP_ONE,
+    "all": aerospike_py.POLICY_READ_MODE_AP_ALL,
+}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from aerospike_py import Record
@@ -9,14 +10,7 @@ from aerospike_py import Record
 from aerospike_cluster_manager_api.models.record import AerospikeRecord, RecordKey, RecordMeta
 
 
-def record_to_model(rec: Record) -> AerospikeRecord:
-    """Convert an aerospike-py :class:`Record` to :class:`AerospikeRecord`.
-
-    ``Record`` is a NamedTuple with ``key``, ``meta``, and ``bins`` attributes.
-    ``key``: ``(namespace, set, pk, digest_bytes)``
-    ``meta``: ``{"gen": int, "ttl": int}``
-    ``bins``: ``{bin_name: value, ...}``
-    """
+def _parts(rec: Record) -> tuple[str, str, str, str | None, int, int, dict[str, Any]]:
     key_tuple = rec.key if rec.key is not None else ()
     meta = rec.meta
     bins: dict[str, Any] = rec.bins or {}
@@ -39,16 +33,41 @@ def record_to_model(rec: Record) -> AerospikeRecord:
         gen = 0
         ttl = 0
 
+    return ns, set_name or "", str(pk) if pk is not None else "", digest_hex, gen, ttl, bins
+
+
+def record_to_model(rec: Record) -> AerospikeRecord:
+    """Convert an aerospike-py :class:`Record` to :class:`AerospikeRecord`.
+
+    ``Record`` is a NamedTuple with ``key``, ``meta``, and ``bins`` attributes.
+    ``key``: ``(namespace, set, pk, digest_bytes)``
+    ``meta``: ``{"gen": int, "ttl": int}``
+    ``bins``: ``{bin_name: value, ...}``
+    """
+    ns, set_name, pk, digest, gen, ttl, bins = _parts(rec)
     return AerospikeRecord(
-        key=RecordKey(
-            namespace=ns,
-            set=set_name or "",
-            pk=str(pk) if pk is not None else "",
-            digest=digest_hex,
-        ),
-        meta=RecordMeta(
-            generation=gen,
-            ttl=ttl,
-        ),
+        key=RecordKey(namespace=ns, set=set_name, pk=pk, digest=digest),
+        meta=RecordMeta(generation=gen, ttl=ttl),
         bins=bins,
     )
+
+
+def records_to_dicts(recs: Iterable[Record]) -> list[dict[str, Any]]:
+    """Convert many records to plain dicts shaped like :class:`AerospikeRecord`, without validation.
+
+    Used for record pages and query results, which are rendered by
+    :mod:`fast_json`; building three models per record costs several times
+    more than the scan that produced it.  The values come straight from the
+    server, so the field constraints :func:`record_to_model` checks cannot fail.
+    """
+    out: list[dict[str, Any]] = []
+    for rec in recs:
+        ns, set_name, pk, digest, gen, ttl, bins = _parts(rec)
+        out.append(
+            {
+                "key": {"namespace": ns, "set": set_name, "pk": pk, "digest": digest},
+                "meta": {"generation": gen, "ttl": ttl, "lastUpdateMs": None},
+                "bins": bins,
+            }
+        )
+    return out
@@ -0,0 +1,744 @@
+"""Cluster clients and rate-limit counters held by the coordinator worker.
+
+With ``WEB_CONCURRENCY > 1`` every uvicorn worker is a separate process.  So
+that N workers do not open N copies of every cluster connection, only the
+coordinator (the worker holding the :mod:`worker_state` lock) keeps Aerospike
+clients.  It serves two Unix sockets in ``WORKER_STATE_DIR``:
+
+* ``coordinator.sock`` (on the event loop): the other workers'
+  :class:`RemoteClient` proxies send each client call there and the
+  coordinator runs it on its own client.  Identical concurrent info reads from
+  several workers share one round trip to the cluster, and query results come
+  back in pages of ``_QUERY_PAGE_RECORDS`` records.
+* ``ratelimit.sock`` (on a thread, so it answers while the event loop is
+  busy): :class:`CoordinatorStorage` keeps the slowapi counters in the
+  coordinator's memory, so limits hold across workers without Redis.  A
+  worker that gets no answer within 50 ms counts locally for a few seconds.
+
+Frames are length-prefixed JSON objects with a fixed set of fields (see
+:func:`_encode` for how bytes, tuples and Aerospike result tuples are tagged),
+so a frame can carry data but never code.  :class:`WorkerState` refuses a
+state directory that is not owned by this user with mode 0700, and the sockets
+are bound under a 0177 umask, so only processes of the same user can connect.
+Aerospike exceptions travel as class name and message and are raised again as
+the same class in the calling worker.
+
+Workers contend for the lock every second.  When the coordinator exits, the
+first worker whose call cannot reach it takes over and runs the call itself;
+clients and counters start afresh in the new coordinator.  A call that was in
+flight when the coordinator died fails with :class:`CoordinatorUnavailable`.
+
+Still per worker: the query cache, single-flight coalescing of whole views,
+scan admission and throttling, the filter expression cache and the latency
+histograms.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import builtins
+import contextlib
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, ClassVar, Protocol
+
+import orjson
+from aerospike_py import exception as aerospike_exception
+from aerospike_py import types as aerospike_types
+from aerospike_py.exception import ClusterError
+from limits.storage import MemoryStorage, Storage
+
+from aerospike_cluster_manager_api.constants import (
+    INFO_BUILD,
+    INFO_EDITION,
+    INFO_NAMESPACES,
+    INFO_NODE,
+    INFO_QUERY_SHOW,
+    INFO_SERVICE,
+    INFO_STATISTICS,
+    INFO_STATUS,
+    INFO_UDF_LIST,
+)
+from aerospike_cluster_manager_api.singleflight import SingleFlight
+from aerospike_cluster_manager_api.worker_state import WorkerState, worker_state
+
+logger = logging.getLogger(__name__)
+
+_CLIENT_SOCKET = "coordinator.sock"
+_LIMITS_SOCKET = "ratelimit.sock"
+_HEADER = struct.Struct("!I")
+
+_ELECTION_INTERVAL_SECONDS = 1.0
+# A worker whose coordinator is gone retries for about a second while a new one starts serving
+_CONNECT_ATTEMPTS = 20
+_CONNECT_BACKOFF_SECONDS = 0.05
+_MAX_IDLE_CONNECTIONS = 32
+# Query results are sent in frames of this many records rather than one frame per scan
+_QUERY_PAGE_RECORDS = 1000
+# Rate-limit lookups block the caller's event loop: give up quickly, then count locally for a while
+_LIMITS_TIMEOUT_SECONDS = 0.05
+_LIMITS_RETRY_SECONDS = 5.0
+
+# Read-only info commands that concurrent callers from several workers may share
+_SHARED_INFO_COMMANDS = frozenset(
+    {
+        INFO_NAMESPACES,
+        INFO_STATISTICS,
+        INFO_BUILD,
+        INFO_EDITION,
+        INFO_SERVICE,
+        INFO_STATUS,
+        INFO_NODE,
+        INFO_UDF_LIST,
+        INFO_QUERY_SHOW,
+    }
+)
+_SHARED_INFO_PREFIXES = ("namespace/", "sets/", "sindex/", "bins/", "sindex-stat:")
+
+_LIMITS_METHODS = frozenset({"incr", "get", "get_expiry", "check", "reset", "clear"})
+
+# Client result tuples rebuilt by name on the receiving side; any other tuple arrives as a plain tuple
+_NAMED_TUPLES: dict[str, type[tuple[Any, ...]]] = {
+    cls.__name__: cls
+    for cls in (
+        aerospike_types.AerospikeKey,
+        aerospike_types.BatchRecord,
+        aerospike_types.BatchWriteResult,
+        aerospike_types.BinTuple,
+        aerospike_types.ExistsResult,
+        aerospike_types.InfoNodeResult,
+        aerospike_types.OperateOrderedResult,
+        aerospike_types.Record,
+        aerospike_types.RecordMetadata,
+    )
+}
+
+
+class CoordinatorUnavailable(ClusterError):
+    """The coordinator worker could not be reached, or went away during a call."""
+
+
+PageCallback = Callable[[list[Any]], Any]
+
+
+class Executor(Protocol):
+    """What the coordinator runs calls on (the worker's :class:`~client_manager.ClientManager`)."""
+
+    async def execute(
+        self, conn_id: str, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Any, list[str]]: ...
+
+    async def close_client(self, conn_id: str) -> None: ...
+
+
+# ---------------------------------------------------------------------------
+# Framing
+# ---------------------------------------------------------------------------
+
+
+def _encode(value: Any) -> Any:
+    """Convert a client argument or result to JSON values.
+
+    Objects whose keys are all strings not starting with ``$`` stay objects;
+    everything JSON has no type for becomes a one-key ``$`` object:
+    ``{"$bytes": base64}``, ``{"$tuple": [...]}``, ``{"$named": [name, [...]]}``
+    and ``{"$map": [[key, value], ...]}``.
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, dict):
+        if all(isinstance(k, str) and not k.startswith("$") for k in value):
+            return {k: _encode(v) for k, v in value.items()}
+        return {"$map": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, tuple):
+        items = [_encode(v) for v in value]
+        name = type(value).__name__
+        return {"$named": [name, items]} if _NAMED_TUPLES.get(name) is type(value) else {"$tuple": items}
+    if isinstance(value, (bytes, bytearray)):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Cannot send a {type(value).__name__} to another worker")
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of :func:`_encode`; rejects unknown ``$`` tags."""
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) != 1 or not next(iter(value)).startswith("$"):
+        return {k: _decode(v) for k, v in value.items()}
+    ((tag, payload),) = value.items()
+    if tag == "$bytes" and isinstance(payload, str):
+        return base64.b64decode(payload, validate=True)
+    if tag == "$tuple" and isinstance(payload, list):
+        return tuple(_decode(v) for v in payload)
+    if tag == "$map" and isinstance(payload, list):
+        return {_hashable(_decode(k)): _decode(v) for k, v in payload}
+    if tag == "$named" and isinstance(payload, list) and len(payload) == 2 and payload[0] in _NAMED_TUPLES:
+        return _NAMED_TUPLES[payload[0]](*(_decode(v) for v in payload[1]))
+    raise ValueError(f"Malformed coordinator frame: unknown value tag {tag!r}")
+
+
+def _hashable(key: Any) -> Any:
+    if isinstance(key, (list, dict)):
+        raise ValueError("Malformed coordinator frame: unhashable map key")
+    return key
+
+
+def _field(message: Any, name: str, kind: type | tuple[type, ...]) -> Any:
+    """Field *name* of a decoded frame, checked against the protocol's schema."""
+    value = message.get(name) if isinstance(message, dict) else None
+    if not isinstance(value, kind):
+        raise ValueError(f"Malformed coordinator frame: field {name!r} missing or of the wrong type")
+    return value
+
+
+def _frame(message: dict[str, Any]) -> bytes:
+    payload = orjson.dumps(message)
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Any:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return orjson.loads(await reader.readexactly(size))
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise EOFError("Coordinator closed the connection")
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv_frame(sock: socket.socket) -> Any:
+    (size,) = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))
+    return orjson.loads(_recv_exactly(sock, size))
+
+
+@contextlib.contextmanager
+def _private_umask() -> Iterator[None]:
+    """Create sockets mode 0600 from the start rather than ``chmod`` them after ``bind``."""
+    previous = os.umask(0o177)
+    try:
+        yield
+    finally:
+        os.umask(previous)
+
+
+def _encode_error(exc: BaseException) -> dict[str, str]:
+    return {"module": type(exc).__module__, "name": type(exc).__name__, "message": str(exc)}
+
+
+def _decode_error(error: Any) -> Exception:
+    """Rebuild an exception raised in the coordinator; Aerospike and builtin classes keep their type."""
+    module, name, message = (_field(error, f, str) for f in ("module", "name", "message"))
+    source = aerospike_exception if module.startswith("aerospike") else builtins if module == "builtins" else None
+    cls = getattr(source, name, None)
+    if isinstance(cls, type) and issubclass(cls, Exception):
+        return cls(message)
+    return RuntimeError(f"{name}: {message}")
+
+
+def _is_shared_read(command: Any) -> bool:
+    return isinstance(command, str) and (command in _SHARED_INFO_COMMANDS or command.startswith(_SHARED_INFO_PREFIXES))
+
+
+# ---------------------------------------------------------------------------
+# Servers (coordinator side)
+# ---------------------------------------------------------------------------
+
+
+class _ClientServer:
+    """``coordinator.sock``: runs the other workers' client calls on this worker's clients."""
+
+    def __init__(self, path: Path, executor: Executor) -> None:
+        self._path = path
+        self._executor = executor
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._flights = SingleFlight()
+
+    async def start(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            self._path.unlink()
+        with _private_umask():
+            self._server = await asyncio.start_unix_server(self._serve, path=str(self._path))
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            self._path.unlink()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                request = await _read_frame(reader)
+                try:
+                    result, node_names = await self._dispatch(request)
+                except Exception as exc:
+                    writer.write(_frame({"ok": False, "error": _encode_error(exc)}))
+                else:
+                    if isinstance(result, list) and request.get("method") == "query":
+                        result = await self._send_pages(writer, result)
+                    writer.write(_frame({"ok": True, "value": _encode(result), "nodes": node_names}))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, orjson.JSONDecodeError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _send_pages(writer: asyncio.StreamWriter, records: list[Any]) -> list[Any]:
+        """Send all but the last page of *records* as ``page`` frames; returns the last page."""
+        last = max(0, len(records) - 1) // _QUERY_PAGE_RECORDS * _QUERY_PAGE_RECORDS
+        for start in range(0, last, _QUERY_PAGE_RECORDS):
+            writer.write(_frame({"ok": True, "page": _encode(records[start : start + _QUERY_PAGE_RECORDS])}))
+            await writer.drain()
+        return records[last:]
+
+    async def _dispatch(self, request: Any) -> tuple[Any, list[str]]:
+        op = _field(request, "op", str)
+        conn_id = _field(request, "conn", str)
+        if op == "close":
+            await self._executor.close_client(conn_id)
+            return None, []
+        if op != "call":
+            raise ValueError(f"Unknown coordinator operation '{op}'")
+        method = _field(request, "method", str)
+        args = tuple(_decode(_field(request, "args", list)))
+        kwargs = _decode(_field(request, "kwargs", dict))
+        if method in ("info_all", "info_random_node") and len(args) == 1 and not kwargs and _is_shared_read(args[0]):
+            return await self._flights.do(
+                (conn_id, method, args[0]), lambda: self._executor.execute(conn_id, method, args, {})
+            )
+        return await self._executor.execute(conn_id, method, args, kwargs)
+
+
+class _LimitsHandler(socketserver.BaseRequestHandler):
+    server: _LimitsServer
+
+    def handle(self) -> None:
+        self.server.connections.add(self.request)
+        try:
+            while True:
+                request = _recv_frame(self.request)
+                method = _field(request, "method", str)
+                args = _field(request, "args", list)
+                if method not in _LIMITS_METHODS or not all(isinstance(a, (str, int, float)) for a in args):
+                    raise ValueError(f"Malformed rate limit storage call '{method}'")
+                self.request.sendall(_frame({"value": getattr(self.server.storage, method)(*args)}))
+        except (EOFError, OSError, ValueError):
+            pass
+        finally:
+            self.server.connections.discard(self.request)
+
+
+class _LimitsServer(socketserver.ThreadingUnixStreamServer):
+    """``ratelimit.sock``: rate-limit counters served from a thread."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, storage: MemoryStorage) -> None:
+        self.storage = storage
+        self.connections: set[socket.socket] = set()
+        self._path = path
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+        with _private_umask():
+            super().__init__(str(path), _LimitsHandler)
+        self._thread = threading.Thread(target=self.serve_forever, name="coordinator-ratelimit", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        for conn in list(self.connections):
+            with contextlib.suppress(OSError):
+                conn.shutdown(socket.SHUT_RDWR)
+        with contextlib.suppress(FileNotFoundError):
+            self._path.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Connections to the coordinator (worker side)
+# ---------------------------------------------------------------------------
+
+
+class _Unreachable(Exception):
+    """Nothing is listening on the coordinator socket; the request was not sent."""
+
+
+class _Channel:
+    """Pool of connections to ``coordinator.sock``; one request at a time per connection."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def request(
+        self, message: dict[str, Any], on_page: PageCallback | None = None
+    ) -> tuple[Any, list[str]] | None:
+        """Send *message* and return the reply's value and node names.
+
+        ``page`` frames that precede a query's reply are passed to *on_page*;
+        if it returns ``False`` the rest of the reply is dropped (the
+        connection is closed) and ``None`` is returned.
+        """
+        reader, writer = await self._acquire()
+        try:
+            writer.write(_frame(message))
+            await writer.drain()
+            reply = await _read_frame(reader)
+            while isinstance(reply, dict) and "page" in reply:
+                if on_page is None or on_page(_decode(_field(reply, "page", list))) is False:
+                    writer.close()
+                    return None
+                reply = await _read_frame(reader)
+        except (asyncio.IncompleteReadError, ConnectionError) as exc:
+            writer.close()
+            raise CoordinatorUnavailable("Lost the connection to the coordinator worker") from exc
+        except BaseException:
+            writer.close()
+            raise
+        if len(self._idle) < _MAX_IDLE_CONNECTIONS:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        if not _field(reply, "ok", bool):
+            raise _decode_error(_field(reply, "error", dict))
+        return _decode(reply.get("value")), _field(reply, "nodes", list)
+
+    async def _acquire(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        try:
+            return await asyncio.open_unix_connection(str(self._path))
+        except (FileNotFoundError, ConnectionRefusedError) as exc:
+            raise _Unreachable from exc
+
+    def close(self) -> None:
+        for _reader, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class _LimitsClient:
+    """Blocking connection to ``ratelimit.sock`` (limits storages are synchronous)."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._sock: socket.socket | None = None
+        self._lock = threading.Lock()
+
+    def request(self, method: str, args: tuple[Any, ...]) -> Any:
+        with self._lock:
+            try:
+                if self._sock is None:
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    self._sock = sock
+                    sock.settimeout(_LIMITS_TIMEOUT_SECONDS)
+                    sock.connect(str(self._path))
+                self._sock.sendall(_frame({"method": method, "args": list(args)}))
+                return _field(_recv_frame(self._sock), "value", (int, float, type(None)))
+            except BaseException:
+                self._close()
+                raise
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            with contextlib.suppress(OSError):
+                self._sock.close()
+            self._sock = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+
+# ---------------------------------------------------------------------------
+# Coordinator role
+# ---------------------------------------------------------------------------
+
+
+class Coordinator:
+    """This worker's side of the coordinator protocol: serve when holding the lock, forward otherwise."""
+
+    def __init__(self, state: WorkerState) -> None:
+        self._state = state
+        # Rate-limit counters, used while this worker is the coordinator
+        self.limits = MemoryStorage()
+        self._executor: Executor | None = None
+        self._client_server: _ClientServer | None = None
+        self._limits_server: _LimitsServer | None = None
+        self._channel = _Channel(state.path(_CLIENT_SOCKET))
+        self._limits_client = _LimitsClient(state.path(_LIMITS_SOCKET))
+        self._limits_retry_at = 0.0
+        self._election: asyncio.Task[None] | None = None
+
+    @property
+    def is_local(self) -> bool:
+        """True when calls run in this worker: single-worker mode, or this worker is the coordinator."""
+        return self._state.is_coordinator
+
+    async def start(self, executor: Executor) -> None:
+        """Contend for the coordinator role now and every second until :meth:`stop`."""
+        self._executor = executor
+        if not self._state.multi_worker:
+            return
+        await self.take_over()
+        self._election = asyncio.create_task(self._contend(), name="coordinator-election")
+
+    async def stop(self) -> None:
+        if self._election is not None:
+            self._election.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._election
+            self._election = None
+        if self._client_server is not None:
+            await self._client_server.stop()
+            self._client_server = None
+        if self._limits_server is not None:
+            await asyncio.to_thread(self._limits_server.stop)
+            self._limits_server = None
+        self._channel.close()
+        self._limits_client.close()
+
+    async def take_over(self) -> bool:
+        """Become the coordinator if the lock is free and start serving. Returns :attr:`is_local`."""
+        if not self._state.try_acquire():
+            return False
+        if self._state.multi_worker and self._client_server is None and self._executor is not None:
+            self._client_server = _ClientServer(self._state.path(_CLIENT_SOCKET), self._executor)
+            self._limits_server = _LimitsServer(self._state.path(_LIMITS_SOCKET), self.limits)
+            await self._client_server.start()
+            logger.info("Worker %d now holds the Aerospike clients for all workers", os.getpid())
+        return True
+
+    async def _contend(self) -> None:
+        while True:
+            await asyncio.sleep(_ELECTION_INTERVAL_SECONDS)
+            try:
+                await self.take_over()
+            except Exception:
+                logger.exception("Coordinator election round failed")
+
+    async def call(
+        self,
+        conn_id: str,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        on_page: PageCallback | None = None,
+    ) -> tuple[Any, list[str]] | None:
+        """Run a client call in the coordinator; returns its result and the cluster's node names.
+
+        A remote query's records arrive in pages passed to *on_page* (see
+        :meth:`_Channel.request`); the returned result holds the last page.
+        """
+        message = {
+            "op": "call",
+            "conn": conn_id,
+            "method": method,
+            "args": _encode(list(args)),
+            "kwargs": _encode(kwargs),
+        }
+        return await self._forward(
+            message,
+            lambda: self._require_executor().execute(conn_id, method, args, kwargs),
+            on_page,
+        )
+
+    async def close(self, conn_id: str) -> None:
+        """Close the coordinator's client for *conn_id*."""
+        await self._forward({"op": "close", "conn": conn_id}, lambda: self._require_executor().close_client(conn_id))
+
+    async def _forward(self, message: dict[str, Any], run_locally: Any, on_page: PageCallback | None = None) -> Any:
+        for _ in range(_CONNECT_ATTEMPTS):
+            if self.is_local:
+                return await run_locally()
+            try:
+                return await self._channel.request(message, on_page)
+            except _Unreachable:
+                if not await self.take_over():
+                    await asyncio.sleep(_CONNECT_BACKOFF_SECONDS)
+        raise CoordinatorUnavailable("No coordinator worker is serving Aerospike clients")
+
+    def _require_executor(self) -> Executor:
+        if self._executor is None:
+            raise RuntimeError("Coordinator has not been started")
+        return self._executor
+
+    def limits_call(self, method: str, *args: Any) -> Any:
+        """Run a rate-limit storage call on the coordinator's counters.
+
+        The call blocks the event loop, so it waits at most
+        ``_LIMITS_TIMEOUT_SECONDS``.  When the coordinator does not answer in
+        time, this worker counts locally for ``_LIMITS_RETRY_SECONDS`` before
+        trying it again, so a restarting coordinator neither fails requests
+        nor slows every one of them down.
+        """
+        if not self.is_local and time.monotonic() >= self._limits_retry_at:
+            try:
+                return self._limits_client.request(method, args)
+            except (OSError, EOFError, ValueError):
+                logger.warning(
+                    "Coordinator rate-limit storage unreachable; counting in this worker for %.0fs",
+                    _LIMITS_RETRY_SECONDS,
+                )
+                self._limits_retry_at = time.monotonic() + _LIMITS_RETRY_SECONDS
+        return getattr(self.limits, method)(*args)
+
+
+# ---------------------------------------------------------------------------
+# Worker-side stand-ins
+# ---------------------------------------------------------------------------
+
+
+class RemoteQuery:
+    """``RemoteClient.query()`` result; the query runs in the coordinator, which sends records in pages."""
+
+    def __init__(self, client: RemoteClient, namespace: str, set_name: str | None) -> None:
+        self._client = client
+        self._namespace = namespace
+        self._set = set_name
+        self._bins: tuple[str, ...] = ()
+        self._predicate: tuple[Any, ...] | None = None
+
+    def select(self, *bins: str) -> None:
+        self._bins = bins
+
+    def where(self, predicate: tuple[Any, ...]) -> None:
+        self._predicate = predicate
+
+    async def results(self, policy: dict[str, Any] | None = None) -> list[Any]:
+        records: list[Any] = []
+        records.extend(await self._run(policy, records.extend))
+        return records
+
+    async def foreach(self, callback: Callable[[Any], Any], policy: dict[str, Any] | None = None) -> None:
+        def each(page: list[Any]) -> bool:
+            return all(callback(record) is not False for record in page)
+
+        last = await self._run(policy, each)
+        if last is not None:
+            each(last)
+
+    async def _run(self, policy: dict[str, Any] | None, on_page: PageCallback) -> list[Any] | None:
+        return await self._client._call(
+            "query", (self._namespace, self._set, self._bins, self._predicate), {"policy": policy}, on_page
+        )
+
+
+class RemoteClient:
+    """Stand-in for ``aerospike_py.AsyncClient`` in a non-coordinator worker.
+
+    Every awaited method is forwarded to the coordinator.  ``get_node_names``
+    answers from the node list returned with the last call.
+    """
+
+    def __init__(self, conn_id: str, coordinator: Coordinator) -> None:
+        self._conn_id = conn_id
+        self._coordinator = coordinator
+        self._node_names: list[str] = []
+
+    async def connect(self) -> RemoteClient:
+        """Have the coordinator connect the cluster (if it has not yet) and fetch its node names."""
+        await self._call("get_node_names", (), {})
+        return self
+
+    def is_connected(self) -> bool:
+        return True
+
+    def get_node_names(self) -> list[str]:
+        return list(self._node_names)
+
+    def query(self, namespace: str, set_name: str | None) -> RemoteQuery:
+        return RemoteQuery(self, namespace, set_name)
+
+    async def _call(
+        self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any], on_page: PageCallback | None = None
+    ) -> Any:
+        reply = await self._coordinator.call(self._conn_id, method, args, kwargs, on_page)
+        if reply is None:
+            return None
+        result, self._node_names = reply
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._call(name, args, kwargs)
+
+        call.__name__ = name
+        return call
+
+
+class CoordinatorStorage(Storage):
+    """``coordinator://`` rate-limit storage: fixed-window counters kept by the coordinator worker."""
+
+    STORAGE_SCHEME: ClassVar[list[str]] = ["coordinator"]
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        coordinator: Coordinator | None = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._coordinator = coordinator
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return (OSError, EOFError, ValueError)
+
+    @property
+    def _target(self) -> Coordinator:
+        return self._coordinator or coordinator
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        return self._target.limits_call("incr", key, expiry, amount)
+
+    def get(self, key: str) -> int:
+        return self._target.limits_call("get", key)
+
+    def get_expiry(self, key: str) -> float:
+        return self._target.limits_call("get_expiry", key)
+
+    def check(self) -> bool:
+        return True
+
+    def reset(self) -> int | None:
+        return self._target.limits_call("reset")
+
+    def clear(self, key: str) -> None:
+        self._target.limits_call("clear", key)
+
+
+coordinator = Coordinator(worker_state)
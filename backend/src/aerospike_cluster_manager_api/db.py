@@ -1,183 +1,274 @@
-"""PostgreSQL persistence layer for connection profiles.
+"""Persistence layer for connection profiles, the audit log and saved queries.
 
-Uses asyncpg with a connection pool for fully async database access.
+:func:`init_db` opens the :class:`Store` selected by ``DATABASE_URL``:
+PostgreSQL (:mod:`db_postgres`) by default, or the embedded SQLite backend
+(:mod:`db_sqlite`) for ``sqlite://`` URLs.  The module-level functions below
+are the API the rest of the application uses; each times its call and runs it
+on the open store.
 """
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import UTC, datetime
-
-import asyncpg
+from datetime import datetime
+from typing import TYPE_CHECKING, Protocol
 
 from aerospike_cluster_manager_api import config
-from aerospike_cluster_manager_api.models.connection import ConnectionProfile
+from aerospike_cluster_manager_api.db_postgres import PostgresStore
+from aerospike_cluster_manager_api.db_sqlite import SQLiteStore, path_from_url
+from aerospike_cluster_manager_api.instrumentation import timed_database
+from aerospike_cluster_manager_api.models.connection import ConnectionProfile, ConnectionProfileResponse
+from aerospike_cluster_manager_api.models.query import QueryHistoryEntry, QueryKind, SavedQuery
+
+if TYPE_CHECKING:
+    from aerospike_cluster_manager_api.audit import AuditEntry
 
 logger = logging.getLogger(__name__)
 
-_pool: asyncpg.Pool | None = None
-CREATE_TABLE_SQL = """
-CREATE TABLE IF NOT EXISTS connections (
-    id           TEXT PRIMARY KEY,
-    name         TEXT NOT NULL,
-    hosts        JSONB NOT NULL,
-    port         INTEGER NOT NULL DEFAULT 3000,
-    cluster_name TEXT,
-    username     TEXT,
-    password     TEXT,
-    color        TEXT NOT NULL DEFAULT '#0097D3',
-    created_at   TEXT NOT NULL,
-    updated_at   TEXT NOT NULL
-);
-"""
 
+class Store(Protocol):
+    """A persistence backend; see the module-level functions for what each method does."""
+
+    async def open(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def check_health(self) -> bool: ...
+
+    async def get_all_connections(self) -> list[ConnectionProfile]: ...
+
+    async def search_connections(
+        self,
+        *,
+        query: str | None = None,
+        tags: list[str] | None = None,
+        environment: str | None = None,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[ConnectionProfileResponse]: ...
+
+    async def get_connection_hosts(self) -> list[tuple[str, str, list[str]]]: ...
+
+    async def get_connection(self, conn_id: str) -> ConnectionProfile | None: ...
+
+    async def create_connection(self, conn: ConnectionProfile) -> None: ...
+
+    async def update_connection(self, conn_id: str, data: dict) -> ConnectionProfile | None: ...
+
+    async def delete_connection(self, conn_id: str) -> bool: ...
+
+    async def insert_audit_entries(self, entries: list[AuditEntry]) -> None: ...
+
+    async def insert_query_history(
+        self,
+        conn_id: str,
+        kind: QueryKind,
+        digest: str,
+        request: dict,
+        *,
+        execution_time_ms: int,
+        scanned_records: int,
+        returned_records: int,
+        cached: bool,
+    ) -> None: ...
+
+    async def prune_query_history(self, conn_id: str, *, older_than: datetime | None, keep: int) -> int: ...
+
+    async def list_query_history(self, conn_id: str, *, before: int | None, limit: int) -> list[QueryHistoryEntry]: ...
 
-def _get_pool() -> asyncpg.Pool:
-    if _pool is None:
+    async def list_saved_queries(self, conn_id: str) -> list[SavedQuery]: ...
+
+    async def get_saved_query(self, conn_id: str, query_id: str) -> SavedQuery | None: ...
+
+    async def create_saved_query(self, query: SavedQuery) -> bool: ...
+
+    async def delete_saved_query(self, conn_id: str, query_id: str) -> bool: ...
+
+    async def get_saved_query_snapshot(self, query_id: str) -> tuple[str, datetime] | None: ...
+
+    async def store_saved_query_snapshot(self, query_id: str, snapshot: str, taken_at: datetime) -> None: ...
+
+
+_store: Store | None = None
+
+
+def _get_store() -> Store:
+    if _store is None:
         raise RuntimeError("Database not initialized. Call init_db() first.")
-    return _pool
+    return _store
+
+
+def is_sqlite_url(url: str) -> bool:
+    return url.startswith("sqlite://")
 
 
 async def init_db() -> None:
-    global _pool
-    logger.info("Connecting to PostgreSQL …")
-    old_pool = _pool
-    pool = await asyncpg.create_pool(config.DATABASE_URL, min_size=2, max_size=10)
-    try:
-        async with pool.acquire() as conn:
-            await conn.execute(CREATE_TABLE_SQL)
-        _pool = pool
-    except Exception:
-        _pool = old_pool
-        await pool.close()
-        raise
-    logger.info("Database initialized")
+    """Open the store for ``DATABASE_URL`` and create or migrate its schema."""
+    global _store
+    store: Store
+    if is_sqlite_url(config.DATABASE_URL):
+        store = SQLiteStore(path_from_url(config.DATABASE_URL))
+    else:
+        store = PostgresStore(config.DATABASE_URL)
+    await store.open()
+    _store = store
+    logger.info("Database initialized (%s)", "sqlite" if isinstance(store, SQLiteStore) else "postgresql")
 
 
 async def check_health() -> bool:
     """Check database connectivity. Returns True if healthy."""
-    try:
-        pool = _get_pool()
-        await pool.fetchval("SELECT 1")
-        return True
-    except Exception:
+    if _store is None:
         return False
+    return await _store.check_health()
 
 
 async def close_db() -> None:
-    global _pool
-    if _pool:
-        await _pool.close()
-        _pool = None
+    global _store
+    if _store is not None:
+        store, _store = _store, None
+        await store.close()
 
 
 # ---------------------------------------------------------------------------
-# Row -> Model helper
+# Async public API
 # ---------------------------------------------------------------------------
 
 
-def _row_to_profile(row: asyncpg.Record) -> ConnectionProfile:
-    hosts = row["hosts"]
-    if isinstance(hosts, str):
-        try:
-            hosts = json.loads(hosts)
-        except json.JSONDecodeError:
-            hosts = [hosts]
-    return ConnectionProfile(
-        id=row["id"],
-        name=row["name"],
-        hosts=hosts,
-        port=row["port"],
-        clusterName=row["cluster_name"],
-        username=row["username"],
-        password=row["password"],
-        color=row["color"],
-        createdAt=row["created_at"],
-        updatedAt=row["updated_at"],
+@timed_database
+async def get_all_connections() -> list[ConnectionProfile]:
+    return await _get_store().get_all_connections()
+
+
+@timed_database
+async def search_connections(
+    *,
+    query: str | None = None,
+    tags: list[str] | None = None,
+    environment: str | None = None,
+    after: tuple[str, str] | None = None,
+    limit: int | None = None,
+) -> list[ConnectionProfileResponse]:
+    """List connection profiles without credentials, filtered and keyset-paginated.
+
+    *query* matches a case-insensitive prefix of the name or of any host, *tags*
+    must all be present, and *after* is the ``(created_at, id)`` of the last row of
+    the previous page.  Results are ordered by ``(created_at, id)``.
+    """
+    return await _get_store().search_connections(
+        query=query, tags=tags, environment=environment, after=after, limit=limit
     )
 
 
+@timed_database
+async def get_connection_hosts() -> list[tuple[str, str, list[str]]]:
+    """Return ``(id, name, hosts)`` for every profile — a light projection for host matching."""
+    return await _get_store().get_connection_hosts()
+
+
+@timed_database
+async def get_connection(conn_id: str) -> ConnectionProfile | None:
+    return await _get_store().get_connection(conn_id)
+
+
+@timed_database
+async def create_connection(conn: ConnectionProfile) -> None:
+    await _get_store().create_connection(conn)
+
+
+@timed_database
+async def update_connection(conn_id: str, data: dict) -> ConnectionProfile | None:
+    return await _get_store().update_connection(conn_id, data)
+
+
+@timed_database
+async def delete_connection(conn_id: str) -> bool:
+    return await _get_store().delete_connection(conn_id)
+
+
 # ---------------------------------------------------------------------------
-# Async public API
+# Audit log
 # ---------------------------------------------------------------------------
 
 
-async def get_all_connections() -> list[ConnectionProfile]:
-    pool = _get_pool()
-    rows = await pool.fetch("SELECT * FROM connections ORDER BY created_at")
-    return [_row_to_profile(row) for row in rows]
+@timed_database
+async def insert_audit_entries(entries: list[AuditEntry]) -> None:
+    """Bulk-insert audit entries (``COPY`` on PostgreSQL)."""
+    if entries:
+        await _get_store().insert_audit_entries(entries)
 
 
-async def get_connection(conn_id: str) -> ConnectionProfile | None:
-    pool = _get_pool()
-    row = await pool.fetchrow("SELECT * FROM connections WHERE id = $1", conn_id)
-    return _row_to_profile(row) if row else None
+# ---------------------------------------------------------------------------
+# Query history & saved queries
+# ---------------------------------------------------------------------------
 
 
-async def create_connection(conn: ConnectionProfile) -> None:
-    pool = _get_pool()
-    await pool.execute(
-        """INSERT INTO connections (id, name, hosts, port, cluster_name, username, password, color, created_at, updated_at)
-           VALUES ($1, $2, $3::jsonb, $4, $5, $6, $7, $8, $9, $10)""",
-        conn.id,
-        conn.name,
-        json.dumps(conn.hosts),
-        conn.port,
-        conn.clusterName,
-        conn.username,
-        conn.password,
-        conn.color,
-        conn.createdAt,
-        conn.updatedAt,
+@timed_database
+async def insert_query_history(
+    conn_id: str,
+    kind: QueryKind,
+    digest: str,
+    request: dict,
+    *,
+    execution_time_ms: int,
+    scanned_records: int,
+    returned_records: int,
+    cached: bool = False,
+) -> None:
+    await _get_store().insert_query_history(
+        conn_id,
+        kind,
+        digest,
+        request,
+        execution_time_ms=execution_time_ms,
+        scanned_records=scanned_records,
+        returned_records=returned_records,
+        cached=cached,
     )
 
 
-async def update_connection(conn_id: str, data: dict) -> ConnectionProfile | None:
-    pool = _get_pool()
-    async with pool.acquire() as conn, conn.transaction():
-        row = await conn.fetchrow("SELECT * FROM connections WHERE id = $1 FOR UPDATE", conn_id)
-        if not row:
-            return None
-
-        existing = _row_to_profile(row)
-        merged = existing.model_dump()
-        merged.update(data)
-        merged["updatedAt"] = datetime.now(UTC).isoformat()
-
-        await conn.execute(
-            """UPDATE connections
-                   SET name = $1, hosts = $2::jsonb, port = $3, cluster_name = $4,
-                       username = $5, password = $6, color = $7, updated_at = $8
-                   WHERE id = $9""",
-            merged["name"],
-            json.dumps(merged["hosts"]),
-            merged["port"],
-            merged.get("clusterName"),
-            merged.get("username"),
-            merged.get("password"),
-            merged["color"],
-            merged["updatedAt"],
-            conn_id,
-        )
-        merged["id"] = conn_id
-        return ConnectionProfile(
-            **{
-                "id": conn_id,
-                "name": merged["name"],
-                "hosts": merged["hosts"],
-                "port": merged["port"],
-                "clusterName": merged.get("clusterName"),
-                "username": merged.get("username"),
-                "password": merged.get("password"),
-                "color": merged["color"],
-                "createdAt": existing.createdAt,
-                "updatedAt": merged["updatedAt"],
-            }
-        )
+@timed_database
+async def prune_query_history(conn_id: str, *, older_than: datetime | None, keep: int) -> int:
+    """Delete history older than *older_than* and all but the newest *keep* rows of *conn_id* (0 keeps all).
 
+    Returns the number of rows deleted.
+    """
+    return await _get_store().prune_query_history(conn_id, older_than=older_than, keep=keep)
 
-async def delete_connection(conn_id: str) -> bool:
-    pool = _get_pool()
-    result = await pool.execute("DELETE FROM connections WHERE id = $1", conn_id)
-    return result == "DELETE 1"
+
+@timed_database
+async def list_query_history(conn_id: str, *, before: int | None = None, limit: int = 50) -> list[QueryHistoryEntry]:
+    """Most recent executions first; *before* is the ``id`` of the last entry of the previous page."""
+    return await _get_store().list_query_history(conn_id, before=before, limit=limit)
+
+
+@timed_database
+async def list_saved_queries(conn_id: str) -> list[SavedQuery]:
+    return await _get_store().list_saved_queries(conn_id)
+
+
+@timed_database
+async def get_saved_query(conn_id: str, query_id: str) -> SavedQuery | None:
+    return await _get_store().get_saved_query(conn_id, query_id)
+
+
+@timed_database
+async def create_saved_query(query: SavedQuery) -> bool:
+    """Insert a saved query. Returns ``False`` if the connection already has a query with that name."""
+    return await _get_store().create_saved_query(query)
+
+
+@timed_database
+async def delete_saved_query(conn_id: str, query_id: str) -> bool:
+    return await _get_store().delete_saved_query(conn_id, query_id)
+
+
+@timed_database
+async def get_saved_query_snapshot(query_id: str) -> tuple[str, datetime] | None:
+    """Return the cached ``(result JSON, taken_at)`` of a saved query, if it has been run."""
+    return await _get_store().get_saved_query_snapshot(query_id)
+
+
+@timed_database
+async def store_saved_query_snapshot(query_id: str, snapshot: str, taken_at: datetime) -> None:
+    """Store *snapshot*, a result already rendered to JSON, as the saved query's cached result."""
+    await _get_store().store_saved_query_snapshot(query_id, snapshot, taken_at)
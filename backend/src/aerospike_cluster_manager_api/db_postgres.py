@@ -0,0 +1,426 @@
+"""PostgreSQL persistence backend.
+
+Uses asyncpg with a connection pool for fully async database access.  This is
+the default :class:`~db.Store`; see :mod:`db_sqlite` for the embedded one.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import asyncpg
+
+from aerospike_cluster_manager_api.db_rows import (
+    AUDIT_COLUMNS,
+    SAVED_QUERY_COLUMNS,
+    SUMMARY_COLUMNS,
+    audit_row,
+    host_rows,
+    json_list,
+    like_prefix,
+    row_to_history,
+    row_to_profile,
+    row_to_saved_query,
+    row_to_summary,
+)
+from aerospike_cluster_manager_api.models.connection import ConnectionProfile, ConnectionProfileResponse
+from aerospike_cluster_manager_api.models.query import QueryHistoryEntry, QueryKind, SavedQuery
+
+if TYPE_CHECKING:
+    from aerospike_cluster_manager_api.audit import AuditEntry
+
+logger = logging.getLogger(__name__)
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS connections (
+    id           TEXT PRIMARY KEY,
+    name         TEXT NOT NULL,
+    hosts        JSONB NOT NULL,
+    port         INTEGER NOT NULL DEFAULT 3000,
+    cluster_name TEXT,
+    username     TEXT,
+    password     TEXT,
+    color        TEXT NOT NULL DEFAULT '#0097D3',
+    read_replica TEXT,
+    read_mode_ap TEXT,
+    rack_id      INTEGER,
+    tags         JSONB NOT NULL DEFAULT '[]'::jsonb,
+    environment  TEXT,
+    created_at   TEXT NOT NULL,
+    updated_at   TEXT NOT NULL
+);
+"""
+
+# Columns added after the initial schema; applied to databases created by older versions.
+MIGRATE_SQL = """
+ALTER TABLE connections ADD COLUMN IF NOT EXISTS read_replica TEXT;
+ALTER TABLE connections ADD COLUMN IF NOT EXISTS read_mode_ap TEXT;
+ALTER TABLE connections ADD COLUMN IF NOT EXISTS rack_id INTEGER;
+ALTER TABLE connections ADD COLUMN IF NOT EXISTS tags JSONB NOT NULL DEFAULT '[]'::jsonb;
+ALTER TABLE connections ADD COLUMN IF NOT EXISTS environment TEXT;
+CREATE INDEX IF NOT EXISTS idx_connections_created_at_id ON connections (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_connections_name_prefix ON connections (lower(name) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_connections_tags ON connections USING GIN (tags);
+CREATE INDEX IF NOT EXISTS idx_connections_environment ON connections (environment);
+"""
+
+CREATE_AUDIT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS audit_log (
+    id            BIGSERIAL PRIMARY KEY,
+    created_at    TIMESTAMPTZ NOT NULL,
+    action        TEXT NOT NULL,
+    target        TEXT NOT NULL,
+    connection_id TEXT,
+    request_id    TEXT,
+    detail        JSONB NOT NULL DEFAULT '{}'::jsonb
+);
+CREATE INDEX IF NOT EXISTS idx_audit_log_created_at ON audit_log (created_at);
+CREATE INDEX IF NOT EXISTS idx_audit_log_connection_id ON audit_log (connection_id, created_at);
+"""
+
+CREATE_QUERY_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS query_history (
+    id                BIGSERIAL PRIMARY KEY,
+    connection_id     TEXT NOT NULL REFERENCES connections (id) ON DELETE CASCADE,
+    kind              TEXT NOT NULL,
+    digest            TEXT NOT NULL,
+    request           JSONB NOT NULL,
+    execution_time_ms INTEGER NOT NULL,
+    scanned_records   INTEGER NOT NULL,
+    returned_records  INTEGER NOT NULL,
+    cached            BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at        TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_query_history_connection_id ON query_history (connection_id, id DESC);
+CREATE INDEX IF NOT EXISTS idx_query_history_created_at ON query_history (created_at);
+CREATE TABLE IF NOT EXISTS saved_queries (
+    id            TEXT PRIMARY KEY,
+    connection_id TEXT NOT NULL REFERENCES connections (id) ON DELETE CASCADE,
+    name          TEXT NOT NULL,
+    kind          TEXT NOT NULL,
+    request       JSONB NOT NULL,
+    digest        TEXT NOT NULL,
+    snapshot      JSONB,
+    snapshot_at   TIMESTAMPTZ,
+    created_at    TEXT NOT NULL,
+    updated_at    TEXT NOT NULL,
+    UNIQUE (connection_id, name)
+);
+"""
+
+# Each profile's hosts, lower-cased, so a host-prefix search is an index range scan rather than a
+# scan of every ``hosts`` array.  Filled from existing profiles the first time it is created.
+CREATE_HOSTS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS connection_hosts (
+    connection_id TEXT NOT NULL REFERENCES connections (id) ON DELETE CASCADE,
+    host          TEXT NOT NULL,
+    PRIMARY KEY (connection_id, host)
+);
+CREATE INDEX IF NOT EXISTS idx_connection_hosts_prefix ON connection_hosts (host text_pattern_ops);
+INSERT INTO connection_hosts (connection_id, host)
+    SELECT DISTINCT id, lower(h) FROM connections, jsonb_array_elements_text(hosts) h
+    WHERE NOT EXISTS (SELECT 1 FROM connection_hosts)
+ON CONFLICT DO NOTHING;
+"""
+
+INSERT_HOSTS_SQL = "INSERT INTO connection_hosts (connection_id, host) VALUES ($1, $2)"
+
+
+class PostgresStore:
+    """Connection-profile store backed by an asyncpg pool."""
+
+    def __init__(self, url: str) -> None:
+        self._url = url
+        self._pool: asyncpg.Pool | None = None
+
+    # -- lifecycle ----------------------------------------------------------
+
+    @property
+    def pool(self) -> asyncpg.Pool:
+        if self._pool is None:
+            raise RuntimeError("Database not initialized. Call init_db() first.")
+        return self._pool
+
+    async def open(self) -> None:
+        logger.info("Connecting to PostgreSQL …")
+        pool = await asyncpg.create_pool(self._url, min_size=2, max_size=10)
+        try:
+            async with pool.acquire() as conn:
+                await conn.execute(CREATE_TABLE_SQL)
+                await conn.execute(MIGRATE_SQL)
+                await conn.execute(CREATE_HOSTS_TABLE_SQL)
+                await conn.execute(CREATE_AUDIT_TABLE_SQL)
+                await conn.execute(CREATE_QUERY_TABLES_SQL)
+        except Exception:
+            await pool.close()
+            raise
+        self._pool = pool
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+    async def check_health(self) -> bool:
+        try:
+            await self.pool.fetchval("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    # -- connection profiles ------------------------------------------------
+
+    async def get_all_connections(self) -> list[ConnectionProfile]:
+        rows = await self.pool.fetch("SELECT * FROM connections ORDER BY created_at")
+        return [row_to_profile(row) for row in rows]
+
+    async def search_connections(
+        self,
+        *,
+        query: str | None = None,
+        tags: list[str] | None = None,
+        environment: str | None = None,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[ConnectionProfileResponse]:
+        where: list[str] = []
+        args: list[object] = []
+        if query:
+            args.append(like_prefix(query))
+            # A UNION of two index range scans; an OR across both would scan every profile
+            where.append(
+                f"id IN (SELECT id FROM connections WHERE lower(name) LIKE ${len(args)} "
+                f"UNION SELECT connection_id FROM connection_hosts WHERE host LIKE ${len(args)})"
+            )
+        if tags:
+            args.append(json.dumps(tags))
+            where.append(f"tags @> ${len(args)}::jsonb")
+        if environment:
+            args.append(environment)
+            where.append(f"environment = ${len(args)}")
+        if after:
+            args.extend(after)
+            where.append(f"(created_at, id) > (${len(args) - 1}, ${len(args)})")
+        sql = f"SELECT {SUMMARY_COLUMNS} FROM connections"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at, id"
+        if limit is not None:
+            args.append(limit)
+            sql += f" LIMIT ${len(args)}"
+        rows = await self.pool.fetch(sql, *args)
+        return [row_to_summary(row) for row in rows]
+
+    async def get_connection_hosts(self) -> list[tuple[str, str, list[str]]]:
+        rows = await self.pool.fetch("SELECT id, name, hosts FROM connections ORDER BY created_at, id")
+        return [(row["id"], row["name"], json_list(row["hosts"])) for row in rows]
+
+    async def get_connection(self, conn_id: str) -> ConnectionProfile | None:
+        row = await self.pool.fetchrow("SELECT * FROM connections WHERE id = $1", conn_id)
+        return row_to_profile(row) if row else None
+
+    async def create_connection(self, conn: ConnectionProfile) -> None:
+        async with self.pool.acquire() as db_conn, db_conn.transaction():
+            await db_conn.execute(
+                """INSERT INTO connections (id, name, hosts, port, cluster_name, username, password, color,
+                                           read_replica, read_mode_ap, rack_id, tags, environment, created_at, updated_at)
+                   VALUES ($1, $2, $3::jsonb, $4, $5, $6, $7, $8, $9, $10, $11, $12::jsonb, $13, $14, $15)""",
+                conn.id,
+                conn.name,
+                json.dumps(conn.hosts),
+                conn.port,
+                conn.clusterName,
+                conn.username,
+                conn.password,
+                conn.color,
+                conn.readReplica,
+                conn.readModeAp,
+                conn.rackId,
+                json.dumps(conn.tags),
+                conn.environment,
+                conn.createdAt,
+                conn.updatedAt,
+            )
+            await db_conn.executemany(INSERT_HOSTS_SQL, host_rows(conn.id, conn.hosts))
+
+    async def update_connection(self, conn_id: str, data: dict) -> ConnectionProfile | None:
+        async with self.pool.acquire() as conn, conn.transaction():
+            row = await conn.fetchrow("SELECT * FROM connections WHERE id = $1 FOR UPDATE", conn_id)
+            if not row:
+                return None
+
+            existing = row_to_profile(row)
+            merged = existing.model_dump()
+            merged.update(data)
+            merged["updatedAt"] = datetime.now(UTC).isoformat()
+
+            await conn.execute(
+                """UPDATE connections
+                       SET name = $1, hosts = $2::jsonb, port = $3, cluster_name = $4,
+                           username = $5, password = $6, color = $7, read_replica = $8,
+                           read_mode_ap = $9, rack_id = $10, tags = $11::jsonb, environment = $12,
+                           updated_at = $13
+                       WHERE id = $14""",
+                merged["name"],
+                json.dumps(merged["hosts"]),
+                merged["port"],
+                merged.get("clusterName"),
+                merged.get("username"),
+                merged.get("password"),
+                merged["color"],
+                merged.get("readReplica"),
+                merged.get("readModeAp"),
+                merged.get("rackId"),
+                json.dumps(merged.get("tags") or []),
+                merged.get("environment"),
+                merged["updatedAt"],
+                conn_id,
+            )
+            if "hosts" in data:
+                await conn.execute("DELETE FROM connection_hosts WHERE connection_id = $1", conn_id)
+                await conn.executemany(INSERT_HOSTS_SQL, host_rows(conn_id, merged["hosts"]))
+            merged["id"] = conn_id
+            return ConnectionProfile(
+                **{
+                    "id": conn_id,
+                    "name": merged["name"],
+                    "hosts": merged["hosts"],
+                    "port": merged["port"],
+                    "clusterName": merged.get("clusterName"),
+                    "username": merged.get("username"),
+                    "password": merged.get("password"),
+                    "color": merged["color"],
+                    "readReplica": merged.get("readReplica"),
+                    "readModeAp": merged.get("readModeAp"),
+                    "rackId": merged.get("rackId"),
+                    "tags": merged.get("tags") or [],
+                    "environment": merged.get("environment"),
+                    "createdAt": existing.createdAt,
+                    "updatedAt": merged["updatedAt"],
+                }
+            )
+
+    async def delete_connection(self, conn_id: str) -> bool:
+        result = await self.pool.execute("DELETE FROM connections WHERE id = $1", conn_id)
+        return result == "DELETE 1"
+
+    # -- audit log ----------------------------------------------------------
+
+    async def insert_audit_entries(self, entries: list[AuditEntry]) -> None:
+        async with self.pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                "audit_log", records=[audit_row(e) for e in entries], columns=list(AUDIT_COLUMNS)
+            )
+
+    # -- query history & saved queries ---------------------------------------
+
+    async def insert_query_history(
+        self,
+        conn_id: str,
+        kind: QueryKind,
+        digest: str,
+        request: dict,
+        *,
+        execution_time_ms: int,
+        scanned_records: int,
+        returned_records: int,
+        cached: bool,
+    ) -> None:
+        await self.pool.execute(
+            """INSERT INTO query_history (connection_id, kind, digest, request, execution_time_ms,
+                                         scanned_records, returned_records, cached, created_at)
+               VALUES ($1, $2, $3, $4::jsonb, $5, $6, $7, $8, $9)""",
+            conn_id,
+            kind,
+            digest,
+            json.dumps(request),
+            execution_time_ms,
+            scanned_records,
+            returned_records,
+            cached,
+            datetime.now(UTC),
+        )
+
+    async def prune_query_history(self, conn_id: str, *, older_than: datetime | None, keep: int) -> int:
+        deleted = 0
+        async with self.pool.acquire() as conn:
+            if older_than is not None:
+                result = await conn.execute("DELETE FROM query_history WHERE created_at < $1", older_than)
+                deleted += int(result.split()[-1])
+            if keep > 0:
+                result = await conn.execute(
+                    """DELETE FROM query_history
+                           WHERE connection_id = $1 AND id <= (
+                               SELECT id FROM query_history WHERE connection_id = $1
+                                   ORDER BY id DESC OFFSET $2 LIMIT 1)""",
+                    conn_id,
+                    keep,
+                )
+                deleted += int(result.split()[-1])
+        return deleted
+
+    async def list_query_history(self, conn_id: str, *, before: int | None, limit: int) -> list[QueryHistoryEntry]:
+        rows = await self.pool.fetch(
+            """SELECT * FROM query_history
+                   WHERE connection_id = $1 AND ($2::bigint IS NULL OR id < $2)
+                   ORDER BY id DESC LIMIT $3""",
+            conn_id,
+            before,
+            limit,
+        )
+        return [row_to_history(row) for row in rows]
+
+    async def list_saved_queries(self, conn_id: str) -> list[SavedQuery]:
+        rows = await self.pool.fetch(
+            f"SELECT {SAVED_QUERY_COLUMNS} FROM saved_queries WHERE connection_id = $1 ORDER BY name",
+            conn_id,
+        )
+        return [row_to_saved_query(row) for row in rows]
+
+    async def get_saved_query(self, conn_id: str, query_id: str) -> SavedQuery | None:
+        row = await self.pool.fetchrow(
+            f"SELECT {SAVED_QUERY_COLUMNS} FROM saved_queries WHERE connection_id = $1 AND id = $2",
+            conn_id,
+            query_id,
+        )
+        return row_to_saved_query(row) if row else None
+
+    async def create_saved_query(self, query: SavedQuery) -> bool:
+        result = await self.pool.execute(
+            """INSERT INTO saved_queries (id, connection_id, name, kind, request, digest, created_at, updated_at)
+               VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7, $8)
+               ON CONFLICT (connection_id, name) DO NOTHING""",
+            query.id,
+            query.connectionId,
+            query.name,
+            query.kind,
+            json.dumps(query.request),
+            query.digest,
+            query.createdAt,
+            query.updatedAt,
+        )
+        return result == "INSERT 0 1"
+
+    async def delete_saved_query(self, conn_id: str, query_id: str) -> bool:
+        result = await self.pool.execute(
+            "DELETE FROM saved_queries WHERE connection_id = $1 AND id = $2", conn_id, query_id
+        )
+        return result == "DELETE 1"
+
+    async def get_saved_query_snapshot(self, query_id: str) -> tuple[str, datetime] | None:
+        row = await self.pool.fetchrow(
+            "SELECT snapshot::text AS snapshot, snapshot_at FROM saved_queries WHERE id = $1 AND snapshot IS NOT NULL",
+            query_id,
+        )
+        return (row["snapshot"], row["snapshot_at"]) if row else None
+
+    async def store_saved_query_snapshot(self, query_id: str, snapshot: str, taken_at: datetime) -> None:
+        await self.pool.execute(
+            "UPDATE saved_queries SET snapshot = $2::jsonb, snapshot_at = $3 WHERE id = $1",
+            query_id,
+            snapshot,
+            taken_at,
+        )
@@ -0,0 +1,132 @@
+"""Row mapping shared by the PostgreSQL and SQLite stores.
+
+Both backends return rows addressable by column name (``asyncpg.Record`` and
+``sqlite3.Row``); JSON columns arrive parsed from PostgreSQL and as text from
+SQLite, which the helpers here accept alike.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from aerospike_cluster_manager_api.models.connection import ConnectionProfile, ConnectionProfileResponse
+from aerospike_cluster_manager_api.models.query import QueryHistoryEntry, SavedQuery
+
+if TYPE_CHECKING:
+    from aerospike_cluster_manager_api.audit import AuditEntry
+
+# A row of either backend
+Row = Mapping[str, Any]
+
+# Every ``saved_queries`` column except the (potentially large) ``snapshot``.
+SAVED_QUERY_COLUMNS = "id, connection_id, name, kind, request, digest, snapshot_at, created_at, updated_at"
+
+AUDIT_COLUMNS = ("created_at", "action", "target", "connection_id", "request_id", "detail")
+
+# Every column except ``password`` — used by list views, which never expose credentials.
+SUMMARY_COLUMNS = (
+    "id, name, hosts, port, cluster_name, username, color, read_replica, read_mode_ap, rack_id, "
+    "tags, environment, created_at, updated_at"
+)
+
+
+def json_list(value: object) -> list:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return [value]
+    return list(value) if value else []
+
+
+def json_dict(value: object) -> dict:
+    if isinstance(value, str):
+        return json.loads(value)
+    return dict(value) if value else {}
+
+
+def _iso(value: datetime | str | None) -> str | None:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _row_fields(row: Row) -> dict:
+    """Map the non-secret columns of a ``connections`` row to model field names."""
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "hosts": json_list(row["hosts"]),
+        "port": row["port"],
+        "clusterName": row["cluster_name"],
+        "username": row["username"],
+        "color": row["color"],
+        "readReplica": row["read_replica"],
+        "readModeAp": row["read_mode_ap"],
+        "rackId": row["rack_id"],
+        "tags": json_list(row["tags"]),
+        "environment": row["environment"],
+        "createdAt": row["created_at"],
+        "updatedAt": row["updated_at"],
+    }
+
+
+def row_to_profile(row: Row) -> ConnectionProfile:
+    return ConnectionProfile(**_row_fields(row), password=row["password"])
+
+
+def row_to_summary(row: Row) -> ConnectionProfileResponse:
+    return ConnectionProfileResponse(**_row_fields(row))
+
+
+def row_to_history(row: Row) -> QueryHistoryEntry:
+    return QueryHistoryEntry(
+        id=row["id"],
+        connectionId=row["connection_id"],
+        kind=row["kind"],
+        digest=row["digest"],
+        request=json_dict(row["request"]),
+        executionTimeMs=row["execution_time_ms"],
+        scannedRecords=row["scanned_records"],
+        returnedRecords=row["returned_records"],
+        cached=bool(row["cached"]),
+        createdAt=_iso(row["created_at"]),
+    )
+
+
+def row_to_saved_query(row: Row) -> SavedQuery:
+    return SavedQuery(
+        id=row["id"],
+        connectionId=row["connection_id"],
+        name=row["name"],
+        kind=row["kind"],
+        request=json_dict(row["request"]),
+        digest=row["digest"],
+        snapshotAt=_iso(row["snapshot_at"]),
+        createdAt=row["created_at"],
+        updatedAt=row["updated_at"],
+    )
+
+
+def audit_row(entry: AuditEntry) -> tuple:
+    """Values of *entry* in :data:`AUDIT_COLUMNS` order."""
+    return (
+        entry.created_at,
+        entry.action,
+        entry.target,
+        entry.connection_id,
+        entry.request_id,
+        json.dumps(entry.detail, default=str),
+    )
+
+
+def host_rows(conn_id: str, hosts: list[str]) -> list[tuple[str, str]]:
+    """``connection_hosts`` rows of a profile: its distinct hosts, lower-cased for prefix search."""
+    return [(conn_id, host) for host in dict.fromkeys(h.lower() for h in hosts)]
+
+
+def like_prefix(prefix: str) -> str:
+    """Escape LIKE wildcards and return a lower-cased prefix pattern."""
+    escaped = prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
@@ -0,0 +1,479 @@
+"""Embedded SQLite persistence backend.
+
+The :class:`~db.Store` selected when ``DATABASE_URL`` starts with ``sqlite://`` so the API can boot
+without a PostgreSQL server (single-node, lab and CI deployments).  The
+database runs in WAL mode and all calls are offloaded with
+``asyncio.to_thread()``; a lock serializes access to the single connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from aerospike_cluster_manager_api.db_rows import (
+    AUDIT_COLUMNS,
+    SAVED_QUERY_COLUMNS,
+    SUMMARY_COLUMNS,
+    audit_row,
+    host_rows,
+    json_list,
+    like_prefix,
+    row_to_history,
+    row_to_profile,
+    row_to_saved_query,
+    row_to_summary,
+)
+from aerospike_cluster_manager_api.models.connection import ConnectionProfile, ConnectionProfileResponse
+from aerospike_cluster_manager_api.models.query import QueryHistoryEntry, QueryKind, SavedQuery
+
+if TYPE_CHECKING:
+    from aerospike_cluster_manager_api.audit import AuditEntry
+
+logger = logging.getLogger(__name__)
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS connections (
+    id           TEXT PRIMARY KEY,
+    name         TEXT NOT NULL,
+    hosts        TEXT NOT NULL,
+    port         INTEGER NOT NULL DEFAULT 3000,
+    cluster_name TEXT,
+    username     TEXT,
+    password     TEXT,
+    color        TEXT NOT NULL DEFAULT '#0097D3',
+    read_replica TEXT,
+    read_mode_ap TEXT,
+    rack_id      INTEGER,
+    tags         TEXT NOT NULL DEFAULT '[]',
+    environment  TEXT,
+    created_at   TEXT NOT NULL,
+    updated_at   TEXT NOT NULL
+);
+"""
+
+# Columns added after the initial schema, keyed by name, for databases created by older versions.
+_ADDED_COLUMNS = {
+    "tags": "TEXT NOT NULL DEFAULT '[]'",
+    "environment": "TEXT",
+}
+
+CREATE_AUDIT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS audit_log (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at    TEXT NOT NULL,
+    action        TEXT NOT NULL,
+    target        TEXT NOT NULL,
+    connection_id TEXT,
+    request_id    TEXT,
+    detail        TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_audit_log_created_at ON audit_log (created_at);
+CREATE INDEX IF NOT EXISTS idx_audit_log_connection_id ON audit_log (connection_id, created_at);
+"""
+
+CREATE_QUERY_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS query_history (
+    id                INTEGER PRIMARY KEY AUTOINCREMENT,
+    connection_id     TEXT NOT NULL REFERENCES connections (id) ON DELETE CASCADE,
+    kind              TEXT NOT NULL,
+    digest            TEXT NOT NULL,
+    request           TEXT NOT NULL,
+    execution_time_ms INTEGER NOT NULL,
+    scanned_records   INTEGER NOT NULL,
+    returned_records  INTEGER NOT NULL,
+    cached            INTEGER NOT NULL DEFAULT 0,
+    created_at        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_query_history_connection_id ON query_history (connection_id, id DESC);
+CREATE INDEX IF NOT EXISTS idx_query_history_created_at ON query_history (created_at);
+CREATE TABLE IF NOT EXISTS saved_queries (
+    id            TEXT PRIMARY KEY,
+    connection_id TEXT NOT NULL REFERENCES connections (id) ON DELETE CASCADE,
+    name          TEXT NOT NULL,
+    kind          TEXT NOT NULL,
+    request       TEXT NOT NULL,
+    digest        TEXT NOT NULL,
+    snapshot      TEXT,
+    snapshot_at   TEXT,
+    created_at    TEXT NOT NULL,
+    updated_at    TEXT NOT NULL,
+    UNIQUE (connection_id, name)
+);
+"""
+
+CREATE_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_connections_created_at_id ON connections (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_connections_name_prefix ON connections (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_connections_environment ON connections (environment);
+"""
+
+# Each profile's hosts, lower-cased, so a host-prefix search is an index range scan; see db_postgres.
+CREATE_HOSTS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS connection_hosts (
+    connection_id TEXT NOT NULL REFERENCES connections (id) ON DELETE CASCADE,
+    host          TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (connection_id, host)
+);
+CREATE INDEX IF NOT EXISTS idx_connection_hosts_prefix ON connection_hosts (host);
+INSERT OR IGNORE INTO connection_hosts (connection_id, host)
+    SELECT DISTINCT connections.id, lower(json_each.value) FROM connections, json_each(connections.hosts)
+    WHERE NOT EXISTS (SELECT 1 FROM connection_hosts);
+"""
+
+INSERT_HOSTS_SQL = "INSERT INTO connection_hosts (connection_id, host) VALUES (?, ?)"
+
+
+def path_from_url(url: str) -> str:
+    """Return the filesystem path of a ``sqlite://`` URL.
+
+    ``sqlite:///data/app.db`` is relative, ``sqlite:////var/lib/app.db`` is absolute
+    and ``sqlite:///:memory:`` is an in-memory database.
+    """
+    path = url.removeprefix("sqlite://")
+    return path[1:] if path.startswith("/") else path
+
+
+class SQLiteStore:
+    """Connection-profile store backed by a single SQLite connection."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def _open_sync(self) -> None:
+        conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(CREATE_TABLE_SQL)
+        existing = {row["name"] for row in conn.execute("PRAGMA table_info(connections)")}
+        for column, ddl in _ADDED_COLUMNS.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE connections ADD COLUMN {column} {ddl}")
+        conn.executescript(CREATE_INDEXES_SQL)
+        conn.executescript(CREATE_HOSTS_TABLE_SQL)
+        conn.executescript(CREATE_AUDIT_TABLE_SQL)
+        conn.executescript(CREATE_QUERY_TABLES_SQL)
+        self._conn = conn
+
+    async def open(self) -> None:
+        logger.info("Opening SQLite database %s …", self._path)
+        await asyncio.to_thread(self._open_sync)
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await asyncio.to_thread(conn.close)
+
+    async def _run[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        def _call() -> T:
+            if self._conn is None:
+                raise RuntimeError("Database not initialized. Call init_db() first.")
+            with self._lock:
+                return fn(self._conn)
+
+        return await asyncio.to_thread(_call)
+
+    async def check_health(self) -> bool:
+        try:
+            await self._run(lambda c: c.execute("SELECT 1").fetchone())
+            return True
+        except Exception:
+            return False
+
+    # -- connection profiles ------------------------------------------------
+
+    async def get_all_connections(self) -> list[ConnectionProfile]:
+        rows = await self._run(lambda c: c.execute("SELECT * FROM connections ORDER BY created_at").fetchall())
+        return [row_to_profile(row) for row in rows]
+
+    async def search_connections(
+        self,
+        *,
+        query: str | None = None,
+        tags: list[str] | None = None,
+        environment: str | None = None,
+        after: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[ConnectionProfileResponse]:
+        where: list[str] = []
+        args: list[object] = []
+        if query:
+            pattern = like_prefix(query)
+            where.append(
+                "id IN (SELECT id FROM connections WHERE name LIKE ? ESCAPE '\\' "
+                "UNION SELECT connection_id FROM connection_hosts WHERE host LIKE ? ESCAPE '\\')"
+            )
+            args.extend([pattern, pattern])
+        for tag in tags or []:
+            where.append("EXISTS (SELECT 1 FROM json_each(connections.tags) WHERE json_each.value = ?)")
+            args.append(tag)
+        if environment:
+            where.append("environment = ?")
+            args.append(environment)
+        if after:
+            where.append("(created_at, id) > (?, ?)")
+            args.extend(after)
+        sql = f"SELECT {SUMMARY_COLUMNS} FROM connections"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+        rows = await self._run(lambda c: c.execute(sql, args).fetchall())
+        return [row_to_summary(row) for row in rows]
+
+    async def get_connection_hosts(self) -> list[tuple[str, str, list[str]]]:
+        rows = await self._run(
+            lambda c: c.execute("SELECT id, name, hosts FROM connections ORDER BY created_at, id").fetchall()
+        )
+        return [(row["id"], row["name"], json_list(row["hosts"])) for row in rows]
+
+    async def get_connection(self, conn_id: str) -> ConnectionProfile | None:
+        row = await self._run(lambda c: c.execute("SELECT * FROM connections WHERE id = ?", (conn_id,)).fetchone())
+        return row_to_profile(row) if row else None
+
+    async def create_connection(self, conn: ConnectionProfile) -> None:
+        params = (
+            conn.id,
+            conn.name,
+            json.dumps(conn.hosts),
+            conn.port,
+            conn.clusterName,
+            conn.username,
+            conn.password,
+            conn.color,
+            conn.readReplica,
+            conn.readModeAp,
+            conn.rackId,
+            json.dumps(conn.tags),
+            conn.environment,
+            conn.createdAt,
+            conn.updatedAt,
+        )
+
+        def _create(c: sqlite3.Connection) -> None:
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                c.execute(
+                    """INSERT INTO connections (id, name, hosts, port, cluster_name, username, password, color,
+                                               read_replica, read_mode_ap, rack_id, tags, environment,
+                                               created_at, updated_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    params,
+                )
+                c.executemany(INSERT_HOSTS_SQL, host_rows(conn.id, conn.hosts))
+                c.execute("COMMIT")
+            except BaseException:
+                c.execute("ROLLBACK")
+                raise
+
+        await self._run(_create)
+
+    async def update_connection(self, conn_id: str, data: dict) -> ConnectionProfile | None:
+        def _update(c: sqlite3.Connection) -> ConnectionProfile | None:
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                row = c.execute("SELECT * FROM connections WHERE id = ?", (conn_id,)).fetchone()
+                if not row:
+                    c.execute("ROLLBACK")
+                    return None
+                existing = row_to_profile(row)
+                merged: dict[str, Any] = existing.model_dump()
+                merged.update(data)
+                merged["id"] = conn_id
+                merged["createdAt"] = existing.createdAt
+                merged["updatedAt"] = datetime.now(UTC).isoformat()
+                updated = ConnectionProfile(**merged)
+                c.execute(
+                    """UPDATE connections
+                           SET name = ?, hosts = ?, port = ?, cluster_name = ?, username = ?, password = ?,
+                               color = ?, read_replica = ?, read_mode_ap = ?, rack_id = ?, tags = ?,
+                               environment = ?, updated_at = ?
+                           WHERE id = ?""",
+                    (
+                        updated.name,
+                        json.dumps(updated.hosts),
+                        updated.port,
+                        updated.clusterName,
+                        updated.username,
+                        updated.password,
+                        updated.color,
+                        updated.readReplica,
+                        updated.readModeAp,
+                        updated.rackId,
+                        json.dumps(updated.tags),
+                        updated.environment,
+                        updated.updatedAt,
+                        conn_id,
+                    ),
+                )
+                if "hosts" in data:
+                    c.execute("DELETE FROM connection_hosts WHERE connection_id = ?", (conn_id,))
+                    c.executemany(INSERT_HOSTS_SQL, host_rows(conn_id, updated.hosts))
+                c.execute("COMMIT")
+                return updated
+            except BaseException:
+                c.execute("ROLLBACK")
+                raise
+
+        return await self._run(_update)
+
+    async def delete_connection(self, conn_id: str) -> bool:
+        cursor = await self._run(lambda c: c.execute("DELETE FROM connections WHERE id = ?", (conn_id,)))
+        return cursor.rowcount == 1
+
+    # -- audit log ----------------------------------------------------------
+
+    async def insert_audit_entries(self, entries: list[AuditEntry]) -> None:
+        sql = f"INSERT INTO audit_log ({', '.join(AUDIT_COLUMNS)}) VALUES ({', '.join('?' * len(AUDIT_COLUMNS))})"
+        params = [(created_at.isoformat(), *rest) for created_at, *rest in map(audit_row, entries)]
+
+        def _insert(c: sqlite3.Connection) -> None:
+            c.execute("BEGIN")
+            try:
+                c.executemany(sql, params)
+            except BaseException:
+                c.execute("ROLLBACK")
+                raise
+            c.execute("COMMIT")
+
+        await self._run(_insert)
+
+    # -- query history & saved queries ---------------------------------------
+
+    async def insert_query_history(
+        self,
+        conn_id: str,
+        kind: QueryKind,
+        digest: str,
+        request: dict,
+        *,
+        execution_time_ms: int,
+        scanned_records: int,
+        returned_records: int,
+        cached: bool,
+    ) -> None:
+        params = (
+            conn_id,
+            kind,
+            digest,
+            json.dumps(request),
+            execution_time_ms,
+            scanned_records,
+            returned_records,
+            cached,
+            datetime.now(UTC).isoformat(),
+        )
+        await self._run(
+            lambda c: c.execute(
+                """INSERT INTO query_history (connection_id, kind, digest, request, execution_time_ms,
+                                             scanned_records, returned_records, cached, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                params,
+            )
+        )
+
+    async def prune_query_history(self, conn_id: str, *, older_than: datetime | None, keep: int) -> int:
+        def _prune(c: sqlite3.Connection) -> int:
+            deleted = 0
+            if older_than is not None:
+                deleted += c.execute(
+                    "DELETE FROM query_history WHERE created_at < ?", (older_than.isoformat(),)
+                ).rowcount
+            if keep > 0:
+                deleted += c.execute(
+                    """DELETE FROM query_history
+                           WHERE connection_id = ? AND id <= (
+                               SELECT id FROM query_history WHERE connection_id = ?
+                                   ORDER BY id DESC LIMIT 1 OFFSET ?)""",
+                    (conn_id, conn_id, keep),
+                ).rowcount
+            return deleted
+
+        return await self._run(_prune)
+
+    async def list_query_history(self, conn_id: str, *, before: int | None, limit: int) -> list[QueryHistoryEntry]:
+        rows = await self._run(
+            lambda c: c.execute(
+                """SELECT * FROM query_history
+                       WHERE connection_id = ? AND (? IS NULL OR id < ?)
+                       ORDER BY id DESC LIMIT ?""",
+                (conn_id, before, before, limit),
+            ).fetchall()
+        )
+        return [row_to_history(row) for row in rows]
+
+    async def list_saved_queries(self, conn_id: str) -> list[SavedQuery]:
+        rows = await self._run(
+            lambda c: c.execute(
+                f"SELECT {SAVED_QUERY_COLUMNS} FROM saved_queries WHERE connection_id = ? ORDER BY name",
+                (conn_id,),
+            ).fetchall()
+        )
+        return [row_to_saved_query(row) for row in rows]
+
+    async def get_saved_query(self, conn_id: str, query_id: str) -> SavedQuery | None:
+        row = await self._run(
+            lambda c: c.execute(
+                f"SELECT {SAVED_QUERY_COLUMNS} FROM saved_queries WHERE connection_id = ? AND id = ?",
+                (conn_id, query_id),
+            ).fetchone()
+        )
+        return row_to_saved_query(row) if row else None
+
+    async def create_saved_query(self, query: SavedQuery) -> bool:
+        params = (
+            query.id,
+            query.connectionId,
+            query.name,
+            query.kind,
+            json.dumps(query.request),
+            query.digest,
+            query.createdAt,
+            query.updatedAt,
+        )
+        cursor = await self._run(
+            lambda c: c.execute(
+                """INSERT INTO saved_queries (id, connection_id, name, kind, request, digest, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (connection_id, name) DO NOTHING""",
+                params,
+            )
+        )
+        return cursor.rowcount == 1
+
+    async def delete_saved_query(self, conn_id: str, query_id: str) -> bool:
+        cursor = await self._run(
+            lambda c: c.execute("DELETE FROM saved_queries WHERE connection_id = ? AND id = ?", (conn_id, query_id))
+        )
+        return cursor.rowcount == 1
+
+    async def get_saved_query_snapshot(self, query_id: str) -> tuple[str, datetime] | None:
+        row = await self._run(
+            lambda c: c.execute(
+                "SELECT snapshot, snapshot_at FROM saved_queries WHERE id = ? AND snapshot IS NOT NULL", (query_id,)
+            ).fetchone()
+        )
+        return (row["snapshot"], datetime.fromisoformat(row["snapshot_at"])) if row else None
+
+    async def store_saved_query_snapshot(self, query_id: str, snapshot: str, taken_at: datetime) -> None:
+        params = (snapshot, taken_at.isoformat(), query_id)
+        await self._run(
+            lambda c: c.execute(
+                "UPDATE saved_queries SET snapshot = ?, snapshot_at = ? WHERE id = ?",
+                params,
+            )
+        )
@@ -3,22 +3,34 @@
 from __future__ import annotations
 
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 
 import aerospike_py
-from fastapi import Depends, HTTPException, Path
+from fastapi import Depends, HTTPException, Path, Query
+from starlette.responses import Response
 
-from aerospike_cluster_manager_api import db
+from aerospike_cluster_manager_api import db, scan_throttle
 from aerospike_cluster_manager_api.client_manager import client_manager
+from aerospike_cluster_manager_api.constants import READ_MODE_AP_POLICIES, REPLICA_POLICIES
+from aerospike_cluster_manager_api.models.connection import ConnectionProfile, ReadModeAP, ReplicaPolicy
+from aerospike_cluster_manager_api.scan_throttle import ScanThrottle
 
 logger = logging.getLogger(__name__)
 
 
-async def _get_verified_connection(conn_id: str = Path()) -> str:
-    """Verify that a connection profile exists and return its id."""
+async def _get_verified_profile(conn_id: str = Path()) -> ConnectionProfile:
+    """Load the connection profile for *conn_id* or raise 404."""
     conn = await db.get_connection(conn_id)
     if not conn:
         raise HTTPException(status_code=404, detail=f"Connection '{conn_id}' not found")
+    return conn
+
+
+async def _get_verified_connection(
+    _profile: Annotated[ConnectionProfile, Depends(_get_verified_profile)],
+    conn_id: str = Path(),
+) -> str:
+    """Verify that a connection profile exists and return its id."""
     return conn_id
 
 
@@ -34,8 +46,62 @@ async def _get_client(conn_id: str = Depends(_get_verified_connection)) -> aeros
         ) from e
 
 
+async def _get_read_routing(
+    profile: Annotated[ConnectionProfile, Depends(_get_verified_profile)],
+    replica: Annotated[
+        ReplicaPolicy | None,
+        Query(description="Replica selection for reads; defaults to the connection profile setting."),
+    ] = None,
+    readModeAp: Annotated[
+        ReadModeAP | None,
+        Query(description="AP read consistency (one/all); defaults to the connection profile setting."),
+    ] = None,
+) -> dict[str, Any]:
+    """Resolve per-request read routing, falling back to the profile defaults.
+
+    Returns the policy keys to merge into ``POLICY_READ`` / ``POLICY_QUERY``.
+    ``prefer_rack`` only prefers the profile's ``rackId`` if the client honours
+    ``rack_ids`` (see :meth:`ClientManager._local_client`).
+    """
+    replica = replica or profile.readReplica
+    read_mode_ap = readModeAp or profile.readModeAp
+    routing: dict[str, Any] = {}
+    if replica:
+        routing["replica"] = REPLICA_POLICIES[replica]
+    if read_mode_ap:
+        routing["read_mode_ap"] = READ_MODE_AP_POLICIES[read_mode_ap]
+    return routing
+
+
+async def _get_scan_throttle(
+    client: Annotated[aerospike_py.AsyncClient, Depends(_get_client)],
+    conn_id: Annotated[str, Depends(_get_verified_connection)],
+    response: Response,
+    recordsPerSecond: Annotated[
+        int | None,
+        Query(ge=1, le=10_000_000, description="Cluster-wide scan rate limit in records per second."),
+    ] = None,
+    lowPriority: Annotated[
+        bool,
+        Query(description="Scan one node at a time at a reduced default rate, to protect serving traffic."),
+    ] = False,
+) -> ScanThrottle:
+    """Resolve the scan throttle for this request (see :mod:`scan_throttle`)."""
+    try:
+        node_count = len(client.get_node_names())
+    except Exception:
+        node_count = 1
+    return scan_throttle.resolve(conn_id, recordsPerSecond, lowPriority, node_count, response)
+
+
 VerifiedConnId = Annotated[str, Depends(_get_verified_connection)]
 """Inject a verified connection id from the path."""
 
 AerospikeClient = Annotated[aerospike_py.AsyncClient, Depends(_get_client)]
 """Inject a cached Aerospike async client resolved from the path ``conn_id``."""
+
+ReadRouting = Annotated[dict[str, Any], Depends(_get_read_routing)]
+"""Inject read routing policy overrides from the ``replica`` / ``readModeAp`` query params or profile."""
+
+ScanThrottling = Annotated[ScanThrottle, Depends(_get_scan_throttle)]
+"""Inject the scan throttle and admission settings from the ``recordsPerSecond`` / ``lowPriority`` query params."""
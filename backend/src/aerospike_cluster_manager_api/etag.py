@@ -0,0 +1,113 @@
+"""ETags and conditional GET for polled listings.
+
+The UI polls cluster info, index, UDF and K8s cluster listings every few
+seconds and they rarely change.  :func:`tag` renders a listing once with
+:mod:`fast_json` and tags it with a hash of the bytes; :func:`conditional`
+answers ``If-None-Match`` with ``304 Not Modified`` when the tag still
+matches, so unchanged polls transfer no body.  Tagging happens inside the
+singleflight computation, so concurrent polls share one render and hash.
+
+The tag is a hash of the rendered body rather than e.g. a CR
+``resourceVersion``: listings include derived values (cluster age, the
+matching connection, namespace usage) that change without a new version.
+Cluster info with per-node statistics changes on every poll, so it is kept
+in :data:`snapshots` for a few seconds: polls within that window see the same
+body and revalidate.
+``CompressionMiddleware`` weakens the tag of compressed responses, and
+:func:`etag_matches` uses the weak comparison, so both forms revalidate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, NamedTuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from aerospike_cluster_manager_api import fast_json
+from aerospike_cluster_manager_api.instrumentation import latency
+from aerospike_cluster_manager_api.singleflight import singleflight
+
+# Browsers keep the response but revalidate it on every poll.
+_CACHE_CONTROL = "private, no-cache"
+
+
+class Tagged(NamedTuple):
+    body: bytes
+    etag: str
+
+    @classmethod
+    def of(cls, content: Any) -> Tagged:
+        with latency.timed("serialization", "etag"):
+            body = fast_json.dumps(content)
+            return cls(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+
+async def tag(content: Awaitable[Any]) -> Tagged:
+    """Await *content* and render it as a :class:`Tagged` body."""
+    return Tagged.of(await content)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of *etag* against an ``If-None-Match`` header (RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def conditional(request: Request, tagged: Tagged) -> Response:
+    """Return 304 if the client's copy is current, otherwise the tagged body."""
+    headers = {"ETag": tagged.etag, "Cache-Control": _CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), tagged.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(tagged.body, media_type="application/json", headers=headers)
+
+
+class Snapshots:
+    """Short-lived :class:`Tagged` bodies of views that would otherwise differ on every poll.
+
+    Keys are singleflight keys; :meth:`forget` takes the same prefixes as
+    :meth:`SingleFlight.forget` and is called alongside it after writes.
+    Snapshots are per worker process.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[Hashable, ...], tuple[float, Tagged]] = {}
+        # Bumped by forget() so a body computed before a write is not kept
+        self._generation = 0
+
+    async def get(
+        self, key: tuple[Hashable, ...], compute: Callable[[], Awaitable[Tagged]], ttl_seconds: float
+    ) -> Tagged:
+        """Return the snapshot for *key* while it is fresh, otherwise compute (via singleflight) and keep it."""
+        now = time.monotonic()
+        hit = self._entries.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        generation = self._generation
+        tagged = await singleflight.do(key, compute)
+        if ttl_seconds > 0 and generation == self._generation:
+            for stale in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[stale]
+            self._entries[key] = (now + ttl_seconds, tagged)
+        return tagged
+
+    def forget(self, *prefix: Hashable) -> None:
+        """Drop snapshots whose key starts with *prefix*."""
+        self._generation += 1
+        n = len(prefix)
+        for key in [k for k in self._entries if k[:n] == prefix]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+
+snapshots = Snapshots()
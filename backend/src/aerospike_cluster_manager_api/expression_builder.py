@@ -1,12 +1,29 @@
-"""Build aerospike-py expression dicts from FilterCondition models."""
+"""Build aerospike-py expression dicts from FilterCondition models.
+
+Filter groups are first normalized (see :func:`normalize`): nested groups are
+flattened, duplicates dropped, constant branches folded and siblings ordered
+so cheap checks run first.  Compiled expressions are memoized in a bounded LRU
+keyed on the normalized tree, so equivalent filters resent by polling
+dashboards and paging share one entry.  Cached expression dicts are shared
+and must be treated as read-only.
+
+Conditions on list/map contents compile to a bin type check only; the exact
+test is returned as :attr:`CompiledFilter.check` and run by the query service
+(see :mod:`filter_eval`).
+"""
 
 from __future__ import annotations
 
 import json
 import re
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
 
 from aerospike_py import exp
 
+from aerospike_cluster_manager_api import config, filter_eval
 from aerospike_cluster_manager_api.models.query import (
     BinDataType,
     FilterCondition,
@@ -57,8 +74,27 @@ _CMP_OPS: dict[FilterOperator, object] = {
 }
 
 
+ALWAYS_TRUE = exp.bool_val(True)
+ALWAYS_FALSE = exp.bool_val(False)
+
+# Particle types returned by exp.bin_type()
+_PARTICLE_LIST = 20
+_PARTICLE_MAP = 19
+
+
+def _collection_prefilter(cond: FilterCondition) -> dict:
+    """Server-side necessary condition for a list/map content condition: the bin holds a list/map."""
+    if cond.operator == FilterOperator.NOT_EXISTS:
+        return ALWAYS_TRUE  # also true when the bin itself is missing
+    particle = _PARTICLE_LIST if cond.bin_type == BinDataType.LIST else _PARTICLE_MAP
+    return exp.eq(exp.bin_type(cond.bin), exp.int_val(particle))
+
+
 def _build_condition(cond: FilterCondition) -> dict:
     """Convert a single FilterCondition into an expression dict."""
+    if cond.is_collection_condition:
+        return _collection_prefilter(cond)
+
     op = cond.operator
     bin_name = cond.bin
     bin_type = cond.bin_type
@@ -104,13 +140,317 @@ def _build_condition(cond: FilterCondition) -> dict:
     raise ValueError(f"Unknown filter operator: {op}")
 
 
-def build_expression(group: FilterGroup) -> dict:
-    """Build a complete expression dict from a FilterGroup."""
-    exprs = [_build_condition(c) for c in group.conditions]
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable, order-stable form of a condition value."""
+    kind = type(value)
+    if kind in _SCALARS:
+        # Keep 1, 1.0 and True apart: they compile to different value expressions.
+        return (kind.__name__, value)
+    if isinstance(value, dict):
+        return ("__dict__", tuple(sorted((str(k), _freeze(v)) for k, v in value.items())))
+    if isinstance(value, list | tuple):
+        return ("__list__", tuple(_freeze(v) for v in value))
+    return (kind.__name__, value)
+
+
+# ---------------------------------------------------------------------------
+# Normalization: flatten, simplify and order the filter tree
+# ---------------------------------------------------------------------------
+
+# Relative per-record evaluation cost.  Siblings are evaluated cheapest first so
+# that the server's short-circuiting of and/or skips the expensive checks.
+_TYPE_COSTS: dict[BinDataType, int] = {
+    BinDataType.INTEGER: 2,
+    BinDataType.FLOAT: 2,
+    BinDataType.BOOL: 2,
+    BinDataType.STRING: 3,
+    BinDataType.LIST: 4,
+    BinDataType.MAP: 4,
+    BinDataType.GEO: 6,
+}
+_OPERATOR_COSTS: dict[FilterOperator, int] = {
+    FilterOperator.EXISTS: 1,
+    FilterOperator.NOT_EXISTS: 1,
+    FilterOperator.IS_TRUE: 2,
+    FilterOperator.IS_FALSE: 2,
+    FilterOperator.CONTAINS: 8,
+    FilterOperator.NOT_CONTAINS: 8,
+    FilterOperator.REGEX: 8,
+    FilterOperator.GEO_WITHIN: 10,
+    FilterOperator.GEO_CONTAINS: 10,
+}
+
+
+def condition_cost(cond: FilterCondition) -> int:
+    """Estimated relative cost of evaluating *cond* against one record."""
+    if cond.is_collection_condition:
+        return 1  # only the bin type check runs on the server
+    if cond.operator in _OPERATOR_COSTS:
+        return _OPERATOR_COSTS[cond.operator]
+    cost = _TYPE_COSTS[cond.bin_type]
+    return 2 * cost if cond.operator == FilterOperator.BETWEEN else cost
+
+
+@dataclass(frozen=True, slots=True)
+class _Leaf:
+    sort_key: tuple  # (cost, 0, condition key)
+    cond: FilterCondition = field(compare=False, hash=False)
+
+
+@dataclass(frozen=True, slots=True)
+class _Branch:
+    sort_key: tuple  # (cost, 1, logic, child keys)
+    logic: str = field(compare=False, hash=False)
+    children: tuple[_Leaf | _Branch, ...] = field(compare=False, hash=False)
+
+
+_Node = _Leaf | _Branch | bool
+
+
+def _leaf(cond: FilterCondition) -> _Leaf | bool:
+    """Wrap *cond*, folding conditions that can never match to ``False``."""
+    if (
+        cond.operator == FilterOperator.BETWEEN
+        and cond.bin_type in (BinDataType.INTEGER, BinDataType.FLOAT)
+        and isinstance(cond.value, int | float)
+        and isinstance(cond.value2, int | float)
+        and cond.value > cond.value2
+    ):
+        return False
+    key = (cond.bin, cond.operator, cond.bin_type, _freeze(cond.value), _freeze(cond.value2), _freeze(cond.path))
+    return _Leaf((condition_cost(cond), 0, key), cond)
+
+
+_OPPOSITES = (
+    (FilterOperator.EXISTS, FilterOperator.NOT_EXISTS),
+    (FilterOperator.IS_TRUE, FilterOperator.IS_FALSE),
+)
+
+
+def _presence(leaves: list[_Leaf]) -> set[tuple]:
+    """(bin, path, operator) of every leaf; conditions on different paths of a bin are unrelated."""
+    return {(leaf.cond.bin, leaf.sort_key[2][5], leaf.cond.operator) for leaf in leaves}
+
+
+def _contradicts(leaves: list[_Leaf]) -> bool:
+    """True when an AND of *leaves* can never match."""
+    seen = _presence(leaves)
+    targets = {(b, p) for b, p, _op in seen}
+    if any((b, p, yes) in seen and (b, p, no) in seen for b, p in targets for yes, no in _OPPOSITES):
+        return True
+    equals: dict[tuple[str, BinDataType], dict] = {}
+    for leaf in leaves:
+        cond = leaf.cond
+        if cond.operator == FilterOperator.EQ and not cond.is_collection_condition:
+            # Compare the compiled values: "1" and 1 are the same integer condition.
+            value = _val_accessor(cond.value, cond.bin_type)
+            if equals.setdefault((cond.bin, cond.bin_type), value) != value:
+                return True
+    return False
+
+
+def _covers_everything(leaves: list[_Leaf]) -> bool:
+    """True when an OR of *leaves* matches every record (``exists x OR not_exists x``)."""
+    seen = _presence(leaves)
+    return any((b, p, FilterOperator.NOT_EXISTS) in seen for b, p, op in seen if op == FilterOperator.EXISTS)
+
+
+def normalize(group: FilterGroup) -> _Node:
+    """Reduce *group* to an ordered tree, or to ``True``/``False`` when the outcome is fixed.
+
+    Nested groups with the same logic as their parent are flattened, duplicate
+    siblings are dropped, constant branches are folded (``x AND false`` is
+    ``false``, ``x OR false`` is ``x``) and single-child groups are unwrapped.
+    AND/OR are commutative, so siblings are sorted cheapest first; equivalent
+    filters therefore normalize to the same tree.
+    """
+    absorbing = group.logic == "or"  # OR with a true child is true; AND with a false child is false
+    children: dict[tuple, _Leaf | _Branch] = {}
+    nodes: list[_Node] = [_leaf(c) for c in group.conditions] + [normalize(g) for g in group.groups]
+    for node in nodes:
+        if isinstance(node, bool):
+            if node is absorbing:
+                return absorbing
+            continue
+        flattened = node.children if isinstance(node, _Branch) and node.logic == group.logic else (node,)
+        for child in flattened:
+            children.setdefault(child.sort_key, child)
 
-    if len(exprs) == 1:
-        return exprs[0]
+    leaves = [c for c in children.values() if isinstance(c, _Leaf)]
+    if group.logic == "and" and _contradicts(leaves):
+        return False
+    if group.logic == "or" and _covers_everything(leaves):
+        return True
+    if not children:
+        return not absorbing
+    if len(children) == 1:
+        return next(iter(children.values()))
+    ordered = sorted(children)
+    cost = sum(k[0] for k in ordered)
+    return _Branch((cost, 1, group.logic, tuple(ordered)), group.logic, tuple(children[k] for k in ordered))
 
-    if group.logic == "and":
-        return exp.and_(*exprs)
+
+def _compile(node: _Node) -> dict:
+    if isinstance(node, bool):
+        return ALWAYS_TRUE if node else ALWAYS_FALSE
+    if isinstance(node, _Leaf):
+        return _build_condition(node.cond)
+    exprs = [_compile(c) for c in node.children]
+    # Collection pre-filters can be constant; fold them like normalize() does.
+    if node.logic == "and":
+        exprs = [e for e in exprs if e != ALWAYS_TRUE]
+        if not exprs:
+            return ALWAYS_TRUE
+        return exprs[0] if len(exprs) == 1 else exp.and_(*exprs)
+    if ALWAYS_TRUE in exprs:
+        return ALWAYS_TRUE
     return exp.or_(*exprs)
+
+
+def _exact(node: _Node) -> bool:
+    """True when the compiled expression of *node* decides it without help from the API."""
+    if isinstance(node, bool):
+        return True
+    if isinstance(node, _Leaf):
+        return not node.cond.is_collection_condition
+    return all(_exact(c) for c in node.children)
+
+
+def _evaluate(node: _Leaf | _Branch, bins: dict[str, Any]) -> bool:
+    if isinstance(node, _Leaf):
+        return filter_eval.matches(node.cond, bins)
+    if node.logic == "and":
+        return all(_evaluate(c, bins) for c in node.children)
+    return any(_evaluate(c, bins) for c in node.children)
+
+
+class CompiledFilter(NamedTuple):
+    expression: dict
+    # Exact test for records the expression let through, when it is only approximate
+    check: Callable[[dict[str, Any]], bool] | None = None
+    # Bins the check reads; they must be fetched even if not selected
+    check_bins: frozenset[str] = frozenset()
+
+
+def _compile_filter(node: _Node) -> CompiledFilter:
+    expression = _compile(node)
+    if isinstance(node, bool) or _exact(node):
+        return CompiledFilter(expression)
+    # Under a top-level AND the server already enforces the exact siblings.
+    residual = (
+        tuple(c for c in node.children if not _exact(c))
+        if isinstance(node, _Branch) and node.logic == "and"
+        else (node,)
+    )
+
+    def check(bins: dict[str, Any]) -> bool:
+        return all(_evaluate(n, bins) for n in residual)
+
+    check_bins: set[str] = set()
+    stack: list[_Leaf | _Branch] = list(residual)
+    while stack:
+        n = stack.pop()
+        if isinstance(n, _Leaf):
+            check_bins.add(n.cond.bin)
+        else:
+            stack.extend(n.children)
+    return CompiledFilter(expression, check, frozenset(check_bins))
+
+
+def _canonical(node: _Node) -> tuple:
+    return (node,) if isinstance(node, bool) else node.sort_key
+
+
+class _ExpressionCache:
+    """Bounded LRU of compiled expressions keyed by canonical filter group.
+
+    Lookups first try the group's JSON as sent, so a repeated filter skips
+    :func:`normalize`; a reordered but equivalent one still shares the compiled
+    entry through its canonical key.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, CompiledFilter] = OrderedDict()
+        self._raw: OrderedDict[str, tuple[tuple, CompiledFilter]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, group: FilterGroup) -> CompiledFilter:
+        return self.lookup(group)[1]
+
+    def lookup(self, group: FilterGroup) -> tuple[tuple, CompiledFilter]:
+        """Return *group*'s canonical key and compiled filter."""
+        if self.maxsize <= 0:
+            self.misses += 1
+            node = normalize(group)
+            return _canonical(node), _compile_filter(node)
+        raw_key = group.model_dump_json()
+        cached = self._raw.get(raw_key)
+        if cached is not None:
+            self._raw.move_to_end(raw_key)
+            self.hits += 1
+            return cached
+        node = normalize(group)
+        key = _canonical(node)
+        compiled = self._entries.get(key)
+        if compiled is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            compiled = self._entries[key] = _compile_filter(node)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        self._raw[raw_key] = (key, compiled)
+        if len(self._raw) > self.maxsize:
+            self._raw.popitem(last=False)
+        return key, compiled
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._raw.clear()
+        self.hits = self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "maxSize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+_cache = _ExpressionCache(config.EXPRESSION_CACHE_SIZE)
+
+
+def compile_filter(group: FilterGroup) -> CompiledFilter:
+    """Compile *group* to a server-side expression plus, if needed, an exact API-side check (memoized)."""
+    return _cache.get_or_build(group)
+
+
+def canonical_key(group: FilterGroup) -> str:
+    """Text form of *group* after :func:`normalize`; equivalent filters (reordered, nested) share it."""
+    return repr(_cache.lookup(group)[0])
+
+
+def build_expression(group: FilterGroup) -> dict:
+    """Build a complete expression dict from a FilterGroup (memoized; do not mutate the result).
+
+    A filter that can never match compiles to :data:`ALWAYS_FALSE`, one that
+    always matches to :data:`ALWAYS_TRUE`.  For list/map content conditions
+    the expression is only a pre-filter; use :func:`compile_filter` to get the
+    exact check as well.
+    """
+    return _cache.get_or_build(group).expression
+
+
+def build_expression_uncached(group: FilterGroup) -> dict:
+    """Build an expression dict from a FilterGroup without consulting the cache."""
+    return _compile(normalize(group))
+
+
+def cache_info() -> dict[str, int]:
+    return _cache.info()
+
+
+def clear_cache() -> None:
+    _cache.clear()
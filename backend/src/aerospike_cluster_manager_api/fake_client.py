@@ -0,0 +1,648 @@
+"""In-memory stand-in for :class:`aerospike_py.AsyncClient`.
+
+With ``AEROSPIKE_CLIENT=fake``, :class:`~aerospike_cluster_manager_api.client_manager.ClientManager`
+hands out a :class:`FakeAsyncClient` per connection profile instead of
+connecting to the profile's hosts, so the API can be load-tested and
+benchmarked on a laptop or in CI without an Aerospike cluster.
+
+The fake implements the client calls the API makes:
+
+* ``get`` / ``put`` / ``remove`` / ``operate`` over a keyspace held by the
+  client (one per connection, in the coordinator worker), with generations and the
+  ``exists`` write policies;
+* ``query`` scans of a set or namespace, applying a secondary-index
+  predicate (which, as on a server, needs a matching index) and the
+  ``filter_expression`` policy for the expressions
+  :mod:`expression_builder` produces (``geo_compare`` is not evaluated);
+* ``info_all`` / ``info_random_node`` / ``get_node_names`` for a cluster of
+  ``FAKE_AEROSPIKE_NODES`` nodes, answering the info commands the API uses
+  with replies shaped like a server's, computed from the keyspace (each
+  record counted on ``replication-factor`` nodes);
+* ``index_*_create`` / ``index_remove`` and ``udf_put`` / ``udf_remove``.
+
+Every awaited call first sleeps ``FAKE_AEROSPIKE_LATENCY_US`` plus or minus
+``FAKE_AEROSPIKE_JITTER_US`` and then, with probability
+``FAKE_AEROSPIKE_FAILURE_PCT`` percent, raises ``AerospikeTimeoutError``.
+Jitter and failures are drawn from a generator seeded with
+``FAKE_AEROSPIKE_SEED``, so a run can be reproduced.  ``FAKE_AEROSPIKE_RECORDS``
+records from :mod:`sample_data_generator` are loaded into ``test.sample_set``.
+Security is reported as disabled: ``admin_*`` calls raise ``AdminError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import re
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import aerospike_py
+from aerospike_py import Record
+from aerospike_py.exception import (
+    AdminError,
+    AerospikeTimeoutError,
+    ClientError,
+    IndexFoundError,
+    IndexNotFound,
+    InvalidArgError,
+    RecordExistsError,
+    RecordNotFound,
+    ServerError,
+    UDFError,
+)
+
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.sample_data_generator import generate_record_bins
+
+NAMESPACES = ("test", "bar")
+REPLICATION_FACTOR = 2
+SEED_SET = "sample_set"
+
+_BUILD = "8.1.0.0"
+_EDITION = "Aerospike Community Edition"
+_MEMORY_SIZE = 4 << 30
+
+# Particle types, as returned by exp.bin_type()
+_PARTICLE_TYPES: tuple[tuple[type, int], ...] = (
+    (bool, 17),
+    (int, 1),
+    (float, 2),
+    (str, 3),
+    (bytes, 4),
+    (dict, 19),
+    (list, 20),
+)
+
+_REGEX_FLAGS = {2: re.IGNORECASE, 8: re.MULTILINE}  # REGEX_ICASE, REGEX_NEWLINE
+
+
+class _Entry:
+    __slots__ = ("bins", "digest", "gen", "size", "ttl")
+
+    def __init__(self, digest: bytes) -> None:
+        self.digest = digest
+        self.gen = 0
+        self.ttl = 0
+        self.bins: dict[str, Any] = {}
+        self.size = 0
+
+
+class _Index:
+    __slots__ = ("bin", "name", "set", "type")
+
+    def __init__(self, name: str, set_name: str, bin_name: str, index_type: str) -> None:
+        self.name = name
+        self.set = set_name
+        self.bin = bin_name
+        self.type = index_type
+
+
+def _digest(set_name: str, pk: Any) -> bytes:
+    return hashlib.blake2b(repr((set_name, pk)).encode(), digest_size=20).digest()
+
+
+def _share(total: int, node: int, nodes: int, rf: int) -> int:
+    """Node *node*'s part of *total* records stored *rf* times across *nodes* nodes."""
+    copies = total * min(rf, nodes)
+    return copies // nodes + (1 if node < copies % nodes else 0)
+
+
+# ---------------------------------------------------------------------------
+# Filter expressions and secondary-index predicates
+# ---------------------------------------------------------------------------
+
+
+class _Unknown(Exception):
+    """A typed bin read found no bin or a value of another type: the record is filtered out."""
+
+
+_TYPED_BINS: dict[str, type | tuple[type, ...]] = {
+    "int_bin": int,
+    "float_bin": float,
+    "string_bin": str,
+    "bool_bin": bool,
+    "geo_bin": str,
+    "list_bin": list,
+    "map_bin": dict,
+    "blob_bin": bytes,
+}
+
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda a, b: a == b,
+    "ne": lambda a, b: a != b,
+    "gt": lambda a, b: a > b,
+    "ge": lambda a, b: a >= b,
+    "lt": lambda a, b: a < b,
+    "le": lambda a, b: a <= b,
+}
+
+
+def particle_type(value: Any) -> int:
+    return next((particle for py_type, particle in _PARTICLE_TYPES if isinstance(value, py_type)), 0)
+
+
+def evaluate(expr: dict[str, Any], bins: dict[str, Any]) -> Any:
+    """Evaluate an ``aerospike_py.exp`` expression against *bins*; raises :class:`_Unknown` on type mismatches."""
+    kind = expr["__expr__"]
+    if kind in _TYPED_BINS:
+        value = bins.get(expr["name"])
+        expected = _TYPED_BINS[kind]
+        if value is None or not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            raise _Unknown
+        return value
+    if kind.endswith("_val"):
+        return expr["val"]
+    if kind in _COMPARISONS:
+        left, right = evaluate(expr["left"], bins), evaluate(expr["right"], bins)
+        try:
+            return _COMPARISONS[kind](left, right)
+        except TypeError:
+            raise _Unknown from None
+    if kind == "and":
+        return all(evaluate(e, bins) for e in expr["exprs"])
+    if kind == "or":
+        return any(evaluate(e, bins) for e in expr["exprs"])
+    if kind == "not":
+        return not evaluate(expr["expr"], bins)
+    if kind == "bin_exists":
+        return expr["name"] in bins
+    if kind == "bin_type":
+        return particle_type(bins.get(expr["name"]))
+    if kind == "regex_compare":
+        flags = 0
+        for bit, flag in _REGEX_FLAGS.items():
+            if expr["flags"] & bit:
+                flags |= flag
+        return re.search(expr["regex"], evaluate(expr["bin"], bins), flags) is not None
+    if kind == "geo_compare":
+        return True
+    raise InvalidArgError(f"Expression '{kind}' is not supported by the fake client")
+
+
+def _matches_expression(expr: dict[str, Any] | None, bins: dict[str, Any]) -> bool:
+    if expr is None:
+        return True
+    try:
+        return bool(evaluate(expr, bins))
+    except _Unknown:
+        return False
+
+
+def _predicate_check(predicate: tuple, index: _Index) -> Callable[[dict[str, Any]], bool]:
+    kind, bin_name = predicate[0], predicate[1]
+    value_type: type = str if index.type == "string" else int
+
+    def typed(value: Any) -> bool:
+        return isinstance(value, value_type) and not isinstance(value, bool)
+
+    if kind == "equals":
+        wanted = predicate[2]
+        return lambda bins: typed(bins.get(bin_name)) and bins[bin_name] == wanted
+    if kind == "between":
+        low, high = predicate[2], predicate[3]
+        return lambda bins: typed(bins.get(bin_name)) and low <= bins[bin_name] <= high
+    if kind == "contains":
+        collection, wanted = predicate[2], predicate[3]
+
+        def contains(bins: dict[str, Any]) -> bool:
+            value = bins.get(bin_name)
+            if collection == aerospike_py.INDEX_TYPE_LIST and isinstance(value, list):
+                return wanted in value
+            if collection == aerospike_py.INDEX_TYPE_MAPKEYS and isinstance(value, dict):
+                return wanted in value
+            if collection == aerospike_py.INDEX_TYPE_MAPVALUES and isinstance(value, dict):
+                return wanted in value.values()
+            return False
+
+        return contains
+    raise ClientError("Geo filters are not supported by the fake client")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class FakeQuery:
+    """``client.query()`` result: ``select`` / ``where``, then ``results`` or ``foreach``."""
+
+    def __init__(self, client: FakeAsyncClient, namespace: str, set_name: str | None) -> None:
+        self._client = client
+        self._namespace = namespace
+        self._set = set_name or ""
+        self._bins: tuple[str, ...] = ()
+        self._predicate: tuple | None = None
+
+    def select(self, *bins: str) -> None:
+        self._bins = bins
+
+    def where(self, predicate: tuple) -> None:
+        self._predicate = predicate
+
+    async def results(self, policy: dict[str, Any] | None = None) -> list[Record]:
+        await self._client._io()
+        return list(self._scan(policy or {}))
+
+    async def foreach(self, callback: Callable[[Record], Any], policy: dict[str, Any] | None = None) -> None:
+        await self._client._io()
+        for record in self._scan(policy or {}):
+            if callback(record) is False:
+                break
+
+    def _scan(self, policy: dict[str, Any]) -> Iterator[Record]:
+        check = None
+        if self._predicate is not None:
+            check = _predicate_check(
+                self._predicate, self._client._index_for(self._namespace, self._set, self._predicate)
+            )
+        expression = policy.get("filter_expression")
+        for set_name, pk, entry in self._client._entries(self._namespace, self._set):
+            if check is not None and not check(entry.bins):
+                continue
+            if not _matches_expression(expression, entry.bins):
+                continue
+            bins = {b: entry.bins[b] for b in self._bins if b in entry.bins} if self._bins else dict(entry.bins)
+            yield Record(
+                key=(self._namespace, set_name, pk, entry.digest),
+                meta={"gen": entry.gen, "ttl": entry.ttl},
+                bins=bins,
+            )
+
+
+class FakeAsyncClient:
+    """Deterministic in-process :class:`aerospike_py.AsyncClient` over an in-memory keyspace."""
+
+    def __init__(
+        self,
+        client_config: dict[str, Any] | None = None,
+        *,
+        nodes: int | None = None,
+        records: int | None = None,
+        latency_us: int | None = None,
+        jitter_us: int | None = None,
+        failure_pct: float | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.config = client_config or {}
+        node_count = max(1, config.FAKE_AEROSPIKE_NODES if nodes is None else nodes)
+        self.node_names = [f"BB9{i:013X}" for i in range(node_count)]
+        self.latency_us = config.FAKE_AEROSPIKE_LATENCY_US if latency_us is None else latency_us
+        self.jitter_us = config.FAKE_AEROSPIKE_JITTER_US if jitter_us is None else jitter_us
+        self.failure_pct = config.FAKE_AEROSPIKE_FAILURE_PCT if failure_pct is None else failure_pct
+        self._rng = random.Random(config.FAKE_AEROSPIKE_SEED if seed is None else seed)
+        self._connected = False
+        self._started = time.monotonic()
+        self._sets: dict[tuple[str, str], dict[Any, _Entry]] = {}
+        self._indexes: dict[str, dict[str, _Index]] = {ns: {} for ns in NAMESPACES}
+        self._udfs: dict[str, str] = {}
+        self._counters: dict[tuple[str, str], int] = {}
+        self.calls = 0
+        for i in range(1, (config.FAKE_AEROSPIKE_RECORDS if records is None else records) + 1):
+            self._write(("test", SEED_SET, i), generate_record_bins(i), None, None)
+
+    # -- Fault injection -----------------------------------------------------
+
+    async def _io(self) -> None:
+        """One simulated round trip: latency, then possibly an injected failure."""
+        self.calls += 1
+        delay_us = self.latency_us
+        if self.jitter_us:
+            delay_us = max(0.0, delay_us + self._rng.uniform(-self.jitter_us, self.jitter_us))
+        await asyncio.sleep(delay_us / 1_000_000)
+        if self.failure_pct and self._rng.random() * 100 < self.failure_pct:
+            raise AerospikeTimeoutError("Injected failure (FAKE_AEROSPIKE_FAILURE_PCT)")
+
+    # -- Connection ------------------------------------------------------------
+
+    async def connect(self, username: str | None = None, password: str | None = None) -> FakeAsyncClient:
+        await self._io()
+        self._connected = True
+        return self
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def close(self) -> None:
+        self._connected = False
+
+    def get_node_names(self) -> list[str]:
+        return list(self.node_names)
+
+    # -- Records -----------------------------------------------------------------
+
+    def _namespace(self, namespace: str) -> str:
+        if namespace not in NAMESPACES:
+            raise ServerError(f"Namespace not found: {namespace}")
+        return namespace
+
+    def _entries(self, namespace: str, set_name: str) -> Iterator[tuple[str, Any, _Entry]]:
+        self._namespace(namespace)
+        for (ns, name), entries in list(self._sets.items()):
+            if ns == namespace and (not set_name or name == set_name):
+                for pk, entry in list(entries.items()):
+                    yield name, pk, entry
+
+    def _existing(self, key: tuple) -> _Entry | None:
+        return self._sets.get((self._namespace(key[0]), key[1] or ""), {}).get(key[2])
+
+    def _lookup(self, key: tuple) -> _Entry:
+        entry = self._existing(key)
+        if entry is None:
+            raise RecordNotFound(f"Record not found: {key[:3]}")
+        return entry
+
+    def _record(self, key: tuple, entry: _Entry, bins: dict[str, Any]) -> Record:
+        return Record(
+            key=(key[0], key[1] or "", key[2], entry.digest), meta={"gen": entry.gen, "ttl": entry.ttl}, bins=bins
+        )
+
+    def _count(self, namespace: str, counter: str) -> None:
+        self._counters[(namespace, counter)] = self._counters.get((namespace, counter), 0) + 1
+
+    def _write(
+        self, key: tuple, bins: dict[str, Any], meta: dict[str, Any] | None, policy: dict[str, Any] | None
+    ) -> _Entry:
+        namespace, set_name, pk = self._namespace(key[0]), key[1] or "", key[2]
+        records = self._sets.setdefault((namespace, set_name), {})
+        entry = records.get(pk)
+        exists = (policy or {}).get("exists", aerospike_py.POLICY_EXISTS_IGNORE)
+        if entry is not None and exists == aerospike_py.POLICY_EXISTS_CREATE_ONLY:
+            raise RecordExistsError(f"Record exists: {key[:3]}")
+        if entry is None and exists in (
+            aerospike_py.POLICY_EXISTS_UPDATE_ONLY,
+            aerospike_py.POLICY_EXISTS_REPLACE_ONLY,
+        ):
+            raise RecordNotFound(f"Record not found: {key[:3]}")
+        if entry is None:
+            entry = records[pk] = _Entry(_digest(set_name, pk))
+        if exists in (aerospike_py.POLICY_EXISTS_REPLACE, aerospike_py.POLICY_EXISTS_REPLACE_ONLY):
+            entry.bins = {}
+        for name, value in bins.items():
+            if value is None:
+                entry.bins.pop(name, None)
+            else:
+                entry.bins[name] = value
+        entry.gen += 1
+        if meta and "ttl" in meta:
+            entry.ttl = meta["ttl"]
+        entry.size = len(repr(entry.bins))
+        return entry
+
+    async def get(self, key: tuple, policy: dict[str, Any] | None = None) -> Record:
+        await self._io()
+        entry = self._lookup(key)
+        self._count(key[0], "client_read_success")
+        return self._record(key, entry, dict(entry.bins))
+
+    async def put(
+        self,
+        key: tuple,
+        bins: dict[str, Any],
+        meta: dict[str, Any] | None = None,
+        policy: dict[str, Any] | None = None,
+    ) -> None:
+        await self._io()
+        self._write(key, bins, meta, policy)
+        self._count(key[0], "client_write_success")
+
+    async def remove(
+        self, key: tuple, meta: dict[str, Any] | None = None, policy: dict[str, Any] | None = None
+    ) -> None:
+        await self._io()
+        self._lookup(key)
+        del self._sets[(key[0], key[1] or "")][key[2]]
+        self._count(key[0], "client_write_success")
+
+    async def operate(
+        self,
+        key: tuple,
+        ops: list[dict[str, Any]],
+        meta: dict[str, Any] | None = None,
+        policy: dict[str, Any] | None = None,
+    ) -> Record:
+        """Apply read, write, increment, append, prepend, touch and delete operations in order."""
+        await self._io()
+        read: dict[str, Any] = {}
+        for op in ops:
+            code, name, value = op["op"], op.get("bin"), op.get("val")
+            if code == aerospike_py.OPERATOR_READ:
+                current = self._lookup(key).bins
+                read.update({name: current[name]} if name else current)
+            elif code == aerospike_py.OPERATOR_DELETE:
+                self._lookup(key)
+                del self._sets[(key[0], key[1] or "")][key[2]]
+            elif code == aerospike_py.OPERATOR_TOUCH:
+                self._write(key, {}, meta or {"ttl": value or 0}, {"exists": aerospike_py.POLICY_EXISTS_UPDATE_ONLY})
+            else:
+                current = self._existing(key)
+                old = current.bins.get(name) if current is not None else None
+                if code == aerospike_py.OPERATOR_WRITE:
+                    new = value
+                elif code == aerospike_py.OPERATOR_INCR:
+                    new = (old or 0) + value
+                elif code == aerospike_py.OPERATOR_APPEND:
+                    new = (old or "") + value
+                elif code == aerospike_py.OPERATOR_PREPEND:
+                    new = value + (old or "")
+                else:
+                    raise InvalidArgError(f"Operation {code} is not supported by the fake client")
+                self._write(key, {name: new}, meta, policy)
+        self._count(key[0], "client_write_success")
+        entry = self._existing(key)
+        if entry is None:
+            return Record(key=(key[0], key[1] or "", key[2], _digest(key[1] or "", key[2])), meta=None, bins=read)
+        return self._record(key, entry, read)
+
+    def query(self, namespace: str, set_name: str | None) -> FakeQuery:
+        return FakeQuery(self, namespace, set_name)
+
+    # -- Secondary indexes -------------------------------------------------------
+
+    def _index_for(self, namespace: str, set_name: str, predicate: tuple) -> _Index:
+        for index in self._indexes[self._namespace(namespace)].values():
+            if index.bin == predicate[1] and (not index.set or index.set == set_name):
+                return index
+        raise IndexNotFound(f"No index on {namespace}.{set_name or '*'}.{predicate[1]}")
+
+    async def _index_create(self, namespace: str, set_name: str, bin_name: str, name: str, index_type: str) -> None:
+        await self._io()
+        indexes = self._indexes[self._namespace(namespace)]
+        if name in indexes:
+            raise IndexFoundError(f"Index already exists: {name}")
+        indexes[name] = _Index(name, set_name or "", bin_name, index_type)
+
+    async def index_integer_create(
+        self, namespace: str, set_name: str, bin_name: str, index_name: str, policy: dict[str, Any] | None = None
+    ) -> None:
+        await self._index_create(namespace, set_name, bin_name, index_name, "numeric")
+
+    async def index_string_create(
+        self, namespace: str, set_name: str, bin_name: str, index_name: str, policy: dict[str, Any] | None = None
+    ) -> None:
+        await self._index_create(namespace, set_name, bin_name, index_name, "string")
+
+    async def index_geo2dsphere_create(
+        self, namespace: str, set_name: str, bin_name: str, index_name: str, policy: dict[str, Any] | None = None
+    ) -> None:
+        await self._index_create(namespace, set_name, bin_name, index_name, "geo2dsphere")
+
+    async def index_remove(self, namespace: str, index_name: str, policy: dict[str, Any] | None = None) -> None:
+        await self._io()
+        if self._indexes[self._namespace(namespace)].pop(index_name, None) is None:
+            raise IndexNotFound(f"Index not found: {index_name}")
+
+    # -- UDFs --------------------------------------------------------------------
+
+    async def udf_put(self, filename: str, udf_type: int = 0, policy: dict[str, Any] | None = None) -> None:
+        await self._io()
+        content = await asyncio.to_thread(Path(filename).read_bytes)
+        self._udfs[Path(filename).name] = hashlib.sha1(content).hexdigest()
+
+    async def udf_remove(self, module: str, policy: dict[str, Any] | None = None) -> None:
+        await self._io()
+        if self._udfs.pop(module, None) is None:
+            raise UDFError(f"UDF module not found: {module}")
+
+    # -- Security ----------------------------------------------------------------
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("admin_"):
+
+            async def security_disabled(*args: Any, **kwargs: Any) -> Any:
+                await self._io()
+                raise AdminError("Security is not enabled")
+
+            return security_disabled
+        raise AttributeError(name)
+
+    # -- Info --------------------------------------------------------------------
+
+    async def info_all(self, command: str, policy: dict[str, Any] | None = None) -> list[tuple[str, int | None, str]]:
+        await self._io()
+        return [(name, None, self._info(command, i)) for i, name in enumerate(self.node_names)]
+
+    async def info_random_node(self, command: str, policy: dict[str, Any] | None = None) -> str:
+        await self._io()
+        return self._info(command, self._rng.randrange(len(self.node_names)))
+
+    def _info(self, command: str, node: int) -> str:
+        """Node *node*'s reply to an info *command*."""
+        name, _, arg = command.partition("/")
+        if command == "namespaces":
+            return ";".join(NAMESPACES)
+        if command == "build":
+            return _BUILD
+        if command == "edition":
+            return _EDITION
+        if command == "service":
+            return f"10.0.0.{node + 1}:3000"
+        if command == "node":
+            return self.node_names[node]
+        if command == "status":
+            return "ok"
+        if command == "statistics":
+            return self._statistics(node)
+        if command == "udf-list":
+            return "".join(f"filename={f},hash={h},type=LUA;" for f, h in sorted(self._udfs.items()))
+        if command == "query-show":
+            return ""
+        if arg in NAMESPACES:
+            if name == "namespace":
+                return self._namespace_stats(arg, node)
+            if name == "sets":
+                return self._sets_info(arg, node)
+            if name == "sindex":
+                return self._sindex_info(arg)
+            if name == "bins":
+                bins = sorted({b for _, _, e in self._entries(arg, "") for b in e.bins})
+                return ",".join([f"bin_names={len(bins)}", "bin_names_quota=65535", *bins])
+        if command.startswith("sindex-stat:"):
+            return self._sindex_stat(dict(p.split("=", 1) for p in command[12:].split(";") if "=" in p), node)
+        if command.startswith("set-config:"):
+            return "ok"
+        return ""
+
+    def _kv(self, stats: dict[str, Any]) -> str:
+        return ";".join(f"{k}={str(v).lower() if isinstance(v, bool) else v}" for k, v in stats.items())
+
+    def _totals(self, namespace: str) -> tuple[int, int]:
+        objects = size = 0
+        for (ns, _set), entries in self._sets.items():
+            if ns == namespace:
+                objects += len(entries)
+                size += sum(e.size for e in entries.values())
+        return objects, size
+
+    def _statistics(self, node: int) -> str:
+        nodes = len(self.node_names)
+        objects = sum(_share(self._totals(ns)[0], node, nodes, REPLICATION_FACTOR) for ns in NAMESPACES)
+        return self._kv(
+            {
+                "cluster_size": nodes,
+                "cluster_integrity": True,
+                "uptime": int(time.monotonic() - self._started),
+                "client_connections": 1,
+                "objects": objects,
+                "system_free_mem_pct": 90,
+            }
+        )
+
+    def _namespace_stats(self, namespace: str, node: int) -> str:
+        nodes = len(self.node_names)
+        objects, size = self._totals(namespace)
+        stats: dict[str, Any] = {
+            "objects": _share(objects, node, nodes, REPLICATION_FACTOR),
+            "tombstones": 0,
+            "memory_used_bytes": _share(size, node, nodes, REPLICATION_FACTOR),
+            "memory-size": _MEMORY_SIZE,
+            "device_used_bytes": 0,
+            "device-total-bytes": 0,
+            "replication-factor": REPLICATION_FACTOR,
+            "stop_writes": False,
+            "hwm_breached": False,
+            "high-water-memory-pct": 60,
+            "high-water-disk-pct": 50,
+            "nsup-period": 120,
+            "default-ttl": 0,
+            "allow-ttl-without-nsup": False,
+        }
+        for counter in ("client_read_success", "client_read_error", "client_write_success", "client_write_error"):
+            stats[counter] = _share(self._counters.get((namespace, counter), 0), node, nodes, 1)
+        return self._kv(stats)
+
+    def _sets_info(self, namespace: str, node: int) -> str:
+        nodes = len(self.node_names)
+        parts = []
+        for (ns, set_name), entries in sorted(self._sets.items()):
+            if ns != namespace or not set_name or not entries:
+                continue
+            size = sum(e.size for e in entries.values())
+            sindexes = sum(1 for i in self._indexes[ns].values() if i.set == set_name)
+            parts.append(
+                f"ns={ns}:set={set_name}:objects={_share(len(entries), node, nodes, REPLICATION_FACTOR)}"
+                f":tombstones=0:memory_data_bytes={_share(size, node, nodes, REPLICATION_FACTOR)}"
+                f":device_data_bytes=0:truncate_lut=0:sindexes={sindexes}:index_populating=false:stop-writes-count=0"
+            )
+        return "".join(f"{p};" for p in parts)
+
+    def _sindex_info(self, namespace: str) -> str:
+        return "".join(
+            f"ns={namespace}:indexname={i.name}:set={i.set or 'NULL'}:bin={i.bin}:type={i.type}"
+            f":indextype=default:context=NULL:state=RW;"
+            for i in self._indexes[namespace].values()
+        )
+
+    def _sindex_stat(self, args: dict[str, str], node: int) -> str:
+        namespace = args.get("namespace", "")
+        index = self._indexes.get(namespace, {}).get(args.get("indexname", ""))
+        if index is None:
+            return "ERROR::no-index"
+        values = [e.bins[index.bin] for _, _, e in self._entries(namespace, index.set) if index.bin in e.bins]
+        keys = len({repr(v) for v in values})
+        nodes = len(self.node_names)
+        entries = _share(len(values), node, nodes, REPLICATION_FACTOR)
+        return self._kv({"keys": _share(keys, node, nodes, 1), "entries": entries})
@@ -0,0 +1,105 @@
+"""orjson rendering for record-heavy responses.
+
+Returning a response model from an endpoint makes FastAPI validate it
+against the route's ``response_model``, dump it to Python objects and then
+``json.dumps`` the result.  For pages of thousands of records that costs far
+more CPU than the scan itself.  Endpoints that return records instead turn
+them into plain dicts (:func:`converters.records_to_dicts`), build the
+response models around them without validation and return :func:`render`,
+which writes the models straight to JSON bytes with orjson.  The output is the
+same as FastAPI's:
+
+* models are written with their field aliases and ``None`` fields included;
+* map keys that are not strings are written as strings (``{1: "a"}`` becomes
+  ``{"1": "a"}``);
+* ``bytes`` bins are written as text when they are valid UTF-8 (as pydantic
+  does) and base64-encoded otherwise, where pydantic would fail;
+* GeoJSON bins, which the client returns as JSON strings, are written as
+  strings, not re-encoded.
+"""
+
+from __future__ import annotations
+
+import base64
+from functools import cache
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+from aerospike_cluster_manager_api.instrumentation import latency
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+@cache
+def _field_names(model_cls: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    return tuple((name, field.alias or name) for name, field in model_cls.model_fields.items())
+
+
+def _bytes(value: bytes | bytearray | memoryview) -> str:
+    raw = bytes(value)
+    try:
+        return raw.decode()
+    except UnicodeDecodeError:
+        return base64.b64encode(raw).decode("ascii")
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        values = obj.__dict__
+        return {alias: values[name] for name, alias in _field_names(type(obj)) if name in values}
+    if isinstance(obj, bytes | bytearray | memoryview):
+        return _bytes(obj)
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _key(key: Any) -> Any:
+    if isinstance(key, bytes | bytearray):
+        return _bytes(key)
+    if isinstance(key, str | int | float | bool) or key is None:
+        return key
+    return str(key)
+
+
+def _jsonable(value: Any) -> Any:
+    """Slow path: rewrite map keys orjson cannot write (e.g. ``bytes`` or tuples)."""
+    if isinstance(value, BaseModel):
+        value = _default(value)
+    if isinstance(value, dict):
+        return {_key(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, list | tuple | set | frozenset):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize *content* (models, dicts, lists, record bins) to JSON bytes."""
+    try:
+        return orjson.dumps(content, default=_default, option=_OPTIONS)
+    except orjson.JSONEncodeError:
+        return orjson.dumps(_jsonable(content), default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content  # already rendered (e.g. a cached query result)
+        with latency.timed("serialization", "fast_json"):
+            return dumps(content)
+
+
+def render(content: Any, response: Response | None = None) -> FastJSONResponse:
+    """Return *content* as a :class:`FastJSONResponse`.
+
+    Headers already set on the endpoint's injected *response* (cache status,
+    scan queue position) are carried over, since FastAPI ignores them when an
+    endpoint returns a response object itself.
+    """
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return FastJSONResponse(content, headers=headers)
@@ -0,0 +1,147 @@
+"""Evaluate filter conditions against record bins in the API process.
+
+aerospike-py has no CDT read expressions yet, so conditions on list/map
+contents (``path``, size and contains-value checks) cannot be compiled to a
+server-side filter.  The expression builder pushes down a coarse check (the
+bin holds a list/map) and the query service applies :func:`matches` to the
+returned records before paginating, so only matching records reach the UI.
+
+Semantics follow server-side expressions: a missing bin, a missing path or a
+value of the wrong type makes a comparison false, whichever the operator.
+Geo and regex conditions are never evaluated here (see
+``models.query.SERVER_ONLY_OPERATORS``).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aerospike_cluster_manager_api.models.query import (
+    SERVER_ONLY_OPERATORS,
+    BinDataType,
+    FilterCondition,
+    FilterOperator,
+)
+
+_MISSING = object()
+
+_BIN_TYPES: dict[BinDataType, type | tuple[type, ...]] = {
+    BinDataType.INTEGER: int,
+    BinDataType.FLOAT: float,
+    BinDataType.STRING: str,
+    BinDataType.BOOL: bool,
+    BinDataType.LIST: list,
+    BinDataType.MAP: dict,
+}
+
+_SIZE_OPS = {
+    FilterOperator.SIZE_EQ: lambda a, b: a == b,
+    FilterOperator.SIZE_GT: lambda a, b: a > b,
+    FilterOperator.SIZE_GE: lambda a, b: a >= b,
+    FilterOperator.SIZE_LT: lambda a, b: a < b,
+    FilterOperator.SIZE_LE: lambda a, b: a <= b,
+}
+
+_ORDER_OPS = {
+    FilterOperator.GT: lambda a, b: a > b,
+    FilterOperator.GE: lambda a, b: a >= b,
+    FilterOperator.LT: lambda a, b: a < b,
+    FilterOperator.LE: lambda a, b: a <= b,
+}
+
+
+def resolve_path(value: Any, path: list[str | int]) -> Any:
+    """Follow map keys and list indexes from *value*; return ``_MISSING`` if any step fails."""
+    for step in path:
+        if isinstance(value, dict):
+            if step not in value:
+                return _MISSING
+            value = value[step]
+        elif isinstance(value, list) and isinstance(step, int) and -len(value) <= step < len(value):
+            value = value[step]
+        else:
+            return _MISSING
+    return value
+
+
+def _comparable(a: Any, b: Any) -> bool:
+    numeric = (int, float)
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool)
+    if isinstance(a, numeric) and isinstance(b, numeric):
+        return True
+    return type(a) is type(b)
+
+
+def _compare(op: FilterOperator, actual: Any, cond: FilterCondition) -> bool:
+    expected = cond.value
+    if op == FilterOperator.EQ:
+        return _comparable(actual, expected) and actual == expected
+    if op == FilterOperator.NE:
+        return _comparable(actual, expected) and actual != expected
+    if op in _ORDER_OPS:
+        return (
+            _comparable(actual, expected) and not isinstance(actual, list | dict) and _ORDER_OPS[op](actual, expected)
+        )
+    if op == FilterOperator.BETWEEN:
+        return (
+            _comparable(actual, expected)
+            and _comparable(actual, cond.value2)
+            and not isinstance(actual, list | dict)
+            and expected <= actual <= cond.value2  # type: ignore[operator]
+        )
+    raise ValueError(f"Operator {op} is not a comparison")
+
+
+def _matches_value(cond: FilterCondition, actual: Any) -> bool:
+    op = cond.operator
+    if op == FilterOperator.EXISTS:
+        return actual is not _MISSING
+    if op == FilterOperator.NOT_EXISTS:
+        return actual is _MISSING
+    if actual is _MISSING:
+        return False
+
+    if op in _SIZE_OPS:
+        return isinstance(actual, list | dict) and _SIZE_OPS[op](len(actual), cond.value)
+    if op in (FilterOperator.CONTAINS_VALUE, FilterOperator.NOT_CONTAINS_VALUE):
+        if not isinstance(actual, list | dict):
+            return False
+        values = actual.values() if isinstance(actual, dict) else actual
+        found = any(_comparable(v, cond.value) and v == cond.value for v in values)
+        return found == (op == FilterOperator.CONTAINS_VALUE)
+    if op in (FilterOperator.CONTAINS, FilterOperator.NOT_CONTAINS):
+        if not isinstance(actual, str):
+            return False
+        # Server-side these are case-insensitive regexes around the escaped value.
+        return (str(cond.value).casefold() in actual.casefold()) == (op == FilterOperator.CONTAINS)
+    if op in (FilterOperator.IS_TRUE, FilterOperator.IS_FALSE):
+        return isinstance(actual, bool) and actual == (op == FilterOperator.IS_TRUE)
+    if op in SERVER_ONLY_OPERATORS:
+        # FilterCondition/FilterGroup validation keeps these out of API-evaluated branches.
+        raise ValueError(f"{op} conditions cannot be evaluated outside the server")
+    return _compare(op, actual, cond)
+
+
+def _has_bin_type(value: Any, bin_type: BinDataType) -> bool:
+    expected = _BIN_TYPES.get(bin_type)
+    if expected is None or not isinstance(value, expected):
+        return False
+    return bin_type != BinDataType.INTEGER or not isinstance(value, bool)
+
+
+def matches(cond: FilterCondition, bins: dict[str, Any]) -> bool:
+    """Return whether a record with *bins* satisfies *cond*."""
+    actual = bins.get(cond.bin, _MISSING)
+    presence_only = cond.operator in (FilterOperator.EXISTS, FilterOperator.NOT_EXISTS) and not cond.path
+    if actual is not _MISSING and not presence_only and not _has_bin_type(actual, cond.bin_type):
+        # A typed bin accessor on a bin of another type yields no value.
+        actual = _MISSING
+    if cond.path:
+        actual = resolve_path(actual, cond.path)
+    elif (
+        cond.bin_type in (BinDataType.LIST, BinDataType.MAP) and not cond.is_collection_condition and not presence_only
+    ):
+        # Whole-collection comparisons compile to a string comparison that never matches.
+        return False
+    return _matches_value(cond, actual)
@@ -0,0 +1,139 @@
+"""Background health monitor for registered Aerospike connections.
+
+Probes every connection profile on a fixed interval and keeps the last
+:class:`ConnectionStatus` (including probe latency) in memory, so list views
+can show cluster health without fanning out one request per connection.
+
+In multi-worker deployments only the coordinator worker (see :mod:`worker_state`)
+probes the clusters; the other workers read its published snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import UTC, datetime
+
+from aerospike_cluster_manager_api import config, db
+from aerospike_cluster_manager_api.client_manager import client_manager
+from aerospike_cluster_manager_api.constants import INFO_BUILD, INFO_EDITION, INFO_NAMESPACES
+from aerospike_cluster_manager_api.info_parser import parse_list
+from aerospike_cluster_manager_api.models.connection import ConnectionStatus
+from aerospike_cluster_manager_api.worker_state import worker_state
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_NAME = "connection_health"
+
+
+async def probe_connection(conn_id: str) -> ConnectionStatus:
+    """Run a single health probe against *conn_id*.
+
+    Never raises: an unreachable cluster is reported as ``connected=False``.
+    The info commands are issued concurrently so a probe costs one round trip.
+    """
+    start = time.monotonic()
+    checked_at = datetime.now(UTC).isoformat()
+    try:
+        client = await client_manager.get_client(conn_id)
+        node_names = client.get_node_names()
+        ns_raw, build, edition = await asyncio.gather(
+            client.info_random_node(INFO_NAMESPACES),
+            client.info_random_node(INFO_BUILD),
+            client.info_random_node(INFO_EDITION),
+        )
+        return ConnectionStatus(
+            connected=True,
+            nodeCount=len(node_names),
+            namespaceCount=len(parse_list(ns_raw)),
+            build=build.strip(),
+            edition=edition.strip(),
+            latencyMs=round((time.monotonic() - start) * 1000, 1),
+            checkedAt=checked_at,
+        )
+    except Exception:
+        logger.warning("Health check failed for connection '%s'", conn_id, exc_info=True)
+        return ConnectionStatus(connected=False, nodeCount=0, namespaceCount=0, checkedAt=checked_at)
+
+
+class HealthMonitor:
+    """Periodically probes all connection profiles and caches the results."""
+
+    def __init__(self, interval: float, concurrency: int) -> None:
+        self._interval = interval
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._statuses: dict[str, ConnectionStatus] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._synced_snapshot: object = None
+
+    def get_status(self, conn_id: str) -> ConnectionStatus | None:
+        """Return the last cached status for *conn_id*, or ``None`` if never probed."""
+        if not worker_state.is_coordinator:
+            self._sync_from_snapshot()
+        return self._statuses.get(conn_id)
+
+    def _sync_from_snapshot(self) -> None:
+        """Merge statuses published by the coordinator worker, keeping the newer of each."""
+        snapshot = worker_state.read(_SNAPSHOT_NAME)
+        if snapshot is None or snapshot is self._synced_snapshot:
+            return
+        for conn_id, raw in snapshot.items():
+            status = ConnectionStatus.model_validate(raw)
+            current = self._statuses.get(conn_id)
+            if current is None or (current.checkedAt or "") <= (status.checkedAt or ""):
+                self._statuses[conn_id] = status
+        if isinstance(self._synced_snapshot, dict):
+            for conn_id in self._synced_snapshot.keys() - snapshot.keys():
+                self.forget(conn_id)
+        self._synced_snapshot = snapshot
+
+    def forget(self, conn_id: str) -> None:
+        """Drop the cached status of a deleted connection."""
+        self._statuses.pop(conn_id, None)
+
+    async def refresh(self, conn_id: str) -> ConnectionStatus:
+        """Probe *conn_id* now and update the cache."""
+        async with self._semaphore:
+            status = await probe_connection(conn_id)
+        self._statuses[conn_id] = status
+        return status
+
+    async def refresh_all(self) -> None:
+        """Probe every registered connection concurrently."""
+        profiles = await db.get_all_connections()
+        known = {p.id for p in profiles}
+        for conn_id in list(self._statuses):
+            if conn_id not in known:
+                self.forget(conn_id)
+        await asyncio.gather(*(self.refresh(p.id) for p in profiles))
+        worker_state.publish(_SNAPSHOT_NAME, {k: v.model_dump() for k, v in self._statuses.items()})
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if worker_state.is_coordinator:
+                    await self.refresh_all()
+                else:
+                    self._sync_from_snapshot()
+            except Exception:
+                logger.exception("Background health check round failed")
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        if self._interval <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="health-monitor")
+        logger.info("Health monitor started (interval=%ss)", self._interval)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+health_monitor = HealthMonitor(config.HEALTH_CHECK_INTERVAL_SECONDS, config.HEALTH_CHECK_CONCURRENCY)
@@ -0,0 +1,220 @@
+"""Latency histograms for the request hot path.
+
+Every request is timed per route template, and the time spent inside it is
+attributed to phases:
+
+* ``aerospike`` - each awaited call on a client handed out by
+  :class:`~aerospike_cluster_manager_api.client_manager.ClientManager`
+  (``get``, ``put``, ``info_all``, ``info_random_node``, query ``results``, ...),
+  recorded per operation and per connection;
+* ``database`` - each connection-store call in :mod:`db`;
+* ``serialization`` - rendering response bodies with :mod:`fast_json`.
+
+Histograms are exposed by ``GET /api/internal/metrics``.  Requests slower
+than ``SLOW_REQUEST_MS`` are logged with the per-phase breakdown, so a slow
+``/clusters`` call shows whether it waited on the cluster, the database or
+JSON encoding.  Histograms are per worker process.  Each timed call is also
+an OpenTelemetry span when tracing is enabled (see :mod:`tracing`).
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import inspect
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from aerospike_cluster_manager_api import tracing
+
+# Upper bounds in milliseconds; a final implicit bucket catches everything slower.
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+PHASES = ("aerospike", "database", "serialization")
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with count, sum and max."""
+
+    __slots__ = ("count", "counts", "max_ms", "total_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the *q* quantile (``max`` for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sumMs": round(self.total_ms, 3),
+            "maxMs": round(self.max_ms, 3),
+            "p50Ms": self.quantile(0.5),
+            "p90Ms": self.quantile(0.9),
+            "p99Ms": self.quantile(0.99),
+            "buckets": {
+                **{f"le{b:g}": n for b, n in zip(BUCKETS_MS, self.counts, strict=False)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class Breakdown:
+    """Time spent per phase while handling one request."""
+
+    __slots__ = ("calls", "ms")
+
+    def __init__(self) -> None:
+        self.ms = dict.fromkeys(PHASES, 0.0)
+        self.calls = dict.fromkeys(PHASES, 0)
+
+    def add(self, phase: str, ms: float) -> None:
+        self.ms[phase] += ms
+        self.calls[phase] += 1
+
+    def describe(self, total_ms: float) -> str:
+        parts = [f"{phase}={self.ms[phase]:.1f}ms/{self.calls[phase]}" for phase in PHASES]
+        # Phases can overlap (concurrent info commands), so "other" is clamped at zero.
+        other = max(0.0, total_ms - sum(self.ms.values()))
+        return " ".join([*parts, f"other={other:.1f}ms"])
+
+
+_breakdown: ContextVar[Breakdown | None] = ContextVar("latency_breakdown", default=None)
+
+
+class LatencyRecorder:
+    """Histograms keyed by (kind, name): ``route``, ``aerospike``, ``connection``, ``database``, ``serialization``."""
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, dict[str, Histogram]] = {}
+        self.slow_requests = 0
+
+    def observe(self, kind: str, name: str, ms: float) -> None:
+        by_name = self._histograms.setdefault(kind, {})
+        histogram = by_name.get(name)
+        if histogram is None:
+            histogram = by_name[name] = Histogram()
+        histogram.observe(ms)
+
+    def record_phase(self, phase: str, name: str, ms: float, *, conn_id: str | None = None) -> None:
+        """Record one timed call of *phase* and charge it to the current request's breakdown."""
+        self.observe(phase, name, ms)
+        if conn_id is not None:
+            self.observe("connection", conn_id, ms)
+        breakdown = _breakdown.get()
+        if breakdown is not None:
+            breakdown.add(phase, ms)
+
+    @contextmanager
+    def timed(self, phase: str, name: str, *, conn_id: str | None = None) -> Iterator[None]:
+        """Time the block as one *phase* call; also traced as a ``"<phase> <name>"`` span."""
+        start = time.perf_counter()
+        try:
+            with tracing.span(f"{phase} {name}", {"operation": name, "connection.id": conn_id}):
+                yield
+        finally:
+            self.record_phase(phase, name, (time.perf_counter() - start) * 1000, conn_id=conn_id)
+
+    @contextmanager
+    def request(self) -> Iterator[Breakdown]:
+        """Collect the phase breakdown of the request handled inside this block."""
+        breakdown = Breakdown()
+        token = _breakdown.set(breakdown)
+        try:
+            yield breakdown
+        finally:
+            _breakdown.reset(token)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "histograms": {
+                kind: {name: h.snapshot() for name, h in sorted(by_name.items())}
+                for kind, by_name in sorted(self._histograms.items())
+            },
+            "slowRequests": self.slow_requests,
+        }
+
+    def reset(self) -> None:
+        self._histograms.clear()
+        self.slow_requests = 0
+
+
+latency = LatencyRecorder()
+
+
+def timed_database[**P, T](fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+    """Decorator recording a :mod:`db` coroutine under the ``database`` phase."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        with latency.timed("database", fn.__name__):
+            return await fn(*args, **kwargs)
+
+    return wrapper
+
+
+class InstrumentedQuery:
+    """Query proxy timing ``results`` / ``foreach`` as the ``query`` operation."""
+
+    __slots__ = ("_conn_id", "_query")
+
+    def __init__(self, query: Any, conn_id: str) -> None:
+        self._query = query
+        self._conn_id = conn_id
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._query, name)
+        if name not in ("results", "foreach"):
+            return attr
+        return _timed_coroutine(attr, "query", self._conn_id)
+
+
+class InstrumentedClient:
+    """Aerospike client proxy timing every awaited call per operation and connection.
+
+    Synchronous methods (``get_node_names``, ``is_connected``) pass through
+    untouched; ``query()`` returns an :class:`InstrumentedQuery`.
+    """
+
+    __slots__ = ("_client", "_conn_id")
+
+    def __init__(self, client: Any, conn_id: str) -> None:
+        self._client = client
+        self._conn_id = conn_id
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name == "query":
+            return lambda *args, **kwargs: InstrumentedQuery(attr(*args, **kwargs), self._conn_id)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+        return _timed_coroutine(attr, name, self._conn_id)
+
+
+def _timed_coroutine[T](fn: Callable[..., Awaitable[T]], operation: str, conn_id: str) -> Callable[..., Awaitable[T]]:
+    async def call(*args: Any, **kwargs: Any) -> T:
+        with latency.timed("aerospike", operation, conn_id=conn_id):
+            return await fn(*args, **kwargs)
+
+    return call
@@ -9,8 +9,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+from collections.abc import Callable
 from typing import Any
 
+from aerospike_cluster_manager_api import tracing
+
 logger = logging.getLogger(__name__)
 
 # CRD constants
@@ -445,62 +448,68 @@ class K8sClient:
     # Async public API
     # ------------------------------------------------------------------
 
+    async def _offload[T](self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking kubernetes-client call in a worker thread, traced as ``k8s <operation>``."""
+        operation = fn.__name__.removeprefix("_").removesuffix("_sync")
+        with tracing.span(f"k8s {operation}", {"k8s.operation": operation}):
+            return await asyncio.to_thread(fn, *args)
+
     async def list_clusters(self, namespace: str | None = None) -> list[dict[str, Any]]:
-        return await asyncio.to_thread(self._list_clusters_sync, namespace)
+        return await self._offload(self._list_clusters_sync, namespace)
 
     async def get_cluster(self, namespace: str, name: str) -> dict[str, Any]:
-        return await asyncio.to_thread(self._get_cluster_sync, namespace, name)
+        return await self._offload(self._get_cluster_sync, namespace, name)
 
     async def create_cluster(self, namespace: str, body: dict[str, Any]) -> dict[str, Any]:
-        return await asyncio.to_thread(self._create_cluster_sync, namespace, body)
+        return await self._offload(self._create_cluster_sync, namespace, body)
 
     async def patch_cluster(self, namespace: str, name: str, body: dict[str, Any]) -> dict[str, Any]:
-        return await asyncio.to_thread(self._patch_cluster_sync, namespace, name, body)
+        return await self._offload(self._patch_cluster_sync, namespace, name, body)
 
     async def delete_cluster(self, namespace: str, name: str) -> dict[str, Any]:
-        return await asyncio.to_thread(self._delete_cluster_sync, namespace, name)
+        return await self._offload(self._delete_cluster_sync, namespace, name)
 
     async def list_namespaces(self) -> list[str]:
-        return await asyncio.to_thread(self._list_namespaces_sync)
+        return await self._offload(self._list_namespaces_sync)
 
     async def create_namespace(self, name: str) -> None:
-        return await asyncio.to_thread(self._create_namespace_sync, name)
+        return await self._offload(self._create_namespace_sync, name)
 
     async def list_storage_classes(self) -> list[str]:
-        return await asyncio.to_thread(self._list_storage_classes_sync)
+        return await self._offload(self._list_storage_classes_sync)
 
     async def list_pods(self, namespace: str, label_selector: str) -> list[dict[str, Any]]:
-        return await asyncio.to_thread(self._list_pods_sync, namespace, label_selector)
+        return await self._offload(self._list_pods_sync, namespace, label_selector)
 
     async def list_templates(self) -> list[dict[str, Any]]:
-        return await asyncio.to_thread(self._list_templates_sync)
+        return await self._offload(self._list_templates_sync)
 
     async def get_template(self, name: str) -> dict[str, Any]:
-        return await asyncio.to_thread(self._get_template_sync, name)
+        return await self._offload(self._get_template_sync, name)
 
     async def create_template(self, body: dict[str, Any]) -> dict[str, Any]:
-        return await asyncio.to_thread(self._create_template_sync, body)
+        return await self._offload(self._create_template_sync, body)
 
     async def patch_template(self, name: str, body: dict[str, Any]) -> dict[str, Any]:
-        return await asyncio.to_thread(self._patch_template_sync, name, body)
+        return await self._offload(self._patch_template_sync, name, body)
 
     async def delete_template(self, name: str) -> dict[str, Any]:
-        return await asyncio.to_thread(self._delete_template_sync, name)
+        return await self._offload(self._delete_template_sync, name)
 
     async def list_secrets(self, namespace: str) -> list[str]:
         """List Secret names in a namespace (Opaque type only)."""
-        return await asyncio.to_thread(self._list_secrets_sync, namespace)
+        return await self._offload(self._list_secrets_sync, namespace)
 
     async def list_events(self, namespace: str, field_selector: str) -> list[dict[str, Any]]:
-        return await asyncio.to_thread(self._list_events_sync, namespace, field_selector)
+        return await self._offload(self._list_events_sync, namespace, field_selector)
 
     async def list_nodes(self) -> list[dict[str, Any]]:
-        return await asyncio.to_thread(self._list_nodes_sync)
+        return await self._offload(self._list_nodes_sync)
 
     async def read_pod_log(
         self, namespace: str, pod_name: str, container: str | None = None, tail_lines: int = 500
     ) -> str:
-        return await asyncio.to_thread(self._read_pod_log_sync, namespace, pod_name, container, tail_lines)
+        return await self._offload(self._read_pod_log_sync, namespace, pod_name, container, tail_lines)
 
     # ------------------------------------------------------------------
     # HPA sync helpers
@@ -651,7 +660,7 @@ class K8sClient:
     # ------------------------------------------------------------------
 
     async def get_hpa(self, namespace: str, name: str) -> dict[str, Any]:
-        return await asyncio.to_thread(self._get_hpa_sync, namespace, name)
+        return await self._offload(self._get_hpa_sync, namespace, name)
 
     async def create_hpa(
         self,
@@ -662,7 +671,7 @@ class K8sClient:
         cpu_target_percent: int | None = None,
         memory_target_percent: int | None = None,
     ) -> dict[str, Any]:
-        return await asyncio.to_thread(
+        return await self._offload(
             self._create_hpa_sync,
             namespace,
             cluster_name,
@@ -681,7 +690,7 @@ class K8sClient:
         cpu_target_percent: int | None = None,
         memory_target_percent: int | None = None,
     ) -> dict[str, Any]:
-        return await asyncio.to_thread(
+        return await self._offload(
             self._update_hpa_sync,
             namespace,
             cluster_name,
@@ -692,7 +701,7 @@ class K8sClient:
         )
 
     async def delete_hpa(self, namespace: str, name: str) -> None:
-        return await asyncio.to_thread(self._delete_hpa_sync, namespace, name)
+        return await self._offload(self._delete_hpa_sync, namespace, name)
 
 
 k8s_client = K8sClient()
@@ -1,22 +1,31 @@
+import asyncio
 import logging
 import time
 import uuid
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Literal
 
-from fastapi import APIRouter, FastAPI, Query, Request
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from starlette.middleware.base import RequestResponseEndpoint
 from starlette.responses import Response
 
-from aerospike_cluster_manager_api import config, db
+from aerospike_cluster_manager_api import config, db, expression_builder, tracing
+from aerospike_cluster_manager_api.audit import audit_log
 from aerospike_cluster_manager_api.client_manager import client_manager
+from aerospike_cluster_manager_api.compression import CompressionMiddleware
+from aerospike_cluster_manager_api.health_monitor import health_monitor
+from aerospike_cluster_manager_api.instrumentation import latency
 from aerospike_cluster_manager_api.logging_config import setup_logging
+from aerospike_cluster_manager_api.profiling import ProfilingMiddleware, profile_store, require_profiling_token
+from aerospike_cluster_manager_api.query_cache import query_cache
 from aerospike_cluster_manager_api.rate_limit import limiter
+from aerospike_cluster_manager_api.request_context import request_id_var
 from aerospike_cluster_manager_api.routers import (
     admin_roles,
     admin_users,
@@ -30,6 +39,9 @@ from aerospike_cluster_manager_api.routers import (
     terminal,
     udfs,
 )
+from aerospike_cluster_manager_api.scan_scheduler import scan_scheduler
+from aerospike_cluster_manager_api.singleflight import singleflight
+from aerospike_cluster_manager_api.worker_state import worker_state
 
 if config.K8S_MANAGEMENT_ENABLED:
     from aerospike_cluster_manager_api.routers import k8s_clusters
@@ -41,12 +53,30 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     logger.info("Starting Aerospike Cluster Manager API")
+    tracing.setup_tracing()
     await db.init_db()
+    if config.AEROSPIKE_CLIENT == "fake":
+        logger.warning(
+            "AEROSPIKE_CLIENT=fake: connections are served by an in-memory fake client "
+            "(%d nodes, %dus latency, %d%% failures); no Aerospike cluster is contacted.",
+            config.FAKE_AEROSPIKE_NODES,
+            config.FAKE_AEROSPIKE_LATENCY_US,
+            config.FAKE_AEROSPIKE_FAILURE_PCT,
+        )
+    if config.WORKERS > 1 and config.QUERY_CACHE_TTL_SECONDS > 0:
+        logger.info("Query result cache disabled: its invalidations would not reach the other workers")
+    await client_manager.start()
+    health_monitor.start()
+    audit_log.start()
 
     yield
 
+    await health_monitor.stop()
+    await audit_log.stop()
     await client_manager.close_all()
+    worker_state.release()
     await db.close_db()
+    tracing.shutdown_tracing()
     logger.info("Shutdown complete")
 
 
@@ -69,22 +99,63 @@ app.add_middleware(
     allow_origins=config.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "X-Request-ID"],
+    allow_headers=[
+        "Content-Type",
+        "Authorization",
+        "X-Request-ID",
+        "traceparent",
+        "tracestate",
+        "X-Profile",
+        "X-Profile-Token",
+    ],
+    expose_headers=[
+        "ETag",
+        "X-Request-ID",
+        "X-Next-Cursor",
+        "X-Query-Cache",
+        "X-Scan-Queue-Position",
+        "X-Scan-Queue-Wait-Ms",
+        "X-Profile-Id",
+    ],
 )
 
+# Inside the request logging middleware, so a profile is keyed by the request id.
+app.add_middleware(ProfilingMiddleware)
+
 
 # ---------------------------------------------------------------------------
 # Request logging middleware
 # ---------------------------------------------------------------------------
 
 
+def _route_template(request: Request) -> str:
+    """The matched route's path template, so histograms stay bounded by the number of routes.
+
+    Routes included under ``/api`` and ``/api/v1`` report their path without the
+    mount prefix; both mounts share one ``/api/...`` histogram.
+    """
+    route = request.scope.get("route")
+    if route is None:
+        return "unmatched"
+    path: str = route.path
+    return path if path.startswith("/api/") else f"/api{path}"
+
+
 @app.middleware("http")
 async def request_logging_middleware(request: Request, call_next: RequestResponseEndpoint) -> Response:
     request_id = request.headers.get("X-Request-ID", uuid.uuid4().hex[:16])
+    request_id_var.set(request_id)
     start = time.monotonic()
-    response = await call_next(request)
+    with (
+        tracing.server_span(request.method, request.url.path, request.headers, request_id) as span,
+        latency.request() as breakdown,
+    ):
+        response = await call_next(request)
+        route = _route_template(request)
+        tracing.finish_server_span(span, request.method, route, response.status_code)
     elapsed_ms = (time.monotonic() - start) * 1000
     response.headers["X-Request-ID"] = request_id
+    latency.observe("route", f"{request.method} {route}", elapsed_ms)
     logger.info(
         "%s %s %d %.1fms request_id=%s",
         request.method,
@@ -93,6 +164,17 @@ async def request_logging_middleware(request: Request, call_next: RequestRespons
         elapsed_ms,
         request_id,
     )
+    if config.SLOW_REQUEST_MS and elapsed_ms >= config.SLOW_REQUEST_MS:
+        latency.slow_requests += 1
+        logger.warning(
+            "Slow request %s %s %d %.1fms %s request_id=%s",
+            request.method,
+            request.url.path,
+            response.status_code,
+            elapsed_ms,
+            breakdown.describe(elapsed_ms),
+            request_id,
+        )
     return response
 
 
@@ -109,6 +191,12 @@ async def security_headers_middleware(request: Request, call_next: RequestRespon
     return response
 
 
+# Added last so it wraps every other middleware and also compresses error responses.
+app.add_middleware(
+    CompressionMiddleware, encodings=config.COMPRESSION_ENCODINGS, minimum_size=config.COMPRESSION_MIN_BYTES
+)
+
+
 # ---------------------------------------------------------------------------
 # Global exception handlers for aerospike-py errors
 # ---------------------------------------------------------------------------
@@ -235,5 +323,34 @@ async def health_check(detail: bool = Query(False)) -> dict:
         "status": overall,
         "components": {
             "database": {"status": "ok" if db_ok else "error"},
+            "auditLog": audit_log.stats(),
+            "queryCache": query_cache.stats(),
+            "expressionCache": expression_builder.cache_info(),
+            "scanScheduler": scan_scheduler.stats(),
+            "coalescedReads": singleflight.stats(),
         },
     }
+
+
+@app.get("/api/internal/metrics", include_in_schema=False)
+async def internal_metrics() -> dict:
+    """Latency histograms of this worker (routes, Aerospike calls, connections, database, serialization)."""
+    return latency.snapshot()
+
+
+@app.get(
+    "/api/internal/profiles/{profile_id}",
+    include_in_schema=False,
+    dependencies=[Depends(require_profiling_token)],
+)
+async def get_profile(profile_id: str, format: Literal["text", "pstats"] = "text") -> Response:
+    """A request profile taken with ``X-Profile: 1``: a text report, or the raw pstats file."""
+    if format == "pstats":
+        path = profile_store.path(profile_id)
+        if path is None or not path.is_file():
+            raise HTTPException(status_code=404, detail=f"Profile '{profile_id}' not found")
+        return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.prof")
+    report = await asyncio.to_thread(profile_store.report, profile_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail=f"Profile '{profile_id}' not found")
+    return PlainTextResponse(report)
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+from typing import Annotated, Literal
+
 from pydantic import BaseModel, Field
 
+ReplicaPolicy = Literal["master", "sequence", "prefer_rack"]
+ReadModeAP = Literal["one", "all"]
+Tag = Annotated[str, Field(min_length=1, max_length=64)]
+
 
 class ConnectionStatus(BaseModel):
     connected: bool
@@ -9,6 +15,8 @@ class ConnectionStatus(BaseModel):
     namespaceCount: int
     build: str | None = None
     edition: str | None = None
+    latencyMs: float | None = None
+    checkedAt: str | None = None
 
 
 class ConnectionProfile(BaseModel):
@@ -20,6 +28,11 @@ class ConnectionProfile(BaseModel):
     username: str | None = None
     password: str | None = None
     color: str = Field(pattern=r"^#[0-9a-fA-F]{6}$")
+    readReplica: ReplicaPolicy | None = None
+    readModeAp: ReadModeAP | None = None
+    rackId: int | None = Field(default=None, ge=0)
+    tags: list[Tag] = Field(default_factory=list, max_length=32)
+    environment: str | None = Field(default=None, max_length=64)
     createdAt: str
     updatedAt: str
 
@@ -32,6 +45,11 @@ class CreateConnectionRequest(BaseModel):
     username: str | None = None
     password: str | None = None
     color: str = Field(pattern=r"^#[0-9a-fA-F]{6}$", default="#0097D3")
+    readReplica: ReplicaPolicy | None = None
+    readModeAp: ReadModeAP | None = None
+    rackId: int | None = Field(default=None, ge=0)
+    tags: list[Tag] = Field(default_factory=list, max_length=32)
+    environment: str | None = Field(default=None, max_length=64)
 
 
 class UpdateConnectionRequest(BaseModel):
@@ -42,6 +60,11 @@ class UpdateConnectionRequest(BaseModel):
     username: str | None = None
     password: str | None = None
     color: str | None = Field(None, pattern=r"^#[0-9a-fA-F]{6}$")
+    readReplica: ReplicaPolicy | None = None
+    readModeAp: ReadModeAP | None = None
+    rackId: int | None = Field(None, ge=0)
+    tags: list[Tag] | None = Field(None, max_length=32)
+    environment: str | None = Field(None, max_length=64)
 
 
 class TestConnectionRequest(BaseModel):
@@ -61,6 +84,11 @@ class ConnectionProfileResponse(BaseModel):
     clusterName: str | None = None
     username: str | None = None
     color: str = Field(pattern=r"^#[0-9a-fA-F]{6}$")
+    readReplica: ReplicaPolicy | None = None
+    readModeAp: ReadModeAP | None = None
+    rackId: int | None = None
+    tags: list[str] = Field(default_factory=list)
+    environment: str | None = None
     createdAt: str
     updatedAt: str
 
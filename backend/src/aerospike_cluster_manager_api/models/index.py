@@ -12,6 +12,7 @@ class SecondaryIndex(BaseModel):
     bin: str
     type: Literal["numeric", "string", "geo2dsphere"]
     state: Literal["ready", "building", "error"]
+    collection: Literal["default", "list", "mapkeys", "mapvalues"] = "default"
 
 
 class CreateIndexRequest(BaseModel):
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from enum import StrEnum
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from .record import AerospikeRecord, BinValue
 
@@ -54,6 +55,33 @@ class FilterOperator(StrEnum):
     IS_FALSE = "is_false"
     GEO_WITHIN = "geo_within"
     GEO_CONTAINS = "geo_contains"
+    SIZE_EQ = "size_eq"
+    SIZE_GT = "size_gt"
+    SIZE_GE = "size_ge"
+    SIZE_LT = "size_lt"
+    SIZE_LE = "size_le"
+    CONTAINS_VALUE = "contains_value"
+    NOT_CONTAINS_VALUE = "not_contains_value"
+
+
+GEO_OPERATORS = frozenset({FilterOperator.GEO_WITHIN, FilterOperator.GEO_CONTAINS})
+
+# Operators only the server evaluates: the API cannot run geo predicates, and does not run
+# user-supplied regexes, whose backtracking could stall the event loop
+SERVER_ONLY_OPERATORS = GEO_OPERATORS | {FilterOperator.REGEX}
+
+# Operators that apply to a whole list or map (or to a list/map found at ``path``)
+COLLECTION_OPERATORS = frozenset(
+    {
+        FilterOperator.SIZE_EQ,
+        FilterOperator.SIZE_GT,
+        FilterOperator.SIZE_GE,
+        FilterOperator.SIZE_LT,
+        FilterOperator.SIZE_LE,
+        FilterOperator.CONTAINS_VALUE,
+        FilterOperator.NOT_CONTAINS_VALUE,
+    }
+)
 
 
 class BinDataType(StrEnum):
@@ -74,11 +102,79 @@ class FilterCondition(BaseModel):
     value: BinValue | None = None
     value2: BinValue | None = None
     bin_type: BinDataType = Field(default=BinDataType.STRING, alias="binType")
+    # Map keys (str) and list indexes (int) leading from the bin to the compared element
+    path: list[str | int] | None = Field(default=None, max_length=8)
+
+    @model_validator(mode="after")
+    def collection_conditions_need_collection_bin(self) -> FilterCondition:
+        if not self.is_collection_condition:
+            return self
+        if self.bin_type not in (BinDataType.LIST, BinDataType.MAP):
+            raise ValueError("Path, size and contains-value conditions require binType 'list' or 'map'")
+        if self.operator in SERVER_ONLY_OPERATORS:
+            raise ValueError("Geo and regex operators cannot be used with a path")
+        if self.operator.startswith("size_") and (not isinstance(self.value, int) or isinstance(self.value, bool)):
+            raise ValueError("Size conditions require an integer value")
+        return self
+
+    @property
+    def is_collection_condition(self) -> bool:
+        """True for conditions on list/map contents, which are evaluated by the API (see ``filter_eval``)."""
+        return bool(self.path) or self.operator in COLLECTION_OPERATORS
+
+
+MAX_FILTER_DEPTH = 4
+MAX_FILTER_CONDITIONS = 50
 
 
 class FilterGroup(BaseModel):
+    """AND/OR of conditions and nested groups, e.g. ``a AND (b OR (c AND d))``."""
+
     logic: Literal["and", "or"] = "and"
-    conditions: list[FilterCondition] = Field(min_length=1, max_length=20)
+    conditions: list[FilterCondition] = Field(default_factory=list, max_length=20)
+    groups: list[FilterGroup] = Field(default_factory=list, max_length=20)
+
+    @model_validator(mode="after")
+    def non_empty_and_bounded(self) -> FilterGroup:
+        if not self.conditions and not self.groups:
+            raise ValueError("A filter group needs at least one condition or nested group")
+        if self.depth() > MAX_FILTER_DEPTH:
+            raise ValueError(f"Filter groups can be nested at most {MAX_FILTER_DEPTH} levels deep")
+        if self.condition_count() > MAX_FILTER_CONDITIONS:
+            raise ValueError(f"A filter may contain at most {MAX_FILTER_CONDITIONS} conditions")
+        if self._mixes_server_only_and_collection():
+            raise ValueError(
+                "Geo and regex conditions cannot share a nested or OR group with path, size or contains-value "
+                "conditions"
+            )
+        return self
+
+    def depth(self) -> int:
+        return 1 + max((g.depth() for g in self.groups), default=0)
+
+    def condition_count(self) -> int:
+        return len(self.conditions) + sum(g.condition_count() for g in self.groups)
+
+    def iter_conditions(self) -> Iterator[FilterCondition]:
+        yield from self.conditions
+        for group in self.groups:
+            yield from group.iter_conditions()
+
+    def _mixes_server_only_and_collection(self) -> bool:
+        """True when geo or regex and collection conditions meet outside the top-level AND.
+
+        Collection conditions are checked by the API, which then has to evaluate
+        the whole branch they sit in; it never evaluates geo or regex conditions.
+        """
+
+        def mixed(conditions: list[FilterCondition]) -> bool:
+            return any(c.operator in SERVER_ONLY_OPERATORS for c in conditions) and any(
+                c.is_collection_condition for c in conditions
+            )
+
+        if self.logic == "or" and mixed(list(self.iter_conditions())):
+            return True
+        return any(mixed(list(g.iter_conditions())) for g in self.groups)
 
 
 class FilteredQueryRequest(BaseModel):
@@ -95,6 +191,18 @@ class FilteredQueryRequest(BaseModel):
     primary_key: str | None = Field(default=None, max_length=1024, alias="primaryKey")
 
 
+class QueryPlan(BaseModel):
+    """How a filtered query was executed."""
+
+    strategy: Literal["pk_lookup", "sindex", "scan"]
+    indexName: str | None = None
+    bin: str | None = None
+    operator: FilterOperator | None = None
+    expressionConditions: int = Field(default=0, ge=0)
+    # List/map content conditions, checked by the API on the records the server returns
+    apiConditions: int = Field(default=0, ge=0)
+
+
 class FilteredQueryResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
@@ -106,3 +214,94 @@ class FilteredQueryResponse(BaseModel):
     execution_time_ms: int = Field(ge=0, alias="executionTimeMs")
     scanned_records: int = Field(ge=0, alias="scannedRecords")
     returned_records: int = Field(ge=0, alias="returnedRecords")
+    plan: QueryPlan | None = None
+
+
+class NodeQueryStats(BaseModel):
+    node: str
+    recordsScanned: int = Field(ge=0)
+    recordsReturned: int = Field(ge=0)
+    elapsedMs: int = Field(ge=0)
+
+
+class QueryExplainResponse(BaseModel):
+    plan: QueryPlan
+    predicate: list[Any] | None = None
+    expression: dict[str, Any] | None = None
+    estimatedCandidates: int | None = Field(default=None, ge=0)
+    estimateSource: Literal["pk_lookup", "sindex_bval", "sindex_entries", "set_objects", "namespace_objects"] | None = (
+        None
+    )
+    setObjects: int | None = Field(default=None, ge=0)
+    executed: bool = False
+    executionTimeMs: int | None = Field(default=None, ge=0)
+    returnedRecords: int | None = Field(default=None, ge=0)
+    nodeStats: list[NodeQueryStats] = Field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Query history & saved queries
+# ---------------------------------------------------------------------------
+
+QueryKind = Literal["query", "filter"]
+"""``query`` is a :class:`QueryRequest` (``POST /query``), ``filter`` a :class:`FilteredQueryRequest`."""
+
+
+class QueryHistoryEntry(BaseModel):
+    id: int
+    connectionId: str
+    kind: QueryKind
+    digest: str
+    request: dict[str, Any]
+    executionTimeMs: int = Field(ge=0)
+    scannedRecords: int = Field(ge=0)
+    returnedRecords: int = Field(ge=0)
+    cached: bool = False
+    createdAt: str
+
+
+class SavedQuery(BaseModel):
+    id: str
+    connectionId: str
+    name: str
+    kind: QueryKind
+    request: dict[str, Any]
+    digest: str
+    snapshotAt: str | None = None
+    createdAt: str
+    updatedAt: str
+
+
+class CreateSavedQueryRequest(BaseModel):
+    name: str = Field(min_length=1, max_length=100)
+    kind: QueryKind
+    request: dict[str, Any]
+
+    @model_validator(mode="after")
+    def _validate_request(self) -> CreateSavedQueryRequest:
+        # Normalize through the real request model so invalid queries are rejected on save.
+        model = QueryRequest if self.kind == "query" else FilteredQueryRequest
+        self.request = model.model_validate(self.request).model_dump(mode="json", by_alias=True, exclude_none=True)
+        return self
+
+
+class SavedQueryRunResponse(BaseModel):
+    result: QueryResponse | FilteredQueryResponse
+    cached: bool
+    snapshotAt: str
+
+
+class QueuedScan(BaseModel):
+    requestId: str
+    kind: str
+    priority: Literal["interactive", "background"]
+    position: int = Field(ge=1)
+    waitingMs: int = Field(ge=0)
+
+
+class ScanQueueStatus(BaseModel):
+    """Scan admission state of one connection (per API worker)."""
+
+    limit: int = Field(ge=0)
+    running: int = Field(ge=0)
+    queued: list[QueuedScan]
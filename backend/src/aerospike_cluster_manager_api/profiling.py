@@ -0,0 +1,182 @@
+"""On-demand request profiling.
+
+A request sent with ``X-Profile: 1`` and ``X-Profile-Token: <PROFILING_TOKEN>``
+runs under ``cProfile``.  The profile is written to ``PROFILE_DIR`` as
+``<profile id>.prof`` (the request's ``X-Request-ID`` when it is a plain
+token, otherwise a generated id) before the last byte of the response is
+sent, and the id is returned in the ``X-Profile-Id`` response header.
+``GET /api/internal/profiles/{profile_id}`` returns the report (top functions
+by cumulative time) or, with ``?format=pstats``, the raw file for
+``snakeviz`` / ``pstats``.
+
+Profiling is disabled unless ``PROFILING_TOKEN`` is set.  Profiled requests
+are limited by ``PROFILING_RATE_LIMIT`` through the shared rate limiter
+storage (so across all workers, see :mod:`coordinator`), and a worker
+profiles one request at a time; further ones get ``429``.
+
+The profiler sees the whole event loop thread: work for other requests that
+runs while the profiled one awaits I/O shows up in its profile too.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import hmac
+import io
+import logging
+import pstats
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Annotated
+
+from fastapi import Header, HTTPException
+from limits import parse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.rate_limit import limiter
+from aerospike_cluster_manager_api.request_context import request_id_var
+
+logger = logging.getLogger(__name__)
+
+# Profile ids become file names: no separators, no dots.
+_PROFILE_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+_RATE_LIMIT_KEY = "request-profiling"
+
+
+def token_valid(token: str | None) -> bool:
+    """Whether *token* matches the configured ``PROFILING_TOKEN`` (always false when profiling is disabled)."""
+    if not config.PROFILING_TOKEN or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), config.PROFILING_TOKEN.encode())
+
+
+async def require_profiling_token(x_profile_token: Annotated[str | None, Header()] = None) -> None:
+    """Dependency guarding the profile endpoints: 404 when profiling is disabled, 403 on a bad token."""
+    if not config.PROFILING_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not token_valid(x_profile_token):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+class ProfileStore:
+    """``.prof`` files in a directory shared by the workers, pruned to the newest *keep*."""
+
+    def __init__(self, directory: str, keep: int) -> None:
+        self._dir = Path(directory)
+        self._keep = keep
+
+    def path(self, profile_id: str) -> Path | None:
+        if not _PROFILE_ID.fullmatch(profile_id):
+            return None
+        return self._dir / f"{profile_id}.prof"
+
+    def save(self, profile_id: str, profiler: cProfile.Profile) -> None:
+        path = self.path(profile_id)
+        assert path is not None
+        self._dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
+        profiles = sorted(self._dir.glob("*.prof"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in profiles[self._keep :]:
+            old.unlink(missing_ok=True)
+
+    def report(self, profile_id: str, limit: int = 60) -> str | None:
+        path = self.path(profile_id)
+        if path is None or not path.is_file():
+            return None
+        out = io.StringIO()
+        pstats.Stats(str(path), stream=out).strip_dirs().sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+
+profile_store = ProfileStore(config.PROFILE_DIR, config.PROFILE_KEEP)
+
+
+def _profile_id() -> str:
+    request_id = request_id_var.get()
+    if request_id and _PROFILE_ID.fullmatch(request_id):
+        return request_id
+    return uuid.uuid4().hex[:16]
+
+
+class ProfilingMiddleware:
+    """ASGI middleware running ``X-Profile: 1`` requests from authorized callers under cProfile."""
+
+    def __init__(self, app: ASGIApp, *, store: ProfileStore = profile_store, rate_limit: str | None = None) -> None:
+        self.app = app
+        self.store = store
+        self.rate_limit = parse(rate_limit or config.PROFILING_RATE_LIMIT)
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not config.PROFILING_TOKEN:
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if headers.get("x-profile") != "1":
+            await self.app(scope, receive, send)
+            return
+        if not token_valid(headers.get("x-profile-token")):
+            await JSONResponse({"detail": "Invalid profiling token"}, status_code=403)(scope, receive, send)
+            return
+        retry_after = self._admit()
+        if retry_after is not None:
+            await JSONResponse(
+                {"detail": "Profiling rate limit exceeded"},
+                status_code=429,
+                headers={"Retry-After": str(retry_after)},
+            )(scope, receive, send)
+            return
+        await self._profile(scope, receive, send)
+
+    def _admit(self) -> int | None:
+        """Reserve a profiling slot; return a Retry-After in seconds if there is none."""
+        if self._active:
+            return 1
+        if limiter.enabled and not limiter.limiter.hit(self.rate_limit, _RATE_LIMIT_KEY):
+            reset_time, _ = limiter.limiter.get_window_stats(self.rate_limit, _RATE_LIMIT_KEY)
+            return max(1, int(reset_time - time.time()))
+        return None
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profile_id = _profile_id()
+        profiler = cProfile.Profile()
+        finished = False
+
+        async def finish() -> None:
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            profiler.disable()
+            self._active = False
+            try:
+                await asyncio.to_thread(self.store.save, profile_id, profiler)
+                logger.info("Saved request profile %s", profile_id)
+            except OSError:
+                logger.exception("Failed to save request profile %s", profile_id)
+
+        async def send_profiled(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"])["X-Profile-Id"] = profile_id
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Save before the response completes, so the profile can be fetched right away.
+                await finish()
+            await send(message)
+
+        try:
+            profiler.enable()
+        except ValueError:  # another profiler owns the interpreter's profiling hook
+            logger.warning("Cannot profile request %s: another profiler is active", profile_id)
+            await self.app(scope, receive, send)
+            return
+        self._active = True
+        try:
+            await self.app(scope, receive, send_profiled)
+        finally:
+            await finish()
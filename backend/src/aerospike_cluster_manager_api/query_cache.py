@@ -0,0 +1,190 @@
+"""In-process LRU cache for ``/query`` and ``/records/{conn_id}/filter`` responses.
+
+Entries are keyed by connection, namespace, set and a digest of the request
+(projection, limits and page, with filters in their canonical form from
+:func:`expression_builder.canonical_key`) plus the read routing, and expire
+after ``QUERY_CACHE_TTL_SECONDS``.  Responses are stored as the JSON bytes
+sent to the client, so a hit is served without serializing again; the cache
+is bounded by their total size (``QUERY_CACHE_MAX_BYTES``) and evicts least
+recently used entries first.
+
+Writes made through this API (``put_record``, ``delete_record``, sample data)
+call :meth:`QueryResultCache.invalidate` for the namespace/set they touched.
+A scan that was in flight during such a write is not stored, so a stale
+result can never be cached after its invalidation.  Invalidation only reaches
+the worker that made the write, so the cache is disabled when the API runs
+with several workers.  Writes made outside this API are only picked up when
+entries expire.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from aerospike_cluster_manager_api import config, fast_json
+from aerospike_cluster_manager_api.expression_builder import canonical_key
+from aerospike_cluster_manager_api.instrumentation import latency
+from aerospike_cluster_manager_api.models.query import (
+    FilteredQueryRequest,
+    FilteredQueryResponse,
+    QueryRequest,
+    QueryResponse,
+)
+
+
+class CacheKey(NamedTuple):
+    conn_id: str
+    namespace: str
+    set_name: str
+    digest: str
+
+
+class CachedResult(NamedTuple):
+    """A query response rendered to JSON, and the same response without its records."""
+
+    body: bytes
+    # For the query history, which only needs the counts and timings
+    summary: QueryResponse | FilteredQueryResponse
+
+    @classmethod
+    def of(cls, response: QueryResponse | FilteredQueryResponse) -> CachedResult:
+        with latency.timed("serialization", "fast_json"):
+            body = fast_json.dumps(response)
+        return cls(body, response.model_copy(update={"records": []}))
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: CachedResult
+    expires_at: float
+
+
+class QueryResultCache:
+    """Byte-bounded LRU cache of query responses with TTL and per-set invalidation."""
+
+    def __init__(self, *, ttl: float, max_bytes: int) -> None:
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._scopes: dict[tuple[str, str, str], set[CacheKey]] = {}
+        self._generations: dict[tuple[str, str, str], int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._max_bytes > 0
+
+    @staticmethod
+    def key(conn_id: str, kind: str, body: QueryRequest | FilteredQueryRequest, routing: dict[str, Any]) -> CacheKey:
+        request = body.model_dump(mode="json", exclude_defaults=True, exclude={"filters"})
+        filters = canonical_key(body.filters) if isinstance(body, FilteredQueryRequest) and body.filters else None
+        canonical = json.dumps([kind, request, filters, routing], sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.sha256(canonical.encode()).hexdigest()
+        return CacheKey(conn_id, body.namespace, body.set or "", digest)
+
+    def get(self, key: CacheKey) -> CachedResult | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def generation(self, key: CacheKey) -> int:
+        """Token to pass to :meth:`put`; it changes whenever *key*'s set is invalidated."""
+        return self._generations.get((key.conn_id, key.namespace, key.set_name), 0)
+
+    def put(self, key: CacheKey, value: CachedResult, generation: int) -> None:
+        if not self.enabled or generation != self.generation(key):
+            return
+        size = len(value.body)
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(value, time.monotonic() + self._ttl)
+        self._scopes.setdefault((key.conn_id, key.namespace, key.set_name), set()).add(key)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def get_or_run(
+        self, key: CacheKey, run: Callable[[], Awaitable[QueryResponse | FilteredQueryResponse]]
+    ) -> tuple[CachedResult, bool]:
+        """Return ``(rendered response, cached)``, running and caching *run* on a miss."""
+        if not self.enabled:
+            return CachedResult.of(await run()), False
+        hit = self.get(key)
+        if hit is not None:
+            return hit, True
+        generation = self.generation(key)
+        value = CachedResult.of(await run())
+        self.put(key, value, generation)
+        return value, False
+
+    def invalidate(self, conn_id: str, namespace: str, set_name: str | None) -> None:
+        """Drop cached results that may include records of *namespace*/*set_name*.
+
+        Namespace-wide scans (no set) are dropped too, since they cover every set.
+        """
+        scopes = {(conn_id, namespace, set_name or ""), (conn_id, namespace, "")}
+        for scope in scopes:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in list(self._scopes.get(scope, ())):
+                self._remove(key)
+
+    def invalidate_connection(self, conn_id: str) -> None:
+        for scope in [s for s in self._scopes if s[0] == conn_id]:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in list(self._scopes[scope]):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._scopes.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "maxBytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= len(entry.value.body)
+        scope = (key.conn_id, key.namespace, key.set_name)
+        keys = self._scopes.get(scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._scopes[scope]
+
+
+query_cache = QueryResultCache(
+    # Off with several workers: an invalidation would not reach the other workers' copies
+    ttl=config.QUERY_CACHE_TTL_SECONDS if config.WORKERS == 1 else 0,
+    max_bytes=config.QUERY_CACHE_MAX_BYTES,
+)
@@ -1,4 +1,17 @@
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-limiter = Limiter(key_func=get_remote_address)
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.coordinator import CoordinatorStorage  # noqa: F401 - registers coordinator://
+
+# With several workers, in-memory counters live in the coordinator worker (see coordinator.py)
+_in_memory = config.RATE_LIMIT_STORAGE_URI == "memory://"
+_storage_uri = "coordinator://" if _in_memory and config.WORKERS > 1 else config.RATE_LIMIT_STORAGE_URI
+
+# coordinator:// already counts locally while the coordinator is away; the fallback
+# also covers anything else it raises, so a storage outage never fails a request
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=_storage_uri,
+    in_memory_fallback_enabled=_storage_uri != "memory://",
+)
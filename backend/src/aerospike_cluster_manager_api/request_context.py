@@ -0,0 +1,8 @@
+"""Per-request context variables set by the HTTP middleware."""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+"""``X-Request-ID`` of the request being handled, or ``None`` outside a request."""
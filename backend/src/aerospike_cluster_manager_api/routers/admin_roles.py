@@ -6,8 +6,9 @@ from aerospike_py.exception import AdminError, AerospikeError
 from fastapi import APIRouter, HTTPException, Query
 from starlette.responses import Response
 
+from aerospike_cluster_manager_api.audit import audit_log
 from aerospike_cluster_manager_api.constants import EE_MSG
-from aerospike_cluster_manager_api.dependencies import AerospikeClient
+from aerospike_cluster_manager_api.dependencies import AerospikeClient, VerifiedConnId
 from aerospike_cluster_manager_api.models.admin import AerospikeRole, CreateRoleRequest, Privilege
 
 logger = logging.getLogger(__name__)
@@ -64,7 +65,7 @@ async def get_roles(client: AerospikeClient) -> list[AerospikeRole]:
     summary="Create role",
     description="Create a new Aerospike role with specified privileges. Requires security to be enabled in aerospike.conf.",
 )
-async def create_role(body: CreateRoleRequest, client: AerospikeClient) -> AerospikeRole:
+async def create_role(body: CreateRoleRequest, client: AerospikeClient, conn_id: VerifiedConnId) -> AerospikeRole:
     """Create a new Aerospike role with specified privileges. Requires security to be enabled in aerospike.conf."""
     if not body.name or not body.privileges:
         raise HTTPException(status_code=400, detail="Missing required fields: name, privileges")
@@ -80,6 +81,7 @@ async def create_role(body: CreateRoleRequest, client: AerospikeClient) -> Aeros
         )
     except AdminError:
         raise HTTPException(status_code=403, detail=EE_MSG) from None
+    audit_log.record("role.create", body.name, connection_id=conn_id, detail={"privileges": privileges})
 
     return AerospikeRole(
         name=body.name,
@@ -98,6 +100,7 @@ async def create_role(body: CreateRoleRequest, client: AerospikeClient) -> Aeros
 )
 async def delete_role(
     client: AerospikeClient,
+    conn_id: VerifiedConnId,
     name: str = Query(..., min_length=1),
 ) -> Response:
     """Delete an Aerospike role by name. Requires security to be enabled in aerospike.conf."""
@@ -105,5 +108,6 @@ async def delete_role(
         await client.admin_drop_role(name)
     except AdminError:
         raise HTTPException(status_code=403, detail=EE_MSG) from None
+    audit_log.record("role.delete", name, connection_id=conn_id)
 
     return Response(status_code=204)
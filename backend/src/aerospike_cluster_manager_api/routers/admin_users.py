@@ -6,8 +6,9 @@ from aerospike_py.exception import AdminError, AerospikeError
 from fastapi import APIRouter, HTTPException, Query
 from starlette.responses import Response
 
+from aerospike_cluster_manager_api.audit import audit_log
 from aerospike_cluster_manager_api.constants import EE_MSG
-from aerospike_cluster_manager_api.dependencies import AerospikeClient
+from aerospike_cluster_manager_api.dependencies import AerospikeClient, VerifiedConnId
 from aerospike_cluster_manager_api.models.admin import AerospikeUser, ChangePasswordRequest, CreateUserRequest
 from aerospike_cluster_manager_api.models.common import MessageResponse
 
@@ -51,7 +52,7 @@ async def get_users(client: AerospikeClient) -> list[AerospikeUser]:
     summary="Create user",
     description="Create a new Aerospike user with specified roles. Requires security to be enabled in aerospike.conf.",
 )
-async def create_user(body: CreateUserRequest, client: AerospikeClient) -> AerospikeUser:
+async def create_user(body: CreateUserRequest, client: AerospikeClient, conn_id: VerifiedConnId) -> AerospikeUser:
     """Create a new Aerospike user with specified roles. Requires security to be enabled in aerospike.conf."""
     if not body.username or not body.password:
         raise HTTPException(status_code=400, detail="Missing required fields: username, password")
@@ -60,6 +61,7 @@ async def create_user(body: CreateUserRequest, client: AerospikeClient) -> Aeros
         await client.admin_create_user(body.username, body.password, body.roles or [])
     except AdminError:
         raise HTTPException(status_code=403, detail=EE_MSG) from None
+    audit_log.record("user.create", body.username, connection_id=conn_id, detail={"roles": body.roles or []})
 
     return AerospikeUser(
         username=body.username,
@@ -76,7 +78,9 @@ async def create_user(body: CreateUserRequest, client: AerospikeClient) -> Aeros
     summary="Change user password",
     description="Change the password for an existing Aerospike user. Requires security to be enabled in aerospike.conf.",
 )
-async def change_password(body: ChangePasswordRequest, client: AerospikeClient) -> MessageResponse:
+async def change_password(
+    body: ChangePasswordRequest, client: AerospikeClient, conn_id: VerifiedConnId
+) -> MessageResponse:
     """Change the password for an existing Aerospike user. Requires security to be enabled in aerospike.conf."""
     if not body.username or not body.password:
         raise HTTPException(status_code=400, detail="Missing required fields: username, password")
@@ -85,6 +89,7 @@ async def change_password(body: ChangePasswordRequest, client: AerospikeClient)
         await client.admin_change_password(body.username, body.password)
     except AdminError:
         raise HTTPException(status_code=403, detail=EE_MSG) from None
+    audit_log.record("user.change_password", body.username, connection_id=conn_id)
 
     return MessageResponse(message="Password updated")
 
@@ -97,6 +102,7 @@ async def change_password(body: ChangePasswordRequest, client: AerospikeClient)
 )
 async def delete_user(
     client: AerospikeClient,
+    conn_id: VerifiedConnId,
     username: str = Query(..., min_length=1),
 ) -> Response:
     """Delete an Aerospike user by username. Requires security to be enabled in aerospike.conf."""
@@ -104,5 +110,6 @@ async def delete_user(
         await client.admin_drop_user(username)
     except AdminError:
         raise HTTPException(status_code=403, detail=EE_MSG) from None
+    audit_log.record("user.delete", username, connection_id=conn_id)
 
     return Response(status_code=204)
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Awaitable
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
+from starlette.responses import Response
 
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.audit import audit_log
 from aerospike_cluster_manager_api.constants import (
     INFO_BUILD,
     INFO_EDITION,
@@ -15,6 +21,7 @@ from aerospike_cluster_manager_api.constants import (
     info_sets,
 )
 from aerospike_cluster_manager_api.dependencies import AerospikeClient, VerifiedConnId
+from aerospike_cluster_manager_api.etag import Tagged, conditional, snapshots, tag
 from aerospike_cluster_manager_api.info_parser import (
     aggregate_node_kv,
     aggregate_set_records,
@@ -31,25 +38,83 @@ from aerospike_cluster_manager_api.models.cluster import (
     SetInfo,
 )
 from aerospike_cluster_manager_api.models.common import MessageResponse
+from aerospike_cluster_manager_api.singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/clusters", tags=["clusters"])
 
 
+# Optional sections of the cluster info response; everything else is always returned.
+CLUSTER_SECTIONS = frozenset({"statistics", "sets"})
+
+
+def parse_include(include: str | None) -> frozenset[str]:
+    """Parse the comma-separated ``include`` parameter; ``None`` means every section."""
+    if include is None:
+        return CLUSTER_SECTIONS
+    sections = frozenset(part.strip() for part in include.split(",") if part.strip())
+    unknown = sections - CLUSTER_SECTIONS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include section(s): {', '.join(sorted(unknown))}. "
+            f"Expected a subset of: {', '.join(sorted(CLUSTER_SECTIONS))}",
+        )
+    return sections
+
+
 @router.get(
     "/{conn_id}",
     summary="Get cluster info",
-    description="Retrieve full cluster information including nodes, namespaces, and sets.",
+    description=(
+        "Retrieve full cluster information including nodes, namespaces, and sets. "
+        "`include` selects the optional sections (`statistics`, `sets`); an empty value returns a "
+        "summary of nodes and namespace usage without the per-node statistics and sets fan-out, "
+        "in which case `clusterSize` is the number of visible nodes and `uptime` / "
+        "`clientConnections` are 0. "
+        "Every view carries an `ETag` and answers `If-None-Match` with `304` while it is unchanged. "
+        "The per-node statistics (uptime, connections, counters) change on every poll, so views that "
+        "include them are snapshotted per connection and may be up to `CLUSTER_SNAPSHOT_TTL_SECONDS` "
+        "(default 10) old; polls within that window revalidate."
+    ),
+    response_model=ClusterInfo,
 )
-async def get_cluster(client: AerospikeClient, conn_id: VerifiedConnId) -> ClusterInfo:
+async def get_cluster(
+    request: Request,
+    client: AerospikeClient,
+    conn_id: VerifiedConnId,
+    include: Annotated[
+        str | None, Query(description="Comma-separated sections to include: statistics, sets (default: all)")
+    ] = None,
+) -> Response:
     """Retrieve full cluster information including nodes, namespaces, and sets."""
-    # --- Nodes ---
-    node_names = await client.get_node_names()
-    info_all_stats = await client.info_all(INFO_STATISTICS)
-    info_all_build = await client.info_all(INFO_BUILD)
-    info_all_edition = await client.info_all(INFO_EDITION)
-    info_all_service = await client.info_all(INFO_SERVICE)
+    sections = parse_include(include)
+    key = ("clusters", conn_id, *sorted(sections))
+
+    def compute() -> Awaitable[Tagged]:
+        return tag(_cluster_info(client, conn_id, sections))
+
+    if "statistics" in sections:
+        return conditional(request, await snapshots.get(key, compute, config.CLUSTER_SNAPSHOT_TTL_SECONDS))
+    return conditional(request, await singleflight.do(key, compute))
+
+
+async def _cluster_info(
+    client: AerospikeClient, conn_id: str, sections: frozenset[str] = CLUSTER_SECTIONS
+) -> ClusterInfo:
+    with_stats = "statistics" in sections
+    with_sets = "sets" in sections
+
+    # --- Nodes --- (independent info commands, issued concurrently)
+    node_names = client.get_node_names()
+    info_all_build, info_all_edition, info_all_service, ns_raw, info_all_stats = await asyncio.gather(
+        client.info_all(INFO_BUILD),
+        client.info_all(INFO_EDITION),
+        client.info_all(INFO_SERVICE),
+        client.info_random_node(INFO_NAMESPACES),
+        client.info_all(INFO_STATISTICS) if with_stats else _no_results(),
+    )
 
     node_map: dict[str, dict] = {}
     for name, _err, resp in info_all_stats:
@@ -61,6 +126,8 @@ async def get_cluster(client: AerospikeClient, conn_id: VerifiedConnId) -> Clust
     for name, _err, resp in info_all_service:
         node_map.setdefault(name, {})["service"] = resp.strip()
 
+    total_nodes = len(node_names)
+
     nodes: list[ClusterNode] = []
     for name in node_names:
         info = node_map.get(name, {})
@@ -75,7 +142,7 @@ async def get_cluster(client: AerospikeClient, conn_id: VerifiedConnId) -> Clust
                 port=safe_int(port, 3000),
                 build=info.get("build", ""),
                 edition=info.get("edition", ""),
-                clusterSize=safe_int(stats.get("cluster_size"), 1),
+                clusterSize=safe_int(stats.get("cluster_size"), 1) if with_stats else total_nodes,
                 uptime=safe_int(stats.get("uptime")),
                 clientConnections=safe_int(stats.get("client_connections")),
                 statistics=stats,
@@ -83,14 +150,14 @@ async def get_cluster(client: AerospikeClient, conn_id: VerifiedConnId) -> Clust
         )
 
     # --- Namespaces ---
-    ns_raw = await client.info_random_node(INFO_NAMESPACES)
     ns_names = parse_list(ns_raw)
-
-    total_nodes = len(node_names)
+    ns_replies, sets_replies = await asyncio.gather(
+        asyncio.gather(*(client.info_all(info_namespace(ns_name)) for ns_name in ns_names)),
+        asyncio.gather(*(client.info_all(info_sets(ns_name)) if with_sets else _no_results() for ns_name in ns_names)),
+    )
 
     namespaces: list[NamespaceInfo] = []
-    for ns_name in ns_names:
-        ns_all = await client.info_all(info_namespace(ns_name))
+    for ns_name, ns_all, sets_all in zip(ns_names, ns_replies, sets_replies, strict=True):
         ns_stats = aggregate_node_kv(ns_all, keys_to_sum=NS_SUM_KEYS)
 
         replication_factor = safe_int(ns_stats.get("replication-factor"), 1)
@@ -108,8 +175,7 @@ async def get_cluster(client: AerospikeClient, conn_id: VerifiedConnId) -> Clust
         if memory_total > 0:
             memory_free_pct = int((1 - memory_used / memory_total) * 100)
 
-        # --- Sets for this namespace (query all nodes and merge) ---
-        sets_all = await client.info_all(info_sets(ns_name))
+        # --- Sets for this namespace (all nodes' replies merged) ---
         agg_sets = aggregate_set_records(sets_all, replication_factor)
         sets = [
             SetInfo(
@@ -149,6 +215,11 @@ async def get_cluster(client: AerospikeClient, conn_id: VerifiedConnId) -> Clust
     return ClusterInfo(connectionId=conn_id, nodes=nodes, namespaces=namespaces)
 
 
+async def _no_results() -> list[tuple[str, int, str]]:
+    """Stand-in for an ``info_all`` call whose section was not requested."""
+    return []
+
+
 @router.post(
     "/{conn_id}/namespaces",
     status_code=200,
@@ -156,7 +227,9 @@ async def get_cluster(client: AerospikeClient, conn_id: VerifiedConnId) -> Clust
     summary="Configure namespace",
     description="Update runtime-tunable parameters of an existing Aerospike namespace.",
 )
-async def configure_namespace(body: CreateNamespaceRequest, client: AerospikeClient) -> MessageResponse:
+async def configure_namespace(
+    body: CreateNamespaceRequest, client: AerospikeClient, conn_id: VerifiedConnId
+) -> MessageResponse:
     """Update runtime-tunable parameters of an existing Aerospike namespace."""
     ns_raw = await client.info_random_node(INFO_NAMESPACES)
     existing = parse_list(ns_raw)
@@ -176,8 +249,16 @@ async def configure_namespace(body: CreateNamespaceRequest, client: AerospikeCli
         f";replication-factor={body.replicationFactor}"
     )
     resp = await client.info_random_node(cmd)
+    singleflight.forget("clusters", conn_id)
+    snapshots.forget("clusters", conn_id)
 
     if resp.strip().lower() != "ok":
         raise HTTPException(status_code=400, detail=f"Failed to configure namespace '{body.name}': {resp.strip()}")
+    audit_log.record(
+        "namespace.configure",
+        body.name,
+        connection_id=conn_id,
+        detail={"memorySize": body.memorySize, "replicationFactor": body.replicationFactor},
+    )
 
     return MessageResponse(message=f"Namespace '{body.name}' configured successfully")
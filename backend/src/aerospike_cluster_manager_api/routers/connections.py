@@ -1,30 +1,35 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
 import contextlib
+import json
 import logging
 import uuid
 from datetime import UTC, datetime
-from typing import Any
+from typing import Annotated, Any
 
-import aerospike_py
 from aerospike_py.exception import AerospikeError
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from starlette.responses import Response
 
 from aerospike_cluster_manager_api import db
-from aerospike_cluster_manager_api.client_manager import client_manager
-from aerospike_cluster_manager_api.constants import INFO_BUILD, INFO_EDITION, INFO_NAMESPACES
+from aerospike_cluster_manager_api.client_manager import client_manager, new_client
 from aerospike_cluster_manager_api.dependencies import _get_verified_connection
-from aerospike_cluster_manager_api.info_parser import parse_list
+from aerospike_cluster_manager_api.health_monitor import health_monitor
 from aerospike_cluster_manager_api.models.connection import (
     ConnectionProfile,
     ConnectionProfileResponse,
     ConnectionStatus,
+    ConnectionWithStatus,
     CreateConnectionRequest,
     TestConnectionRequest,
     UpdateConnectionRequest,
 )
+from aerospike_cluster_manager_api.query_cache import query_cache
 from aerospike_cluster_manager_api.rate_limit import limiter
+from aerospike_cluster_manager_api.services import query_service
 from aerospike_cluster_manager_api.utils import parse_host_port
 
 logger = logging.getLogger(__name__)
@@ -32,11 +37,59 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/connections", tags=["connections"])
 
 
-@router.get("", summary="List connections", description="Retrieve all saved Aerospike connection profiles.")
-async def list_connections() -> list[ConnectionProfileResponse]:
-    """Retrieve all saved Aerospike connection profiles."""
-    profiles = await db.get_all_connections()
-    return [ConnectionProfileResponse.from_profile(p) for p in profiles]
+def _encode_cursor(profile: ConnectionProfileResponse) -> str:
+    raw = json.dumps([profile.createdAt, profile.id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        created_at, conn_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return str(created_at), str(conn_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+@router.get("", summary="List connections", description="Retrieve saved Aerospike connection profiles.")
+async def list_connections(
+    response: Response,
+    withStatus: bool = Query(False, description="Attach the last background health check result to each profile."),
+    q: str | None = Query(None, min_length=1, max_length=255, description="Name or host prefix (case-insensitive)."),
+    tag: Annotated[list[str] | None, Query(description="Only profiles carrying all of these tags.")] = None,
+    environment: str | None = Query(None, max_length=64),
+    limit: int | None = Query(None, ge=1, le=500, description="Page size; omit to return every match."),
+    cursor: str | None = Query(None, description="Value of the previous page's X-Next-Cursor header."),
+) -> list[ConnectionWithStatus | ConnectionProfileResponse]:
+    """Retrieve saved Aerospike connection profiles.
+
+    Supports prefix search, tag/environment filters and keyset pagination: when more
+    results exist, the ``X-Next-Cursor`` response header carries the cursor for the next page.
+    With ``withStatus=true`` each profile carries the status cached by the background
+    health monitor. Profiles that have not been probed yet are checked inline.
+    """
+    profiles = await db.search_connections(
+        query=q,
+        tags=tag,
+        environment=environment,
+        after=_decode_cursor(cursor) if cursor else None,
+        limit=limit + 1 if limit else None,
+    )
+    if limit and len(profiles) > limit:
+        profiles = profiles[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(profiles[-1])
+
+    if not withStatus:
+        return list(profiles)
+
+    missing = [p.id for p in profiles if health_monitor.get_status(p.id) is None]
+    if missing:
+        await asyncio.gather(*(health_monitor.refresh(conn_id) for conn_id in missing))
+
+    result: list[ConnectionWithStatus | ConnectionProfileResponse] = []
+    for p in profiles:
+        status = health_monitor.get_status(p.id) or ConnectionStatus(connected=False, nodeCount=0, namespaceCount=0)
+        result.append(ConnectionWithStatus(**p.model_dump(), status=status))
+    return result
 
 
 @router.post("", status_code=201, summary="Create connection", description="Create a new Aerospike connection profile.")
@@ -53,6 +106,11 @@ async def create_connection(request: Request, body: CreateConnectionRequest) ->
         username=body.username,
         password=body.password,
         color=body.color,
+        readReplica=body.readReplica,
+        readModeAp=body.readModeAp,
+        rackId=body.rackId,
+        tags=body.tags,
+        environment=body.environment,
         createdAt=now,
         updatedAt=now,
     )
@@ -81,6 +139,9 @@ async def update_connection(
     conn = await db.update_connection(conn_id, update_data)
     if not conn:
         raise HTTPException(status_code=404, detail=f"Connection '{conn_id}' not found")
+    # Reconnect lazily so that host, credential and rack changes take effect
+    await client_manager.close_client(conn_id)
+    query_cache.invalidate_connection(conn_id)
     return ConnectionProfileResponse.from_profile(conn)
 
 
@@ -94,25 +155,9 @@ async def get_connection_health(conn_id: str = Depends(_get_verified_connection)
 
     Always returns HTTP 200. Uses ``connected: false`` to signal unreachable clusters
     so that the frontend health indicator never mistakes a transient 503 for a permanent failure.
+    The fresh result also replaces the background monitor's cached status.
     """
-    try:
-        client = await client_manager.get_client(conn_id)
-        node_names = await client.get_node_names()
-        ns_raw = await client.info_random_node(INFO_NAMESPACES)
-        namespaces = parse_list(ns_raw)
-        build = (await client.info_random_node(INFO_BUILD)).strip()
-        edition = (await client.info_random_node(INFO_EDITION)).strip()
-
-        return ConnectionStatus(
-            connected=True,
-            nodeCount=len(node_names),
-            namespaceCount=len(namespaces),
-            build=build,
-            edition=edition,
-        )
-    except Exception:
-        logger.warning("Health check failed for connection '%s'", conn_id, exc_info=True)
-        return ConnectionStatus(connected=False, nodeCount=0, namespaceCount=0)
+    return await health_monitor.refresh(conn_id)
 
 
 @router.post(
@@ -131,7 +176,7 @@ async def test_connection(request: Request, body: TestConnectionRequest) -> dict
             config["user"] = body.username
             config["password"] = body.password
 
-        client = aerospike_py.AsyncClient(config)
+        client = new_client(config)
         await client.connect()
         try:
             if not client.is_connected():
@@ -156,4 +201,7 @@ async def delete_connection(request: Request, conn_id: str = Depends(_get_verifi
     """Delete a connection profile and close its active client."""
     await db.delete_connection(conn_id)
     await client_manager.close_client(conn_id)
+    health_monitor.forget(conn_id)
+    query_cache.invalidate_connection(conn_id)
+    query_service.forget(conn_id)
     return Response(status_code=204)
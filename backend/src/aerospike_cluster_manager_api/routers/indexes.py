@@ -2,51 +2,45 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from starlette.responses import Response
 
-from aerospike_cluster_manager_api.constants import INFO_NAMESPACES, info_sindex
-from aerospike_cluster_manager_api.dependencies import AerospikeClient
-from aerospike_cluster_manager_api.info_parser import parse_list, parse_records
+from aerospike_cluster_manager_api.audit import audit_log
+from aerospike_cluster_manager_api.constants import INFO_NAMESPACES
+from aerospike_cluster_manager_api.dependencies import AerospikeClient, VerifiedConnId
+from aerospike_cluster_manager_api.etag import conditional, tag
+from aerospike_cluster_manager_api.info_parser import parse_list
 from aerospike_cluster_manager_api.models.index import CreateIndexRequest, SecondaryIndex
+from aerospike_cluster_manager_api.services.index_service import list_namespace_indexes
+from aerospike_cluster_manager_api.singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/indexes", tags=["indexes"])
 
-_STATE_MAP = {"RW": "ready", "WO": "building", "D": "error"}
-_TYPE_MAP = {"numeric": "numeric", "string": "string", "geo2dsphere": "geo2dsphere"}
-
 
 @router.get(
     "/{conn_id}",
     summary="List secondary indexes",
-    description="Retrieve all secondary indexes across all namespaces in the cluster.",
+    description=(
+        "Retrieve all secondary indexes across all namespaces in the cluster. "
+        "Supports conditional requests with `If-None-Match`."
+    ),
+    response_model=list[SecondaryIndex],
 )
-async def get_indexes(client: AerospikeClient) -> list[SecondaryIndex]:
+async def get_indexes(request: Request, client: AerospikeClient, conn_id: VerifiedConnId) -> Response:
     """Retrieve all secondary indexes across all namespaces in the cluster."""
+    tagged = await singleflight.do(("indexes", conn_id), lambda: tag(_list_indexes(client)))
+    return conditional(request, tagged)
+
+
+async def _list_indexes(client: AerospikeClient) -> list[SecondaryIndex]:
     ns_raw = await client.info_random_node(INFO_NAMESPACES)
     ns_names = parse_list(ns_raw)
 
     indexes: list[SecondaryIndex] = []
     for ns in ns_names:
-        sindex_raw = await client.info_random_node(info_sindex(ns))
-        for rec in parse_records(sindex_raw):
-            raw_type = rec.get("type", rec.get("bin_type", "string")).lower()
-            idx_type = _TYPE_MAP.get(raw_type, "string")
-            raw_state = rec.get("state", "RW")
-            state = _STATE_MAP.get(raw_state, "ready")
-
-            indexes.append(
-                SecondaryIndex(
-                    name=rec.get("indexname", rec.get("index_name", "")),
-                    namespace=ns,
-                    set=rec.get("set", rec.get("set_name", "")),
-                    bin=rec.get("bin", rec.get("bin_name", "")),
-                    type=idx_type,
-                    state=state,
-                )
-            )
+        indexes.extend(await list_namespace_indexes(client, ns))
     return indexes
 
 
@@ -56,7 +50,7 @@ async def get_indexes(client: AerospikeClient) -> list[SecondaryIndex]:
     summary="Create secondary index",
     description="Create a new secondary index on a specified namespace, set, and bin.",
 )
-async def create_index(body: CreateIndexRequest, client: AerospikeClient) -> SecondaryIndex:
+async def create_index(body: CreateIndexRequest, client: AerospikeClient, conn_id: VerifiedConnId) -> SecondaryIndex:
     """Create a new secondary index on a specified namespace, set, and bin."""
     if body.type == "numeric":
         await client.index_integer_create(body.namespace, body.set, body.bin, body.name)
@@ -66,6 +60,13 @@ async def create_index(body: CreateIndexRequest, client: AerospikeClient) -> Sec
         await client.index_geo2dsphere_create(body.namespace, body.set, body.bin, body.name)
     else:
         raise HTTPException(status_code=400, detail=f"Unsupported index type: {body.type}")
+    singleflight.forget("indexes", conn_id)
+    audit_log.record(
+        "index.create",
+        f"{body.namespace}/{body.name}",
+        connection_id=conn_id,
+        detail={"set": body.set, "bin": body.bin, "type": body.type},
+    )
 
     return SecondaryIndex(
         name=body.name,
@@ -85,9 +86,12 @@ async def create_index(body: CreateIndexRequest, client: AerospikeClient) -> Sec
 )
 async def delete_index(
     client: AerospikeClient,
+    conn_id: VerifiedConnId,
     name: str = Query(..., min_length=1),
     ns: str = Query(..., min_length=1),
 ) -> Response:
     """Remove a secondary index by name from the specified namespace."""
     await client.index_remove(ns, name)
+    singleflight.forget("indexes", conn_id)
+    audit_log.record("index.delete", f"{ns}/{name}", connection_id=conn_id)
     return Response(status_code=204)
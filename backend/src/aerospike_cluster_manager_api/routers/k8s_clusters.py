@@ -12,11 +12,15 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query, Request
 from pydantic import BaseModel
+from starlette.responses import Response
 
 from aerospike_cluster_manager_api import config, db
+from aerospike_cluster_manager_api.audit import audit_log
 from aerospike_cluster_manager_api.client_manager import client_manager
+from aerospike_cluster_manager_api.etag import Tagged, conditional
+from aerospike_cluster_manager_api.health_monitor import health_monitor
 from aerospike_cluster_manager_api.k8s_client import K8sApiError, k8s_client
 from aerospike_cluster_manager_api.models.connection import ConnectionProfile
 from aerospike_cluster_manager_api.models.k8s_cluster import (
@@ -107,19 +111,23 @@ def _k8s_endpoint(operation: str):
 # ---------------------------------------------------------------------------
 
 
-@router.get("/clusters", summary="List K8s Aerospike clusters")
+@router.get(
+    "/clusters",
+    summary="List K8s Aerospike clusters",
+    description="Supports conditional requests with `If-None-Match`.",
+    response_model=list[K8sClusterSummary],
+)
 @_k8s_endpoint("list Kubernetes clusters")
-async def list_k8s_clusters(namespace: str | None = None) -> list[K8sClusterSummary]:
+async def list_k8s_clusters(request: Request, namespace: str | None = None) -> Response:
     _require_k8s()
     items = await k8s_client.list_clusters(namespace)
 
-    connections = await db.get_all_connections()
     conn_by_host: dict[str, str] = {}
     conn_by_name: dict[str, str] = {}
-    for conn in connections:
-        for host in conn.hosts:
-            conn_by_host[host.lower()] = conn.id
-        conn_by_name[conn.name] = conn.id
+    for conn_id, conn_name, hosts in await db.get_connection_hosts():
+        for host in hosts:
+            conn_by_host[host.lower()] = conn_id
+        conn_by_name[conn_name] = conn_id
 
     def _find_connection_id(item: dict[str, Any]) -> str | None:
         meta = item.get("metadata", {})
@@ -132,7 +140,8 @@ async def list_k8s_clusters(namespace: str | None = None) -> list[K8sClusterSumm
             return conn_id
         return conn_by_name.get(f"[K8s] {name}")
 
-    return [extract_summary(item, connection_id=_find_connection_id(item)) for item in items]
+    summaries = [extract_summary(item, connection_id=_find_connection_id(item)) for item in items]
+    return conditional(request, Tagged.of(summaries))
 
 
 @router.get("/clusters/{namespace}/{name}", summary="Get K8s Aerospike cluster detail")
@@ -237,6 +246,7 @@ async def create_k8s_cluster(body: CreateK8sClusterRequest) -> K8sClusterSummary
 
     cr = build_cr(body)
     result = await k8s_client.create_cluster(body.namespace, cr)
+    audit_log.record("k8s.cluster.create", f"{body.namespace}/{body.name}", detail={"size": body.size})
 
     connection_id: str | None = None
     auto_connect_warning: str | None = None
@@ -282,6 +292,7 @@ async def update_k8s_cluster(
 
     patch = build_update_patch(body)
     result = await k8s_client.patch_cluster(namespace, name, patch)
+    audit_log.record("k8s.cluster.update", f"{namespace}/{name}", detail={"fields": sorted(body.model_fields_set)})
     return extract_summary(result)
 
 
@@ -293,6 +304,7 @@ async def delete_k8s_cluster(
 ) -> DeleteResponse:
     _require_k8s()
     await k8s_client.delete_cluster(namespace, name)
+    audit_log.record("k8s.cluster.delete", f"{namespace}/{name}")
 
     try:
         all_conns = await db.get_all_connections()
@@ -302,6 +314,7 @@ async def delete_k8s_cluster(
             if conn.name == k8s_prefix or service_host in conn.hosts:
                 await db.delete_connection(conn.id)
                 await client_manager.close_client(conn.id)
+                health_monitor.forget(conn.id)
                 logger.info("Cleaned up auto-connect profile %s for deleted cluster %s/%s", conn.id, namespace, name)
     except Exception:
         logger.warning("Failed to clean up connection profiles for %s/%s", namespace, name, exc_info=True)
@@ -319,6 +332,7 @@ async def scale_k8s_cluster(
     _require_k8s()
     patch = {"spec": {"size": body.size}}
     result = await k8s_client.patch_cluster(namespace, name, patch)
+    audit_log.record("k8s.cluster.scale", f"{namespace}/{name}", detail={"size": body.size})
     return extract_summary(result)
 
 
@@ -371,6 +385,7 @@ async def create_or_update_k8s_cluster_hpa(
             )
         else:
             raise
+    audit_log.record("k8s.hpa.apply", f"{namespace}/{name}", detail=body.model_dump())
     return extract_hpa_response(raw)
 
 
@@ -382,6 +397,7 @@ async def delete_k8s_cluster_hpa(
 ) -> DeleteResponse:
     _require_k8s()
     await k8s_client.delete_hpa(namespace, name)
+    audit_log.record("k8s.hpa.delete", f"{namespace}/{name}")
     return DeleteResponse(message=f"HPA for {namespace}/{name} deleted")
 
 
@@ -453,6 +469,7 @@ async def create_k8s_template(body: CreateK8sTemplateRequest) -> K8sTemplateSumm
     _require_k8s()
     cr = build_template_cr(body)
     result = await k8s_client.create_template(cr)
+    audit_log.record("k8s.template.create", body.name)
     return extract_template_summary(result)
 
 
@@ -467,6 +484,7 @@ async def update_k8s_template(
     if not patch.get("spec"):
         raise HTTPException(status_code=400, detail="No fields to update")
     result = await k8s_client.patch_template(name, patch)
+    audit_log.record("k8s.template.update", name, detail={"fields": sorted(body.model_fields_set)})
     return extract_template_summary(result)
 
 
@@ -489,6 +507,7 @@ async def delete_k8s_template(
             "Remove the template reference from these clusters before deleting.",
         )
     await k8s_client.delete_template(name)
+    audit_log.record("k8s.template.delete", name)
     return DeleteResponse(message=f"Template {name} deletion initiated")
 
 
@@ -528,6 +547,7 @@ async def resync_k8s_cluster_template(
     _require_k8s()
     patch: dict[str, Any] = {"metadata": {"annotations": {"acko.io/resync-template": "true"}}}
     result = await k8s_client.patch_cluster(namespace, name, patch)
+    audit_log.record("k8s.cluster.resync_template", f"{namespace}/{name}")
     return extract_summary(result)
 
 
@@ -545,4 +565,5 @@ async def trigger_k8s_cluster_operation(
         operation["podList"] = body.pod_list
     patch: dict[str, Any] = {"spec": {"operations": [operation]}}
     result = await k8s_client.patch_cluster(namespace, name, patch)
+    audit_log.record("k8s.cluster.operation", f"{namespace}/{name}", detail=operation)
     return extract_summary(result)
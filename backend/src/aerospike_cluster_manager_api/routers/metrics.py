@@ -15,6 +15,7 @@ from aerospike_cluster_manager_api.models.metrics import (
     MetricSeries,
     NamespaceMetrics,
 )
+from aerospike_cluster_manager_api.singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,10 @@ _STATS_MIN_KEYS = frozenset({"uptime"})
 )
 async def get_metrics(client: AerospikeClient, conn_id: VerifiedConnId) -> ClusterMetrics:
     """Retrieve cluster-wide metrics including TPS, memory, device usage, and per-namespace stats."""
+    return await singleflight.do(("metrics", conn_id), lambda: _cluster_metrics(client, conn_id))
+
+
+async def _cluster_metrics(client: AerospikeClient, conn_id: str) -> ClusterMetrics:
     try:
         # Cluster-level statistics (aggregated across all nodes)
         stats_all = await client.info_all(INFO_STATISTICS)
@@ -1,17 +1,34 @@
 from __future__ import annotations
 
 import logging
-import time
-
-from aerospike_py.exception import RecordNotFound
-from fastapi import APIRouter, HTTPException
-
-from aerospike_cluster_manager_api.constants import MAX_QUERY_RECORDS, POLICY_QUERY, POLICY_READ
-from aerospike_cluster_manager_api.converters import record_to_model
-from aerospike_cluster_manager_api.dependencies import AerospikeClient
-from aerospike_cluster_manager_api.models.query import QueryRequest, QueryResponse
-from aerospike_cluster_manager_api.routers.records import _auto_detect_pk
-from aerospike_cluster_manager_api.utils import build_predicate
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Annotated
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from starlette.responses import Response
+
+from aerospike_cluster_manager_api import config, db
+from aerospike_cluster_manager_api.dependencies import AerospikeClient, ReadRouting, ScanThrottling, VerifiedConnId
+from aerospike_cluster_manager_api.fast_json import FastJSONResponse, render
+from aerospike_cluster_manager_api.models.query import (
+    CreateSavedQueryRequest,
+    FilteredQueryRequest,
+    FilteredQueryResponse,
+    QueryExplainResponse,
+    QueryHistoryEntry,
+    QueryRequest,
+    QueryResponse,
+    SavedQuery,
+    SavedQueryRunResponse,
+    ScanQueueStatus,
+)
+from aerospike_cluster_manager_api.query_cache import CachedResult, query_cache
+from aerospike_cluster_manager_api.scan_scheduler import scan_scheduler
+from aerospike_cluster_manager_api.services import query_service
+from aerospike_cluster_manager_api.services.query_explain import explain_filtered_query
+from aerospike_cluster_manager_api.services.query_service import record_history, request_digest, store_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -22,52 +39,202 @@ router = APIRouter(prefix="/query", tags=["query"])
     "/{conn_id}",
     summary="Execute query",
     description="Execute a query against Aerospike using primary key lookup, predicate filter, or full scan.",
+    response_model=QueryResponse,
 )
-async def execute_query(body: QueryRequest, client: AerospikeClient) -> QueryResponse:
+async def execute_query(
+    body: QueryRequest,
+    client: AerospikeClient,
+    routing: ReadRouting,
+    throttle: ScanThrottling,
+    conn_id: VerifiedConnId,
+    background_tasks: BackgroundTasks,
+    response: Response,
+) -> FastJSONResponse:
     """Execute a query against Aerospike using primary key lookup, predicate filter, or full scan."""
-    start_time = time.monotonic()
-
-    if body.primaryKey:
-        if not body.set:
-            raise HTTPException(status_code=400, detail="Set is required for primary key lookup")
-
-        pk = _auto_detect_pk(body.primaryKey)
-
-        try:
-            raw_result = await client.get((body.namespace, body.set, pk), policy=POLICY_READ)
-            raw_results = [raw_result]
-        except RecordNotFound:
-            raw_results = []
-
-        elapsed_ms = int((time.monotonic() - start_time) * 1000)
-        records = [record_to_model(r) for r in raw_results]
-        return QueryResponse(
-            records=records,
-            executionTimeMs=elapsed_ms,
-            scannedRecords=len(records),
-            returnedRecords=len(records),
-        )
+    result, cached = await query_cache.get_or_run(
+        query_cache.key(conn_id, "query", body, routing),
+        lambda: throttle.run(
+            lambda: query_service.execute_query(client, body, {**routing, **throttle.policy}),
+            lambda r: r.scannedRecords,
+            kind=None if body.primaryKey else "query",
+        ),
+    )
+    response.headers["X-Query-Cache"] = "hit" if cached else "miss"
+    background_tasks.add_task(record_history, conn_id, "query", body, result.summary, cached=cached)
+    return render(result.body, response)
 
-    q = client.query(body.namespace, body.set or "")
-    if body.predicate:
-        q.where(build_predicate(body.predicate))
-    if body.selectBins:
-        q.select(*body.selectBins)
-    raw_results = await q.results(POLICY_QUERY)
 
-    elapsed_ms = int((time.monotonic() - start_time) * 1000)
-    scanned = len(raw_results)
+@router.post(
+    "/{conn_id}/explain",
+    summary="Explain filtered query",
+    description=(
+        "Report whether a filtered query would use a secondary index or a full scan, the estimated candidate "
+        "count and the generated filter expression. With `execute=true` the query is also run (records are not "
+        "returned) and per-node scanned/returned counts and elapsed time are collected."
+    ),
+)
+async def explain_query(
+    body: FilteredQueryRequest,
+    client: AerospikeClient,
+    routing: ReadRouting,
+    throttle: ScanThrottling,
+    execute: Annotated[bool, Query(description="Run the query and collect per-node statistics")] = False,
+) -> QueryExplainResponse:
+    """Explain how a filtered query would run."""
+    if not execute:
+        return await explain_filtered_query(client, body, routing)
+    return await throttle.run(
+        lambda: explain_filtered_query(client, body, {**routing, **throttle.policy}, execute=True),
+        lambda r: sum(s.recordsScanned for s in r.nodeStats) or r.returnedRecords or 0,
+        kind="explain",
+    )
 
-    if body.maxRecords and body.maxRecords > 0:
-        raw_results = raw_results[: body.maxRecords]
-    if len(raw_results) > MAX_QUERY_RECORDS:
-        raw_results = raw_results[:MAX_QUERY_RECORDS]
 
-    records = [record_to_model(r) for r in raw_results]
+@router.get(
+    "/{conn_id}/scans",
+    summary="Scan queue status",
+    description=(
+        "List running and queued scans for this connection. Queued requests are identified by their "
+        "X-Request-ID and listed in admission order."
+    ),
+)
+async def get_scan_queue(conn_id: VerifiedConnId) -> ScanQueueStatus:
+    """List running and queued scans for this connection."""
+    return ScanQueueStatus.model_validate(scan_scheduler.status(conn_id))
+
+
+# ---------------------------------------------------------------------------
+# Query history & saved queries
+# ---------------------------------------------------------------------------
+
+
+@router.get(
+    "/{conn_id}/history",
+    summary="Query history",
+    description="List executed queries for a connection, most recent first. Page with the `before` entry id.",
+)
+async def get_query_history(
+    conn_id: VerifiedConnId,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    before: Annotated[int | None, Query(ge=1, description="Return entries older than this id")] = None,
+) -> list[QueryHistoryEntry]:
+    """List executed queries for a connection, most recent first."""
+    return await db.list_query_history(conn_id, before=before, limit=limit)
+
+
+@router.get(
+    "/{conn_id}/saved",
+    summary="List saved queries",
+    description="List the named queries saved for a connection.",
+)
+async def list_saved_queries(conn_id: VerifiedConnId) -> list[SavedQuery]:
+    """List the named queries saved for a connection."""
+    return await db.list_saved_queries(conn_id)
+
 
-    return QueryResponse(
-        records=records,
-        executionTimeMs=elapsed_ms,
-        scannedRecords=scanned,
-        returnedRecords=len(records),
+@router.post(
+    "/{conn_id}/saved",
+    status_code=201,
+    summary="Save query",
+    description="Save a query or filtered scan under a name unique to the connection.",
+)
+async def create_saved_query(body: CreateSavedQueryRequest, conn_id: VerifiedConnId) -> SavedQuery:
+    """Save a query or filtered scan under a name unique to the connection."""
+    model = QueryRequest if body.kind == "query" else FilteredQueryRequest
+    now = datetime.now(UTC).isoformat()
+    saved = SavedQuery(
+        id=f"sq-{uuid.uuid4().hex[:12]}",
+        connectionId=conn_id,
+        name=body.name,
+        kind=body.kind,
+        request=body.request,
+        digest=request_digest(model.model_validate(body.request)),
+        createdAt=now,
+        updatedAt=now,
     )
+    if not await db.create_saved_query(saved):
+        raise HTTPException(status_code=409, detail=f"A saved query named '{body.name}' already exists")
+    return saved
+
+
+@router.delete(
+    "/{conn_id}/saved/{query_id}",
+    status_code=204,
+    summary="Delete saved query",
+    description="Delete a saved query and its cached result snapshot.",
+)
+async def delete_saved_query(query_id: str, conn_id: VerifiedConnId) -> Response:
+    """Delete a saved query and its cached result snapshot."""
+    if not await db.delete_saved_query(conn_id, query_id):
+        raise HTTPException(status_code=404, detail=f"Saved query '{query_id}' not found")
+    return Response(status_code=204)
+
+
+@router.post(
+    "/{conn_id}/saved/{query_id}/run",
+    summary="Run saved query",
+    description=(
+        "Run a saved query. A result snapshot younger than the freshness window is returned instead of "
+        "rescanning, unless `refresh` is set."
+    ),
+    response_model=SavedQueryRunResponse,
+)
+async def run_saved_query(
+    query_id: str,
+    client: AerospikeClient,
+    routing: ReadRouting,
+    throttle: ScanThrottling,
+    conn_id: VerifiedConnId,
+    background_tasks: BackgroundTasks,
+    refresh: Annotated[bool, Query(description="Ignore any cached snapshot and rescan")] = False,
+) -> FastJSONResponse:
+    """Run a saved query, serving a fresh result snapshot when one exists."""
+    saved = await db.get_saved_query(conn_id, query_id)
+    if saved is None:
+        raise HTTPException(status_code=404, detail=f"Saved query '{query_id}' not found")
+
+    body: QueryRequest | FilteredQueryRequest
+    response_model: type[QueryResponse | FilteredQueryResponse]
+    if saved.kind == "query":
+        body, response_model = QueryRequest.model_validate(saved.request), QueryResponse
+    else:
+        body, response_model = FilteredQueryRequest.model_validate(saved.request), FilteredQueryResponse
+
+    freshness = timedelta(seconds=config.SAVED_QUERY_SNAPSHOT_TTL_SECONDS)
+    if not refresh and freshness:
+        snapshot = await db.get_saved_query_snapshot(query_id)
+        if snapshot is not None:
+            result, taken_at = snapshot
+            if datetime.now(UTC) - taken_at < freshness:
+                summary = response_model.model_validate({**orjson.loads(result), "records": []})
+                background_tasks.add_task(record_history, conn_id, saved.kind, body, summary, cached=True)
+                return _run_response(result.encode(), cached=True, snapshot_at=taken_at)
+
+    policy = {**routing, **throttle.policy}
+    response: QueryResponse | FilteredQueryResponse
+    if isinstance(body, QueryRequest):
+        query_body = body
+        response = await throttle.run(
+            lambda: query_service.execute_query(client, query_body, policy),
+            lambda r: r.scannedRecords,
+            kind=None if query_body.primaryKey else "saved",
+        )
+    else:
+        filtered_body = body
+        response = await throttle.run(
+            lambda: query_service.execute_filtered_query(client, filtered_body, policy),
+            lambda r: r.scanned_records,
+            kind=None if filtered_body.primary_key else "saved",
+        )
+
+    taken_at = datetime.now(UTC)
+    rendered = CachedResult.of(response)
+    background_tasks.add_task(store_snapshot, query_id, rendered.body.decode(), taken_at)
+    background_tasks.add_task(record_history, conn_id, saved.kind, body, rendered.summary)
+    return _run_response(rendered.body, cached=False, snapshot_at=taken_at)
+
+
+def _run_response(result: bytes, *, cached: bool, snapshot_at: datetime) -> FastJSONResponse:
+    """A :class:`SavedQueryRunResponse` around an already rendered *result*, which is not parsed again."""
+    tail = orjson.dumps({"cached": cached, "snapshotAt": snapshot_at.isoformat()})
+    return render(b'{"result":' + result + b"," + tail[1:])
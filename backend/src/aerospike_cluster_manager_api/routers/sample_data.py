@@ -8,11 +8,17 @@ from pathlib import Path
 
 from fastapi import APIRouter
 
+from aerospike_cluster_manager_api.audit import audit_log
 from aerospike_cluster_manager_api.constants import POLICY_WRITE
-from aerospike_cluster_manager_api.dependencies import AerospikeClient
+from aerospike_cluster_manager_api.dependencies import AerospikeClient, VerifiedConnId
+from aerospike_cluster_manager_api.etag import snapshots
 from aerospike_cluster_manager_api.lua_modules import get_lua_modules
 from aerospike_cluster_manager_api.models.sample_data import CreateSampleDataRequest, CreateSampleDataResponse
+from aerospike_cluster_manager_api.query_cache import query_cache
+from aerospike_cluster_manager_api.request_context import request_id_var
 from aerospike_cluster_manager_api.sample_data_generator import SAMPLE_INDEXES, generate_record_bins
+from aerospike_cluster_manager_api.scan_scheduler import Priority, scan_scheduler
+from aerospike_cluster_manager_api.singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +34,15 @@ router = APIRouter(prefix="/sample-data", tags=["sample-data"])
 async def create_sample_data(
     body: CreateSampleDataRequest,
     client: AerospikeClient,
+    conn_id: VerifiedConnId,
+) -> CreateSampleDataResponse:
+    # Bulk loads and index builds compete with scans for the cluster; queue them as background work.
+    async with scan_scheduler.admit(conn_id, Priority.BACKGROUND, kind="sample-data", request_id=request_id_var.get()):
+        return await _create_sample_data(body, client, conn_id)
+
+
+async def _create_sample_data(
+    body: CreateSampleDataRequest, client: AerospikeClient, conn_id: str
 ) -> CreateSampleDataResponse:
     start = time.monotonic()
     ns = body.namespace
@@ -36,11 +51,16 @@ async def create_sample_data(
 
     # 1. Insert records
     records_created = 0
-    for i in range(1, count + 1):
-        key_tuple = (ns, set_name, i)
-        bins = generate_record_bins(i)
-        await client.put(key_tuple, bins, policy=POLICY_WRITE)
-        records_created += 1
+    try:
+        for i in range(1, count + 1):
+            key_tuple = (ns, set_name, i)
+            bins = generate_record_bins(i)
+            await client.put(key_tuple, bins, policy=POLICY_WRITE)
+            records_created += 1
+    finally:
+        query_cache.invalidate(conn_id, ns, set_name)
+        singleflight.forget("clusters", conn_id)
+        snapshots.forget("clusters", conn_id)
 
     # Short random suffix to avoid name collisions across multiple invocations.
     suffix = secrets.token_hex(3)  # e.g. "a3f2b1"
@@ -68,6 +88,8 @@ async def create_sample_data(
                     logger.info("Index %s already exists, skipping", actual_idx_name)
                 else:
                     raise
+            finally:
+                singleflight.forget("indexes", conn_id)
 
     # 3. Register UDFs (if requested)
     udfs_registered: list[str] = []
@@ -80,8 +102,15 @@ async def create_sample_data(
                 tmp_path = str(Path(tmp_dir) / actual_filename)
                 Path(tmp_path).write_text(content)
                 await client.udf_put(tmp_path)
+                singleflight.forget("udfs", conn_id)
                 udfs_registered.append(actual_filename)
 
+    audit_log.record(
+        "sample_data.create",
+        f"{ns}/{set_name}",
+        connection_id=conn_id,
+        detail={"records": records_created, "indexes": indexes_created, "udfs": udfs_registered},
+    )
     elapsed_ms = int((time.monotonic() - start) * 1000)
 
     return CreateSampleDataResponse(
@@ -4,13 +4,16 @@ import logging
 import tempfile
 from pathlib import Path
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 from starlette.responses import Response
 
+from aerospike_cluster_manager_api.audit import audit_log
 from aerospike_cluster_manager_api.constants import INFO_UDF_LIST
-from aerospike_cluster_manager_api.dependencies import AerospikeClient
+from aerospike_cluster_manager_api.dependencies import AerospikeClient, VerifiedConnId
+from aerospike_cluster_manager_api.etag import conditional, tag
 from aerospike_cluster_manager_api.info_parser import parse_records
 from aerospike_cluster_manager_api.models.udf import UDFModule, UploadUDFRequest
+from aerospike_cluster_manager_api.singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +38,16 @@ async def _list_udfs(c) -> list[UDFModule]:
 @router.get(
     "/{conn_id}",
     summary="List UDF modules",
-    description="Retrieve all registered UDF modules from the Aerospike cluster.",
+    description=(
+        "Retrieve all registered UDF modules from the Aerospike cluster. "
+        "Supports conditional requests with `If-None-Match`."
+    ),
+    response_model=list[UDFModule],
 )
-async def get_udfs(client: AerospikeClient) -> list[UDFModule]:
+async def get_udfs(request: Request, client: AerospikeClient, conn_id: VerifiedConnId) -> Response:
     """Retrieve all registered UDF modules from the Aerospike cluster."""
-    return await _list_udfs(client)
+    tagged = await singleflight.do(("udfs", conn_id), lambda: tag(_list_udfs(client)))
+    return conditional(request, tagged)
 
 
 @router.post(
@@ -48,7 +56,7 @@ async def get_udfs(client: AerospikeClient) -> list[UDFModule]:
     summary="Upload UDF module",
     description="Upload and register a Lua UDF module to the Aerospike cluster.",
 )
-async def upload_udf(body: UploadUDFRequest, client: AerospikeClient) -> UDFModule:
+async def upload_udf(body: UploadUDFRequest, client: AerospikeClient, conn_id: VerifiedConnId) -> UDFModule:
     """Upload and register a Lua UDF module to the Aerospike cluster."""
     tmp_path: str | None = None
     try:
@@ -60,6 +68,8 @@ async def upload_udf(body: UploadUDFRequest, client: AerospikeClient) -> UDFModu
     finally:
         if tmp_path:
             Path(tmp_path).unlink(missing_ok=True)
+    singleflight.forget("udfs", conn_id)
+    audit_log.record("udf.upload", body.filename, connection_id=conn_id, detail={"size": len(body.content)})
 
     # Re-fetch to get actual hash
     modules = await _list_udfs(client)
@@ -77,8 +87,11 @@ async def upload_udf(body: UploadUDFRequest, client: AerospikeClient) -> UDFModu
 )
 async def delete_udf(
     client: AerospikeClient,
+    conn_id: VerifiedConnId,
     filename: str = Query(..., min_length=1),
 ) -> Response:
     """Remove a registered UDF module from the Aerospike cluster by filename."""
     await client.udf_remove(filename)
+    singleflight.forget("udfs", conn_id)
+    audit_log.record("udf.delete", filename, connection_id=conn_id)
     return Response(status_code=204)
@@ -0,0 +1,177 @@
+"""Per-connection admission control for scan-type operations.
+
+At most ``SCAN_MAX_CONCURRENT_PER_CONNECTION`` scans (record listing,
+filtered scans, queries, saved-query runs, executed explains and sample-data
+loads) run against one connection at a time; the rest wait in a priority
+queue.  Interactive page loads are admitted before background work, and
+requests of the same priority in arrival order.  A full queue or a wait
+longer than ``SCAN_QUEUE_TIMEOUT_SECONDS`` is answered with 503.
+
+Callers that had to wait get their initial queue position and wait time in
+the ``X-Scan-Queue-Position`` / ``X-Scan-Queue-Wait-Ms`` response headers;
+``GET /api/query/{conn_id}/scans`` lists the queue while it waits.  The
+scheduler is per worker process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+from fastapi import HTTPException
+
+from aerospike_cluster_manager_api import config
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    future: asyncio.Future[None] = field(compare=False)
+    kind: str = field(compare=False)
+    request_id: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+@dataclass(slots=True)
+class _ConnectionQueue:
+    running: int = 0
+    waiters: list[_Waiter] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class Admission:
+    position: int  # 1-based queue position when enqueued; 0 if admitted immediately
+    waited_ms: int
+
+
+class ScanScheduler:
+    """Caps concurrent scans per connection and queues the rest by priority."""
+
+    def __init__(self, *, max_concurrent: int, max_queued: int, timeout: float) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.timeout = timeout
+        self._queues: dict[str, _ConnectionQueue] = {}
+        self._seq = itertools.count()
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _release(self, conn_id: str) -> None:
+        queue = self._queues[conn_id]
+        queue.running -= 1
+        while queue.waiters:
+            waiter = heapq.heappop(queue.waiters)
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                queue.running += 1
+                break
+        if not queue.running and not queue.waiters:
+            del self._queues[conn_id]
+
+    @staticmethod
+    def _discard(queue: _ConnectionQueue, waiter: _Waiter) -> None:
+        if waiter in queue.waiters:
+            queue.waiters.remove(waiter)
+            heapq.heapify(queue.waiters)
+
+    @asynccontextmanager
+    async def admit(
+        self, conn_id: str, priority: Priority, *, kind: str, request_id: str = ""
+    ) -> AsyncIterator[Admission]:
+        """Hold one of the connection's scan slots for the duration of the ``async with`` block."""
+        if self.max_concurrent <= 0:
+            yield Admission(0, 0)
+            return
+
+        queue = self._queues.setdefault(conn_id, _ConnectionQueue())
+        admission = Admission(0, 0)
+        if queue.running < self.max_concurrent and not queue.waiters:
+            queue.running += 1
+        else:
+            if len(queue.waiters) >= self.max_queued:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503, detail="Too many scans queued for this connection", headers={"Retry-After": "5"}
+                )
+            waiter = _Waiter(
+                int(priority),
+                next(self._seq),
+                asyncio.get_running_loop().create_future(),
+                kind,
+                request_id,
+                time.monotonic(),
+            )
+            heapq.heappush(queue.waiters, waiter)
+            position = sum(1 for w in queue.waiters if w <= waiter)
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter.future), self.timeout)
+            except TimeoutError:
+                if not waiter.future.done():
+                    waiter.future.cancel()
+                    self._discard(queue, waiter)
+                    self.timed_out += 1
+                    raise HTTPException(
+                        status_code=503, detail="Timed out waiting for a scan slot", headers={"Retry-After": "5"}
+                    ) from None
+                # The slot was handed over just as the wait timed out; use it.
+            except asyncio.CancelledError:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    self._release(conn_id)  # the slot was handed over just before the cancellation
+                else:
+                    waiter.future.cancel()
+                    self._discard(queue, waiter)
+                raise
+            admission = Admission(position, int((time.monotonic() - waiter.enqueued_at) * 1000))
+
+        try:
+            yield admission
+        finally:
+            self._release(conn_id)
+
+    def status(self, conn_id: str) -> dict[str, Any]:
+        queue = self._queues.get(conn_id, _ConnectionQueue())
+        now = time.monotonic()
+        waiting = sorted(w for w in queue.waiters if not w.future.done())
+        return {
+            "limit": self.max_concurrent,
+            "running": queue.running,
+            "queued": [
+                {
+                    "requestId": w.request_id,
+                    "kind": w.kind,
+                    "priority": Priority(w.priority).name.lower(),
+                    "position": i,
+                    "waitingMs": int((now - w.enqueued_at) * 1000),
+                }
+                for i, w in enumerate(waiting, start=1)
+            ],
+        }
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "connections": len(self._queues),
+            "running": sum(q.running for q in self._queues.values()),
+            "queued": sum(len(q.waiters) for q in self._queues.values()),
+            "rejected": self.rejected,
+            "timedOut": self.timed_out,
+        }
+
+
+scan_scheduler = ScanScheduler(
+    max_concurrent=config.SCAN_MAX_CONCURRENT_PER_CONNECTION,
+    max_queued=config.SCAN_QUEUE_MAX,
+    timeout=config.SCAN_QUEUE_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,152 @@
+"""Records-per-second throttling for scans and queries.
+
+A throttled scan is paced twice:
+
+* the server paces it through the ``records_per_second`` query policy.  That
+  limit applies per node, so the requested cluster-wide rate is divided by
+  the number of nodes.  ``lowPriority`` additionally scans one node at a time
+  (``max_concurrent_nodes=1``).
+* a per-connection :class:`TokenBucket` in the API charges every finished
+  scan for the records it read and delays the next throttled scan on that
+  connection until the debt is repaid.  Paging through a set in the UI
+  therefore cannot add up to more than the requested rate either.
+
+Buckets are per worker process.  :meth:`ScanThrottle.run` also takes a slot
+from the per-connection scan scheduler (see :mod:`scan_scheduler`), after
+any throttling delay so that paced scans do not hold a slot while waiting;
+``lowPriority`` scans queue behind interactive ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from starlette.responses import Response
+
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.request_context import request_id_var
+from aerospike_cluster_manager_api.scan_scheduler import Priority, scan_scheduler
+
+T = TypeVar("T")
+
+_MAX_BUCKETS = 256
+
+
+class TokenBucket:
+    """Token bucket that may go into debt: callers wait for a non-negative balance, then charge."""
+
+    def __init__(self, rate: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self._clock = clock
+        self._tokens = rate  # one second of burst
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def idle(self) -> bool:
+        self._refill()
+        return self._tokens >= self.rate
+
+    def delay(self) -> float:
+        """Seconds until the balance is non-negative."""
+        self._refill()
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def wait(self) -> None:
+        async with self._lock:
+            while (delay := self.delay()) > 0:
+                await asyncio.sleep(delay)
+
+    def charge(self, tokens: int) -> None:
+        self._refill()
+        self._tokens -= tokens
+
+
+_buckets: dict[tuple[str, int], TokenBucket] = {}
+
+
+def _bucket(conn_id: str, rate: int) -> TokenBucket:
+    key = (conn_id, rate)
+    bucket = _buckets.get(key)
+    if bucket is None:
+        if len(_buckets) >= _MAX_BUCKETS:
+            for stale in [k for k, b in _buckets.items() if b.idle]:
+                del _buckets[stale]
+        bucket = _buckets[key] = TokenBucket(rate)
+    return bucket
+
+
+@dataclass(frozen=True, slots=True)
+class ScanThrottle:
+    """Per-request throttle resolved from ``recordsPerSecond`` / ``lowPriority``."""
+
+    conn_id: str
+    records_per_second: int | None = None
+    low_priority: bool = False
+    node_count: int = 1
+    response: Response | None = field(default=None, compare=False)
+    policy: dict[str, Any] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        if self.records_per_second:
+            per_node = max(1, self.records_per_second // max(1, self.node_count))
+            self.policy["records_per_second"] = per_node
+        if self.low_priority:
+            self.policy["max_concurrent_nodes"] = 1
+
+    @property
+    def priority(self) -> Priority:
+        return Priority.BACKGROUND if self.low_priority else Priority.INTERACTIVE
+
+    async def run(self, fn: Callable[[], Awaitable[T]], count: Callable[[T], int], *, kind: str | None) -> T:
+        """Run the scan *fn* once the connection's bucket and scan scheduler allow it.
+
+        The bucket is then charged ``count(result)`` records.  ``kind=None``
+        marks a primary key lookup, which is neither throttled nor queued.
+        """
+        if kind is None:
+            return await fn()
+        bucket = _bucket(self.conn_id, self.records_per_second) if self.records_per_second else None
+        if bucket is not None:
+            await bucket.wait()
+        async with scan_scheduler.admit(
+            self.conn_id, self.priority, kind=kind, request_id=request_id_var.get()
+        ) as slot:
+            if slot.position and self.response is not None:
+                self.response.headers["X-Scan-Queue-Position"] = str(slot.position)
+                self.response.headers["X-Scan-Queue-Wait-Ms"] = str(slot.waited_ms)
+            result = await fn()
+        if bucket is not None:
+            bucket.charge(count(result))
+        return result
+
+
+def resolve(
+    conn_id: str,
+    records_per_second: int | None,
+    low_priority: bool,
+    node_count: int,
+    response: Response | None = None,
+) -> ScanThrottle:
+    """Apply the low-priority default rate and the configured cluster-wide cap."""
+    rate = records_per_second
+    if rate is None and low_priority:
+        rate = config.SCAN_LOW_PRIORITY_RECORDS_PER_SECOND or None
+    cap = config.SCAN_MAX_RECORDS_PER_SECOND
+    if cap > 0:
+        rate = min(rate, cap) if rate else cap
+    return ScanThrottle(conn_id, rate, low_priority, node_count, response)
+
+
+def reset() -> None:
+    """Drop all buckets (tests)."""
+    _buckets.clear()
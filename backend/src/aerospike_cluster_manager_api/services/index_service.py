@@ -0,0 +1,39 @@
+"""Secondary index discovery shared by the indexes router and the query planner."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aerospike_cluster_manager_api.constants import info_sindex
+from aerospike_cluster_manager_api.info_parser import parse_records
+from aerospike_cluster_manager_api.models.index import SecondaryIndex
+
+_STATE_MAP = {"RW": "ready", "WO": "building", "D": "error"}
+_TYPE_MAP = {"numeric": "numeric", "string": "string", "geo2dsphere": "geo2dsphere", "geojson": "geo2dsphere"}
+_COLLECTION_TYPES = {"list", "mapkeys", "mapvalues"}
+
+
+def parse_sindexes(ns: str, raw: str) -> list[SecondaryIndex]:
+    """Parse a ``sindex/<ns>`` info response."""
+    indexes: list[SecondaryIndex] = []
+    for rec in parse_records(raw):
+        raw_type = rec.get("type", rec.get("bin_type", "string")).lower()
+        raw_state = rec.get("state", "RW")
+        collection = rec.get("indextype", "default").lower()
+        indexes.append(
+            SecondaryIndex(
+                name=rec.get("indexname", rec.get("index_name", "")),
+                namespace=ns,
+                set=rec.get("set", rec.get("set_name", "")),
+                bin=rec.get("bin", rec.get("bin_name", "")),
+                type=_TYPE_MAP.get(raw_type, "string"),
+                state=_STATE_MAP.get(raw_state, "ready"),
+                collection=collection if collection in _COLLECTION_TYPES else "default",
+            )
+        )
+    return indexes
+
+
+async def list_namespace_indexes(client: Any, ns: str) -> list[SecondaryIndex]:
+    """Return the secondary indexes defined on namespace *ns*."""
+    return parse_sindexes(ns, await client.info_random_node(info_sindex(ns)))
@@ -0,0 +1,146 @@
+"""Explain how a filtered query would run, optionally running it to collect per-node statistics.
+
+Candidate estimates come from info statistics: for an equality on an indexed
+bin, the index's entries per bin value; for an index range, all index entries
+(an upper bound); for a scan, the object count of the set (or namespace).
+Per-node counters are read from the server's ``query-show`` job list, matching
+jobs on the namespace/set that appeared while the query ran.  Concurrent
+queries on the same set can therefore be attributed to this one.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from aerospike_cluster_manager_api.constants import (
+    INFO_QUERY_SHOW,
+    NS_SUM_KEYS,
+    info_namespace,
+    info_sets,
+)
+from aerospike_cluster_manager_api.expression_builder import build_expression
+from aerospike_cluster_manager_api.info_parser import (
+    aggregate_node_kv,
+    aggregate_set_records,
+    parse_records,
+    safe_int,
+)
+from aerospike_cluster_manager_api.models.query import (
+    FilteredQueryRequest,
+    FilterOperator,
+    NodeQueryStats,
+    QueryExplainResponse,
+)
+from aerospike_cluster_manager_api.services.query_planner import Plan, index_cardinality, plan_filtered_query
+from aerospike_cluster_manager_api.services.query_service import run_plan
+
+logger = logging.getLogger(__name__)
+
+
+async def _object_counts(client: Any, body: FilteredQueryRequest) -> tuple[int, int | None, int]:
+    """Return ``(effective_rf, set_objects, namespace_objects)`` for the request's namespace."""
+    ns_all = await client.info_all(info_namespace(body.namespace))
+    responding = sum(1 for _name, err, _resp in ns_all if not err)
+    ns_stats = aggregate_node_kv(ns_all, keys_to_sum=NS_SUM_KEYS)
+    rf = max(1, min(safe_int(ns_stats.get("replication-factor"), 1), responding or 1))
+    ns_objects = safe_int(ns_stats.get("objects")) // rf
+
+    set_objects: int | None = None
+    if body.set:
+        sets = aggregate_set_records(await client.info_all(info_sets(body.namespace)), rf)
+        set_objects = next((s["objects"] for s in sets if s["name"] == body.set), 0)
+    return rf, set_objects, ns_objects
+
+
+async def _index_estimate(client: Any, body: FilteredQueryRequest, plan: Plan, rf: int) -> tuple[int, str] | None:
+    if plan.index is None:
+        return None
+    stats = await index_cardinality(client, body.namespace, plan.index.name)
+    if stats is None:
+        return 0, "sindex_entries"
+    if plan.condition is not None and plan.condition.operator == FilterOperator.EQ and stats.entries_per_bval:
+        return round(stats.entries_per_bval / rf), "sindex_bval"
+    return stats.entries // rf, "sindex_entries"
+
+
+def _query_jobs(results: list[tuple[str, int | None, str]], body: FilteredQueryRequest) -> dict[str, dict[str, dict]]:
+    """Map node name -> trid -> job fields, for query jobs on the request's namespace/set."""
+    wanted_set = body.set or ""
+    jobs: dict[str, dict[str, dict]] = {}
+    for name, err, resp in results:
+        if err or not resp or resp.startswith("ERROR"):
+            continue
+        node_jobs = jobs.setdefault(name, {})
+        for rec in parse_records(resp):
+            job_set = rec.get("set", "")
+            if rec.get("ns") != body.namespace or (job_set if job_set != "NULL" else "") != wanted_set:
+                continue
+            node_jobs[rec.get("trid", "")] = rec
+    return jobs
+
+
+def _node_stats(before: dict[str, dict[str, dict]], after: dict[str, dict[str, dict]]) -> list[NodeQueryStats]:
+    stats: list[NodeQueryStats] = []
+    for node, jobs in sorted(after.items()):
+        new_jobs = [job for trid, job in jobs.items() if trid not in before.get(node, {})]
+        if not new_jobs:
+            continue
+        returned = sum(safe_int(j.get("recs-succeeded")) for j in new_jobs)
+        filtered = sum(safe_int(j.get("recs-filtered-meta")) + safe_int(j.get("recs-filtered-bins")) for j in new_jobs)
+        failed = sum(safe_int(j.get("recs-failed")) for j in new_jobs)
+        stats.append(
+            NodeQueryStats(
+                node=node,
+                recordsScanned=returned + filtered + failed,
+                recordsReturned=returned,
+                elapsedMs=max(safe_int(j.get("run-time")) for j in new_jobs),
+            )
+        )
+    return stats
+
+
+async def _query_show(client: Any, body: FilteredQueryRequest) -> dict[str, dict[str, dict]]:
+    try:
+        return _query_jobs(await client.info_all(INFO_QUERY_SHOW), body)
+    except Exception:
+        logger.debug("query-show is not available", exc_info=True)
+        return {}
+
+
+async def explain_filtered_query(
+    client: Any, body: FilteredQueryRequest, routing: dict[str, Any], *, execute: bool = False
+) -> QueryExplainResponse:
+    """Describe the plan for *body*; with *execute*, also run it and collect per-node counters."""
+    plan = await plan_filtered_query(client, body)
+    response = QueryExplainResponse(
+        plan=plan.describe(),
+        predicate=list(plan.predicate) if plan.predicate else None,
+        expression=build_expression(plan.filters) if plan.filters else None,
+    )
+
+    if plan.strategy == "pk_lookup":
+        response.estimatedCandidates, response.estimateSource = 1, "pk_lookup"
+    else:
+        rf, set_objects, ns_objects = await _object_counts(client, body)
+        response.setObjects = set_objects
+        scan_size = set_objects if set_objects is not None else ns_objects
+        estimate = await _index_estimate(client, body, plan, rf)
+        if estimate is not None:
+            response.estimatedCandidates = min(estimate[0], scan_size)
+            response.estimateSource = estimate[1]  # type: ignore[assignment]
+        else:
+            response.estimatedCandidates = scan_size
+            response.estimateSource = "set_objects" if set_objects is not None else "namespace_objects"
+
+    if execute and plan.strategy != "pk_lookup":
+        before = await _query_show(client, body)
+        start = time.monotonic()
+        raw_results = await run_plan(client, body, plan, routing)
+        response.executionTimeMs = int((time.monotonic() - start) * 1000)
+        response.returnedRecords = len(raw_results)
+        response.nodeStats = _node_stats(before, await _query_show(client, body))
+        response.executed = True
+
+    return response
@@ -0,0 +1,247 @@
+"""Choose between a secondary-index query and a full scan for filtered queries.
+
+Given the secondary indexes of the namespace, the planner promotes the most
+selective indexable top-level condition of an AND filter group to the query's
+``where()`` predicate and leaves the remaining conditions as the filter
+expression.  Geo conditions are never promoted because aerospike-py does not
+execute geo predicates yet.
+
+When several conditions have a usable index, their ``sindex-stat`` counters
+decide: an equality is estimated at the index's entries per bin value, a range
+at all of its entries (an upper bound), and the smallest estimate wins.  If
+the statistics of any candidate index cannot be read, candidates are ranked by
+operator alone: equality over bounded ranges over one-sided ranges, then by
+position in the filter group.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from aerospike_py import predicates
+
+from aerospike_cluster_manager_api.constants import info_sindex_stat
+from aerospike_cluster_manager_api.expression_builder import ALWAYS_FALSE, build_expression
+from aerospike_cluster_manager_api.info_parser import parse_kv_pairs, safe_int
+from aerospike_cluster_manager_api.models.index import SecondaryIndex
+from aerospike_cluster_manager_api.models.query import (
+    BinDataType,
+    FilterCondition,
+    FilteredQueryRequest,
+    FilterGroup,
+    FilterOperator,
+    QueryPlan,
+    QueryPredicate,
+)
+from aerospike_cluster_manager_api.services.index_service import list_namespace_indexes
+from aerospike_cluster_manager_api.utils import build_predicate
+
+logger = logging.getLogger(__name__)
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+# Lower rank = more selective.
+_RANKS: dict[FilterOperator, int] = {
+    FilterOperator.EQ: 0,
+    FilterOperator.BETWEEN: 1,
+    FilterOperator.GT: 2,
+    FilterOperator.GE: 2,
+    FilterOperator.LT: 2,
+    FilterOperator.LE: 2,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Plan:
+    strategy: Literal["pk_lookup", "sindex", "scan"]
+    predicate: tuple | None = None
+    filters: FilterGroup | None = None
+    index: SecondaryIndex | None = None
+    condition: FilterCondition | None = None
+
+    def describe(self) -> QueryPlan:
+        return QueryPlan(
+            strategy=self.strategy,
+            indexName=self.index.name if self.index else None,
+            bin=self.condition.bin if self.condition else None,
+            operator=self.condition.operator if self.condition else None,
+            expressionConditions=self.filters.condition_count() if self.filters else 0,
+            apiConditions=sum(c.is_collection_condition for c in self.filters.iter_conditions()) if self.filters else 0,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class IndexCardinality:
+    """``sindex-stat`` counters of one index, summed over the responding nodes (replicas included)."""
+
+    entries: int
+    entries_per_bval: float
+
+    def estimate(self, operator: FilterOperator) -> float:
+        """Index entries a predicate with *operator* reads: per bin value for equality, all of them otherwise."""
+        if operator == FilterOperator.EQ and self.entries_per_bval:
+            return self.entries_per_bval
+        return self.entries
+
+
+def _safe_float(value: str | None) -> float:
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+async def index_cardinality(client: Any, namespace: str, index_name: str) -> IndexCardinality | None:
+    """Read *index_name*'s ``sindex-stat`` from every node; ``None`` when no node answered."""
+    entries = 0
+    per_bval = 0.0
+    answered = False
+    for _name, err, resp in await client.info_all(info_sindex_stat(namespace, index_name)):
+        if err:
+            continue
+        answered = True
+        stats = parse_kv_pairs(resp)
+        node_entries = safe_int(stats.get("entries"))
+        entries += node_entries
+        if "entries_per_bval" in stats:
+            per_bval += _safe_float(stats["entries_per_bval"])
+        elif safe_int(stats.get("keys")):
+            per_bval += node_entries / safe_int(stats.get("keys"))
+    return IndexCardinality(entries, per_bval) if answered else None
+
+
+def _condition_predicate(cond: FilterCondition) -> tuple | None:
+    """Return the ``where()`` predicate equivalent to *cond*, or ``None`` if there is none."""
+    if cond.bin_type == BinDataType.STRING:
+        if cond.operator == FilterOperator.EQ and isinstance(cond.value, str):
+            return predicates.equals(cond.bin, cond.value)
+        return None
+    if cond.bin_type != BinDataType.INTEGER or cond.operator not in _RANKS:
+        return None
+    try:
+        value = int(cond.value)  # type: ignore[arg-type]
+        if cond.operator == FilterOperator.EQ:
+            return predicates.equals(cond.bin, value)
+        if cond.operator == FilterOperator.BETWEEN:
+            return predicates.between(cond.bin, value, int(cond.value2))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    low, high = {
+        FilterOperator.GT: (value + 1, INT64_MAX),
+        FilterOperator.GE: (value, INT64_MAX),
+        FilterOperator.LT: (INT64_MIN, value - 1),
+        FilterOperator.LE: (INT64_MIN, value),
+    }[cond.operator]
+    return predicates.between(cond.bin, low, high)
+
+
+def _usable(
+    index: SecondaryIndex, set_name: str | None, bin_name: str, index_type: str, collection: str = "default"
+) -> bool:
+    if index.state != "ready" or index.collection != collection or index.bin != bin_name:
+        return False
+    # An index without a set covers the whole namespace; a set index only serves its own set.
+    if index.set not in ("", "NULL") and index.set != set_name:
+        return False
+    return index.type == index_type
+
+
+def _predicate_index(
+    pred: QueryPredicate, set_name: str | None, indexes: list[SecondaryIndex]
+) -> SecondaryIndex | None:
+    """The index a raw ``predicate`` runs on, or ``None`` (the server then rejects the query)."""
+    if pred.operator.startswith("geo_"):
+        index_type = "geo2dsphere"
+    else:
+        index_type = "numeric" if isinstance(pred.value, int) and not isinstance(pred.value, bool) else "string"
+    collection = "list" if pred.operator == "contains" else "default"
+    return next((i for i in indexes if _usable(i, set_name, pred.bin, index_type, collection)), None)
+
+
+def _candidates(
+    filters: FilterGroup, set_name: str | None, indexes: list[SecondaryIndex]
+) -> list[tuple[int, FilterCondition, tuple, SecondaryIndex]]:
+    """``(position, condition, predicate, index)`` of each top-level condition a usable index can serve."""
+    found = []
+    for pos, cond in enumerate(filters.conditions):
+        predicate = _condition_predicate(cond)
+        if predicate is None:
+            continue
+        index_type = "numeric" if cond.bin_type == BinDataType.INTEGER else "string"
+        index = next((i for i in indexes if _usable(i, set_name, cond.bin, index_type)), None)
+        if index is not None:
+            found.append((pos, cond, predicate, index))
+    return found
+
+
+def choose_plan(
+    body: FilteredQueryRequest,
+    indexes: list[SecondaryIndex],
+    cardinality: Mapping[str, IndexCardinality] | None = None,
+) -> Plan:
+    """Pick the access path for *body* given the namespace's secondary indexes.
+
+    *cardinality* maps index names to their statistics; without an entry for
+    every candidate index the operator ranking decides.
+    """
+    if body.primary_key:
+        return Plan("pk_lookup")
+    filters = body.filters
+    if body.predicate:
+        predicate = build_predicate(body.predicate)
+        return Plan(
+            "sindex", predicate=predicate, filters=filters, index=_predicate_index(body.predicate, body.set, indexes)
+        )
+    if filters is None or (filters.logic == "or" and len(filters.conditions) + len(filters.groups) > 1):
+        return Plan("scan", filters=filters)
+    if build_expression(filters) == ALWAYS_FALSE:
+        # Nothing can match; run_plan returns without touching the cluster.
+        return Plan("scan", filters=filters)
+
+    candidates = _candidates(filters, body.set, indexes)
+    if not candidates:
+        return Plan("scan", filters=filters)
+    stats = cardinality or {}
+    if all(index.name in stats for *_, index in candidates):
+        pos, cond, predicate, index = min(
+            candidates, key=lambda c: (stats[c[3].name].estimate(c[1].operator), _RANKS[c[1].operator], c[0])
+        )
+    else:
+        pos, cond, predicate, index = min(candidates, key=lambda c: (_RANKS[c[1].operator], c[0]))
+    rest = [c for i, c in enumerate(filters.conditions) if i != pos]
+    remaining = FilterGroup(logic="and", conditions=rest, groups=filters.groups) if rest or filters.groups else None
+    return Plan("sindex", predicate=predicate, filters=remaining, index=index, condition=cond)
+
+
+async def plan_filtered_query(client: Any, body: FilteredQueryRequest) -> Plan:
+    """Plan *body*, looking up secondary indexes only when a condition could use one.
+
+    Index statistics are read only when more than one index could serve the query.
+    """
+    if body.primary_key or (body.filters is None and body.predicate is None):
+        return choose_plan(body, [])
+    try:
+        indexes = await list_namespace_indexes(client, body.namespace)
+    except Exception:
+        logger.warning(
+            "Failed to list secondary indexes of '%s'; falling back to a scan", body.namespace, exc_info=True
+        )
+        indexes = []
+    plan = choose_plan(body, indexes)
+    if plan.strategy != "sindex" or body.predicate or body.filters is None:
+        return plan
+    names = list(dict.fromkeys(index.name for *_, index in _candidates(body.filters, body.set, indexes)))
+    if len(names) < 2:
+        return plan
+    results = await asyncio.gather(
+        *(index_cardinality(client, body.namespace, name) for name in names), return_exceptions=True
+    )
+    cardinality = {name: r for name, r in zip(names, results, strict=True) if isinstance(r, IndexCardinality)}
+    if len(cardinality) < len(names):
+        logger.warning("Failed to read sindex statistics of '%s'; ranking indexes by operator", body.namespace)
+    return choose_plan(body, indexes, cardinality)
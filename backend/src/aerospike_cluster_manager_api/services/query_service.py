@@ -0,0 +1,267 @@
+"""Query execution shared by the query, records and saved-query routers.
+
+``execute_query`` backs ``POST /query/{conn_id}`` and ``execute_filtered_query``
+backs ``POST /records/{conn_id}/filter``; saved queries re-run either one.
+
+Their responses are built with ``model_construct`` and hold records as plain
+dicts (see :func:`converters.records_to_dicts`); routers render them with
+:func:`fast_json.render` rather than letting FastAPI re-validate them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from aerospike_py.exception import IndexNotFound, RecordNotFound
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from aerospike_cluster_manager_api import config, db
+from aerospike_cluster_manager_api.constants import MAX_QUERY_RECORDS, POLICY_QUERY, POLICY_READ
+from aerospike_cluster_manager_api.converters import records_to_dicts
+from aerospike_cluster_manager_api.expression_builder import ALWAYS_FALSE, ALWAYS_TRUE, compile_filter
+from aerospike_cluster_manager_api.models.query import (
+    FilteredQueryRequest,
+    FilteredQueryResponse,
+    QueryKind,
+    QueryRequest,
+    QueryResponse,
+)
+from aerospike_cluster_manager_api.services.query_planner import Plan, plan_filtered_query
+from aerospike_cluster_manager_api.utils import build_predicate
+
+logger = logging.getLogger(__name__)
+
+
+def auto_detect_pk(pk: str) -> str | int:
+    """Convert PK to int only when the round-trip is lossless (no leading zeros).
+
+    "1"     → 1    (integer key)
+    "00001" → "00001"  (string key — leading zeros preserved)
+    "-5"    → -5   (negative integer key)
+    "abc"   → "abc"  (string key)
+    """
+    try:
+        as_int = int(pk)
+        if str(as_int) == pk:
+            return as_int
+    except ValueError:
+        pass
+    return pk
+
+
+def request_digest(body: BaseModel) -> str:
+    """Stable SHA-256 digest of a query request, independent of field order and defaults."""
+    canonical = json.dumps(body.model_dump(mode="json", exclude_defaults=True), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def _get_by_pk(client: Any, namespace: str, set_name: str | None, pk: str, routing: dict[str, Any]) -> list:
+    if not set_name:
+        raise HTTPException(status_code=400, detail="Set is required for primary key lookup")
+    try:
+        return [await client.get((namespace, set_name, auto_detect_pk(pk)), policy={**POLICY_READ, **routing})]
+    except RecordNotFound:
+        return []
+
+
+def _limit(raw_results: list, max_records: int | None) -> list:
+    if max_records and max_records > 0:
+        raw_results = raw_results[:max_records]
+    if len(raw_results) > MAX_QUERY_RECORDS:
+        raw_results = raw_results[:MAX_QUERY_RECORDS]
+    return raw_results
+
+
+async def execute_query(client: Any, body: QueryRequest, routing: dict[str, Any]) -> QueryResponse:
+    """Run a primary key lookup, predicate query or full scan."""
+    start_time = time.monotonic()
+
+    if body.primaryKey:
+        raw_results = await _get_by_pk(client, body.namespace, body.set, body.primaryKey, routing)
+        elapsed_ms = int((time.monotonic() - start_time) * 1000)
+        records = records_to_dicts(raw_results)
+        return QueryResponse.model_construct(
+            records=records,
+            executionTimeMs=elapsed_ms,
+            scannedRecords=len(records),
+            returnedRecords=len(records),
+        )
+
+    q = client.query(body.namespace, body.set or "")
+    if body.predicate:
+        q.where(build_predicate(body.predicate))
+    if body.selectBins:
+        q.select(*body.selectBins)
+    raw_results = await q.results({**POLICY_QUERY, **routing})
+
+    elapsed_ms = int((time.monotonic() - start_time) * 1000)
+    scanned = len(raw_results)
+    records = records_to_dicts(_limit(raw_results, body.maxRecords))
+
+    return QueryResponse.model_construct(
+        records=records,
+        executionTimeMs=elapsed_ms,
+        scannedRecords=scanned,
+        returnedRecords=len(records),
+    )
+
+
+async def run_plan(client: Any, body: FilteredQueryRequest, plan: Plan, routing: dict[str, Any]) -> list:
+    """Execute a planned (non-PK) filtered query and return the raw records."""
+    compiled = compile_filter(plan.filters) if plan.filters else None
+    if compiled is not None and compiled.expression == ALWAYS_FALSE:
+        return []
+
+    q = client.query(body.namespace, body.set or "")
+    if plan.predicate:
+        q.where(plan.predicate)
+    extra_bins: set[str] = set()
+    if body.select_bins:
+        # List/map content conditions are checked here, so their bins must be read too.
+        extra_bins = set(compiled.check_bins) - set(body.select_bins) if compiled else set()
+        q.select(*body.select_bins, *sorted(extra_bins))
+
+    # Build policy with the filter conditions not served by the index
+    policy = {**POLICY_QUERY, **routing}
+    if compiled is not None and compiled.expression != ALWAYS_TRUE:
+        policy["filter_expression"] = compiled.expression
+    raw_results = await q.results(policy)
+
+    if compiled is None or compiled.check is None:
+        return raw_results
+    matched = [r for r in raw_results if compiled.check(r.bins or {})]
+    if extra_bins:
+        matched = [r._replace(bins={k: v for k, v in r.bins.items() if k not in extra_bins}) for r in matched]
+    return matched
+
+
+async def execute_filtered_query(
+    client: Any, body: FilteredQueryRequest, routing: dict[str, Any]
+) -> FilteredQueryResponse:
+    """Scan records with optional expression filters and return one page of results.
+
+    When a secondary index covers one of the filter conditions, the query uses it
+    instead of a full scan (see :mod:`query_planner`); the response reports the plan.
+    """
+    start_time = time.monotonic()
+
+    # PK lookup short-circuit
+    if body.primary_key:
+        raw_results = await _get_by_pk(client, body.namespace, body.set, body.primary_key, routing)
+        elapsed_ms = int((time.monotonic() - start_time) * 1000)
+        records = records_to_dicts(raw_results)
+        return FilteredQueryResponse.model_construct(
+            records=records,
+            total=len(records),
+            page=1,
+            page_size=body.page_size,
+            has_more=False,
+            execution_time_ms=elapsed_ms,
+            scanned_records=len(records),
+            returned_records=len(records),
+            plan=Plan("pk_lookup").describe(),
+        )
+
+    plan = await plan_filtered_query(client, body)
+    try:
+        raw_results = await run_plan(client, body, plan, routing)
+    except IndexNotFound:
+        if plan.condition is None:
+            raise
+        # The promoted index was dropped after planning; fall back to filtering everything server-side.
+        logger.warning("Index '%s' disappeared; retrying as a scan", plan.index.name if plan.index else "")
+        plan = Plan("scan", filters=body.filters)
+        raw_results = await run_plan(client, body, plan, routing)
+
+    elapsed_ms = int((time.monotonic() - start_time) * 1000)
+    scanned = len(raw_results)
+
+    raw_results = _limit(raw_results, body.max_records)
+    total = len(raw_results)
+
+    # Paginate
+    start = (body.page - 1) * body.page_size
+    paged = raw_results[start : start + body.page_size]
+    records = records_to_dicts(paged)
+
+    return FilteredQueryResponse.model_construct(
+        records=records,
+        total=total,
+        page=body.page,
+        page_size=body.page_size,
+        has_more=start + body.page_size < total,
+        execution_time_ms=elapsed_ms,
+        scanned_records=scanned,
+        returned_records=len(records),
+        plan=plan.describe(),
+    )
+
+
+# Last prune of each connection's history (monotonic seconds); entries go with the connection
+_pruned_at: dict[str, float] = {}
+
+
+def forget(conn_id: str) -> None:
+    """Drop per-connection state of a deleted connection."""
+    _pruned_at.pop(conn_id, None)
+
+
+async def record_history(
+    conn_id: str,
+    kind: QueryKind,
+    body: QueryRequest | FilteredQueryRequest,
+    response: QueryResponse | FilteredQueryResponse,
+    *,
+    cached: bool = False,
+) -> None:
+    """Append an execution to the query history. Failures are logged, never raised."""
+    summary = response.model_dump(by_alias=True, exclude={"records"})
+    try:
+        await db.insert_query_history(
+            conn_id,
+            kind,
+            request_digest(body),
+            body.model_dump(mode="json", by_alias=True, exclude_none=True),
+            execution_time_ms=summary["executionTimeMs"],
+            scanned_records=summary["scannedRecords"],
+            returned_records=summary["returnedRecords"],
+            cached=cached,
+        )
+    except Exception:
+        logger.warning("Failed to record query history for connection '%s'", conn_id, exc_info=True)
+        return
+    await _prune_history(conn_id)
+
+
+async def store_snapshot(query_id: str, snapshot: str, taken_at: datetime) -> None:
+    """Store a saved query's rendered result. Failures are logged, never raised."""
+    try:
+        await db.store_saved_query_snapshot(query_id, snapshot, taken_at)
+    except Exception:
+        logger.warning("Failed to store the result snapshot of saved query '%s'", query_id, exc_info=True)
+
+
+async def _prune_history(conn_id: str) -> None:
+    """Apply the history retention limits, at most once per prune interval per connection."""
+    days, keep = config.QUERY_HISTORY_RETENTION_DAYS, config.QUERY_HISTORY_MAX_ROWS
+    if days <= 0 and keep <= 0:
+        return
+    now = time.monotonic()
+    if now - _pruned_at.get(conn_id, -math.inf) < config.QUERY_HISTORY_PRUNE_INTERVAL_SECONDS:
+        return
+    _pruned_at[conn_id] = now
+    older_than = datetime.now(UTC) - timedelta(days=days) if days > 0 else None
+    try:
+        deleted = await db.prune_query_history(conn_id, older_than=older_than, keep=keep)
+    except Exception:
+        logger.warning("Failed to prune query history for connection '%s'", conn_id, exc_info=True)
+        return
+    if deleted:
+        logger.debug("Pruned %d query history rows (connection '%s')", deleted, conn_id)
@@ -0,0 +1,61 @@
+"""Coalesce identical concurrent reads into one in-flight computation.
+
+Overview pages (``get_cluster``, ``get_indexes``, ``get_udfs``,
+``get_metrics``) fan out many info commands.  When several users open the
+same page at once, :meth:`SingleFlight.do` runs the fan-out once per key
+(route, connection and normalized parameters) and hands its result, or its
+exception, to every caller that arrived while it was running.  Nothing is
+kept after the computation finishes; this is not a cache.
+
+The computation runs in its own task, so a caller that disconnects does not
+cancel it for the others.  Writes call :meth:`SingleFlight.forget` so that
+requests arriving after a write start a fresh computation instead of joining
+one that began before it.  Coalescing is per worker process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share one in-flight awaitable between concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of ``fn()``, joining a running call for *key* if there is one."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+            self.leaders += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved when every caller has gone away
+
+    def forget(self, *prefix: Hashable) -> None:
+        """Detach in-flight calls whose key is a tuple starting with *prefix*; they still finish for their callers."""
+        n = len(prefix)
+        for key in [k for k in self._inflight if isinstance(k, tuple) and k[:n] == prefix]:
+            del self._inflight[key]
+
+    def stats(self) -> dict[str, int]:
+        return {"inflight": len(self._inflight), "leaders": self.leaders, "shared": self.shared}
+
+
+singleflight = SingleFlight()
@@ -0,0 +1,119 @@
+"""OpenTelemetry tracing.
+
+Tracing is off unless ``OTEL_EXPORTER_OTLP_ENDPOINT`` is set and the
+optional ``tracing`` extra (``opentelemetry-sdk`` and the OTLP/HTTP
+exporter) is installed; :func:`span` is then a shared no-op context manager
+and costs nothing on the hot path.
+
+When enabled, every request gets a server span (continuing a W3C
+``traceparent`` sent by the caller, with the ``X-Request-ID`` as the
+``request.id`` attribute) and child spans for:
+
+* each awaited Aerospike client call and each :mod:`db` call (opened by
+  :meth:`instrumentation.LatencyRecorder.timed`, so spans and latency
+  histograms always cover the same calls);
+* Aerospike client connects in :class:`client_manager.ClientManager`;
+* thread-offloaded Kubernetes API calls in :class:`k8s_client.K8sClient`.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any
+
+from aerospike_cluster_manager_api import config
+
+try:
+    from opentelemetry import propagate
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - optional dependency
+    propagate = None
+
+logger = logging.getLogger(__name__)
+
+_NOOP: AbstractContextManager[Any] = nullcontext()
+
+_tracer: Any = None
+_provider: Any = None
+
+
+def setup_tracing() -> None:
+    """Install the OTLP exporter if ``OTEL_EXPORTER_OTLP_ENDPOINT`` is configured."""
+    global _tracer, _provider
+    if not config.OTEL_EXPORTER_OTLP_ENDPOINT:
+        return
+    try:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning(
+            "OTEL_EXPORTER_OTLP_ENDPOINT is set but OpenTelemetry is not installed; tracing disabled. "
+            "Install the 'tracing' extra to enable it."
+        )
+        return
+
+    endpoint = config.OTEL_EXPORTER_OTLP_ENDPOINT.rstrip("/")
+    if not endpoint.endswith("/v1/traces"):
+        endpoint += "/v1/traces"
+    provider = TracerProvider(resource=Resource.create({SERVICE_NAME: config.OTEL_SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)))
+    _provider = provider
+    _tracer = provider.get_tracer("aerospike_cluster_manager_api")
+    logger.info("Exporting traces over OTLP to %s", endpoint)
+
+
+def use_tracer_provider(provider: Any) -> None:
+    """Trace into *provider* instead of the OTLP exporter (tests, embedding)."""
+    global _tracer, _provider
+    _provider = provider
+    _tracer = provider.get_tracer("aerospike_cluster_manager_api") if provider is not None else None
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop the exporter."""
+    global _tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = _provider = None
+
+
+def span(name: str, attributes: Mapping[str, Any] | None = None) -> AbstractContextManager[Any]:
+    """Child span of the current span, or a no-op when tracing is disabled.
+
+    Attributes whose value is ``None`` are left out.
+    """
+    if _tracer is None:
+        return _NOOP
+    if attributes:
+        attributes = {k: v for k, v in attributes.items() if v is not None}
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+@contextmanager
+def server_span(method: str, path: str, headers: Mapping[str, str], request_id: str) -> Iterator[Any]:
+    """Root span of one HTTP request, continuing the caller's trace context from *headers*."""
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(
+        f"{method} {path}",
+        context=propagate.extract(headers),
+        kind=SpanKind.SERVER,
+        attributes={"http.request.method": method, "url.path": path, "request.id": request_id},
+    ) as current:
+        yield current
+
+
+def finish_server_span(current: Any, method: str, route: str, status_code: int) -> None:
+    """Name the server span after the matched route and record the response status."""
+    if current is None:
+        return
+    current.update_name(f"{method} {route}")
+    current.set_attribute("http.route", route)
+    current.set_attribute("http.response.status_code", status_code)
+    if status_code >= 500:
+        current.set_status(Status(StatusCode.ERROR))
@@ -0,0 +1,137 @@
+"""Coordination of shared state between uvicorn worker processes.
+
+When the API runs with ``--workers N`` (or ``WEB_CONCURRENCY=N``) every worker
+is a separate process with its own module-level singletons.  Exactly one worker
+holds an exclusive file lock in ``WORKER_STATE_DIR`` and acts as the
+*coordinator*: it holds the Aerospike clients and rate-limit counters for all
+workers (see :mod:`coordinator`), runs the background collectors and publishes
+their snapshots as JSON files that the other workers read.
+
+If the coordinator exits, its lock is released by the OS and the next worker
+that calls :meth:`WorkerState.try_acquire` takes over.
+
+The directory holds the coordinator's sockets, so it must belong to this user
+with mode 0700; :meth:`WorkerState.ensure_dir` refuses any other directory
+(for instance one another user created first under a shared ``/tmp``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import logging
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import IO, Any
+
+from aerospike_cluster_manager_api import config
+
+logger = logging.getLogger(__name__)
+
+_LOCK_FILE = "coordinator.lock"
+
+
+class WorkerState:
+    """Coordinator election and snapshot exchange via a local state directory."""
+
+    def __init__(self, state_dir: str, multi_worker: bool) -> None:
+        self._dir = Path(state_dir)
+        self._multi_worker = multi_worker
+        self._lock_fh: IO[str] | None = None
+        self._read_cache: dict[str, tuple[float, Any]] = {}
+
+    @property
+    def multi_worker(self) -> bool:
+        return self._multi_worker
+
+    def path(self, name: str) -> Path:
+        """Path of *name* in the state directory (lock, snapshots and coordinator sockets)."""
+        return self._dir / name
+
+    def ensure_dir(self) -> None:
+        """Create the state directory, or check that the existing one is private to this user.
+
+        Raises :class:`PermissionError` if it is a symlink, not owned by this
+        user, or accessible to anyone else.
+        """
+        with contextlib.suppress(FileExistsError):
+            self._dir.mkdir(mode=0o700, parents=True)
+        st = os.lstat(self._dir)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+            raise PermissionError(
+                f"Refusing worker state directory {self._dir}: it must be a directory owned by uid "
+                f"{os.getuid()} with mode 0700 (set WORKER_STATE_DIR to a private directory)"
+            )
+
+    @property
+    def is_coordinator(self) -> bool:
+        """True in single-worker mode, or when this process holds the coordinator lock."""
+        return not self._multi_worker or self._lock_fh is not None
+
+    def try_acquire(self) -> bool:
+        """Try to become the coordinator without blocking. Returns :attr:`is_coordinator`."""
+        if self.is_coordinator:
+            return True
+        self.ensure_dir()
+        fh = open(self._dir / _LOCK_FILE, "a+")  # noqa: SIM115 — held open for the process lifetime
+        try:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            fh.close()
+            return False
+        fh.seek(0)
+        fh.truncate()
+        fh.write(str(os.getpid()))
+        fh.flush()
+        self._lock_fh = fh
+        logger.info("Worker %d is now the shared-state coordinator", os.getpid())
+        return True
+
+    def release(self) -> None:
+        if self._lock_fh is None:
+            return
+        with contextlib.suppress(OSError):
+            fcntl.flock(self._lock_fh.fileno(), fcntl.LOCK_UN)
+        self._lock_fh.close()
+        self._lock_fh = None
+
+    def publish(self, name: str, payload: Any) -> None:
+        """Atomically write a JSON snapshot visible to all workers."""
+        if not self._multi_worker:
+            return
+        self.ensure_dir()
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(payload, fh, separators=(",", ":"))
+            os.replace(tmp_path, self._dir / f"{name}.json")
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def read(self, name: str) -> Any | None:
+        """Return the latest published snapshot *name*, or ``None`` if there is none.
+
+        The parsed payload is cached per file mtime, so repeated reads cost one ``stat()``.
+        """
+        path = self._dir / f"{name}.json"
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        cached = self._read_cache.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            payload = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Failed to read shared snapshot '%s'", path, exc_info=True)
+            return None
+        self._read_cache[name] = (mtime, payload)
+        return payload
+
+
+worker_state = WorkerState(config.WORKER_STATE_DIR, multi_worker=config.WORKERS > 1)
@@ -8,7 +8,17 @@ from unittest.mock import patch
 import pytest
 from testcontainers.postgres import PostgresContainer
 
+from aerospike_cluster_manager_api.etag import snapshots
 from aerospike_cluster_manager_api.models.connection import ConnectionProfile
+from aerospike_cluster_manager_api.query_cache import query_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_query_cache():
+    """Keep cached query responses and cluster snapshots from leaking between router tests."""
+    yield
+    query_cache.clear()
+    snapshots.clear()
 
 
 @pytest.fixture(scope="session")
@@ -51,6 +61,6 @@ async def init_test_db(postgres_url: str):
         await db.init_db()
         yield postgres_url
         # Clean up: drop all rows so each test starts fresh
-        if db._pool is not None:
-            await db._pool.execute("DELETE FROM connections")
+        if db._store is not None:
+            await db._get_store().pool.execute("DELETE FROM connections")
             await db.close_db()
@@ -0,0 +1,86 @@
+"""Tests for the asynchronous batched audit log."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from aerospike_cluster_manager_api import db
+from aerospike_cluster_manager_api.audit import AuditLog
+from aerospike_cluster_manager_api.request_context import request_id_var
+
+
+def _audit_log(**overrides) -> AuditLog:
+    options = {"enabled": True, "queue_size": 100, "batch_size": 10, "flush_interval": 0.01}
+    options.update(overrides)
+    return AuditLog(**options)
+
+
+class TestAuditLog:
+    def test_disabled_records_nothing(self):
+        log = _audit_log(enabled=False)
+        log.record("record.put", "test/demo/1")
+        assert log.stats()["enqueued"] == 0
+        assert log.stats()["queued"] == 0
+
+    def test_full_queue_drops_and_counts(self):
+        log = _audit_log(queue_size=2)
+        for i in range(5):
+            log.record("record.delete", f"test/demo/{i}")
+        stats = log.stats()
+        assert stats["queued"] == 2
+        assert stats["enqueued"] == 2
+        assert stats["dropped"] == 3
+
+    async def test_captures_request_id(self):
+        log = _audit_log()
+        token = request_id_var.set("req-123")
+        try:
+            log.record("udf.delete", "module.lua", connection_id="conn-1")
+        finally:
+            request_id_var.reset(token)
+
+        insert = AsyncMock()
+        with patch.object(db, "insert_audit_entries", insert):
+            await log.flush()
+
+        (entry,) = insert.await_args.args[0]
+        assert entry.request_id == "req-123"
+        assert entry.connection_id == "conn-1"
+
+    async def test_background_writer_batches(self):
+        log = _audit_log(batch_size=10)
+        insert = AsyncMock()
+        with patch.object(db, "insert_audit_entries", insert):
+            log.start()
+            for i in range(25):
+                log.record("record.put", f"test/demo/{i}")
+            for _ in range(100):
+                if log.written == 25:
+                    break
+                await asyncio.sleep(0.01)
+            await log.stop()
+
+        assert log.written == 25
+        assert [len(call.args[0]) for call in insert.await_args_list] == [10, 10, 5]
+
+    async def test_stop_flushes_pending_entries(self):
+        log = _audit_log(flush_interval=60)
+        insert = AsyncMock()
+        with patch.object(db, "insert_audit_entries", insert):
+            log.start()
+            log.record("index.create", "test/idx_age")
+            log.record("index.delete", "test/idx_age")
+            await asyncio.sleep(0)
+            await log.stop()
+
+        assert log.written == 2
+        assert log.stats()["queued"] == 0
+
+    async def test_write_failure_is_counted(self):
+        log = _audit_log()
+        log.record("user.delete", "alice")
+        with patch.object(db, "insert_audit_entries", AsyncMock(side_effect=RuntimeError("db down"))):
+            await log.flush()
+        assert log.failed == 1
+        assert log.written == 0
@@ -0,0 +1,148 @@
+"""Tests for the cluster info endpoint and its ``include`` sections."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.etag import snapshots
+from aerospike_cluster_manager_api.main import app
+
+NODES = ["BB9000000000001", "BB9000000000002"]
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+async def client():
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+
+    app.state.limiter.enabled = False
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+def _aerospike() -> AsyncMock:
+    replies = {
+        "statistics": "cluster_size=2;uptime=3600;client_connections=7",
+        "build": "7.1.0.0",
+        "edition": "Aerospike Community Edition",
+        "service": "10.0.0.1:3000",
+        "namespace/test": "objects=10;replication-factor=2;memory_used_bytes=100;memory-size=1000",
+        "sets/test": "ns=test:set=demo:objects=10:tombstones=0:memory_data_bytes=50:stop-writes-count=0",
+    }
+
+    async def info_all(command: str):
+        return [(name, 0, replies[command]) for name in NODES]
+
+    mock_client = AsyncMock()
+    mock_client.get_node_names = MagicMock(return_value=NODES)
+    mock_client.info_random_node = AsyncMock(return_value="test")
+    mock_client.info_all = AsyncMock(side_effect=info_all)
+    return mock_client
+
+
+async def _get(
+    client: AsyncClient,
+    mock_client: AsyncMock,
+    params: dict[str, str] | None = None,
+    headers: dict[str, str] | None = None,
+):
+    with (
+        patch(
+            "aerospike_cluster_manager_api.dependencies.db.get_connection",
+            AsyncMock(return_value={"id": "conn-test"}),
+        ),
+        patch(
+            "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+            AsyncMock(return_value=mock_client),
+        ),
+    ):
+        return await client.get("/api/clusters/conn-test", params=params or {}, headers=headers)
+
+
+def _commands(mock_client: AsyncMock) -> set[str]:
+    return {call.args[0] for call in mock_client.info_all.await_args_list}
+
+
+class TestGetCluster:
+    async def test_full_view_by_default(self, client: AsyncClient):
+        mock_client = _aerospike()
+        response = await _get(client, mock_client)
+        assert response.status_code == 200
+        body = response.json()
+        node = body["nodes"][0]
+        assert node["uptime"] == 3600
+        assert node["clientConnections"] == 7
+        assert node["statistics"]["uptime"] == "3600"
+        assert body["namespaces"][0]["sets"][0]["name"] == "demo"
+        assert {"statistics", "sets/test"} <= _commands(mock_client)
+
+    async def test_empty_include_skips_statistics_and_sets(self, client: AsyncClient):
+        mock_client = _aerospike()
+        response = await _get(client, mock_client, {"include": ""})
+        assert response.status_code == 200
+        body = response.json()
+        node = body["nodes"][0]
+        assert node["statistics"] == {}
+        assert node["clusterSize"] == 2
+        assert node["build"] == "7.1.0.0"
+        namespace = body["namespaces"][0]
+        assert namespace["objects"] == 10
+        assert namespace["memoryUsed"] == 200
+        assert namespace["sets"] == []
+        assert _commands(mock_client) == {"build", "edition", "service", "namespace/test"}
+
+    async def test_single_section(self, client: AsyncClient):
+        mock_client = _aerospike()
+        response = await _get(client, mock_client, {"include": "sets"})
+        body = response.json()
+        assert body["nodes"][0]["statistics"] == {}
+        assert body["namespaces"][0]["sets"][0]["objects"] == 10
+        assert "statistics" not in _commands(mock_client)
+
+    async def test_every_view_is_tagged(self, client: AsyncClient):
+        full = await _get(client, _aerospike())
+        summary = await _get(client, _aerospike(), {"include": ""})
+        with_sets = await _get(client, _aerospike(), {"include": "sets"})
+        assert len({full.headers["etag"], summary.headers["etag"], with_sets.headers["etag"]}) == 3
+
+        again = await _get(client, _aerospike(), {"include": ""}, {"If-None-Match": summary.headers["etag"]})
+        assert again.status_code == 304
+
+    async def test_full_view_is_snapshotted_between_polls(self, client: AsyncClient):
+        full = await _get(client, _aerospike())
+
+        mock_client = _aerospike()
+        again = await _get(client, mock_client, headers={"If-None-Match": full.headers["etag"]})
+        assert again.status_code == 304
+        assert mock_client.info_all.await_count == 0
+
+        snapshots.forget("clusters", "conn-test")
+        assert (await _get(client, mock_client)).status_code == 200
+        assert "statistics" in _commands(mock_client)
+
+    async def test_snapshot_ttl_zero_recomputes_every_poll(self, client: AsyncClient):
+        with patch.object(config, "CLUSTER_SNAPSHOT_TTL_SECONDS", 0):
+            await _get(client, _aerospike())
+            mock_client = _aerospike()
+            await _get(client, mock_client)
+        assert "statistics" in _commands(mock_client)
+
+    async def test_unknown_section_rejected(self, client: AsyncClient):
+        response = await _get(client, _aerospike(), {"include": "sets,bins"})
+        assert response.status_code == 400
+        assert "bins" in response.json()["detail"]
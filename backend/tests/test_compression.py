@@ -0,0 +1,156 @@
+"""Tests for negotiated response compression."""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from aerospike_cluster_manager_api.compression import CompressionMiddleware, negotiate
+
+BIG = {"statistics": {f"stat_{i}": i for i in range(500)}}
+
+
+async def _big(_request):
+    return JSONResponse(BIG, headers={"ETag": '"abc"'})
+
+
+async def _small(_request):
+    return JSONResponse({"ok": True})
+
+
+async def _png(_request):
+    return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+
+async def _stream(_request):
+    async def chunks():
+        for i in range(50):
+            yield f"line {i} {'x' * 100}\n".encode()
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+async def _short_stream(_request):
+    async def chunks():
+        yield b"a"
+        yield b"b"
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+async def _no_transform(_request):
+    return PlainTextResponse("x" * 5000, headers={"Cache-Control": "no-transform"})
+
+
+def _app(encodings: list[str] | None = None) -> Starlette:
+    app = Starlette(
+        routes=[
+            Route("/big", _big),
+            Route("/small", _small),
+            Route("/png", _png),
+            Route("/stream", _stream),
+            Route("/short-stream", _short_stream),
+            Route("/no-transform", _no_transform),
+        ]
+    )
+    app.add_middleware(CompressionMiddleware, encodings=encodings or ["zstd", "br", "gzip"], minimum_size=1024)
+    return app
+
+
+@pytest.fixture()
+async def client():
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as ac:
+        yield ac
+
+
+async def _raw(client: AsyncClient, path: str, accept: str) -> tuple[Response, bytes]:
+    async with client.stream("GET", path, headers={"Accept-Encoding": accept}) as response:
+        return response, b"".join([chunk async for chunk in response.aiter_raw()])
+
+
+class TestNegotiate:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip, deflate, br, zstd", "zstd"),
+            ("gzip, br", "br"),
+            ("gzip;q=1.0, br;q=0.5", "gzip"),
+            ("br;q=0, gzip", "gzip"),
+            ("identity", None),
+            ("", None),
+            ("*", "zstd"),
+            ("*;q=0.1, zstd;q=0", "br"),
+            ("GZIP", "gzip"),
+            ("gzip;q=abc", None),
+        ],
+    )
+    def test_choice(self, header: str, expected: str | None):
+        assert negotiate(header, ["zstd", "br", "gzip"]) == expected
+
+
+class TestCompressionMiddleware:
+    async def test_gzip(self, client: AsyncClient):
+        response, body = await _raw(client, "/big", "gzip")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(body)
+        assert gzip.decompress(body).startswith(b'{"statistics"')
+
+    async def test_brotli(self, client: AsyncClient):
+        brotli = pytest.importorskip("brotli")
+        response, body = await _raw(client, "/big", "br")
+        assert response.headers["content-encoding"] == "br"
+        assert brotli.decompress(body).startswith(b'{"statistics"')
+
+    async def test_zstd(self, client: AsyncClient):
+        zstandard = pytest.importorskip("zstandard")
+        response, body = await _raw(client, "/big", "zstd, gzip")
+        assert response.headers["content-encoding"] == "zstd"
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(body).startswith(b'{"statistics"')
+
+    async def test_strong_etag_weakened(self, client: AsyncClient):
+        response, _ = await _raw(client, "/big", "gzip")
+        assert response.headers["etag"] == 'W/"abc"'
+
+    async def test_identity_without_accept_encoding(self, client: AsyncClient):
+        response, body = await _raw(client, "/big", "identity")
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == '"abc"'
+        assert body.startswith(b'{"statistics"')
+
+    async def test_small_responses_not_compressed(self, client: AsyncClient):
+        response, body = await _raw(client, "/small", "gzip")
+        assert "content-encoding" not in response.headers
+        assert body == b'{"ok":true}'
+
+    async def test_binary_types_not_compressed(self, client: AsyncClient):
+        response, _ = await _raw(client, "/png", "gzip")
+        assert "content-encoding" not in response.headers
+
+    async def test_no_transform_respected(self, client: AsyncClient):
+        response, _ = await _raw(client, "/no-transform", "gzip")
+        assert "content-encoding" not in response.headers
+
+    async def test_streaming_compressed_chunk_by_chunk(self, client: AsyncClient):
+        response, body = await _raw(client, "/stream", "gzip")
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        text = zlib.decompress(body, 16 + zlib.MAX_WBITS).decode()
+        assert text.count("\n") == 50
+
+    async def test_short_stream_sent_as_is(self, client: AsyncClient):
+        response, body = await _raw(client, "/short-stream", "gzip")
+        assert "content-encoding" not in response.headers
+        assert body == b"ab"
+
+    async def test_only_configured_encodings_offered(self):
+        transport = ASGITransport(app=_app(["gzip"]))
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            response, _ = await _raw(ac, "/big", "zstd, br")
+        assert "content-encoding" not in response.headers
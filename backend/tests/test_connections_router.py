@@ -84,6 +84,27 @@ class TestListConnections:
         for item in response.json():
             assert_no_password(item)
 
+    async def test_with_status_uses_cached_health(self, client: AsyncClient):
+        from aerospike_cluster_manager_api.health_monitor import health_monitor
+        from aerospike_cluster_manager_api.models.connection import ConnectionStatus
+
+        create_resp = await client.post("/api/connections", json=CREATE_PAYLOAD)
+        conn_id = create_resp.json()["id"]
+        cached = ConnectionStatus(connected=True, nodeCount=3, namespaceCount=1, latencyMs=1.5)
+
+        with (
+            patch.object(health_monitor, "get_status", return_value=cached),
+            patch.object(health_monitor, "refresh", AsyncMock()) as mock_refresh,
+        ):
+            response = await client.get("/api/connections", params={"withStatus": "true"})
+
+        assert response.status_code == 200
+        item = next(i for i in response.json() if i["id"] == conn_id)
+        assert_no_password(item)
+        assert item["status"]["connected"] is True
+        assert item["status"]["nodeCount"] == 3
+        mock_refresh.assert_not_called()
+
 
 class TestCreateConnection:
     async def test_create_returns_201(self, client: AsyncClient):
@@ -198,9 +219,7 @@ class TestTestConnection:
         mock_client.is_connected = lambda: True
         mock_client.close = AsyncMock()
 
-        with patch(
-            "aerospike_cluster_manager_api.routers.connections.aerospike_py.AsyncClient", return_value=mock_client
-        ):
+        with patch("aerospike_cluster_manager_api.client_manager.aerospike_py.AsyncClient", return_value=mock_client):
             response = await client.post(
                 "/api/connections/test",
                 json={"hosts": ["localhost"], "port": 3000},
@@ -214,7 +233,7 @@ class TestTestConnection:
     async def test_failure(self, client: AsyncClient):
         """Test connection endpoint when connection fails."""
         with patch(
-            "aerospike_cluster_manager_api.routers.connections.aerospike_py.AsyncClient",
+            "aerospike_cluster_manager_api.client_manager.aerospike_py.AsyncClient",
             side_effect=Exception("Connection refused"),
         ):
             response = await client.post(
@@ -234,9 +253,7 @@ class TestTestConnection:
         mock_client.is_connected = lambda: False
         mock_client.close = AsyncMock()
 
-        with patch(
-            "aerospike_cluster_manager_api.routers.connections.aerospike_py.AsyncClient", return_value=mock_client
-        ):
+        with patch("aerospike_cluster_manager_api.client_manager.aerospike_py.AsyncClient", return_value=mock_client):
             response = await client.post(
                 "/api/connections/test",
                 json={"hosts": ["localhost"], "port": 3000},
@@ -255,7 +272,7 @@ class TestTestConnection:
         mock_client.close = AsyncMock()
 
         with patch(
-            "aerospike_cluster_manager_api.routers.connections.aerospike_py.AsyncClient", return_value=mock_client
+            "aerospike_cluster_manager_api.client_manager.aerospike_py.AsyncClient", return_value=mock_client
         ) as mock_cls:
             response = await client.post(
                 "/api/connections/test",
@@ -0,0 +1,137 @@
+"""Tests for sharing cluster clients and rate-limit counters through the coordinator worker."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+from aerospike_py import predicates
+from aerospike_py.exception import RecordNotFound
+from aerospike_py.types import Record
+
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api import coordinator as coordinator_module
+from aerospike_cluster_manager_api.client_manager import ClientManager
+from aerospike_cluster_manager_api.coordinator import Coordinator, CoordinatorStorage, _decode, _encode
+from aerospike_cluster_manager_api.worker_state import WorkerState
+
+KEY = ("test", "demo", "user-1")
+
+
+@pytest.fixture()
+async def workers(tmp_path, sample_connection):
+    """Two workers sharing one state directory; the first one becomes the coordinator."""
+    managers = [ClientManager(Coordinator(WorkerState(str(tmp_path), multi_worker=True))) for _ in range(2)]
+    with (
+        patch.object(config, "AEROSPIKE_CLIENT", "fake"),
+        patch.object(config, "FAKE_AEROSPIKE_RECORDS", 0),
+        patch(
+            "aerospike_cluster_manager_api.client_manager.db.get_connection", AsyncMock(return_value=sample_connection)
+        ),
+    ):
+        for manager in managers:
+            await manager.start()
+        yield managers
+        for manager in managers:
+            await manager.close_all()
+            manager._coordinator._state.release()
+
+
+async def test_calls_run_on_the_coordinators_client(workers):
+    coordinator, worker = workers
+    assert coordinator._coordinator.is_local and not worker._coordinator.is_local
+
+    client = await worker.get_client("conn-test-1")
+    await client.put(KEY, {"name": "Ann"})
+    await client.index_string_create("test", "demo", "name", "idx_name")
+
+    assert worker._clients == {}
+    assert list(coordinator._clients) == ["conn-test-1"]
+    assert client.get_node_names() == coordinator._clients["conn-test-1"].get_node_names()
+    assert (await (await coordinator.get_client("conn-test-1")).get(KEY)).bins == {"name": "Ann"}
+
+    query = client.query("test", "demo")
+    query.select("name")
+    query.where(predicates.equals("name", "Ann"))
+    assert [r.bins for r in await query.results()] == [{"name": "Ann"}]
+
+
+async def test_query_results_arrive_in_pages(workers):
+    _coordinator, worker = workers
+    client = await worker.get_client("conn-test-1")
+    for i in range(5):
+        await client.put(("test", "demo", f"user-{i}"), {"n": i})
+
+    seen = []
+    with patch.object(coordinator_module, "_QUERY_PAGE_RECORDS", 2):
+        assert len(await client.query("test", "demo").results()) == 5
+        await client.query("test", "demo").foreach(lambda record: seen.append(record) or len(seen) < 3)
+        # The connection abandoned by foreach is not reused; later calls still work
+        assert len(await client.query("test", "demo").results()) == 5
+
+    assert len(seen) == 3
+
+
+async def test_errors_keep_their_aerospike_class(workers):
+    _coordinator, worker = workers
+    client = await worker.get_client("conn-test-1")
+    with pytest.raises(RecordNotFound):
+        await client.get(KEY)
+
+
+async def test_a_worker_takes_over_when_the_coordinator_exits(workers):
+    coordinator, worker = workers
+    await (await worker.get_client("conn-test-1")).put(KEY, {"a": 1})
+
+    await coordinator.close_all()
+    coordinator._coordinator._state.release()
+
+    client = await worker.get_client("conn-test-1")
+    with pytest.raises(RecordNotFound):
+        # The new coordinator connects afresh; the fake's keyspace went with the old one
+        await client.get(KEY)
+    assert worker._coordinator.is_local
+    assert list(worker._clients) == ["conn-test-1"]
+
+
+async def test_rate_limit_counters_are_shared(workers):
+    coordinator, worker = workers
+    first = CoordinatorStorage("coordinator://", coordinator=coordinator._coordinator)
+    second = CoordinatorStorage("coordinator://", coordinator=worker._coordinator)
+
+    assert first.incr("LIMITER/ip/route", 60) == 1
+    assert second.incr("LIMITER/ip/route", 60) == 2
+    assert second.get("LIMITER/ip/route") == 2 == coordinator._coordinator.limits.get("LIMITER/ip/route")
+
+    second.clear("LIMITER/ip/route")
+    assert first.get("LIMITER/ip/route") == 0
+
+
+async def test_rate_limits_count_locally_while_the_coordinator_is_away(workers):
+    coordinator, worker = workers
+    storage = CoordinatorStorage("coordinator://", coordinator=worker._coordinator)
+    await coordinator.close_all()
+
+    assert storage.incr("LIMITER/ip/route", 60) == 1
+    assert storage.incr("LIMITER/ip/route", 60) == 2
+    assert worker._coordinator.limits.get("LIMITER/ip/route") == 2
+
+
+def test_frames_round_trip_client_values():
+    record = Record(
+        key=("test", "demo", "k", b"\x01\x02"), meta={"gen": 1, "ttl": 0}, bins={"b": b"\xff", 7: [1.5, None]}
+    )
+    values = [record, {"$bytes": "not a tag"}, ("a", 1), [b"", {}]]
+
+    decoded = _decode(orjson.loads(orjson.dumps(_encode(values))))
+
+    assert decoded == values
+    assert type(decoded[0]) is Record and type(decoded[2]) is tuple
+
+
+def test_frames_carry_no_objects():
+    with pytest.raises(TypeError):
+        _encode(object())
+    with pytest.raises(ValueError, match="unknown value tag"):
+        _decode({"$pickle": "gASVAAAAAA=="})
@@ -18,7 +18,7 @@ from aerospike_cluster_manager_api.models.connection import ConnectionProfile
 class TestInitDb:
     async def test_init_creates_table(self, init_test_db):
         """init_db() should create the connections table."""
-        pool = db._get_pool()
+        pool = db._get_store().pool
         row = await pool.fetchrow("SELECT table_name FROM information_schema.tables WHERE table_name = 'connections'")
         assert row is not None
 
@@ -102,6 +102,16 @@ class TestCreateConnection:
         assert retrieved.password == "secret"
         assert retrieved.hosts == ["10.0.0.1", "10.0.0.2"]
 
+    async def test_insert_preserves_read_routing(self, init_test_db, sample_connection):
+        conn = sample_connection.model_copy(update={"readReplica": "prefer_rack", "readModeAp": "all", "rackId": 3})
+        await db.create_connection(conn)
+
+        retrieved = await db.get_connection(conn.id)
+        assert retrieved is not None
+        assert retrieved.readReplica == "prefer_rack"
+        assert retrieved.readModeAp == "all"
+        assert retrieved.rackId == 3
+
     async def test_insert_duplicate_id_raises(self, init_test_db, sample_connection):
         await db.create_connection(sample_connection)
         with pytest.raises(asyncpg.UniqueViolationError):
@@ -183,27 +193,44 @@ class TestDeleteConnection:
         assert any(p.id == "conn-other" for p in remaining)
 
 
+class TestSearchConnections:
+    async def test_host_prefix_follows_updates(self, init_test_db, sample_connection):
+        await db.create_connection(sample_connection.model_copy(update={"hosts": ["Edge.Tokyo", "10.2.0.1"]}))
+        assert [p.id for p in await db.search_connections(query="edge")] == [sample_connection.id]
+
+        await db.update_connection(sample_connection.id, {"hosts": ["10.9.0.1"]})
+        assert await db.search_connections(query="edge") == []
+        assert [p.id for p in await db.search_connections(query="10.9")] == [sample_connection.id]
+
+    async def test_hosts_are_dropped_with_their_profile(self, init_test_db, sample_connection):
+        await db.create_connection(sample_connection)
+        await db.delete_connection(sample_connection.id)
+
+        pool = db._get_store().pool
+        assert await pool.fetchval("SELECT count(*) FROM connection_hosts") == 0
+
+
 class TestCloseDb:
-    async def test_close_sets_pool_to_none(self, init_test_db):
-        """After close_db(), the module-level _pool should be None."""
-        assert db._pool is not None
+    async def test_close_sets_store_to_none(self, init_test_db):
+        """After close_db(), the module-level _store should be None."""
+        assert db._store is not None
         await db.close_db()
-        assert db._pool is None
+        assert db._store is None
 
     async def test_close_when_already_closed(self):
         """Calling close_db() when already closed should not raise."""
-        db._pool = None
+        db._store = None
         await db.close_db()
-        assert db._pool is None
+        assert db._store is None
 
 
-class TestGetPoolWithoutInit:
+class TestGetStoreWithoutInit:
     def test_raises_runtime_error(self):
-        """_get_pool() should raise if init_db() was never called."""
-        original = db._pool
-        db._pool = None
+        """_get_store() should raise if init_db() was never called."""
+        original = db._store
+        db._store = None
         try:
             with pytest.raises(RuntimeError, match="Database not initialized"):
-                db._get_pool()
+                db._get_store()
         finally:
-            db._pool = original
+            db._store = original
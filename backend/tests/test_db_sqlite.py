@@ -0,0 +1,267 @@
+"""Tests for the embedded SQLite persistence backend.
+
+Runs the public ``db`` API against a temporary SQLite file, so no database
+server is required.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from aerospike_cluster_manager_api import db
+from aerospike_cluster_manager_api.audit import AuditEntry
+from aerospike_cluster_manager_api.db_sqlite import path_from_url
+from aerospike_cluster_manager_api.models.connection import ConnectionProfile
+from aerospike_cluster_manager_api.models.query import SavedQuery
+
+
+@pytest.fixture()
+async def sqlite_db(tmp_path):
+    url = f"sqlite:///{tmp_path}/manager.db"
+    with patch("aerospike_cluster_manager_api.config.DATABASE_URL", url):
+        await db.init_db()
+        yield url
+        await db.close_db()
+
+
+class TestPathFromUrl:
+    def test_relative(self):
+        assert path_from_url("sqlite:///data/app.db") == "data/app.db"
+
+    def test_absolute(self):
+        assert path_from_url("sqlite:////var/lib/app.db") == "/var/lib/app.db"
+
+    def test_memory(self):
+        assert path_from_url("sqlite:///:memory:") == ":memory:"
+
+
+class TestSQLiteBackend:
+    async def test_wal_mode_enabled(self, sqlite_db, tmp_path):
+        with sqlite3.connect(tmp_path / "manager.db") as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    async def test_health(self, sqlite_db):
+        assert await db.check_health() is True
+
+    async def test_crud_round_trip(self, sqlite_db, sample_connection):
+        await db.create_connection(sample_connection)
+
+        retrieved = await db.get_connection(sample_connection.id)
+        assert retrieved == sample_connection
+
+        updated = await db.update_connection(sample_connection.id, {"name": "Renamed", "id": "hacked"})
+        assert updated is not None
+        assert updated.id == sample_connection.id
+        assert updated.name == "Renamed"
+        assert updated.updatedAt != sample_connection.updatedAt
+        assert (await db.get_connection(sample_connection.id)).name == "Renamed"
+
+        assert await db.delete_connection(sample_connection.id) is True
+        assert await db.delete_connection(sample_connection.id) is False
+        assert await db.get_connection(sample_connection.id) is None
+
+    async def test_ordered_by_created_at(self, sqlite_db, sample_connection):
+        later = ConnectionProfile(
+            id="conn-later",
+            name="Later Connection",
+            hosts=["10.0.0.1", "10.0.0.2"],
+            port=3000,
+            color="#FF0000",
+            createdAt="2099-01-01T00:00:00+00:00",
+            updatedAt="2099-01-01T00:00:00+00:00",
+        )
+        await db.create_connection(later)
+        await db.create_connection(sample_connection)
+
+        ids = [p.id for p in await db.get_all_connections()]
+        assert ids == [sample_connection.id, "conn-later"]
+
+    async def test_update_nonexistent_returns_none(self, sqlite_db):
+        assert await db.update_connection("does-not-exist", {"name": "Nope"}) is None
+
+    async def test_duplicate_id_raises(self, sqlite_db, sample_connection):
+        await db.create_connection(sample_connection)
+        with pytest.raises(sqlite3.IntegrityError):
+            await db.create_connection(sample_connection)
+
+
+class TestSearchConnections:
+    @pytest.fixture()
+    async def seeded(self, sqlite_db, sample_connection):
+        profiles = [
+            sample_connection.model_copy(
+                update={
+                    "id": f"conn-{i}",
+                    "name": name,
+                    "hosts": [host],
+                    "password": "secret",
+                    "tags": tags,
+                    "environment": env,
+                    "createdAt": f"2025-01-0{i}T00:00:00+00:00",
+                }
+            )
+            for i, (name, host, tags, env) in enumerate(
+                [
+                    ("Prod Seoul", "10.1.0.1", ["prod", "kr"], "production"),
+                    ("Prod Tokyo", "10.2.0.1", ["prod", "jp"], "production"),
+                    ("Staging_1", "stage.internal", ["kr"], "staging"),
+                ],
+                start=1,
+            )
+        ]
+        for p in profiles:
+            await db.create_connection(p)
+        return profiles
+
+    async def test_prefix_matches_name_or_host(self, seeded):
+        assert [p.id for p in await db.search_connections(query="prod")] == ["conn-1", "conn-2"]
+        assert [p.id for p in await db.search_connections(query="10.2")] == ["conn-2"]
+        # LIKE wildcards in the prefix are matched literally
+        assert [p.id for p in await db.search_connections(query="staging_")] == ["conn-3"]
+        assert await db.search_connections(query="%") == []
+
+    async def test_host_prefix_follows_updates(self, seeded):
+        await db.update_connection("conn-2", {"hosts": ["Edge.Tokyo", "10.2.0.1"]})
+        assert [p.id for p in await db.search_connections(query="edge")] == ["conn-2"]
+
+        await db.update_connection("conn-2", {"hosts": ["10.9.0.1"]})
+        assert await db.search_connections(query="edge") == []
+        assert [p.id for p in await db.search_connections(query="10.9")] == ["conn-2"]
+
+    async def test_hosts_of_existing_profiles_are_indexed_on_open(self, seeded, sqlite_db):
+        path = path_from_url(sqlite_db)
+        await db.close_db()
+        with sqlite3.connect(path) as conn:
+            conn.execute("DROP TABLE connection_hosts")
+        await db.init_db()
+
+        assert [p.id for p in await db.search_connections(query="stage.")] == ["conn-3"]
+
+    async def test_prefix_search_uses_the_indexes(self, seeded):
+        def plan(c):
+            sql = (
+                "SELECT id FROM connections WHERE id IN (SELECT id FROM connections WHERE name LIKE ? ESCAPE '\\' "
+                "UNION SELECT connection_id FROM connection_hosts WHERE host LIKE ? ESCAPE '\\')"
+            )
+            return " | ".join(row["detail"] for row in c.execute("EXPLAIN QUERY PLAN " + sql, ("pr%", "pr%")))
+
+        details = await db._get_store()._run(plan)
+        assert "idx_connections_name_prefix" in details and "idx_connection_hosts_prefix" in details
+        assert "SCAN" not in details
+
+    async def test_tag_and_environment_filters(self, seeded):
+        assert [p.id for p in await db.search_connections(tags=["kr"])] == ["conn-1", "conn-3"]
+        assert [p.id for p in await db.search_connections(tags=["prod", "kr"])] == ["conn-1"]
+        assert [p.id for p in await db.search_connections(environment="staging")] == ["conn-3"]
+
+    async def test_keyset_pagination(self, seeded):
+        first = await db.search_connections(limit=2)
+        assert [p.id for p in first] == ["conn-1", "conn-2"]
+        rest = await db.search_connections(after=(first[-1].createdAt, first[-1].id), limit=2)
+        assert [p.id for p in rest] == ["conn-3"]
+
+    async def test_projection_excludes_password(self, seeded):
+        for summary in await db.search_connections():
+            assert "password" not in summary.model_dump()
+
+    async def test_connection_hosts(self, seeded):
+        assert await db.get_connection_hosts() == [
+            ("conn-1", "Prod Seoul", ["10.1.0.1"]),
+            ("conn-2", "Prod Tokyo", ["10.2.0.1"]),
+            ("conn-3", "Staging_1", ["stage.internal"]),
+        ]
+
+
+class TestAuditEntries:
+    async def test_insert_audit_entries(self, sqlite_db, tmp_path):
+        await db.insert_audit_entries(
+            [
+                AuditEntry(action="record.put", target="test/demo/1", connection_id="conn-1", detail={"ttl": 60}),
+                AuditEntry(action="udf.delete", target="module.lua", request_id="req-1"),
+            ]
+        )
+        with sqlite3.connect(tmp_path / "manager.db") as conn:
+            rows = conn.execute("SELECT action, target, connection_id, request_id, detail FROM audit_log ORDER BY id")
+            assert rows.fetchall() == [
+                ("record.put", "test/demo/1", "conn-1", None, '{"ttl": 60}'),
+                ("udf.delete", "module.lua", None, "req-1", "{}"),
+            ]
+
+
+class TestQueryHistoryAndSavedQueries:
+    async def test_history_newest_first_with_paging(self, sqlite_db, sample_connection):
+        await db.create_connection(sample_connection)
+        for i in range(3):
+            await db.insert_query_history(
+                sample_connection.id,
+                "query",
+                f"digest-{i}",
+                {"namespace": "test"},
+                execution_time_ms=i,
+                scanned_records=10,
+                returned_records=5,
+            )
+
+        first = await db.list_query_history(sample_connection.id, limit=2)
+        assert [e.digest for e in first] == ["digest-2", "digest-1"]
+        assert first[0].request == {"namespace": "test"}
+        rest = await db.list_query_history(sample_connection.id, before=first[-1].id, limit=2)
+        assert [e.digest for e in rest] == ["digest-0"]
+
+    async def test_prune_history(self, sqlite_db, sample_connection):
+        await db.create_connection(sample_connection)
+        for i in range(5):
+            await db.insert_query_history(
+                sample_connection.id,
+                "query",
+                f"digest-{i}",
+                {},
+                execution_time_ms=1,
+                scanned_records=0,
+                returned_records=0,
+            )
+
+        assert await db.prune_query_history(sample_connection.id, older_than=None, keep=2) == 3
+        assert [e.digest for e in await db.list_query_history(sample_connection.id)] == ["digest-4", "digest-3"]
+        assert await db.prune_query_history(sample_connection.id, older_than=None, keep=2) == 0
+
+        future = datetime.now(UTC) + timedelta(seconds=1)
+        assert await db.prune_query_history(sample_connection.id, older_than=future, keep=0) == 2
+        assert await db.list_query_history(sample_connection.id) == []
+
+    async def test_saved_query_lifecycle(self, sqlite_db, sample_connection):
+        await db.create_connection(sample_connection)
+        saved = SavedQuery(
+            id="sq-1",
+            connectionId=sample_connection.id,
+            name="hot keys",
+            kind="filter",
+            request={"namespace": "test", "set": "demo"},
+            digest="abc",
+            createdAt="2025-01-01T00:00:00+00:00",
+            updatedAt="2025-01-01T00:00:00+00:00",
+        )
+        assert await db.create_saved_query(saved) is True
+        assert await db.create_saved_query(saved.model_copy(update={"id": "sq-2"})) is False
+        assert [q.id for q in await db.list_saved_queries(sample_connection.id)] == ["sq-1"]
+
+        assert await db.get_saved_query_snapshot("sq-1") is None
+        taken_at = datetime.now(UTC)
+        await db.store_saved_query_snapshot("sq-1", '{"records":[]}', taken_at)
+        assert await db.get_saved_query_snapshot("sq-1") == ('{"records":[]}', taken_at)
+        assert (await db.get_saved_query(sample_connection.id, "sq-1")).snapshotAt == taken_at.isoformat()
+
+        assert await db.delete_saved_query(sample_connection.id, "sq-1") is True
+        assert await db.get_saved_query(sample_connection.id, "sq-1") is None
+
+    async def test_deleting_connection_cascades(self, sqlite_db, sample_connection):
+        await db.create_connection(sample_connection)
+        await db.insert_query_history(
+            sample_connection.id, "query", "d", {}, execution_time_ms=1, scanned_records=0, returned_records=0
+        )
+        await db.delete_connection(sample_connection.id)
+        assert await db.list_query_history(sample_connection.id) == []
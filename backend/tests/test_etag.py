@@ -0,0 +1,132 @@
+"""Tests for ETags and conditional GET on polled listings."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from aerospike_cluster_manager_api.etag import Snapshots, Tagged, etag_matches
+from aerospike_cluster_manager_api.main import app
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+async def client():
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+
+    app.state.limiter.enabled = False
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+class TestEtagMatches:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, False),
+            ("", False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"x", "abc"', True),
+            ('"x", W/"y"', False),
+            ("*", True),
+            ("abc", False),
+        ],
+    )
+    def test_weak_comparison(self, header: str | None, expected: bool):
+        assert etag_matches(header, '"abc"') is expected
+
+    def test_tag_is_stable_and_content_sensitive(self):
+        assert Tagged.of([{"a": 1}]).etag == Tagged.of([{"a": 1}]).etag
+        assert Tagged.of([{"a": 1}]).etag != Tagged.of([{"a": 2}]).etag
+
+
+class TestSnapshots:
+    async def test_fresh_snapshot_is_reused_until_forgotten(self):
+        snapshots = Snapshots()
+        compute = AsyncMock(side_effect=lambda: Tagged.of({"n": compute.await_count}))
+        key = ("clusters", "conn-1", "statistics")
+
+        first = await snapshots.get(key, compute, 60)
+        assert await snapshots.get(key, compute, 60) is first
+        snapshots.forget("clusters", "conn-2")
+        assert await snapshots.get(key, compute, 60) is first
+
+        snapshots.forget("clusters", "conn-1")
+        assert (await snapshots.get(key, compute, 60)).etag != first.etag
+
+    async def test_body_computed_across_a_write_is_not_kept(self):
+        snapshots = Snapshots()
+        key = ("clusters", "conn-1", "statistics")
+
+        async def racing_write() -> Tagged:
+            snapshots.forget("clusters", "conn-1")
+            return Tagged.of({"before": "write"})
+
+        await snapshots.get(key, racing_write, 60)
+        after = await snapshots.get(key, AsyncMock(return_value=Tagged.of({"after": "write"})), 60)
+        assert after.body == b'{"after":"write"}'
+
+
+def _udf_client(listing: str) -> AsyncMock:
+    mock_client = AsyncMock()
+    mock_client.info_random_node = AsyncMock(return_value=listing)
+    return mock_client
+
+
+class TestConditionalListings:
+    async def _get(self, client: AsyncClient, mock_client: AsyncMock, headers: dict[str, str] | None = None):
+        with (
+            patch(
+                "aerospike_cluster_manager_api.dependencies.db.get_connection",
+                AsyncMock(return_value={"id": "conn-test"}),
+            ),
+            patch(
+                "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+                AsyncMock(return_value=mock_client),
+            ),
+        ):
+            return await client.get("/api/udfs/conn-test", headers=headers or {})
+
+    async def test_etag_sent_and_304_on_match(self, client: AsyncClient):
+        listing = "filename=agg.lua,hash=abc,type=LUA;"
+        first = await self._get(client, _udf_client(listing))
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert [m["filename"] for m in first.json()] == ["agg.lua"]
+
+        second = await self._get(client, _udf_client(listing), {"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    async def test_weak_etag_from_compressed_response_revalidates(self, client: AsyncClient):
+        listing = "filename=agg.lua,hash=abc,type=LUA;"
+        first = await self._get(client, _udf_client(listing))
+        second = await self._get(client, _udf_client(listing), {"If-None-Match": f"W/{first.headers['etag']}"})
+        assert second.status_code == 304
+
+    async def test_changed_listing_returns_new_body(self, client: AsyncClient):
+        first = await self._get(client, _udf_client("filename=agg.lua,hash=abc,type=LUA;"))
+        second = await self._get(
+            client,
+            _udf_client("filename=agg.lua,hash=def,type=LUA;"),
+            {"If-None-Match": first.headers["etag"]},
+        )
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+        assert second.json()[0]["hash"] == "def"
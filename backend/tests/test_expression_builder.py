@@ -0,0 +1,140 @@
+"""Tests for filter expression compilation and its memoization."""
+
+from __future__ import annotations
+
+import pytest
+
+from aerospike_cluster_manager_api import expression_builder
+from aerospike_cluster_manager_api.expression_builder import (
+    ALWAYS_FALSE,
+    ALWAYS_TRUE,
+    _ExpressionCache,
+    build_expression,
+    build_expression_uncached,
+    normalize,
+)
+from aerospike_cluster_manager_api.models.query import FilterGroup
+
+AGE_GT = {"bin": "age", "operator": "gt", "value": 30, "binType": "integer"}
+CITY_EQ = {"bin": "city", "operator": "eq", "value": "Seoul", "binType": "string"}
+NAME_RE = {"bin": "name", "operator": "regex", "value": "^A", "binType": "string"}
+
+
+def _group(*conditions: dict, logic: str = "and", groups: list[dict] | None = None) -> FilterGroup:
+    return FilterGroup.model_validate({"logic": logic, "conditions": list(conditions), "groups": groups or []})
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    expression_builder.clear_cache()
+    yield
+    expression_builder.clear_cache()
+
+
+def _key(group: FilterGroup) -> object:
+    node = normalize(group)
+    return node if isinstance(node, bool) else node.sort_key
+
+
+class TestNormalize:
+    def test_order_and_duplicates_do_not_matter(self):
+        assert _key(_group(AGE_GT, CITY_EQ, NAME_RE)) == _key(_group(NAME_RE, CITY_EQ, AGE_GT, CITY_EQ))
+        assert len(normalize(_group(NAME_RE, CITY_EQ, AGE_GT, CITY_EQ)).children) == 3
+
+    def test_logic_and_value_types_are_significant(self):
+        assert _key(_group(AGE_GT, CITY_EQ)) != _key(_group(AGE_GT, CITY_EQ, logic="or"))
+        as_float = {**AGE_GT, "value": 30.0}
+        assert _key(_group(AGE_GT)) != _key(_group(as_float))
+
+    def test_single_condition_ignores_logic(self):
+        assert _key(_group(AGE_GT, AGE_GT, logic="or")) == _key(_group(AGE_GT))
+
+    def test_nested_values_are_hashable(self):
+        geo = {"bin": "loc", "operator": "geo_within", "value": {"type": "Point", "coordinates": [1, 2]}}
+        assert hash(_key(_group(geo)))
+
+    def test_cheap_conditions_first(self):
+        geo = {"bin": "loc", "operator": "geo_within", "value": "{}", "binType": "geo"}
+        exists = {"bin": "flag", "operator": "exists"}
+        node = normalize(_group(geo, NAME_RE, CITY_EQ, AGE_GT, exists))
+        assert [c.cond.bin for c in node.children] == ["flag", "age", "city", "name", "loc"]
+
+    def test_nested_groups_are_flattened_and_ordered(self):
+        nested = _group(NAME_RE, groups=[{"logic": "and", "conditions": [AGE_GT]}])
+        assert _key(nested) == _key(_group(AGE_GT, NAME_RE))
+
+        or_group = {"logic": "or", "conditions": [NAME_RE, CITY_EQ]}
+        node = normalize(_group(AGE_GT, groups=[or_group]))
+        assert node.logic == "and"
+        assert node.children[0].cond.bin == "age"
+        assert [c.cond.bin for c in node.children[1].children] == ["city", "name"]
+
+    def test_constant_branches_fold(self):
+        empty_range = {"bin": "age", "operator": "between", "value": 50, "value2": 10, "binType": "integer"}
+        assert normalize(_group(AGE_GT, empty_range)) is False
+        # x OR false -> x
+        or_group = _group(CITY_EQ, groups=[{"conditions": [empty_range]}], logic="or")
+        assert _key(or_group) == _key(_group(CITY_EQ))
+
+    def test_contradictions_and_tautologies(self):
+        exists = {"bin": "x", "operator": "exists"}
+        missing = {"bin": "x", "operator": "not_exists"}
+        assert normalize(_group(exists, missing)) is False
+        assert normalize(_group(exists, missing, logic="or")) is True
+        assert normalize(_group(AGE_GT, groups=[{"logic": "or", "conditions": [exists, missing]}])).cond.bin == "age"
+        assert normalize(_group(CITY_EQ, {**CITY_EQ, "value": "Busan"})) is False
+        assert normalize(_group(CITY_EQ, {**CITY_EQ, "value": "Busan"}, logic="or")).logic == "or"
+
+
+class TestBuildExpression:
+    def test_equivalent_groups_share_an_entry(self):
+        first = build_expression(_group(AGE_GT, CITY_EQ))
+        second = build_expression(_group(CITY_EQ, AGE_GT, AGE_GT))
+        assert second is first
+        assert expression_builder.cache_info()["entries"] == 1
+        assert expression_builder.cache_info()["hits"] == 1
+
+    def test_cached_matches_uncached(self):
+        group = _group(NAME_RE, AGE_GT, CITY_EQ, logic="or")
+        assert build_expression(group) == build_expression_uncached(group)
+        assert build_expression(group)["__expr__"] == "or"
+
+    def test_nested_expression(self):
+        expr = build_expression(_group(NAME_RE, groups=[{"logic": "or", "conditions": [AGE_GT, CITY_EQ]}]))
+        assert expr["__expr__"] == "and"
+        assert [e["__expr__"] for e in expr["exprs"]] == ["or", "regex_compare"]
+
+    def test_constants(self):
+        exists = {"bin": "x", "operator": "exists"}
+        missing = {"bin": "x", "operator": "not_exists"}
+        assert build_expression(_group(exists, missing)) == ALWAYS_FALSE
+        assert build_expression(_group(exists, missing, logic="or")) == ALWAYS_TRUE
+
+    def test_duplicates_are_dropped_from_the_expression(self):
+        assert build_expression(_group(AGE_GT, AGE_GT)) == build_expression(_group(AGE_GT))
+
+    def test_repeated_group_skips_normalize(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(expression_builder, "normalize", lambda g: calls.append(g) or normalize(g))
+        first = build_expression(_group(AGE_GT, CITY_EQ))
+        assert build_expression(_group(AGE_GT, CITY_EQ)) is first
+        assert len(calls) == 1
+        assert build_expression(_group(CITY_EQ, AGE_GT)) is first
+        assert len(calls) == 2
+        info = expression_builder.cache_info()
+        assert (info["entries"], info["hits"], info["misses"]) == (1, 2, 1)
+
+    def test_cache_is_bounded(self):
+        cache = _ExpressionCache(maxsize=2)
+        groups = [_group({**AGE_GT, "value": v}) for v in range(3)]
+        for g in groups:
+            cache.get_or_build(g)
+        assert cache.info()["entries"] == 2
+        cache.get_or_build(groups[0])
+        assert cache.info()["misses"] == 4
+
+    def test_zero_size_disables_caching(self):
+        cache = _ExpressionCache(maxsize=0)
+        cache.get_or_build(_group(AGE_GT))
+        cache.get_or_build(_group(AGE_GT))
+        assert cache.info() == {"entries": 0, "maxSize": 0, "hits": 0, "misses": 2}
@@ -0,0 +1,208 @@
+"""Tests for the in-memory fake Aerospike client (AEROSPIKE_CLIENT=fake)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import aerospike_py
+import pytest
+from aerospike_py import exp
+from aerospike_py.exception import (
+    AerospikeTimeoutError,
+    IndexFoundError,
+    IndexNotFound,
+    RecordExistsError,
+    RecordNotFound,
+)
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.client_manager import ClientManager
+from aerospike_cluster_manager_api.fake_client import FakeAsyncClient
+from aerospike_cluster_manager_api.info_parser import aggregate_node_kv, aggregate_set_records, parse_records
+from aerospike_cluster_manager_api.main import app
+
+KEY = ("test", "demo", "user-1")
+
+
+async def _fake(**kwargs) -> FakeAsyncClient:
+    client = FakeAsyncClient({"hosts": [("localhost", 3000)]}, **kwargs)
+    await client.connect()
+    return client
+
+
+class TestRecords:
+    async def test_put_get_remove(self):
+        client = await _fake()
+        await client.put(KEY, {"name": "Ann", "age": 30})
+        await client.put(KEY, {"age": 31, "name": None})
+
+        record = await client.get(KEY)
+        assert record.bins == {"age": 31}
+        assert record.meta["gen"] == 2
+        assert record.key[:3] == KEY and len(record.key[3]) == 20
+
+        await client.remove(KEY)
+        with pytest.raises(RecordNotFound):
+            await client.get(KEY)
+
+    async def test_exists_policies(self):
+        client = await _fake()
+        with pytest.raises(RecordNotFound):
+            await client.put(KEY, {"a": 1}, policy={"exists": aerospike_py.POLICY_EXISTS_UPDATE_ONLY})
+        await client.put(KEY, {"a": 1, "b": 2}, policy={"exists": aerospike_py.POLICY_EXISTS_CREATE_ONLY})
+        with pytest.raises(RecordExistsError):
+            await client.put(KEY, {"a": 1}, policy={"exists": aerospike_py.POLICY_EXISTS_CREATE_ONLY})
+        await client.put(KEY, {"c": 3}, policy={"exists": aerospike_py.POLICY_EXISTS_REPLACE})
+        assert (await client.get(KEY)).bins == {"c": 3}
+
+    async def test_operate(self):
+        client = await _fake()
+        record = await client.operate(
+            KEY,
+            [
+                {"op": aerospike_py.OPERATOR_WRITE, "bin": "s", "val": "b"},
+                {"op": aerospike_py.OPERATOR_APPEND, "bin": "s", "val": "c"},
+                {"op": aerospike_py.OPERATOR_PREPEND, "bin": "s", "val": "a"},
+                {"op": aerospike_py.OPERATOR_INCR, "bin": "n", "val": 5},
+                {"op": aerospike_py.OPERATOR_READ, "bin": None, "val": None},
+            ],
+        )
+        assert record.bins == {"s": "abc", "n": 5}
+
+
+class TestQuery:
+    async def test_predicate_needs_an_index(self):
+        client = await _fake(records=50)
+        query = client.query("test", "sample_set")
+        query.where(("between", "bin_int", 0, 60))
+        with pytest.raises(IndexNotFound):
+            await query.results()
+
+        await client.index_integer_create("test", "sample_set", "bin_int", "idx_bin_int")
+        with pytest.raises(IndexFoundError):
+            await client.index_integer_create("test", "sample_set", "bin_int", "idx_bin_int")
+        records = await query.results()
+        assert records and all(r.bins["bin_int"] <= 60 for r in records)
+
+    async def test_filter_expression_and_select(self):
+        client = await _fake(records=50)
+        query = client.query("test", "sample_set")
+        query.select("bin_str")
+        expression = exp.and_(
+            exp.eq(exp.int_bin("bin_bool"), exp.int_val(1)),
+            exp.regex_compare("^h", aerospike_py.REGEX_ICASE, exp.string_bin("bin_str")),
+        )
+        records = await query.results({"filter_expression": expression})
+        expected = [
+            r
+            for r in await client.query("test", "sample_set").results()
+            if r.bins["bin_bool"] == 1 and r.bins["bin_str"].lower().startswith("h")
+        ]
+        assert {r.key[2] for r in records} == {r.key[2] for r in expected}
+        assert all(set(r.bins) == {"bin_str"} for r in records)
+
+    async def test_type_mismatch_filters_the_record_out(self):
+        client = await _fake()
+        await client.put(KEY, {"v": "text"})
+        records = await client.query("test", "demo").results(
+            {"filter_expression": exp.gt(exp.int_bin("v"), exp.int_val(0))}
+        )
+        assert records == []
+
+
+class TestInfo:
+    async def test_multi_node_replies_add_up(self):
+        client = await _fake(nodes=3, records=100)
+        assert client.get_node_names() == client.node_names
+        assert len(client.node_names) == 3
+
+        ns_stats = aggregate_node_kv(await client.info_all("namespace/test"), keys_to_sum={"objects"})
+        assert ns_stats["objects"] == str(100 * 2)
+        sets = aggregate_set_records(await client.info_all("sets/test"), replication_factor=2)
+        assert [(s["name"], s["objects"]) for s in sets] == [("sample_set", 100)]
+
+        await client.index_string_create("test", "sample_set", "bin_str", "idx_bin_str")
+        sindex = parse_records(await client.info_random_node("sindex/test"))
+        assert sindex[0]["indexname"] == "idx_bin_str" and sindex[0]["type"] == "string"
+
+    async def test_udf_list(self, tmp_path):
+        client = await _fake()
+        path = tmp_path / "module.lua"
+        path.write_text("function f(rec) return 1 end")
+        await client.udf_put(str(path))
+        assert (await client.info_random_node("udf-list")).startswith("filename=module.lua,hash=")
+
+
+class TestFaultInjection:
+    async def test_latency(self):
+        client = await _fake(latency_us=20_000)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await client.put(KEY, {"a": 1})
+        assert loop.time() - start >= 0.015
+
+    async def test_failures_are_reproducible(self):
+        async def outcomes(seed: int) -> list[bool]:
+            client = await _fake(failure_pct=30, seed=seed)
+            result = []
+            for _ in range(50):
+                try:
+                    await client.put(KEY, {"a": 1})
+                    result.append(True)
+                except AerospikeTimeoutError:
+                    result.append(False)
+            return result
+
+        first = await outcomes(7)
+        assert first == await outcomes(7)
+        assert 0 < first.count(False) < 50
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+async def api():
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+    app.state.limiter.enabled = False
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+async def test_client_manager_serves_the_api_from_the_fake(api: AsyncClient, sample_connection):
+    manager = ClientManager()
+    with (
+        patch.object(config, "AEROSPIKE_CLIENT", "fake"),
+        patch.object(config, "FAKE_AEROSPIKE_RECORDS", 0),
+        patch(
+            "aerospike_cluster_manager_api.client_manager.db.get_connection", AsyncMock(return_value=sample_connection)
+        ),
+        patch(
+            "aerospike_cluster_manager_api.dependencies.db.get_connection", AsyncMock(return_value=sample_connection)
+        ),
+        patch("aerospike_cluster_manager_api.dependencies.client_manager", manager),
+        patch("aerospike_cluster_manager_api.services.query_service.db.insert_query_history", AsyncMock()),
+    ):
+        created = await api.post(
+            "/api/sample-data/conn-test-1", json={"namespace": "test", "recordCount": 200, "registerUdfs": False}
+        )
+        cluster = await api.get("/api/clusters/conn-test-1")
+        page = await api.get("/api/records/conn-test-1", params={"ns": "test", "set": "sample_set", "pageSize": 500})
+        indexes = await api.get("/api/indexes/conn-test-1")
+
+    assert created.status_code == 201, created.text
+    assert isinstance(manager._clients["conn-test-1"], FakeAsyncClient)
+    assert cluster.status_code == 200, cluster.text
+    assert len(cluster.json()["nodes"]) == config.FAKE_AEROSPIKE_NODES
+    assert page.json()["total"] == 200
+    assert sorted(i["name"] for i in indexes.json()) == sorted(created.json()["indexesCreated"])
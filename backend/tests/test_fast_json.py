@@ -0,0 +1,92 @@
+"""Tests for orjson rendering of record responses."""
+
+from __future__ import annotations
+
+import base64
+import json
+
+from aerospike_py import Record
+from starlette.responses import Response
+
+from aerospike_cluster_manager_api.converters import record_to_model, records_to_dicts
+from aerospike_cluster_manager_api.fast_json import dumps, render
+from aerospike_cluster_manager_api.models.query import FilteredQueryResponse, QueryPlan
+from aerospike_cluster_manager_api.models.record import RecordListResponse
+
+
+def _record(bins: dict, pk: object = 1) -> Record:
+    return Record(key=("test", "demo", pk, bytes.fromhex("abcd")), meta={"gen": 3, "ttl": 60}, bins=bins)
+
+
+class TestRecordsToDicts:
+    def test_matches_validated_model_dump(self):
+        recs = [
+            _record({"n": 1, "s": "x", "l": [1, [2, {"k": "v"}]], "m": {"a": {"b": 1.5}}}),
+            Record(key=("test", "demo", None, None), meta=None, bins=None),
+            _record({"flag": True}, pk=None),
+        ]
+        expected = [record_to_model(r).model_dump(mode="json") for r in recs]
+        assert json.loads(dumps(records_to_dicts(recs))) == expected
+
+
+class TestDumps:
+    def test_response_model_uses_aliases_and_keeps_none(self):
+        value = FilteredQueryResponse.model_construct(
+            records=records_to_dicts([_record({"a": 1})]),
+            total=1,
+            page=1,
+            page_size=25,
+            has_more=False,
+            execution_time_ms=3,
+            scanned_records=1,
+            returned_records=1,
+            plan=QueryPlan(strategy="scan"),
+        )
+        out = json.loads(dumps(value))
+        assert out["pageSize"] == 25
+        assert out["hasMore"] is False
+        assert out["plan"]["indexName"] is None
+        assert out["records"][0]["key"]["digest"] == "abcd"
+
+    def test_same_output_as_pydantic(self):
+        recs = [_record({"i": i, "tags": ["a", i], "nested": {"x": [i, {"y": None}]}}) for i in range(3)]
+        validated = RecordListResponse(
+            records=[record_to_model(r) for r in recs], total=3, page=1, pageSize=25, hasMore=False
+        )
+        fast = RecordListResponse.model_construct(
+            records=records_to_dicts(recs), total=3, page=1, pageSize=25, hasMore=False
+        )
+        assert json.loads(dumps(fast)) == json.loads(validated.model_dump_json())
+
+    def test_utf8_bytes_written_as_text(self):
+        assert json.loads(dumps({"b": b"hello"})) == {"b": "hello"}
+
+    def test_binary_bytes_written_as_base64(self):
+        blob = bytes([0xFF, 0x00, 0x10])
+        assert json.loads(dumps({"b": blob, "l": [bytearray(blob)]})) == {
+            "b": base64.b64encode(blob).decode(),
+            "l": [base64.b64encode(blob).decode()],
+        }
+
+    def test_non_string_map_keys(self):
+        assert json.loads(dumps({"m": {1: "a", 2.5: "b", None: "c"}})) == {"m": {"1": "a", "2.5": "b", "null": "c"}}
+
+    def test_bytes_map_keys_fall_back(self):
+        assert json.loads(dumps({"m": {b"k": {b"\xff": 1}}})) == {"m": {"k": {base64.b64encode(b"\xff").decode(): 1}}}
+
+    def test_geojson_string_is_not_reencoded(self):
+        geo = '{"type": "Point", "coordinates": [126.97, 37.56]}'
+        assert json.loads(dumps({"loc": geo})) == {"loc": geo}
+
+    def test_nan_becomes_null(self):
+        assert json.loads(dumps({"f": float("nan")})) == {"f": None}
+
+
+class TestRender:
+    def test_carries_over_injected_response_headers(self):
+        injected = Response()
+        injected.headers["X-Query-Cache"] = "hit"
+        rendered = render({"a": 1}, injected)
+        assert rendered.headers["x-query-cache"] == "hit"
+        assert rendered.headers["content-length"] == str(len(b'{"a":1}'))
+        assert rendered.media_type == "application/json"
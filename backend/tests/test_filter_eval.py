@@ -0,0 +1,134 @@
+"""Tests for API-side evaluation of list/map content filter conditions."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aerospike_py import Record
+from pydantic import ValidationError
+
+from aerospike_cluster_manager_api.expression_builder import ALWAYS_TRUE, compile_filter
+from aerospike_cluster_manager_api.filter_eval import matches
+from aerospike_cluster_manager_api.models.query import FilterCondition, FilteredQueryRequest, FilterGroup
+from aerospike_cluster_manager_api.services.query_service import execute_filtered_query
+
+PROFILE = {
+    "profile": {"city": "Seoul", "age": 31, "tags": ["vip", "beta"], "addresses": [{"zip": "04524"}]},
+    "scores": [10, 20, 30],
+    "name": "Alice",
+}
+
+
+def _cond(**fields) -> FilterCondition:
+    return FilterCondition.model_validate({"binType": "map", **fields})
+
+
+class TestMatches:
+    @pytest.mark.parametrize(
+        ("fields", "expected"),
+        [
+            ({"bin": "profile", "path": ["city"], "operator": "eq", "value": "Seoul"}, True),
+            ({"bin": "profile", "path": ["city"], "operator": "eq", "value": "Busan"}, False),
+            ({"bin": "profile", "path": ["age"], "operator": "between", "value": 30, "value2": 40}, True),
+            ({"bin": "profile", "path": ["age"], "operator": "gt", "value": "30"}, False),  # type mismatch
+            ({"bin": "profile", "path": ["addresses", 0, "zip"], "operator": "contains", "value": "452"}, True),
+            ({"bin": "profile", "path": ["addresses", 5, "zip"], "operator": "exists"}, False),
+            ({"bin": "profile", "path": ["missing"], "operator": "ne", "value": 1}, False),
+            ({"bin": "profile", "path": ["missing"], "operator": "not_exists"}, True),
+            ({"bin": "profile", "path": ["tags"], "operator": "contains_value", "value": "vip"}, True),
+            ({"bin": "profile", "path": ["tags"], "operator": "size_ge", "value": 3}, False),
+            ({"bin": "profile", "operator": "size_eq", "value": 4}, True),
+            ({"bin": "profile", "operator": "not_contains_value", "value": "Seoul"}, False),
+            ({"bin": "scores", "binType": "list", "path": [-1], "operator": "eq", "value": 30}, True),
+            ({"bin": "scores", "binType": "list", "operator": "contains_value", "value": 20.0}, True),
+            ({"bin": "nope", "path": ["city"], "operator": "not_exists"}, True),
+            ({"bin": "name", "path": ["city"], "operator": "exists"}, False),  # not a map
+        ],
+    )
+    def test_conditions(self, fields, expected):
+        assert matches(_cond(**fields), PROFILE) is expected
+
+    def test_plain_conditions_follow_server_semantics(self):
+        assert matches(_cond(bin="name", operator="contains", value="LIC", binType="string"), PROFILE) is True
+        assert matches(_cond(bin="name", operator="eq", value=1, binType="integer"), PROFILE) is False
+        assert matches(_cond(bin="name", operator="exists", binType="integer"), PROFILE) is True
+
+    def test_validation(self):
+        with pytest.raises(ValidationError):
+            FilterCondition.model_validate({"bin": "p", "path": ["a"], "operator": "eq", "value": 1})
+        with pytest.raises(ValidationError):
+            _cond(bin="p", operator="size_eq", value="3")
+        geo = {"bin": "loc", "operator": "geo_within", "value": "{}", "binType": "geo"}
+        city = {"bin": "profile", "path": ["city"], "operator": "eq", "value": "Seoul", "binType": "map"}
+        with pytest.raises(ValidationError):
+            FilterGroup.model_validate({"logic": "or", "conditions": [geo, city]})
+        FilterGroup.model_validate({"conditions": [geo, city]})
+
+    def test_regex_stays_on_the_server(self):
+        with pytest.raises(ValidationError):
+            _cond(bin="profile", path=["city"], operator="regex", value="(a+)+$")
+        regex = {"bin": "name", "operator": "regex", "value": "(a+)+$"}
+        city = {"bin": "profile", "path": ["city"], "operator": "eq", "value": "Seoul", "binType": "map"}
+        with pytest.raises(ValidationError):
+            FilterGroup.model_validate({"logic": "or", "conditions": [regex, city]})
+        with pytest.raises(ValidationError):
+            FilterGroup.model_validate({"conditions": [city], "groups": [{"conditions": [regex, city]}]})
+        compiled = compile_filter(FilterGroup.model_validate({"conditions": [regex, city]}))
+        assert compiled.check_bins == frozenset({"profile"})
+
+
+class TestCompileFilter:
+    def test_prefilter_and_residual_check(self):
+        city = {"bin": "profile", "path": ["city"], "operator": "eq", "value": "Seoul", "binType": "map"}
+        name = {"bin": "name", "operator": "eq", "value": "Alice"}
+        compiled = compile_filter(FilterGroup.model_validate({"conditions": [city, name]}))
+        kinds = [e["__expr__"] for e in compiled.expression["exprs"]]
+        assert kinds == ["eq", "eq"]
+        assert compiled.expression["exprs"][0]["left"]["__expr__"] == "bin_type"
+        assert compiled.check_bins == frozenset({"profile"})
+        assert compiled.check(PROFILE) is True
+        assert compiled.check({**PROFILE, "profile": {"city": "Busan"}}) is False
+
+    def test_exact_filters_have_no_check(self):
+        compiled = compile_filter(FilterGroup.model_validate({"conditions": [{"bin": "name", "operator": "exists"}]}))
+        assert compiled.check is None
+
+    def test_not_exists_path_needs_no_server_filter(self):
+        cond = {"bin": "profile", "path": ["x"], "operator": "not_exists", "binType": "map"}
+        compiled = compile_filter(FilterGroup.model_validate({"conditions": [cond]}))
+        assert compiled.expression == ALWAYS_TRUE
+        assert compiled.check is not None
+
+
+class TestExecution:
+    async def test_records_filtered_before_paging_and_extra_bins_dropped(self):
+        records = [
+            Record(key=("test", "demo", i, b"d"), meta={"gen": 1, "ttl": 0}, bins={"name": n, "profile": {"city": c}})
+            for i, (n, c) in enumerate([("a", "Seoul"), ("b", "Busan"), ("c", "Seoul")])
+        ]
+        query = MagicMock()
+        query.results = AsyncMock(return_value=records)
+        client = MagicMock()
+        client.query = MagicMock(return_value=query)
+        client.info_random_node = AsyncMock(return_value="")
+        body = FilteredQueryRequest.model_validate(
+            {
+                "namespace": "test",
+                "set": "demo",
+                "selectBins": ["name"],
+                "pageSize": 1,
+                "filters": {
+                    "conditions": [
+                        {"bin": "profile", "path": ["city"], "operator": "eq", "value": "Seoul", "binType": "map"}
+                    ]
+                },
+            }
+        )
+        response = await execute_filtered_query(client, body, {})
+
+        query.select.assert_called_once_with("name", "profile")
+        assert response.total == 2
+        assert response.has_more is True
+        assert response.records[0]["bins"] == {"name": "a"}
+        assert response.plan.apiConditions == 1
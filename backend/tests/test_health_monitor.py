@@ -0,0 +1,74 @@
+"""Tests for the background connection health monitor."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aerospike_cluster_manager_api.health_monitor import HealthMonitor, probe_connection
+
+
+def _mock_aerospike_client() -> AsyncMock:
+    mock_client = AsyncMock()
+    mock_client.get_node_names = MagicMock(return_value=["BB9", "BB8", "BB7"])
+
+    async def _info(cmd: str) -> str:
+        return {"namespaces": "test;bar", "build": "8.1.0.3\n", "edition": "Aerospike Community Edition"}[cmd]
+
+    mock_client.info_random_node = AsyncMock(side_effect=_info)
+    return mock_client
+
+
+class TestProbeConnection:
+    async def test_connected(self):
+        with patch(
+            "aerospike_cluster_manager_api.health_monitor.client_manager.get_client",
+            AsyncMock(return_value=_mock_aerospike_client()),
+        ):
+            status = await probe_connection("conn-1")
+
+        assert status.connected is True
+        assert status.nodeCount == 3
+        assert status.namespaceCount == 2
+        assert status.build == "8.1.0.3"
+        assert status.latencyMs is not None
+        assert status.checkedAt is not None
+
+    async def test_unreachable_returns_disconnected(self):
+        with patch(
+            "aerospike_cluster_manager_api.health_monitor.client_manager.get_client",
+            AsyncMock(side_effect=OSError("refused")),
+        ):
+            status = await probe_connection("conn-1")
+
+        assert status.connected is False
+        assert status.nodeCount == 0
+        assert status.latencyMs is None
+
+
+class TestHealthMonitor:
+    async def test_refresh_all_caches_and_prunes(self, sample_connection):
+        monitor = HealthMonitor(interval=0, concurrency=4)
+        monitor._statuses["conn-deleted"] = AsyncMock()
+
+        with (
+            patch(
+                "aerospike_cluster_manager_api.health_monitor.db.get_all_connections",
+                AsyncMock(return_value=[sample_connection]),
+            ),
+            patch(
+                "aerospike_cluster_manager_api.health_monitor.client_manager.get_client",
+                AsyncMock(return_value=_mock_aerospike_client()),
+            ),
+        ):
+            await monitor.refresh_all()
+
+        cached = monitor.get_status(sample_connection.id)
+        assert cached is not None
+        assert cached.connected is True
+        assert monitor.get_status("conn-deleted") is None
+
+    async def test_zero_interval_does_not_start(self):
+        monitor = HealthMonitor(interval=0, concurrency=4)
+        monitor.start()
+        assert monitor._task is None
+        await monitor.stop()
@@ -0,0 +1,152 @@
+"""Tests for latency histograms and the slow-request breakdown."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.instrumentation import (
+    Histogram,
+    InstrumentedClient,
+    LatencyRecorder,
+    latency,
+    timed_database,
+)
+from aerospike_cluster_manager_api.main import app
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+async def client():
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+
+    app.state.limiter.enabled = False
+    latency.reset()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+class _FakeQuery:
+    async def results(self, _policy=None):
+        return ["r1", "r2"]
+
+
+class _FakeAerospike:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+
+    async def info_all(self, command: str):
+        await asyncio.sleep(self.delay)
+        return [("A", 0, command)]
+
+    async def info_random_node(self, command: str) -> str:
+        await asyncio.sleep(self.delay)
+        return ""
+
+    def get_node_names(self) -> list[str]:
+        return ["A"]
+
+    def query(self, ns: str, set_name: str) -> _FakeQuery:
+        return _FakeQuery()
+
+
+class TestHistogram:
+    def test_quantiles_use_bucket_upper_bounds(self):
+        h = Histogram()
+        for ms in [0.5] * 90 + [40] * 9 + [20_000]:
+            h.observe(ms)
+        assert h.count == 100
+        assert h.quantile(0.5) == 1
+        assert h.quantile(0.95) == 50
+        assert h.quantile(1.0) == 20_000
+        snap = h.snapshot()
+        assert snap["buckets"]["le1"] == 90
+        assert snap["buckets"]["inf"] == 1
+        assert snap["maxMs"] == 20_000
+
+    def test_empty(self):
+        assert Histogram().snapshot()["p99Ms"] == 0.0
+
+
+class TestInstrumentedClient:
+    async def test_records_operation_connection_and_breakdown(self):
+        recorder = LatencyRecorder()
+        with patch("aerospike_cluster_manager_api.instrumentation.latency", recorder):
+            wrapped = InstrumentedClient(_FakeAerospike(), "conn-1")
+            with recorder.request() as breakdown:
+                assert await wrapped.info_all("build") == [("A", 0, "build")]
+                assert await wrapped.query("test", "demo").results() == ["r1", "r2"]
+                assert wrapped.get_node_names() == ["A"]
+        hist = recorder.snapshot()["histograms"]
+        assert set(hist["aerospike"]) == {"info_all", "query"}
+        assert hist["connection"]["conn-1"]["count"] == 2
+        assert breakdown.calls["aerospike"] == 2
+
+    async def test_database_decorator(self):
+        recorder = LatencyRecorder()
+
+        @timed_database
+        async def get_connection(conn_id: str) -> str:
+            return conn_id
+
+        with patch("aerospike_cluster_manager_api.instrumentation.latency", recorder):
+            assert await get_connection("x") == "x"
+        assert recorder.snapshot()["histograms"]["database"]["get_connection"]["count"] == 1
+
+
+class TestRequestInstrumentation:
+    async def _get_udfs(self, client: AsyncClient, delay: float = 0.0, prefix: str = "/api/v1"):
+        aerospike = InstrumentedClient(_FakeAerospike(delay), "conn-test")
+        with (
+            patch(
+                "aerospike_cluster_manager_api.dependencies.db.get_connection",
+                AsyncMock(return_value={"id": "conn-test"}),
+            ),
+            patch(
+                "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+                AsyncMock(return_value=aerospike),
+            ),
+        ):
+            return await client.get(f"{prefix}/udfs/conn-test")
+
+    async def test_route_histograms_exposed(self, client: AsyncClient):
+        await self._get_udfs(client)
+        await self._get_udfs(client, prefix="/api")
+        body = (await client.get("/api/internal/metrics")).json()
+        routes = body["histograms"]["route"]
+        assert routes["GET /api/udfs/{conn_id}"]["count"] == 2
+        assert body["histograms"]["serialization"]["etag"]["count"] >= 1
+
+    async def test_slow_request_logged_with_breakdown(self, client: AsyncClient, caplog: pytest.LogCaptureFixture):
+        with (
+            patch.object(config, "SLOW_REQUEST_MS", 1),
+            caplog.at_level(logging.WARNING, logger="aerospike_cluster_manager_api.main"),
+        ):
+            await self._get_udfs(client, delay=0.01)
+        slow = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Slow request")]
+        assert len(slow) == 1
+        assert "/api/v1/udfs/conn-test" in slow[0]
+        assert "aerospike=" in slow[0] and "/1 " in slow[0]
+        assert "serialization=" in slow[0]
+        assert latency.slow_requests == 1
+
+    async def test_fast_requests_not_logged(self, client: AsyncClient, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.WARNING, logger="aerospike_cluster_manager_api.main"):
+            await self._get_udfs(client)
+        assert not [r for r in caplog.records if r.getMessage().startswith("Slow request")]
@@ -0,0 +1,125 @@
+"""Tests for on-demand request profiling."""
+
+from __future__ import annotations
+
+import pstats
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from aerospike_cluster_manager_api import config
+from aerospike_cluster_manager_api.main import app
+from aerospike_cluster_manager_api.profiling import ProfileStore, ProfilingMiddleware, profile_store
+from aerospike_cluster_manager_api.rate_limit import limiter
+
+TOKEN = "s3cret"
+PROFILE = {"X-Profile": "1", "X-Profile-Token": TOKEN}
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+def profiles(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(config, "PROFILING_TOKEN", TOKEN)
+    monkeypatch.setattr(profile_store, "_dir", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture()
+async def client(profiles: Path):
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+
+    app.state.limiter.enabled = False
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+def _busy_work() -> int:
+    return sum(i * i for i in range(20_000))
+
+
+async def _endpoint(_request):
+    return JSONResponse({"total": _busy_work()})
+
+
+class TestProfiledRequests:
+    async def test_profile_saved_under_request_id(self, client: AsyncClient, profiles: Path):
+        response = await client.get("/api/health", headers={**PROFILE, "X-Request-ID": "req-1"})
+        assert response.status_code == 200
+        assert response.headers["x-profile-id"] == "req-1"
+        assert (profiles / "req-1.prof").is_file()
+
+        report = await client.get("/api/internal/profiles/req-1", headers={"X-Profile-Token": TOKEN})
+        assert report.status_code == 200
+        assert "cumulative" in report.text
+
+        raw = await client.get("/api/internal/profiles/req-1?format=pstats", headers={"X-Profile-Token": TOKEN})
+        assert raw.status_code == 200
+        assert raw.content == (profiles / "req-1.prof").read_bytes()
+
+    async def test_unsafe_request_id_replaced(self, client: AsyncClient, profiles: Path):
+        response = await client.get("/api/health", headers={**PROFILE, "X-Request-ID": "../../etc/passwd"})
+        profile_id = response.headers["x-profile-id"]
+        assert "/" not in profile_id
+        assert [p.name for p in profiles.iterdir()] == [f"{profile_id}.prof"]
+
+    async def test_bad_token_rejected(self, client: AsyncClient, profiles: Path):
+        response = await client.get("/api/health", headers={"X-Profile": "1", "X-Profile-Token": "nope"})
+        assert response.status_code == 403
+        assert not list(profiles.iterdir())
+        fetch = await client.get("/api/internal/profiles/req-1", headers={"X-Profile-Token": "nope"})
+        assert fetch.status_code == 403
+
+    async def test_unknown_profile(self, client: AsyncClient):
+        response = await client.get("/api/internal/profiles/missing", headers={"X-Profile-Token": TOKEN})
+        assert response.status_code == 404
+
+    async def test_disabled_without_token(self, client: AsyncClient, profiles: Path, monkeypatch):
+        monkeypatch.setattr(config, "PROFILING_TOKEN", "")
+        response = await client.get("/api/health", headers=PROFILE)
+        assert response.status_code == 200
+        assert "x-profile-id" not in response.headers
+        assert (await client.get("/api/internal/profiles/x", headers=PROFILE)).status_code == 404
+
+
+class TestProfilingMiddleware:
+    async def test_global_rate_limit(self, profiles: Path):
+        rate_limit = "2/minute"
+        inner = Starlette(routes=[Route("/work", _endpoint)])
+        wrapped = ProfilingMiddleware(inner, store=ProfileStore(str(profiles), keep=10), rate_limit=rate_limit)
+        try:
+            async with AsyncClient(transport=ASGITransport(app=wrapped), base_url="http://test") as ac:
+                statuses = [(await ac.get("/work", headers=PROFILE)).status_code for _ in range(3)]
+                unprofiled = await ac.get("/work")
+        finally:
+            limiter.limiter.clear(wrapped.rate_limit, "request-profiling")
+        assert statuses == [200, 200, 429]
+        assert unprofiled.status_code == 200
+        assert len(list(profiles.glob("*.prof"))) == 2
+
+    async def test_profile_captures_endpoint_work(self, profiles: Path):
+        store = ProfileStore(str(profiles), keep=1)
+        wrapped = ProfilingMiddleware(
+            Starlette(routes=[Route("/work", _endpoint)]), store=store, rate_limit="100/second"
+        )
+        async with AsyncClient(transport=ASGITransport(app=wrapped), base_url="http://test") as ac:
+            first = await ac.get("/work", headers=PROFILE)
+            second = await ac.get("/work", headers=PROFILE)
+        stats = pstats.Stats(str(store.path(second.headers["x-profile-id"])))
+        assert any(func[2] == "_busy_work" for func in stats.stats)
+        # keep=1 prunes the older profile
+        assert not store.path(first.headers["x-profile-id"]).is_file()
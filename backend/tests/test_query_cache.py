@@ -0,0 +1,142 @@
+"""Tests for the query result cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from aerospike_cluster_manager_api.models.query import FilteredQueryRequest, QueryRequest, QueryResponse
+from aerospike_cluster_manager_api.query_cache import CachedResult, QueryResultCache
+
+
+def _response(scanned: int = 0) -> QueryResponse:
+    return QueryResponse(records=[], executionTimeMs=1, scannedRecords=scanned, returnedRecords=0)
+
+
+def _result(scanned: int = 0) -> CachedResult:
+    return CachedResult.of(_response(scanned))
+
+
+def _key(cache: QueryResultCache, set_name: str | None = "demo", page: int = 1, conn_id: str = "conn-1"):
+    body = FilteredQueryRequest(namespace="test", set=set_name, page=page)
+    return cache.key(conn_id, "filter", body, {})
+
+
+class TestKey:
+    def test_page_and_routing_are_part_of_the_key(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        assert _key(cache, page=1) != _key(cache, page=2)
+        body = QueryRequest(namespace="test", set="demo")
+        assert cache.key("conn-1", "query", body, {}) != cache.key("conn-1", "query", body, {"replica": 1})
+
+    def test_equivalent_requests_share_a_key(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        a = FilteredQueryRequest(namespace="test", set="demo", pageSize=25)
+        b = FilteredQueryRequest.model_validate({"set": "demo", "namespace": "test"})
+        assert cache.key("conn-1", "filter", a, {}) == cache.key("conn-1", "filter", b, {})
+
+    def test_equivalent_filters_share_a_key(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        age = {"bin": "age", "operator": "gt", "value": 30, "binType": "integer"}
+        name = {"bin": "name", "operator": "eq", "value": "Ann", "binType": "string"}
+
+        def key(filters: dict) -> tuple:
+            body = FilteredQueryRequest.model_validate({"namespace": "test", "set": "demo", "filters": filters})
+            return cache.key("conn-1", "filter", body, {})
+
+        flat = key({"logic": "and", "conditions": [age, name]})
+        assert key({"logic": "and", "conditions": [name, age]}) == flat
+        assert key({"logic": "and", "conditions": [age], "groups": [{"logic": "and", "conditions": [name]}]}) == flat
+        assert key({"logic": "or", "conditions": [age, name]}) != flat
+
+
+class TestQueryResultCache:
+    def test_hit_and_miss(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        key = _key(cache)
+        assert cache.get(key) is None
+        cache.put(key, _result(5), cache.generation(key))
+        assert cache.get(key).summary.scannedRecords == 5
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_ttl_expiry(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        key = _key(cache)
+        with patch("aerospike_cluster_manager_api.query_cache.time.monotonic", return_value=100.0):
+            cache.put(key, _result(), cache.generation(key))
+        with patch("aerospike_cluster_manager_api.query_cache.time.monotonic", return_value=131.0):
+            assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_bytes(self):
+        size = len(_result().body)
+        cache = QueryResultCache(ttl=30, max_bytes=size * 2)
+        first, second, third = (_key(cache, page=p) for p in (1, 2, 3))
+        cache.put(first, _result(), 0)
+        cache.put(second, _result(), 0)
+        cache.get(first)  # first becomes most recently used
+        cache.put(third, _result(), 0)
+
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.get(third) is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == size * 2
+
+    def test_invalidate_drops_set_and_namespace_wide_entries(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        demo, other, whole_ns = _key(cache, "demo"), _key(cache, "other"), _key(cache, None)
+        other_conn = _key(cache, "demo", conn_id="conn-2")
+        for key in (demo, other, whole_ns, other_conn):
+            cache.put(key, _result(), 0)
+
+        cache.invalidate("conn-1", "test", "demo")
+
+        assert cache.get(demo) is None
+        assert cache.get(whole_ns) is None
+        assert cache.get(other) is not None
+        assert cache.get(other_conn) is not None
+
+    def test_result_of_scan_racing_a_write_is_not_stored(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        key = _key(cache)
+        generation = cache.generation(key)
+        cache.invalidate("conn-1", "test", "demo")  # write lands while the scan runs
+        cache.put(key, _result(), generation)
+        assert cache.get(key) is None
+
+    def test_invalidate_connection(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        mine, theirs = _key(cache), _key(cache, conn_id="conn-2")
+        cache.put(mine, _result(), 0)
+        cache.put(theirs, _result(), 0)
+        cache.invalidate_connection("conn-1")
+        assert cache.get(mine) is None
+        assert cache.get(theirs) is not None
+
+    async def test_get_or_run(self):
+        cache = QueryResultCache(ttl=30, max_bytes=1 << 20)
+        key = _key(cache)
+        calls = 0
+
+        async def run() -> QueryResponse:
+            nonlocal calls
+            calls += 1
+            return _response(calls)
+
+        assert await cache.get_or_run(key, run) == (_result(1), False)
+        hit, cached = await cache.get_or_run(key, run)
+        assert cached is True and hit.body == _result(1).body
+        assert hit.summary.scannedRecords == 1
+        assert calls == 1
+
+    async def test_disabled_always_runs(self):
+        cache = QueryResultCache(ttl=0, max_bytes=1 << 20)
+        key = _key(cache)
+
+        async def run() -> QueryResponse:
+            return _response()
+
+        assert (await cache.get_or_run(key, run))[1] is False
+        assert (await cache.get_or_run(key, run))[1] is False
+        assert cache.stats()["entries"] == 0
@@ -0,0 +1,102 @@
+"""Tests for the filtered query explain service."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from aerospike_cluster_manager_api.models.query import FilteredQueryRequest
+from aerospike_cluster_manager_api.services.query_explain import explain_filtered_query
+
+SINDEX_RAW = "ns=test:indexname=idx_age:set=demo:bin=age:type=numeric:indextype=default:context=NULL:state=RW"
+
+INFO_ALL = {
+    "namespace/test": [
+        ("node-a", None, "objects=600;replication-factor=2"),
+        ("node-b", None, "objects=600;replication-factor=2"),
+    ],
+    "sets/test": [
+        ("node-a", None, "ns=test:set=demo:objects=500:tombstones=0"),
+        ("node-b", None, "ns=test:set=demo:objects=500:tombstones=0"),
+    ],
+    "sindex-stat:namespace=test;indexname=idx_age": [
+        ("node-a", None, "entries=500;entries_per_bval=4;entries_per_rec=1"),
+        ("node-b", None, "entries=500;entries_per_bval=6;entries_per_rec=1"),
+    ],
+}
+
+
+def _client(query_show: list[list[tuple[str, None, str]]] | None = None) -> MagicMock:
+    shows = iter(query_show or [])
+
+    async def info_all(cmd: str):
+        if cmd == "query-show":
+            return next(shows)
+        return INFO_ALL[cmd]
+
+    query = MagicMock()
+    query.results = AsyncMock(return_value=[SimpleNamespace()] * 3)
+    client = MagicMock()
+    client.info_random_node = AsyncMock(return_value=SINDEX_RAW)
+    client.info_all = AsyncMock(side_effect=info_all)
+    client.query = MagicMock(return_value=query)
+    return client
+
+
+def _request(operator: str, **extra) -> FilteredQueryRequest:
+    cond = {"bin": "age", "operator": operator, "value": 30, "binType": "integer", **extra}
+    name = {"bin": "name", "operator": "regex", "value": "^A", "binType": "string"}
+    return FilteredQueryRequest.model_validate(
+        {"namespace": "test", "set": "demo", "filters": {"logic": "and", "conditions": [cond, name]}}
+    )
+
+
+class TestExplain:
+    async def test_equality_estimate_from_entries_per_bval(self):
+        result = await explain_filtered_query(_client(), _request("eq"), {})
+        assert result.plan.strategy == "sindex"
+        assert result.plan.indexName == "idx_age"
+        assert result.predicate == ["equals", "age", 30]
+        assert result.expression["__expr__"] == "regex_compare"
+        assert result.estimateSource == "sindex_bval"
+        assert result.estimatedCandidates == 5  # (4 + 6) / rf 2
+        assert result.setObjects == 500
+        assert result.executed is False
+
+    async def test_range_estimate_is_capped_by_set_size(self):
+        result = await explain_filtered_query(_client(), _request("between", value2=40), {})
+        assert result.estimateSource == "sindex_entries"
+        assert result.estimatedCandidates == 500
+
+    async def test_scan_estimate_uses_set_objects(self):
+        body = FilteredQueryRequest.model_validate(
+            {
+                "namespace": "test",
+                "set": "demo",
+                "filters": {"conditions": [{"bin": "name", "operator": "regex", "value": "^A"}]},
+            }
+        )
+        result = await explain_filtered_query(_client(), body, {})
+        assert result.plan.strategy == "scan"
+        assert result.predicate is None
+        assert (result.estimatedCandidates, result.estimateSource) == (500, "set_objects")
+
+    async def test_execute_collects_new_jobs_per_node(self):
+        old_job = "trid=1:ns=test:set=demo:recs-succeeded=99:run-time=5"
+        new_job = "trid=2:ns=test:set=demo:recs-succeeded=3:recs-filtered-bins=7:run-time=12"
+        other_set = "trid=3:ns=test:set=other:recs-succeeded=50:run-time=1"
+        client = _client(
+            [
+                [("node-a", None, old_job), ("node-b", None, "")],
+                [("node-a", None, f"{old_job};{new_job};{other_set}"), ("node-b", None, new_job)],
+            ]
+        )
+        result = await explain_filtered_query(client, _request("eq"), {}, execute=True)
+
+        assert result.executed is True
+        assert result.returnedRecords == 3
+        assert [(s.node, s.recordsScanned, s.recordsReturned, s.elapsedMs) for s in result.nodeStats] == [
+            ("node-a", 10, 3, 12),
+            ("node-b", 10, 3, 12),
+        ]
+        client.query.return_value.where.assert_called_once_with(("equals", "age", 30))
@@ -0,0 +1,175 @@
+"""Tests for secondary-index selection in filtered queries."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from aerospike_cluster_manager_api.models.index import SecondaryIndex
+from aerospike_cluster_manager_api.models.query import FilteredQueryRequest, FilterGroup
+from aerospike_cluster_manager_api.services.index_service import parse_sindexes
+from aerospike_cluster_manager_api.services.query_planner import (
+    INT64_MAX,
+    IndexCardinality,
+    choose_plan,
+    plan_filtered_query,
+)
+from aerospike_cluster_manager_api.services.query_service import execute_filtered_query
+
+SINDEX_RAW = (
+    "ns=test:indexname=idx_age:set=demo:bin=age:type=numeric:indextype=default:context=NULL:state=RW;"
+    "ns=test:indexname=idx_city:set=NULL:bin=city:type=string:indextype=default:context=NULL:state=RW;"
+    "ns=test:indexname=idx_tags:set=demo:bin=tags:type=string:indextype=list:context=NULL:state=RW;"
+    "ns=test:indexname=idx_score:set=demo:bin=score:type=numeric:indextype=default:context=NULL:state=WO"
+)
+INDEXES = parse_sindexes("test", SINDEX_RAW)
+
+
+def _request(*conditions: dict, logic: str = "and", set_name: str = "demo") -> FilteredQueryRequest:
+    return FilteredQueryRequest.model_validate(
+        {"namespace": "test", "set": set_name, "filters": {"logic": logic, "conditions": list(conditions)}}
+    )
+
+
+AGE_GT = {"bin": "age", "operator": "gt", "value": 30, "binType": "integer"}
+CITY_EQ = {"bin": "city", "operator": "eq", "value": "Seoul", "binType": "string"}
+NAME_RE = {"bin": "name", "operator": "regex", "value": "^A", "binType": "string"}
+
+
+class TestParseSindexes:
+    def test_fields(self):
+        by_name = {i.name: i for i in INDEXES}
+        assert by_name["idx_age"] == SecondaryIndex(
+            name="idx_age", namespace="test", set="demo", bin="age", type="numeric", state="ready"
+        )
+        assert by_name["idx_tags"].collection == "list"
+        assert by_name["idx_score"].state == "building"
+
+
+class TestChoosePlan:
+    def test_equality_beats_range(self):
+        plan = choose_plan(_request(AGE_GT, CITY_EQ, NAME_RE), INDEXES)
+        assert plan.strategy == "sindex"
+        assert plan.index.name == "idx_city"
+        assert plan.predicate == ("equals", "city", "Seoul")
+        assert [c.bin for c in plan.filters.conditions] == ["age", "name"]
+
+    def test_one_sided_range_becomes_between(self):
+        plan = choose_plan(_request(AGE_GT, NAME_RE), INDEXES)
+        assert plan.predicate == ("between", "age", 31, INT64_MAX)
+        assert plan.describe().expressionConditions == 1
+
+    def test_single_condition_leaves_no_expression(self):
+        plan = choose_plan(_request(CITY_EQ), INDEXES)
+        assert plan.filters is None
+        assert plan.describe().strategy == "sindex"
+
+    def test_set_index_not_used_for_other_sets(self):
+        plan = choose_plan(_request(AGE_GT, set_name="other"), INDEXES)
+        assert plan.strategy == "scan"
+
+    def test_namespace_index_serves_any_set(self):
+        assert choose_plan(_request(CITY_EQ, set_name="other"), INDEXES).index.name == "idx_city"
+
+    def test_or_group_scans(self):
+        plan = choose_plan(_request(AGE_GT, CITY_EQ, logic="or"), INDEXES)
+        assert plan.strategy == "scan"
+        assert len(plan.filters.conditions) == 2
+
+    def test_ineligible_indexes_and_types(self):
+        tags = {"bin": "tags", "operator": "eq", "value": "x", "binType": "string"}
+        building = {"bin": "score", "operator": "eq", "value": 1, "binType": "integer"}
+        mistyped = {"bin": "age", "operator": "eq", "value": "30", "binType": "string"}
+        not_equal = {"bin": "age", "operator": "ne", "value": 30, "binType": "integer"}
+        for cond in (tags, building, mistyped, not_equal):
+            assert choose_plan(_request(cond), INDEXES).strategy == "scan", cond
+
+    def test_predicate_uses_an_index_of_the_set_and_type(self):
+        def plan(predicate: dict, set_name: str = "demo"):
+            body = FilteredQueryRequest.model_validate({"namespace": "test", "set": set_name, "predicate": predicate})
+            return choose_plan(body, INDEXES)
+
+        assert plan({"bin": "age", "operator": "equals", "value": 30}).index.name == "idx_age"
+        assert plan({"bin": "age", "operator": "equals", "value": 30}, set_name="other").index is None
+        assert plan({"bin": "age", "operator": "equals", "value": "30"}).index is None
+        assert plan({"bin": "tags", "operator": "contains", "value": "x"}).index.name == "idx_tags"
+
+    def test_cardinality_outranks_operator(self):
+        # City has few distinct values, so an equality on it reads more entries than the age range
+        cardinality = {"idx_city": IndexCardinality(10_000, 5_000.0), "idx_age": IndexCardinality(800, 1.0)}
+        plan = choose_plan(_request(AGE_GT, CITY_EQ), INDEXES, cardinality)
+        assert plan.index.name == "idx_age"
+        assert choose_plan(_request(AGE_GT, CITY_EQ), INDEXES, {"idx_age": cardinality["idx_age"]}).index.name == (
+            "idx_city"
+        )
+
+    def test_primary_key(self):
+        body = FilteredQueryRequest(namespace="test", set="demo", primaryKey="1")
+        assert choose_plan(body, INDEXES).strategy == "pk_lookup"
+
+
+class TestPlanFilteredQuery:
+    async def test_index_lookup_failure_falls_back_to_scan(self):
+        client = MagicMock()
+        client.info_random_node = AsyncMock(side_effect=RuntimeError("boom"))
+        plan = await plan_filtered_query(client, _request(CITY_EQ))
+        assert plan.strategy == "scan"
+
+    async def test_reads_index_statistics_when_several_indexes_qualify(self):
+        stats = {
+            "sindex-stat:namespace=test;indexname=idx_city": "entries=10000;entries_per_bval=5000",
+            "sindex-stat:namespace=test;indexname=idx_age": "entries=800;entries_per_bval=1",
+        }
+        client = MagicMock()
+        client.info_random_node = AsyncMock(return_value=SINDEX_RAW)
+        client.info_all = AsyncMock(side_effect=lambda cmd: [("node-a", None, stats[cmd])])
+
+        assert (await plan_filtered_query(client, _request(AGE_GT, CITY_EQ))).index.name == "idx_age"
+        assert client.info_all.await_count == 2
+
+        client.info_all.reset_mock()
+        assert (await plan_filtered_query(client, _request(CITY_EQ, NAME_RE))).index.name == "idx_city"
+        client.info_all.assert_not_awaited()
+
+    async def test_no_filters_skips_index_lookup(self):
+        client = MagicMock()
+        client.info_random_node = AsyncMock()
+        plan = await plan_filtered_query(client, FilteredQueryRequest(namespace="test"))
+        assert plan.strategy == "scan"
+        client.info_random_node.assert_not_awaited()
+
+
+class TestNestedFilters:
+    def test_top_level_condition_promoted_nested_group_kept(self):
+        body = FilteredQueryRequest.model_validate(
+            {
+                "namespace": "test",
+                "set": "demo",
+                "filters": {"conditions": [CITY_EQ], "groups": [{"logic": "or", "conditions": [AGE_GT, NAME_RE]}]},
+            }
+        )
+        plan = choose_plan(body, INDEXES)
+        assert plan.index.name == "idx_city"
+        assert plan.filters.groups[0].logic == "or"
+        assert plan.describe().expressionConditions == 2
+
+    def test_depth_and_emptiness_are_validated(self):
+        nested: dict = {"conditions": [CITY_EQ]}
+        for _ in range(4):
+            nested = {"groups": [nested]}
+        with pytest.raises(ValidationError):
+            FilterGroup.model_validate(nested)
+        with pytest.raises(ValidationError):
+            FilterGroup.model_validate({"logic": "and"})
+
+    async def test_contradictory_filter_skips_the_cluster(self):
+        exists = {"bin": "x", "operator": "exists"}
+        missing = {"bin": "x", "operator": "not_exists"}
+        client = MagicMock()
+        client.info_random_node = AsyncMock(return_value=SINDEX_RAW)
+        response = await execute_filtered_query(client, _request(CITY_EQ, exists, missing, set_name="other"), {})
+        assert response.records == []
+        assert response.plan.strategy == "scan"
+        client.query.assert_not_called()
@@ -0,0 +1,179 @@
+"""Integration tests for the query router (saved queries and history)."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from aerospike_cluster_manager_api.main import app
+from aerospike_cluster_manager_api.models.query import SavedQuery
+from aerospike_cluster_manager_api.services import query_service
+
+SAVED = SavedQuery(
+    id="sq-1",
+    connectionId="conn-test",
+    name="demo scan",
+    kind="query",
+    request={"namespace": "test", "set": "demo"},
+    digest="abc",
+    createdAt="2025-01-01T00:00:00+00:00",
+    updatedAt="2025-01-01T00:00:00+00:00",
+)
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+async def client():
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+
+    app.state.limiter.enabled = False
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+def _mock_aerospike() -> MagicMock:
+    query = MagicMock()
+    query.results = AsyncMock(
+        return_value=[SimpleNamespace(key=("test", "demo", 1, b"\x01"), meta={"gen": 1, "ttl": 0}, bins={"a": 1})]
+    )
+    mock_client = MagicMock()
+    mock_client.query = MagicMock(return_value=query)
+    return mock_client
+
+
+@pytest.fixture()
+def mocked_db(sample_connection):
+    with (
+        patch(
+            "aerospike_cluster_manager_api.dependencies.db.get_connection",
+            AsyncMock(return_value=sample_connection),
+        ),
+        patch("aerospike_cluster_manager_api.routers.query.db") as db_mock,
+        patch("aerospike_cluster_manager_api.services.query_service.db.insert_query_history", AsyncMock()) as history,
+        patch(
+            "aerospike_cluster_manager_api.services.query_service.db.prune_query_history", AsyncMock(return_value=0)
+        ) as prune,
+        patch(
+            "aerospike_cluster_manager_api.services.query_service.db.store_saved_query_snapshot", AsyncMock()
+        ) as store_snapshot,
+        patch.dict(query_service._pruned_at, clear=True),
+    ):
+        db_mock.get_saved_query = AsyncMock(return_value=SAVED)
+        db_mock.store_saved_query_snapshot = store_snapshot
+        db_mock.history = history
+        db_mock.prune = prune
+        yield db_mock
+
+
+class TestRunSavedQuery:
+    async def test_fresh_snapshot_is_served_without_scanning(self, client: AsyncClient, mocked_db):
+        taken_at = datetime.now(UTC) - timedelta(seconds=5)
+        snapshot = '{"records":[],"executionTimeMs":12,"scannedRecords":40,"returnedRecords":0}'
+        mocked_db.get_saved_query_snapshot = AsyncMock(return_value=(snapshot, taken_at))
+        aerospike = _mock_aerospike()
+
+        with patch(
+            "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+            AsyncMock(return_value=aerospike),
+        ):
+            response = await client.post("/api/query/conn-test/saved/sq-1/run")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["cached"] is True
+        assert body["result"]["scannedRecords"] == 40
+        aerospike.query.assert_not_called()
+        assert mocked_db.history.await_args.kwargs["cached"] is True
+
+    async def test_stale_snapshot_rescans_and_stores(self, client: AsyncClient, mocked_db):
+        taken_at = datetime.now(UTC) - timedelta(days=1)
+        snapshot = '{"records":[],"executionTimeMs":12,"scannedRecords":40,"returnedRecords":0}'
+        mocked_db.get_saved_query_snapshot = AsyncMock(return_value=(snapshot, taken_at))
+        aerospike = _mock_aerospike()
+
+        with patch(
+            "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+            AsyncMock(return_value=aerospike),
+        ):
+            response = await client.post("/api/query/conn-test/saved/sq-1/run")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["cached"] is False
+        assert body["result"]["returnedRecords"] == 1
+        aerospike.query.assert_called_once_with("test", "demo")
+        mocked_db.store_saved_query_snapshot.assert_awaited_once()
+        stored = orjson.loads(mocked_db.store_saved_query_snapshot.await_args.args[1])
+        assert stored["returnedRecords"] == 1 and stored["records"] == body["result"]["records"]
+        assert mocked_db.history.await_args.kwargs["cached"] is False
+
+    async def test_refresh_bypasses_snapshot(self, client: AsyncClient, mocked_db):
+        mocked_db.get_saved_query_snapshot = AsyncMock()
+        aerospike = _mock_aerospike()
+
+        with patch(
+            "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+            AsyncMock(return_value=aerospike),
+        ):
+            response = await client.post("/api/query/conn-test/saved/sq-1/run", params={"refresh": "true"})
+
+        assert response.status_code == 200
+        assert response.json()["cached"] is False
+        mocked_db.get_saved_query_snapshot.assert_not_awaited()
+
+
+class TestHistoryRetention:
+    async def test_history_is_pruned_once_per_interval(self, client: AsyncClient, mocked_db):
+        snapshot = '{"records":[],"executionTimeMs":12,"scannedRecords":40,"returnedRecords":0}'
+        mocked_db.get_saved_query_snapshot = AsyncMock(return_value=(snapshot, datetime.now(UTC)))
+
+        with patch(
+            "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+            AsyncMock(return_value=_mock_aerospike()),
+        ):
+            for _ in range(2):
+                response = await client.post("/api/query/conn-test/saved/sq-1/run")
+                assert response.status_code == 200
+
+        assert mocked_db.history.await_count == 2
+        mocked_db.prune.assert_awaited_once()
+        assert mocked_db.prune.await_args.args == ("conn-test",)
+        assert mocked_db.prune.await_args.kwargs["older_than"] < datetime.now(UTC) - timedelta(days=29)
+
+
+class TestSaveQuery:
+    async def test_invalid_request_rejected(self, client: AsyncClient, mocked_db):
+        response = await client.post(
+            "/api/query/conn-test/saved",
+            json={"name": "bad", "kind": "filter", "request": {"namespace": "test", "pageSize": 0}},
+        )
+        assert response.status_code == 422
+
+    async def test_duplicate_name_conflicts(self, client: AsyncClient, mocked_db):
+        mocked_db.create_saved_query = AsyncMock(return_value=False)
+        response = await client.post(
+            "/api/query/conn-test/saved",
+            json={"name": "demo scan", "kind": "query", "request": {"namespace": "test"}},
+        )
+        assert response.status_code == 409
+
+    async def test_forget_drops_the_connections_prune_time(self, mocked_db):
+        query_service._pruned_at["conn-test"] = 1.0
+        query_service.forget("conn-test")
+        assert "conn-test" not in query_service._pruned_at
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
@@ -34,7 +34,7 @@ async def client():
 
 
 class TestGetRecordDetail:
-    async def test_returns_single_record(self, client: AsyncClient):
+    async def test_returns_single_record(self, client: AsyncClient, sample_connection):
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(
             return_value=SimpleNamespace(
@@ -47,7 +47,7 @@ class TestGetRecordDetail:
         with (
             patch(
                 "aerospike_cluster_manager_api.dependencies.db.get_connection",
-                AsyncMock(return_value={"id": "conn-test"}),
+                AsyncMock(return_value=sample_connection),
             ),
             patch(
                 "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
@@ -79,7 +79,7 @@ class TestGetRecordDetail:
         }
         mock_client.get.assert_awaited_once_with(("test", "demo", 42), policy=POLICY_READ)
 
-    async def test_returns_404_for_missing_record(self, client: AsyncClient):
+    async def test_returns_404_for_missing_record(self, client: AsyncClient, sample_connection):
         from aerospike_py.exception import RecordNotFound
 
         mock_client = AsyncMock()
@@ -88,7 +88,7 @@ class TestGetRecordDetail:
         with (
             patch(
                 "aerospike_cluster_manager_api.dependencies.db.get_connection",
-                AsyncMock(return_value={"id": "conn-test"}),
+                AsyncMock(return_value=sample_connection),
             ),
             patch(
                 "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
@@ -102,3 +102,68 @@ class TestGetRecordDetail:
 
         assert response.status_code == 404
         assert response.json() == {"detail": "Record not found"}
+
+    async def test_read_routing_from_profile_and_query(self, client: AsyncClient, sample_connection):
+        import aerospike_py
+
+        profile = sample_connection.model_copy(update={"readReplica": "prefer_rack", "rackId": 2})
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(
+            return_value=SimpleNamespace(key=("test", "demo", 1, None), meta={"gen": 1, "ttl": 0}, bins={})
+        )
+
+        with (
+            patch(
+                "aerospike_cluster_manager_api.dependencies.db.get_connection",
+                AsyncMock(return_value=profile),
+            ),
+            patch(
+                "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+                AsyncMock(return_value=mock_client),
+            ),
+        ):
+            await client.get(
+                "/api/records/conn-test/detail",
+                params={"ns": "test", "set": "demo", "pk": "1"},
+            )
+            await client.get(
+                "/api/records/conn-test/detail",
+                params={"ns": "test", "set": "demo", "pk": "1", "replica": "sequence", "readModeAp": "all"},
+            )
+
+        first, second = mock_client.get.await_args_list
+        assert first.kwargs["policy"] == {**POLICY_READ, "replica": aerospike_py.POLICY_REPLICA_PREFER_RACK}
+        assert second.kwargs["policy"] == {
+            **POLICY_READ,
+            "replica": aerospike_py.POLICY_REPLICA_SEQUENCE,
+            "read_mode_ap": aerospike_py.POLICY_READ_MODE_AP_ALL,
+        }
+
+
+class TestFilteredRecordsCache:
+    async def test_repeat_is_cached_until_a_write(self, client: AsyncClient, sample_connection):
+        query = MagicMock()
+        query.results = AsyncMock(return_value=[])
+        mock_client = MagicMock()
+        mock_client.query = MagicMock(return_value=query)
+        mock_client.remove = AsyncMock()
+        body = {"namespace": "test", "set": "demo", "pageSize": 10}
+
+        with (
+            patch(
+                "aerospike_cluster_manager_api.dependencies.db.get_connection",
+                AsyncMock(return_value=sample_connection),
+            ),
+            patch(
+                "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+                AsyncMock(return_value=mock_client),
+            ),
+            patch("aerospike_cluster_manager_api.services.query_service.db.insert_query_history", AsyncMock()),
+        ):
+            first = await client.post("/api/records/conn-test/filter", json=body)
+            second = await client.post("/api/records/conn-test/filter", json=body)
+            await client.delete("/api/records/conn-test", params={"ns": "test", "set": "demo", "pk": "1"})
+            third = await client.post("/api/records/conn-test/filter", json=body)
+
+        assert [r.headers["X-Query-Cache"] for r in (first, second, third)] == ["miss", "hit", "miss"]
+        assert query.results.await_count == 2
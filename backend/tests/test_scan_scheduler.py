@@ -0,0 +1,141 @@
+"""Tests for per-connection scan admission control."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from aerospike_cluster_manager_api.scan_scheduler import Priority, ScanScheduler
+
+
+async def _hold(
+    scheduler: ScanScheduler, conn_id: str, priority: Priority, release: asyncio.Event, log: list, name: str
+):
+    async with scheduler.admit(conn_id, priority, kind="test", request_id=name) as slot:
+        log.append((name, slot.position))
+        await release.wait()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAdmission:
+    async def test_admits_up_to_limit_immediately(self):
+        scheduler = ScanScheduler(max_concurrent=2, max_queued=10, timeout=5)
+        release = asyncio.Event()
+        log: list = []
+        tasks = [
+            asyncio.create_task(_hold(scheduler, "c1", Priority.INTERACTIVE, release, log, f"r{i}")) for i in range(3)
+        ]
+        await _settle()
+
+        assert log == [("r0", 0), ("r1", 0)]
+        status = scheduler.status("c1")
+        assert status["running"] == 2
+        assert [q["requestId"] for q in status["queued"]] == ["r2"]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert log[-1] == ("r2", 1)
+        assert scheduler.stats()["connections"] == 0
+
+    async def test_connections_are_independent(self):
+        scheduler = ScanScheduler(max_concurrent=1, max_queued=10, timeout=5)
+        release = asyncio.Event()
+        log: list = []
+        tasks = [
+            asyncio.create_task(_hold(scheduler, conn, Priority.INTERACTIVE, release, log, conn))
+            for conn in ("c1", "c2")
+        ]
+        await _settle()
+        assert sorted(log) == [("c1", 0), ("c2", 0)]
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_interactive_is_admitted_before_background(self):
+        scheduler = ScanScheduler(max_concurrent=1, max_queued=10, timeout=5)
+        gates = {name: asyncio.Event() for name in ("first", "bg", "ui")}
+        log: list = []
+        first = asyncio.create_task(_hold(scheduler, "c1", Priority.INTERACTIVE, gates["first"], log, "first"))
+        await _settle()
+        bg = asyncio.create_task(_hold(scheduler, "c1", Priority.BACKGROUND, gates["bg"], log, "bg"))
+        await _settle()
+        ui = asyncio.create_task(_hold(scheduler, "c1", Priority.INTERACTIVE, gates["ui"], log, "ui"))
+        await _settle()
+
+        queued = scheduler.status("c1")["queued"]
+        assert [(q["requestId"], q["priority"], q["position"]) for q in queued] == [
+            ("ui", "interactive", 1),
+            ("bg", "background", 2),
+        ]
+
+        for gate in gates.values():
+            gate.set()
+        await asyncio.gather(first, bg, ui)
+        assert [name for name, _ in log] == ["first", "ui", "bg"]
+
+    async def test_disabled_when_limit_is_zero(self):
+        scheduler = ScanScheduler(max_concurrent=0, max_queued=0, timeout=5)
+        async with scheduler.admit("c1", Priority.INTERACTIVE, kind="test") as slot:
+            assert slot.position == 0
+        assert scheduler.stats()["running"] == 0
+
+
+class TestRejection:
+    async def test_full_queue_returns_503(self):
+        scheduler = ScanScheduler(max_concurrent=1, max_queued=1, timeout=5)
+        release = asyncio.Event()
+        log: list = []
+        tasks = [
+            asyncio.create_task(_hold(scheduler, "c1", Priority.INTERACTIVE, release, log, f"r{i}")) for i in range(2)
+        ]
+        await _settle()
+
+        with pytest.raises(HTTPException) as exc_info:
+            async with scheduler.admit("c1", Priority.INTERACTIVE, kind="test"):
+                pass
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "5"}
+        assert scheduler.stats()["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_queue_timeout_returns_503_and_frees_place(self):
+        scheduler = ScanScheduler(max_concurrent=1, max_queued=10, timeout=0.01)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(scheduler, "c1", Priority.INTERACTIVE, release, [], "holder"))
+        await _settle()
+
+        with pytest.raises(HTTPException) as exc_info:
+            async with scheduler.admit("c1", Priority.INTERACTIVE, kind="test"):
+                pass
+        assert exc_info.value.status_code == 503
+        assert scheduler.status("c1")["queued"] == []
+        assert scheduler.stats()["timedOut"] == 1
+
+        release.set()
+        await holder
+        assert scheduler.stats()["running"] == 0
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = ScanScheduler(max_concurrent=1, max_queued=10, timeout=5)
+        release = asyncio.Event()
+        log: list = []
+        holder = asyncio.create_task(_hold(scheduler, "c1", Priority.INTERACTIVE, release, log, "holder"))
+        await _settle()
+        waiter = asyncio.create_task(_hold(scheduler, "c1", Priority.INTERACTIVE, release, log, "waiter"))
+        await _settle()
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert scheduler.status("c1")["queued"] == []
+
+        release.set()
+        await holder
+        assert [name for name, _ in log] == ["holder"]
+        assert scheduler.stats() == {"connections": 0, "running": 0, "queued": 0, "rejected": 0, "timedOut": 0}
@@ -0,0 +1,128 @@
+"""Tests for records-per-second scan throttling."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from aerospike_cluster_manager_api import scan_throttle
+from aerospike_cluster_manager_api.main import app
+from aerospike_cluster_manager_api.scan_throttle import TokenBucket, resolve
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+async def client():
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+
+    app.state.limiter.enabled = False
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+@pytest.fixture(autouse=True)
+def _reset_buckets():
+    yield
+    scan_throttle.reset()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_debt_is_repaid_at_the_rate(self):
+        clock = _Clock()
+        bucket = TokenBucket(100, clock=clock)
+        assert bucket.delay() == 0
+        bucket.charge(300)  # 100 of burst, 200 of debt
+        assert bucket.delay() == pytest.approx(2.0)
+        clock.now = 1.5
+        assert bucket.delay() == pytest.approx(0.5)
+        clock.now = 10
+        assert bucket.delay() == 0
+        assert bucket.idle
+
+
+class TestResolve:
+    def test_rate_is_split_across_nodes(self):
+        throttle = resolve("c", 1000, False, node_count=4)
+        assert throttle.policy == {"records_per_second": 250}
+
+    def test_low_priority_defaults(self):
+        with patch.object(scan_throttle.config, "SCAN_LOW_PRIORITY_RECORDS_PER_SECOND", 500):
+            throttle = resolve("c", None, True, node_count=1)
+        assert throttle.records_per_second == 500
+        assert throttle.policy == {"records_per_second": 500, "max_concurrent_nodes": 1}
+
+    def test_configured_cap(self):
+        with patch.object(scan_throttle.config, "SCAN_MAX_RECORDS_PER_SECOND", 200):
+            assert resolve("c", None, False, 1).records_per_second == 200
+            assert resolve("c", 5000, False, 1).records_per_second == 200
+            assert resolve("c", 50, False, 1).records_per_second == 50
+
+    def test_unthrottled(self):
+        assert resolve("c", None, False, 3).policy == {}
+
+
+class TestRun:
+    async def test_second_scan_waits_for_debt(self):
+        throttle = resolve("c", 100, False, 1)
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+            bucket = scan_throttle._buckets[("c", 100)]
+            bucket.charge(-int(delay * 100) - 1)
+
+        with patch.object(scan_throttle.asyncio, "sleep", fake_sleep):
+            await throttle.run(AsyncMock(return_value=list(range(250))), len, kind="records")
+            await throttle.run(AsyncMock(return_value=[]), len, kind="records")
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(1.5, abs=0.05)
+
+
+class TestRecordsEndpoint:
+    async def test_throttle_params_reach_the_query_policy(self, client: AsyncClient, sample_connection):
+        query = MagicMock()
+        query.results = AsyncMock(return_value=[SimpleNamespace(key=("test", "demo", 1, b"\x01"), meta={}, bins={})])
+        mock_client = MagicMock()
+        mock_client.query = MagicMock(return_value=query)
+        mock_client.get_node_names = MagicMock(return_value=["A", "B"])
+        with (
+            patch(
+                "aerospike_cluster_manager_api.dependencies.db.get_connection",
+                AsyncMock(return_value=sample_connection),
+            ),
+            patch(
+                "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+                AsyncMock(return_value=mock_client),
+            ),
+        ):
+            response = await client.get(
+                "/api/records/conn-test",
+                params={"ns": "test", "set": "demo", "recordsPerSecond": 1000, "lowPriority": "true"},
+            )
+
+        assert response.status_code == 200
+        policy = query.results.await_args.args[0]
+        assert policy["records_per_second"] == 500
+        assert policy["max_concurrent_nodes"] == 1
@@ -0,0 +1,148 @@
+"""Tests for coalescing identical concurrent reads."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from aerospike_cluster_manager_api.main import app
+from aerospike_cluster_manager_api.singleflight import SingleFlight
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+async def client():
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+
+    app.state.limiter.enabled = False
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+class _Gate:
+    """Counts calls and blocks them until released."""
+
+    def __init__(self, result: object = "value", error: Exception | None = None) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    async def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        gate = _Gate()
+        tasks = [asyncio.create_task(flight.do(("udfs", "c1"), gate)) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.release.set()
+
+        assert await asyncio.gather(*tasks) == ["value"] * 5
+        assert gate.calls == 1
+        assert flight.stats() == {"inflight": 0, "leaders": 1, "shared": 4}
+
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+        gate = _Gate()
+        gate.release.set()
+        await asyncio.gather(flight.do(("udfs", "c1"), gate), flight.do(("udfs", "c2"), gate))
+        assert gate.calls == 2
+
+    async def test_sequential_calls_are_not_cached(self):
+        flight = SingleFlight()
+        gate = _Gate()
+        gate.release.set()
+        await flight.do("k", gate)
+        await flight.do("k", gate)
+        assert gate.calls == 2
+
+    async def test_exception_reaches_every_caller(self):
+        flight = SingleFlight()
+        gate = _Gate(error=RuntimeError("boom"))
+        tasks = [asyncio.create_task(flight.do("k", gate)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert gate.calls == 1
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+        gate = _Gate()
+        first = asyncio.create_task(flight.do("k", gate))
+        second = asyncio.create_task(flight.do("k", gate))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        gate.release.set()
+        assert await second == "value"
+
+    async def test_forget_starts_fresh_call_for_later_callers(self):
+        flight = SingleFlight()
+        before, after = _Gate("old"), _Gate("new")
+        early = asyncio.create_task(flight.do(("indexes", "c1"), before))
+        await asyncio.sleep(0)
+
+        flight.forget("indexes", "c1")
+        late = asyncio.create_task(flight.do(("indexes", "c1"), after))
+        await asyncio.sleep(0)
+        before.release.set()
+        after.release.set()
+
+        assert await early == "old"
+        assert await late == "new"
+
+
+class TestCoalescedEndpoints:
+    async def test_concurrent_udf_listings_share_one_info_call(self, client: AsyncClient):
+        release = asyncio.Event()
+
+        async def info_random_node(_cmd: str) -> str:
+            await release.wait()
+            return "filename=agg.lua,hash=abc,type=LUA;"
+
+        mock_client = AsyncMock()
+        mock_client.info_random_node = AsyncMock(side_effect=info_random_node)
+
+        with (
+            patch(
+                "aerospike_cluster_manager_api.dependencies.db.get_connection",
+                AsyncMock(return_value={"id": "conn-test"}),
+            ),
+            patch(
+                "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+                AsyncMock(return_value=mock_client),
+            ),
+        ):
+            requests = [asyncio.create_task(client.get("/api/udfs/conn-test")) for _ in range(4)]
+            for _ in range(20):
+                await asyncio.sleep(0)
+            release.set()
+            responses = await asyncio.gather(*requests)
+
+        assert [r.status_code for r in responses] == [200] * 4
+        assert all([m["filename"] for m in r.json()] == ["agg.lua"] for r in responses)
+        assert mock_client.info_random_node.await_count == 1
@@ -0,0 +1,117 @@
+"""Tests for OpenTelemetry spans around requests, Aerospike, database and K8s calls."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, nullcontext
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind
+
+from aerospike_cluster_manager_api import tracing
+from aerospike_cluster_manager_api.instrumentation import InstrumentedClient, timed_database
+from aerospike_cluster_manager_api.k8s_client import K8sClient
+from aerospike_cluster_manager_api.main import app
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+@asynccontextmanager
+async def _noop_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture()
+def exporter():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracing.use_tracer_provider(provider)
+    yield exporter
+    tracing.use_tracer_provider(None)
+
+
+@pytest.fixture()
+async def client():
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+
+    app.state.limiter.enabled = False
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.router.lifespan_context = original_lifespan
+
+
+class _FakeAerospike:
+    async def info_random_node(self, command: str) -> str:
+        return "filename=agg.lua,hash=abc,type=LUA;"
+
+
+def test_disabled_by_default():
+    assert isinstance(tracing.span("aerospike get"), nullcontext)
+
+
+class TestRequestSpans:
+    async def test_server_span_continues_caller_trace(self, client: AsyncClient, exporter: InMemorySpanExporter):
+        with (
+            patch(
+                "aerospike_cluster_manager_api.dependencies.db.get_connection",
+                AsyncMock(return_value={"id": "conn-test"}),
+            ),
+            patch(
+                "aerospike_cluster_manager_api.dependencies.client_manager.get_client",
+                AsyncMock(return_value=InstrumentedClient(_FakeAerospike(), "conn-test")),
+            ),
+        ):
+            response = await client.get(
+                "/api/udfs/conn-test", headers={"traceparent": TRACEPARENT, "X-Request-ID": "req-42"}
+            )
+        assert response.status_code == 200
+
+        spans = {s.name: s for s in exporter.get_finished_spans()}
+        server = spans["GET /api/udfs/{conn_id}"]
+        assert server.kind == SpanKind.SERVER
+        assert format(server.context.trace_id, "032x") == TRACE_ID
+        assert server.attributes["request.id"] == "req-42"
+        assert server.attributes["http.response.status_code"] == 200
+
+        info = spans["aerospike info_random_node"]
+        assert info.parent is not None
+        assert info.context.trace_id == server.context.trace_id
+        assert info.attributes["connection.id"] == "conn-test"
+        assert "serialization etag" in spans
+
+
+class TestClientSpans:
+    async def test_database_call_span(self, exporter: InMemorySpanExporter):
+        @timed_database
+        async def get_connection(conn_id: str) -> str:
+            return conn_id
+
+        await get_connection("x")
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "database get_connection"
+        assert "connection.id" not in span.attributes
+
+    async def test_k8s_offloaded_call_span(self, exporter: InMemorySpanExporter):
+        def _list_namespaces_sync(_self: K8sClient) -> list[str]:
+            return ["default"]
+
+        k8s = K8sClient()
+        with patch.object(K8sClient, "_list_namespaces_sync", _list_namespaces_sync):
+            assert await k8s.list_namespaces() == ["default"]
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "k8s list_namespaces"
+        assert span.attributes["k8s.operation"] == "list_namespaces"
@@ -0,0 +1,59 @@
+"""Tests for multi-worker coordinator election and snapshot sharing."""
+
+from __future__ import annotations
+
+import pytest
+
+from aerospike_cluster_manager_api.worker_state import WorkerState
+
+
+class TestWorkerState:
+    def test_single_worker_is_always_coordinator(self, tmp_path):
+        state = WorkerState(str(tmp_path), multi_worker=False)
+        assert state.is_coordinator is True
+        state.publish("snap", {"a": 1})
+        assert state.read("snap") is None
+
+    def test_only_one_coordinator(self, tmp_path):
+        first = WorkerState(str(tmp_path), multi_worker=True)
+        second = WorkerState(str(tmp_path), multi_worker=True)
+        try:
+            assert first.try_acquire() is True
+            assert second.try_acquire() is False
+            assert second.is_coordinator is False
+
+            first.release()
+            assert second.try_acquire() is True
+        finally:
+            first.release()
+            second.release()
+
+    def test_publish_and_read(self, tmp_path):
+        writer = WorkerState(str(tmp_path), multi_worker=True)
+        reader = WorkerState(str(tmp_path), multi_worker=True)
+
+        assert reader.read("connection_health") is None
+        writer.publish("connection_health", {"conn-1": {"connected": True}})
+
+        first = reader.read("connection_health")
+        assert first == {"conn-1": {"connected": True}}
+        # Unchanged file is served from the mtime cache
+        assert reader.read("connection_health") is first
+
+    def test_creates_a_private_state_dir(self, tmp_path):
+        state = WorkerState(str(tmp_path / "state"), multi_worker=True)
+        try:
+            assert state.try_acquire() is True
+            assert (tmp_path / "state").stat().st_mode & 0o777 == 0o700
+        finally:
+            state.release()
+
+    def test_refuses_a_shared_state_dir(self, tmp_path):
+        (tmp_path / "state").mkdir(mode=0o777)
+        (tmp_path / "state").chmod(0o777)
+        (tmp_path / "link").symlink_to(tmp_path / "private")
+        (tmp_path / "private").mkdir(mode=0o700)
+
+        for name in ("state", "link"):
+            with pytest.raises(PermissionError, match="Refusing worker state directory"):
+                WorkerState(str(tmp_path / name), multi_worker=True).try_acquire()
@@ -75,7 +75,8 @@ export default function IndexesPage({ params }: { params: Promise<{ connId: stri
 
   const fetchCluster = useCallback(async () => {
     try {
-      const info = await api.getCluster(connId);
+      // Only namespace names are needed here: skip node statistics and sets.
+      const info = await api.getCluster(connId, []);
       setClusterInfo(info);
       if (info.namespaces.length > 0) {
         setFormNamespace((prev) => prev || info.namespaces[0].name);
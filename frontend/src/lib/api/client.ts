@@ -257,8 +257,10 @@ export const api = {
     }),
 
   // Cluster
-  getCluster: (connId: string) =>
-    request<import("./types").ClusterInfo>(`/api/clusters/${encodePathSegment(connId)}`),
+  getCluster: (connId: string, include?: ("statistics" | "sets")[]) =>
+    request<import("./types").ClusterInfo>(
+      withQuery(`/api/clusters/${encodePathSegment(connId)}`, { include: include?.join(",") }),
+    ),
   configureNamespace: (connId: string, data: import("./types").ConfigureNamespaceRequest) =>
     request<{ message: string }>(`/api/clusters/${encodePathSegment(connId)}/namespaces`, {
       method: "POST",
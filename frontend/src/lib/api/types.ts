@@ -192,7 +192,14 @@ export type FilterOperator =
   | "is_true"
   | "is_false"
   | "geo_within"
-  | "geo_contains";
+  | "geo_contains"
+  | "size_eq"
+  | "size_gt"
+  | "size_ge"
+  | "size_lt"
+  | "size_le"
+  | "contains_value"
+  | "not_contains_value";
 
 export type BinDataType = "integer" | "float" | "string" | "bool" | "list" | "map" | "geo";
 
@@ -203,11 +210,14 @@ export interface FilterCondition {
   value?: BinValue;
   value2?: BinValue;
   binType: BinDataType;
+  /** Map keys and list indexes from a list/map bin to the compared element */
+  path?: (string | number)[];
 }
 
 export interface FilterGroup {
   logic: "and" | "or";
   conditions: FilterCondition[];
+  groups?: FilterGroup[];
 }
 
 export interface FilteredQueryRequest {